@@ -0,0 +1,7 @@
+"""Benchmarks for the lifecyclelogging package.
+
+Run the registered suite with ``python -m benchmarks run`` and check it
+against a stored baseline with ``python -m benchmarks compare``. Standalone
+comparisons run with ``python -m benchmarks.<module>`` from the repository
+root.
+"""
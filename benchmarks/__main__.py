@@ -0,0 +1,87 @@
+"""Command line entry point: ``python -m benchmarks run|compare``.
+
+``run`` executes the suite, prints the results and optionally stores them as a
+baseline. ``compare`` checks a results file against a baseline and exits with
+status 1 when any case regressed beyond the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from pathlib import Path
+
+import orjson
+
+from benchmarks.compare import (
+    DEFAULT_THRESHOLD,
+    compare_results,
+    format_comparison,
+    load_results,
+)
+from benchmarks.suite import CASES, print_results, run_suite, suite_document
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark command line.
+
+    Args:
+        argv: Command line arguments, defaulting to ``sys.argv``.
+
+    Returns:
+        int: The process exit status.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmark suite")
+    run.add_argument("patterns", nargs="*", help="shell patterns of cases to run")
+    run.add_argument("--quick", action="store_true", help="use scaled-down inputs")
+    run.add_argument("--output", type=Path, help="write results (e.g. a baseline)")
+    run.add_argument(
+        "--baseline", type=Path, help="compare against this baseline after running"
+    )
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare = commands.add_parser("compare", help="compare results to a baseline")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    commands.add_parser("list", help="list the registered cases")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        print("\n".join(CASES))  # noqa: T201
+        return 0
+
+    if args.command == "run":
+        results = run_suite(args.patterns, quick=args.quick)
+        print_results(results)
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_bytes(
+                orjson.dumps(
+                    suite_document(results, args.quick), option=orjson.OPT_INDENT_2
+                )
+            )
+        if not args.baseline:
+            return 0
+        baseline = load_results(args.baseline)
+    else:
+        baseline = load_results(args.baseline)
+        results = load_results(args.current)
+
+    rows = compare_results(baseline, results, args.threshold)
+    print(format_comparison(rows))  # noqa: T201
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")  # noqa: T201
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
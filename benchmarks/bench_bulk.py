@@ -0,0 +1,83 @@
+"""Compare N ``logged_statement`` calls with one ``logged_statements`` call.
+
+Both variants log to a file handler in a temporary directory, so the numbers
+include formatting, locking and writing.
+"""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+
+from pathlib import Path
+from typing import Any
+
+from lifecyclelogging import Logging
+from lifecyclelogging.handlers import BatchFileHandler
+
+from benchmarks.harness import measure, print_table
+
+
+RECORDS_PER_RUN = 2_000
+
+
+def _records() -> list[dict[str, Any]]:
+    return [
+        {
+            "msg": f"Processed resource {index}",
+            "context_marker": "sync",
+            "identifiers": [f"res-{index}"],
+            "log_level": "info",
+        }
+        for index in range(RECORDS_PER_RUN)
+    ]
+
+
+def _logger(name: str, log_path: Path) -> Logging:
+    logger = Logging(
+        enable_console=False,
+        enable_file=False,
+        logger_name=name,
+        default_storage_marker="run",
+    )
+    logger.logger.setLevel(logging.INFO)
+    logger.logger.propagate = False
+    logger.logger.addHandler(BatchFileHandler(log_path))
+    return logger
+
+
+def _per_record(stats: dict[str, float]) -> dict[str, float]:
+    return {
+        "median_ns": stats["median_ns"] / RECORDS_PER_RUN,
+        "best_ns": stats["best_ns"] / RECORDS_PER_RUN,
+        "ops_per_sec": stats["ops_per_sec"] * RECORDS_PER_RUN,
+    }
+
+
+def main() -> None:
+    """Run the bulk logging comparison."""
+    records = _records()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        single = _logger("bench_bulk_single", Path(tmp_dir) / "single.log")
+        bulk = _logger("bench_bulk_batch", Path(tmp_dir) / "bulk.log")
+
+        def log_individually() -> None:
+            for record in records:
+                single.logged_statement(**record)
+
+        def log_in_bulk() -> None:
+            bulk.logged_statements(records)
+
+        results = {
+            "logged_statement x N": _per_record(measure(log_individually, number=1)),
+            "logged_statements": _per_record(measure(log_in_bulk, number=1)),
+        }
+        for logger in (single, bulk):
+            for handler in list(logger.logger.handlers):
+                logger.logger.removeHandler(handler)
+                handler.close()
+    print_table("Bulk logging to a file handler (per record)", results)
+
+
+if __name__ == "__main__":
+    main()
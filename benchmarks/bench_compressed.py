@@ -0,0 +1,85 @@
+"""Compare plain and compressed log files in throughput and bytes written.
+
+Each run writes the same JSON-heavy records, rendered by ``add_json_data``,
+to a fresh file. "emit" is the time spent in the emitting thread; "total"
+also includes closing the handler, which for compressed files waits for the
+background thread to drain.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import tempfile
+import time
+
+from pathlib import Path
+
+from lifecyclelogging.handlers import BatchFileHandler, CompressedFileHandler
+from lifecyclelogging.utils import add_json_data
+
+from benchmarks.workload import make_payload
+
+
+RECORDS_PER_RUN = 20_000
+
+
+def _records() -> list[logging.LogRecord]:
+    payloads = [make_payload(2048, seed) for seed in range(256)]
+    return [
+        logging.LogRecord(
+            "bench",
+            logging.INFO,
+            __file__,
+            0,
+            add_json_data(f"Reconciled batch {index}", payloads[index % 256], None),
+            (),
+            None,
+        )
+        for index in range(RECORDS_PER_RUN)
+    ]
+
+
+def _run(
+    handler: logging.Handler, records: list[logging.LogRecord]
+) -> tuple[float, float]:
+    started = time.perf_counter()
+    for record in records:
+        handler.handle(record)
+    emitted = time.perf_counter()
+    handler.close()
+    return emitted - started, time.perf_counter() - started
+
+
+def main() -> None:
+    """Run the comparison and print a table."""
+    records = _records()
+    variants = {"plain": "", "gzip": ".gz"}
+    if importlib.util.find_spec("zstandard") is not None:
+        variants["zstd"] = ".zst"
+
+    print(  # noqa: T201
+        f"{RECORDS_PER_RUN} records per run\n"
+        f"  {'format':<6}  {'emit rec/s':>12}  {'total rec/s':>12}  {'bytes':>14}  ratio"
+    )
+    plain_size = 0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, suffix in variants.items():
+            path = Path(tmp_dir) / f"bench.log{suffix}"
+            handler: logging.Handler = (
+                BatchFileHandler(path)
+                if name == "plain"
+                else CompressedFileHandler(path, name, mode="wb")  # type: ignore[arg-type]
+            )
+            emit_seconds, total_seconds = _run(handler, records)
+            size = path.stat().st_size
+            plain_size = plain_size or size
+            print(  # noqa: T201
+                f"  {name:<6}  {RECORDS_PER_RUN / emit_seconds:>12,.0f}"
+                f"  {RECORDS_PER_RUN / total_seconds:>12,.0f}"
+                f"  {size:>14,}  {plain_size / size:>5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compare console output modes in lines per second.
+
+Output is redirected to ``os.devnull`` so the numbers reflect formatting and
+writing cost rather than terminal speed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+
+from lifecyclelogging.handlers import add_console_handler
+
+from benchmarks.harness import measure, print_table
+
+
+LINES_PER_RUN = 2_000
+
+
+def bench_mode(mode: str) -> dict[str, float]:
+    """Measure one console mode.
+
+    Args:
+        mode: The console mode to measure.
+
+    Returns:
+        dict[str, float]: Per-line timing statistics.
+    """
+    logger = logging.getLogger(f"bench_console_{mode}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.handlers.clear()
+    add_console_handler(logger, mode)  # type: ignore[arg-type]
+
+    def emit_lines() -> None:
+        for index in range(LINES_PER_RUN):
+            logger.info("Processed resource %d in region us-east-1", index)
+
+    result = measure(emit_lines, number=1, repeat=5)
+    for handler in logger.handlers:
+        handler.flush()
+    logger.handlers.clear()
+    return {
+        "median_ns": result["median_ns"] / LINES_PER_RUN,
+        "best_ns": result["best_ns"] / LINES_PER_RUN,
+        "ops_per_sec": result["ops_per_sec"] * LINES_PER_RUN,
+    }
+
+
+def main() -> None:
+    """Run the console mode comparison."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):  # noqa: PTH123
+        results = {mode: bench_mode(mode) for mode in ("rich", "plain", "jsonl")}
+    print_table("Console output modes (per line)", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compare result encodings in payload size and encode/decode time.
+
+"json" is the plain ``exit_run`` document, "json+base64" is what
+``encode_to_base64`` writes, and "msgpack" and "cbor" are the binary output
+formats, measured when their optional packages are installed.
+"""
+
+from __future__ import annotations
+
+import base64
+import functools
+import importlib.util
+
+from typing import Any, Callable
+
+import orjson
+
+from lifecyclelogging.encoders import decode_binary, encode_binary
+
+from benchmarks.harness import measure
+from benchmarks.workload import make_results
+
+
+RESULTS_PER_RUN = 5_000
+
+Codec = tuple[Callable[[Any], bytes], Callable[[bytes], Any]]
+
+
+def _codecs() -> dict[str, Codec]:
+    codecs: dict[str, Codec] = {
+        "json": (lambda data: orjson.dumps(data, default=str), orjson.loads),
+        "json+base64": (
+            lambda data: base64.b64encode(orjson.dumps(data, default=str)),
+            lambda data: orjson.loads(base64.b64decode(data)),
+        ),
+    }
+    for name, package in (("msgpack", "msgpack"), ("cbor", "cbor2")):
+        if importlib.util.find_spec(package) is not None:
+            codecs[name] = (
+                functools.partial(encode_binary, output_format=name),
+                functools.partial(decode_binary, output_format=name),
+            )
+    return codecs
+
+
+def main() -> None:
+    """Run the comparison and print a table."""
+    results = make_results(RESULTS_PER_RUN)
+    print(  # noqa: T201
+        f"{RESULTS_PER_RUN} results per document\n"
+        f"  {'format':<12}  {'bytes':>12}  {'size':>6}  "
+        f"{'encode ms':>10}  {'decode ms':>10}"
+    )
+    json_size = 0
+    for name, (encode, decode) in _codecs().items():
+        payload = encode(results)
+        json_size = json_size or len(payload)
+        encode_stats = measure(functools.partial(encode, results), number=5)
+        decode_stats = measure(functools.partial(decode, payload), number=5)
+        print(  # noqa: T201
+            f"  {name:<12}  {len(payload):>12,}  {len(payload) / json_size:>5.0%}"
+            f"  {encode_stats['median_ns'] / 1e6:>10.2f}"
+            f"  {decode_stats['median_ns'] / 1e6:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
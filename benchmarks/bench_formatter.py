@@ -0,0 +1,77 @@
+"""Compare the per-record cost of ``logging.Formatter`` and ``CompiledFormatter``.
+
+Each layout is formatted for the same records. The records are prepared once
+with a pre-rendered message and no arguments, as ``Logging`` emits them, and
+spread over a few seconds so date caching is exercised across boundaries.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from lifecyclelogging.formatters import CompiledFormatter
+from lifecyclelogging.handlers import PLAIN_CONSOLE_FORMAT
+
+from benchmarks.harness import measure, print_table
+
+
+RECORDS_PER_RUN = 1_000
+
+LAYOUTS: dict[str, str] = {
+    "default layout": PLAIN_CONSOLE_FORMAT,
+    "asctime layout": "%(asctime)s %(name)s [%(levelname)s] %(message)s",
+    "timestamp + sequence": "%(timestamp)s #%(sequence)d [%(levelname)-8s] %(message)s",
+}
+
+
+def _records() -> list[logging.LogRecord]:
+    records = []
+    for index in range(RECORDS_PER_RUN):
+        record = logging.LogRecord(
+            "bench",
+            (logging.DEBUG, logging.INFO, logging.WARNING)[index % 3],
+            __file__,
+            0,
+            f"[sync] Processed resource {index} (res-{index})",
+            (),
+            None,
+        )
+        record.created = 1_792_400_000 + index / 250
+        record.msecs = (record.created - int(record.created)) * 1000
+        records.append(record)
+    return records
+
+
+def _per_record(stats: dict[str, float]) -> dict[str, float]:
+    return {
+        "median_ns": stats["median_ns"] / RECORDS_PER_RUN,
+        "best_ns": stats["best_ns"] / RECORDS_PER_RUN,
+        "ops_per_sec": stats["ops_per_sec"] * RECORDS_PER_RUN,
+    }
+
+
+def main() -> None:
+    """Run the comparison for each layout."""
+    records = _records()
+    for name, fmt in LAYOUTS.items():
+        # logging.Formatter has no %(timestamp)s or %(sequence)d
+        formatters: dict[str, logging.Formatter] = (
+            {}
+            if "%(timestamp)" in fmt
+            else {"logging.Formatter": logging.Formatter(fmt)}
+        )
+        formatters["CompiledFormatter"] = CompiledFormatter(fmt)
+
+        results = {}
+        for label, formatter in formatters.items():
+
+            def format_all(formatter: logging.Formatter = formatter) -> None:
+                for record in records:
+                    formatter.format(record)
+
+            results[label] = _per_record(measure(format_all, number=20))
+        print_table(f"{name}: {fmt} (per record)", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compare repeated concatenation with the segment-based message builder.
+
+The concatenation reference reproduces how messages were built before the
+builder existed: one ``msg += ...`` per labeled payload. Payloads are served
+from a warm ``PayloadCache`` so the numbers reflect message assembly rather
+than JSON serialization, which dominates cold calls either way.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from lifecyclelogging.cache import PayloadCache
+from lifecyclelogging.utils import _render_payload, add_json_data
+
+from benchmarks.harness import measure, print_table
+
+
+def concat_reference(
+    msg: str,
+    labeled_data: Mapping[str, Any],
+    cache: PayloadCache,
+) -> str:
+    """Build a message the old way, concatenating once per label.
+
+    Args:
+        msg: The base message.
+        labeled_data: Labeled payloads to append.
+        cache: Cache the rendered payloads are served from.
+
+    Returns:
+        str: The complete message.
+    """
+    for label, data in labeled_data.items():
+        msg += f"\n{label}:\n" + _render_payload(data, None, cache, None)
+    return msg
+
+
+def main() -> None:
+    """Run the comparison for growing label counts."""
+    base = "Reconciled resources " * 20
+    for labels in (10, 100, 1_000, 5_000):
+        labeled = {
+            f"resource_{index}": {"id": index, "state": "ok", "notes": "x" * 512}
+            for index in range(labels)
+        }
+        cache = PayloadCache(max_entries=labels, max_bytes=1 << 30)
+        number = max(1, 20_000 // labels)
+        results = {
+            "concatenation": measure(
+                lambda labeled=labeled, cache=cache: concat_reference(
+                    base, labeled, cache
+                ),
+                number,
+            ),
+            "builder": measure(
+                lambda labeled=labeled, cache=cache: add_json_data(
+                    base, None, labeled, cache=cache
+                ),
+                number,
+            ),
+        }
+        print_table(f"{labels} labeled payloads per call (cached)", results)
+
+
+if __name__ == "__main__":
+    main()
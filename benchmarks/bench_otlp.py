@@ -0,0 +1,95 @@
+"""Measure OTLP/HTTP export throughput against a local stand-in collector.
+
+Each run logs the same structured statements through ``add_otlp_exporter``.
+"emit" is the time spent in the logging thread, which only maps and queues
+records; "delivered" also includes waiting until the collector has accepted
+every batch. A ``max_batch`` of 1 shows the cost of one request per record.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from lifecyclelogging import Logging
+
+
+RECORDS_PER_RUN = 20_000
+
+VARIANTS: dict[str, dict[str, Any]] = {
+    "batch 1": {"max_batch": 1},
+    "batch 512": {"max_batch": 512},
+    "batch 512 gzip": {"max_batch": 512, "compression": "gzip"},
+    "batch 512 x2 workers": {"max_batch": 512, "workers": 2},
+}
+
+
+class _Collector(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+def _run(endpoint: str, name: str, options: dict[str, Any]) -> tuple[float, float]:
+    logger = Logging(enable_console=False, enable_file=False, logger_name=name)
+    logger.logger.setLevel(logging.INFO)
+    logger.logger.propagate = False
+    handler = logger.add_otlp_exporter(
+        endpoint, max_queue=RECORDS_PER_RUN, overflow="block", **options
+    )
+
+    started = time.perf_counter()
+    for index in range(RECORDS_PER_RUN):
+        logger.logged_statement(
+            "Processed resource",
+            json_data={"index": index, "status": "ok"},
+            identifiers=[f"res-{index}"],
+            context_marker="sync",
+            log_level="info",
+        )
+    emitted = time.perf_counter()
+    handler.flush(60)
+    delivered = time.perf_counter()
+
+    logger.logger.removeHandler(handler)
+    handler.close()
+    return emitted - started, delivered - started
+
+
+def main() -> None:
+    """Run the throughput comparison and print a table."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Collector)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/v1/logs"
+
+    width = max(len(name) for name in VARIANTS)
+    print(  # noqa: T201
+        f"{RECORDS_PER_RUN} records per run\n"
+        f"  {'variant':<{width}}  {'emit rec/s':>12}  {'delivered rec/s':>15}"
+    )
+    try:
+        for index, (name, options) in enumerate(VARIANTS.items()):
+            emit_seconds, total_seconds = _run(endpoint, f"bench_otlp_{index}", options)
+            print(  # noqa: T201
+                f"  {name:<{width}}  {RECORDS_PER_RUN / emit_seconds:>12,.0f}"
+                f"  {RECORDS_PER_RUN / total_seconds:>15,.0f}"
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
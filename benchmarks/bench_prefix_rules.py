@@ -0,0 +1,87 @@
+"""Compare list-scanned and compiled prefix allowlists as the list grows.
+
+The reference reproduces how ``exit_run`` prefixed fields before the lists
+were compiled: every field of every record transformed its key and scanned
+both lists. The compiled path is ``KeyTransformer`` with
+``compile_prefix_rule``, as ``exit_run`` now uses.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from extended_data_types import to_snake_case
+from lifecyclelogging.transforms import KeyTransformer, compile_prefix_rule
+
+from benchmarks.harness import measure, print_table
+from benchmarks.workload import make_results
+
+
+RECORDS = 2_000
+
+
+def list_reference(
+    results: Mapping[str, Any],
+    allowlist: Sequence[str],
+    denylist: Sequence[str],
+) -> dict[str, Any]:
+    """Prefix top-level fields the old way, scanning the lists per field.
+
+    Args:
+        results: The results to prefix.
+        allowlist: Fields to prefix.
+        denylist: Fields never to prefix.
+
+    Returns:
+        dict[str, Any]: The prefixed results.
+    """
+    output: dict[str, Any] = {}
+    for top_level_key, record in results.items():
+        transformed: dict[str, Any] = {}
+        for field_name, field_data in record.items():
+            key = to_snake_case(field_name)
+            if (
+                (not allowlist or field_name in allowlist or key in allowlist)
+                and field_name not in denylist
+                and key not in denylist
+            ):
+                key = f"pre_{key}"
+            transformed[key] = field_data
+        output[top_level_key] = transformed
+    return output
+
+
+def main() -> None:
+    """Run the comparison for growing allowlists."""
+    results = make_results(RECORDS)
+    for size in (10, 100, 1_000, 10_000):
+        allowlist = [f"unusedField{index}" for index in range(size - 1)]
+        allowlist.append("accountName")
+        denylist = [f"deniedField{index}" for index in range(size)]
+
+        def compiled(
+            allowlist: list[str] = allowlist, denylist: list[str] = denylist
+        ) -> None:
+            KeyTransformer(
+                to_snake_case,
+                prefix="pre",
+                prefix_rule=compile_prefix_rule(allowlist, denylist),
+            ).transform_results(results)
+
+        def scanned(
+            allowlist: list[str] = allowlist, denylist: list[str] = denylist
+        ) -> None:
+            list_reference(results, allowlist, denylist)
+
+        print_table(
+            f"{size} list entries, {RECORDS} records (per call)",
+            {
+                "list scan": measure(scanned, number=1, repeat=3),
+                "compiled": measure(compiled, number=1, repeat=3),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
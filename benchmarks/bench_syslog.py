@@ -0,0 +1,117 @@
+"""Compare the network syslog sink with the standard library's SysLogHandler.
+
+Both send the same records to a local relay, run in a separate process like
+a real one, that discards what it reads.
+"emit" is the time spent in the logging thread; "delivered" also includes
+waiting until the sink's worker has written every batch. ``SysLogHandler``
+sends on the logging thread, one write per record, so its two rates match.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import socket
+import socketserver
+import threading
+import time
+
+from logging.handlers import SysLogHandler
+
+from lifecyclelogging import NetworkSyslogHandler
+
+
+RECORDS_PER_RUN = 50_000
+
+
+class _DrainStream(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        while self.request.recv(1 << 16):
+            pass
+
+
+class _DrainDatagrams(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        pass
+
+
+def _records() -> list[logging.LogRecord]:
+    return [
+        logging.LogRecord(
+            "bench",
+            logging.INFO,
+            __file__,
+            0,
+            "[sync] Processed resource %d (res-%d)",
+            (index, index),
+            None,
+        )
+        for index in range(RECORDS_PER_RUN)
+    ]
+
+
+def _run(
+    handler: logging.Handler, records: list[logging.LogRecord]
+) -> tuple[float, float]:
+    started = time.perf_counter()
+    for record in records:
+        handler.handle(record)
+    emitted = time.perf_counter()
+    if isinstance(handler, NetworkSyslogHandler):
+        handler.flush(60)
+    delivered = time.perf_counter()
+    handler.close()
+    return emitted - started, delivered - started
+
+
+def _serve(ports: multiprocessing.SimpleQueue[tuple[int, int]]) -> None:
+    stream = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _DrainStream)
+    stream.daemon_threads = True
+    datagrams = socketserver.UDPServer(("127.0.0.1", 0), _DrainDatagrams)
+    threading.Thread(target=datagrams.serve_forever, daemon=True).start()
+    ports.put((stream.server_address[1], datagrams.server_address[1]))
+    stream.serve_forever()
+
+
+def main() -> None:
+    """Run the comparison and print a table."""
+    ports: multiprocessing.SimpleQueue[tuple[int, int]] = multiprocessing.SimpleQueue()
+    relay = multiprocessing.Process(target=_serve, args=(ports,), daemon=True)
+    relay.start()
+    stream_port, datagram_port = ports.get()
+    stream_address = ("127.0.0.1", stream_port)
+    datagram_address = ("127.0.0.1", datagram_port)
+
+    variants = {
+        "SysLogHandler tcp": lambda: SysLogHandler(
+            stream_address, socktype=socket.SOCK_STREAM
+        ),
+        "NetworkSyslogHandler tcp": lambda: NetworkSyslogHandler(
+            stream_address, max_queue=RECORDS_PER_RUN
+        ),
+        "SysLogHandler udp": lambda: SysLogHandler(datagram_address),
+        "NetworkSyslogHandler udp": lambda: NetworkSyslogHandler(
+            datagram_address, transport="udp", max_queue=RECORDS_PER_RUN
+        ),
+    }
+
+    records = _records()
+    width = max(len(name) for name in variants)
+    print(  # noqa: T201
+        f"{RECORDS_PER_RUN} records per run\n"
+        f"  {'handler':<{width}}  {'emit rec/s':>12}  {'delivered rec/s':>15}"
+    )
+    try:
+        for name, create in variants.items():
+            emit_seconds, total_seconds = _run(create(), records)
+            print(  # noqa: T201
+                f"  {name:<{width}}  {RECORDS_PER_RUN / emit_seconds:>12,.0f}"
+                f"  {RECORDS_PER_RUN / total_seconds:>15,.0f}"
+            )
+    finally:
+        relay.terminate()
+        relay.join()
+
+
+if __name__ == "__main__":
+    main()
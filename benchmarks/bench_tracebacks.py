@@ -0,0 +1,64 @@
+"""Compare traceback rendering cost for a repeated failure.
+
+"rich" is what a ``RichHandler`` with ``rich_tracebacks=True`` does per
+exception, "stdlib" is ``logging.Formatter.formatException``, and the
+``TracebackPolicy`` rows render the same exception with a warm frame cache,
+in full and as the rate-limited summary.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+
+from lifecyclelogging.tracebacks import TracebackPolicy
+from rich.console import Console
+from rich.traceback import Traceback
+
+from benchmarks.harness import measure, print_table
+
+
+def _fail(depth: int) -> None:
+    if depth:
+        _fail(depth - 1)
+    error_message = "reconcile failed"
+    raise ValueError(error_message)
+
+
+def _exception(depth: int = 12) -> ValueError:
+    try:
+        _fail(depth)
+    except ValueError as exc:
+        return exc
+    raise AssertionError
+
+
+def main() -> None:
+    """Run the comparison and print a table."""
+    exc = _exception()
+    exc_info = (type(exc), exc, exc.__traceback__)
+    console = Console(file=io.StringIO(), width=120)
+    formatter = logging.Formatter()
+    policy = TracebackPolicy(max_full_renders=None)
+    limited = TracebackPolicy(max_full_renders=0)
+
+    def rich() -> None:
+        console.print(Traceback.from_exception(*exc_info))
+
+    print_table(
+        "traceback rendering (13 frames)",
+        {
+            "rich": measure(rich, number=20),
+            "stdlib": measure(
+                lambda: formatter.formatException(exc_info), number=2_000
+            ),
+            "policy.full": measure(lambda: policy.format_full(exc), number=2_000),
+            "policy.summary": measure(
+                lambda: limited.format_summary(exc), number=20_000
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
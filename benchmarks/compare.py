@@ -0,0 +1,100 @@
+"""Compare suite results against a stored baseline and flag regressions."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+DEFAULT_THRESHOLD = 0.10
+"""float: Relative slowdown of the median above which a case regresses."""
+
+
+def load_results(path: str | Path) -> dict[str, dict[str, float]]:
+    """Read the per-case results from a document written by ``run --output``.
+
+    Args:
+        path: The results file.
+
+    Returns:
+        dict[str, dict[str, float]]: Statistics per case name.
+    """
+    document: dict[str, Any] = orjson.loads(Path(path).read_bytes())
+    return document["results"]
+
+
+def compare_results(
+    baseline: dict[str, dict[str, float]],
+    current: dict[str, dict[str, float]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Compare median timings case by case.
+
+    Args:
+        baseline: Statistics per case name from the baseline run.
+        current: Statistics per case name from the run being checked.
+        threshold: Relative slowdown above which a case is a regression, and
+            relative speedup above which it is reported as an improvement.
+
+    Returns:
+        list[dict[str, Any]]: One row per case with the baseline and current
+        medians, their ratio and a status of ``regression``, ``improvement``,
+        ``unchanged``, ``new`` or ``missing``.
+    """
+    rows: list[dict[str, Any]] = []
+    for name in sorted(baseline.keys() | current.keys()):
+        before = baseline.get(name, {}).get("median_ns")
+        after = current.get(name, {}).get("median_ns")
+        if before is None or after is None:
+            status = "new" if before is None else "missing"
+            ratio = None
+        else:
+            ratio = after / before if before else float("inf")
+            if ratio > 1 + threshold:
+                status = "regression"
+            elif ratio < 1 - threshold:
+                status = "improvement"
+            else:
+                status = "unchanged"
+        rows.append(
+            {
+                "name": name,
+                "baseline_ns": before,
+                "current_ns": after,
+                "ratio": ratio,
+                "status": status,
+            }
+        )
+    return rows
+
+
+def format_comparison(rows: list[dict[str, Any]]) -> str:
+    """Render comparison rows as an aligned text table.
+
+    Args:
+        rows: Rows from ``compare_results``.
+
+    Returns:
+        str: The table.
+    """
+    width = max((len(row["name"]) for row in rows), default=4)
+    lines = [f"{'case':<{width}}  {'baseline':>12}  {'current':>12}  {'ratio':>7}"]
+    for row in rows:
+        before = (
+            f"{row['baseline_ns'] / 1000:.2f}us"
+            if row["baseline_ns"] is not None
+            else "-"
+        )
+        after = (
+            f"{row['current_ns'] / 1000:.2f}us"
+            if row["current_ns"] is not None
+            else "-"
+        )
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        lines.append(
+            f"{row['name']:<{width}}  {before:>12}  {after:>12}  {ratio:>7}  "
+            f"{row['status']}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,56 @@
+"""Small timing harness shared by the benchmark modules."""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+from typing import Any, Callable
+
+
+def measure(
+    func: Callable[[], Any],
+    number: int,
+    repeat: int = 5,
+) -> dict[str, float]:
+    """Time ``func`` and return per-operation statistics.
+
+    Args:
+        func: The operation to time.
+        number: Number of calls per timed run.
+        repeat: Number of timed runs.
+
+    Returns:
+        dict[str, float]: Median and best nanoseconds per call, and the
+        operations per second implied by the median.
+    """
+    func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter_ns() - started) / number)
+
+    median = statistics.median(timings)
+    return {
+        "median_ns": median,
+        "best_ns": min(timings),
+        "ops_per_sec": 1e9 / median if median else float("inf"),
+    }
+
+
+def print_table(title: str, rows: dict[str, dict[str, float]]) -> None:
+    """Print benchmark results as an aligned table.
+
+    Args:
+        title: Heading printed above the table.
+        rows: Results from ``measure`` keyed by case name.
+    """
+    print(title)  # noqa: T201
+    width = max(len(name) for name in rows)
+    for name, result in rows.items():
+        print(  # noqa: T201
+            f"  {name:<{width}}  {result['median_ns'] / 1000:>10.2f} us/op"
+            f"  {result['ops_per_sec']:>12,.0f} ops/s"
+        )
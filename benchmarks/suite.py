@@ -0,0 +1,455 @@
+"""Registered microbenchmarks and macro scenarios for the whole package.
+
+Each case is a function taking ``quick`` and returning the statistics from
+``measure``. Quick mode scales the inputs down (no 50 MB payloads or
+million-record runs) so the suite finishes in seconds for local iteration.
+Use ``python -m benchmarks run`` to execute the suite.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import fnmatch
+import logging
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Callable
+
+import orjson
+
+from lifecyclelogging import ArtifactStore, Logging
+from lifecyclelogging.const import STATEMENT_ATTRIBUTE
+from lifecyclelogging.formatters import CompiledFormatter
+from lifecyclelogging.handlers import PLAIN_CONSOLE_FORMAT, BufferedStreamHandler
+from lifecyclelogging.otlp import record_to_otlp
+from lifecyclelogging.utils import add_json_data
+
+from benchmarks.harness import measure, print_table
+from benchmarks.workload import make_payload, make_results, make_statements
+
+
+Case = Callable[[bool], dict[str, float]]
+
+CASES: dict[str, Case] = {}
+"""dict[str, Case]: Registered cases by name, in registration order."""
+
+PAYLOAD_SIZES: dict[str, int] = {
+    "1kb": 1 << 10,
+    "64kb": 64 << 10,
+    "1mb": 1 << 20,
+    "10mb": 10 << 20,
+    "50mb": 50 << 20,
+}
+QUICK_PAYLOAD_LIMIT = 1 << 20
+
+# Cases with more items than this are timed once; setup dominates otherwise
+SINGLE_RUN_THRESHOLD = 100_000
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    """Register a benchmark case under ``name``.
+
+    Args:
+        name: Dotted case name, ``micro.*`` or ``macro.*``.
+
+    Returns:
+        Callable[[Case], Case]: The registering decorator.
+    """
+
+    def register(func: Case) -> Case:
+        CASES[name] = func
+        return func
+
+    return register
+
+
+def _per_item(stats: dict[str, float], items: int) -> dict[str, float]:
+    return {
+        "median_ns": stats["median_ns"] / items,
+        "best_ns": stats["best_ns"] / items,
+        "ops_per_sec": stats["ops_per_sec"] * items,
+    }
+
+
+@contextlib.contextmanager
+def _quiet_logger(name: str) -> Iterator[Logging]:
+    """Yield a Logging instance that emits INFO and above to ``os.devnull``."""
+    with open(os.devnull, "w") as devnull:  # noqa: PTH123
+        logger = Logging(enable_console=False, enable_file=False, logger_name=name)
+        logger.logger.propagate = False
+        logger.logger.setLevel("INFO")
+        handler = BufferedStreamHandler(devnull)
+        logger.logger.addHandler(handler)
+        try:
+            yield logger
+        finally:
+            logger.logger.removeHandler(handler)
+            handler.close()
+
+
+@contextlib.contextmanager
+def _in_temp_dir() -> Iterator[None]:
+    """Run in a temporary directory so ``log_results`` files are discarded."""
+    previous = Path.cwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            yield
+        finally:
+            os.chdir(previous)
+
+
+@case("micro.logged_statement.suppressed")
+def bench_suppressed(quick: bool) -> dict[str, float]:
+    """Statement dropped by the verbosity check."""
+    with _quiet_logger("bench_suppressed") as logger:
+        return measure(
+            lambda: logger.logged_statement("hidden", verbose=True, verbosity=2),
+            number=10_000 if quick else 100_000,
+        )
+
+
+_FLIGHT_PAYLOAD = {"account": "acct-1", "region": "us-east-1", "items": list(range(20))}
+
+
+@case("micro.logged_statement.level_suppressed")
+def bench_level_suppressed(quick: bool) -> dict[str, float]:
+    """DEBUG statement with a payload, rendered then dropped at INFO."""
+    with _quiet_logger("bench_level_suppressed") as logger:
+        return measure(
+            lambda: logger.logged_statement("detail", json_data=_FLIGHT_PAYLOAD),
+            number=5_000 if quick else 50_000,
+        )
+
+
+@case("micro.logged_statement.flight_recorded")
+def bench_flight_recorded(quick: bool) -> dict[str, float]:
+    """The same DEBUG statement kept unrendered by the flight recorder."""
+    with _quiet_logger("bench_flight_recorded") as logger:
+        logger.enable_flight_recorder()
+        return measure(
+            lambda: logger.logged_statement("detail", json_data=_FLIGHT_PAYLOAD),
+            number=5_000 if quick else 50_000,
+        )
+
+
+@case("micro.logged_statement.suppressed_recorded")
+def bench_suppressed_recorded(quick: bool) -> dict[str, float]:
+    """Statement dropped by the verbosity check and kept by the recorder."""
+    with _quiet_logger("bench_suppressed_recorded") as logger:
+        logger.enable_flight_recorder()
+        return measure(
+            lambda: logger.logged_statement("hidden", verbose=True, verbosity=2),
+            number=10_000 if quick else 100_000,
+        )
+
+
+@case("micro.logged_statement.emitted")
+def bench_emitted(quick: bool) -> dict[str, float]:
+    """Statement rendered and written by a handler."""
+    with _quiet_logger("bench_emitted") as logger:
+        return measure(
+            lambda: logger.logged_statement(
+                "emitted", context_marker="sync", log_level="info"
+            ),
+            number=5_000 if quick else 50_000,
+        )
+
+
+@case("micro.logged_statement.adaptive")
+def bench_adaptive(quick: bool) -> dict[str, float]:
+    """Emitted statement with adaptive verbosity measuring handler latency."""
+    with _quiet_logger("bench_adaptive") as logger:
+        logger.enable_adaptive_verbosity()
+        return measure(
+            lambda: logger.logged_statement(
+                "emitted", context_marker="sync", log_level="info"
+            ),
+            number=5_000 if quick else 50_000,
+        )
+
+
+@case("micro.format.default_layout")
+def bench_format_default_layout(quick: bool) -> dict[str, float]:
+    """Formatting a record with the compiled default file layout."""
+    formatter = CompiledFormatter(PLAIN_CONSOLE_FORMAT)
+    record = logging.LogRecord(
+        "bench", logging.INFO, __file__, 0, "[sync] Processed (res-1)", (), None
+    )
+    return measure(
+        lambda: formatter.format(record), number=10_000 if quick else 100_000
+    )
+
+
+@case("micro.otlp.record_to_otlp")
+def bench_record_to_otlp(quick: bool) -> dict[str, float]:
+    """Mapping a structured statement's record to an OTLP log record."""
+    record = logging.LogRecord(
+        "bench", logging.INFO, __file__, 0, "[sync] Processed (res-1)", (), None
+    )
+    setattr(
+        record,
+        STATEMENT_ATTRIBUTE,
+        {
+            "msg": "Processed",
+            "context_marker": "sync",
+            "identifiers": ["res-1"],
+            "storage_marker": "run",
+            "json_data": {"index": 1, "status": "ok", "tags": ["a", "b"]},
+            "labeled_json_data": None,
+            "call_site": (__file__, 0, "bench"),
+        },
+    )
+    return measure(lambda: record_to_otlp(record), number=5_000 if quick else 50_000)
+
+
+@case("micro.logged_statement.stored")
+def bench_stored(quick: bool) -> dict[str, float]:
+    """Statement written and stored under a marker."""
+    with _quiet_logger("bench_stored") as logger:
+        counter = iter(range(sys.maxsize))
+        return measure(
+            lambda: logger.logged_statement(
+                f"stored {next(counter)}", storage_marker="run", log_level="warning"
+            ),
+            number=5_000 if quick else 50_000,
+        )
+
+
+@case("micro.bind.create")
+def bench_bind_create(quick: bool) -> dict[str, float]:
+    """Creating a child logger with a bound marker and identifiers."""
+    with _quiet_logger("bench_bind") as logger:
+        return measure(
+            lambda: logger.bind(context_marker="sync", identifiers=["acct", "east"]),
+            number=10_000 if quick else 100_000,
+        )
+
+
+@case("micro.logged_statement.bound")
+def bench_bound(quick: bool) -> dict[str, float]:
+    """Statement through a child logger with a bound marker and identifiers."""
+    with _quiet_logger("bench_bound") as logger:
+        child = logger.bind(context_marker="sync", identifiers=["acct", "east"])
+        return measure(
+            lambda: child.logged_statement("emitted", log_level="info"),
+            number=5_000 if quick else 50_000,
+        )
+
+
+def _payload_case(size: int) -> Case:
+    def bench(quick: bool) -> dict[str, float]:  # noqa: ARG001
+        payload = make_payload(size)
+        return measure(
+            lambda: add_json_data("payload", payload, None),
+            number=max(1, (4 << 20) // size),
+            repeat=3 if size >= (10 << 20) else 5,
+        )
+
+    return bench
+
+
+for _label, _size in PAYLOAD_SIZES.items():
+    case(f"micro.add_json_data.{_label}")(_payload_case(_size))
+
+
+def _key_transform_case(transform: str) -> Case:
+    def bench(quick: bool) -> dict[str, float]:
+        results = make_results(1_000 if quick else 10_000)
+        logger = Logging(enable_console=False, enable_file=False)
+        transform_fn = logger._resolve_key_transform(transform, False, None)  # noqa: SLF001
+        assert transform_fn is not None  # noqa: S101
+        stats = measure(
+            lambda: logger._transform_nested_keys(results, transform_fn),  # noqa: SLF001
+            number=1,
+        )
+        return _per_item(stats, len(results))
+
+    return bench
+
+
+for _transform in ("snake_case", "camel_case", "kebab_case"):
+    case(f"micro.key_transform.{_transform}")(_key_transform_case(_transform))
+
+
+@case("micro.log_results.json")
+def bench_log_results(quick: bool) -> dict[str, float]:
+    """``log_results`` serializing and atomically writing a results file."""
+    payload = make_payload(1 << 20 if quick else 10 << 20)
+    logger = Logging(enable_console=False, enable_file=False)
+
+    with _in_temp_dir():
+        return measure(lambda: logger.log_results(payload, "results"), number=3)
+
+
+@case("micro.base64.results")
+def bench_base64(quick: bool) -> dict[str, float]:
+    """Base64 encoding of serialized results, as ``encode_to_base64`` does."""
+    payload = make_payload(1 << 20 if quick else 10 << 20)
+
+    def encode() -> str:
+        return base64.b64encode(orjson.dumps(payload)).decode("utf-8")
+
+    return measure(encode, number=3)
+
+
+@case("macro.exit_run.base64")
+def bench_exit_run_base64(quick: bool) -> dict[str, float]:
+    """Full ``exit_run`` with ``encode_to_base64`` writing to ``os.devnull``."""
+    results = make_results(1_000 if quick else 20_000)
+    logger = Logging(enable_console=False, enable_file=False)
+
+    def run() -> None:
+        with contextlib.suppress(SystemExit):
+            logger.exit_run(results, encode_to_base64=True)
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(_in_temp_dir())
+        devnull = stack.enter_context(open(os.devnull, "w"))  # noqa: PTH123
+        stack.enter_context(contextlib.redirect_stdout(devnull))
+        return measure(run, number=1, repeat=3)
+
+
+@case("macro.exit_run.artifact_store")
+def bench_exit_run_artifact_store(quick: bool) -> dict[str, float]:
+    """Repeated ``exit_run`` with unchanged results and an artifact store."""
+    results = make_results(1_000 if quick else 20_000)
+
+    def run() -> None:
+        logger = Logging(
+            enable_console=False,
+            enable_file=False,
+            artifact_store=ArtifactStore("artifacts", keep_runs=5),
+        )
+        logger.exit_run(results, exit_on_completion=False)
+
+    with _in_temp_dir():
+        return measure(run, number=1, repeat=5)
+
+
+@case("macro.threads.producers")
+def bench_threaded_producers(quick: bool) -> dict[str, float]:
+    """Several threads logging through one Logging instance."""
+    threads = 4
+    per_thread = 2_000 if quick else 20_000
+
+    with _quiet_logger("bench_threads") as logger:
+
+        def produce() -> None:
+            for index in range(per_thread):
+                logger.logged_statement(
+                    f"item {index}", context_marker="sync", log_level="info"
+                )
+
+        def run() -> None:
+            workers = [threading.Thread(target=produce) for _ in range(threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        return _per_item(measure(run, number=1, repeat=3), threads * per_thread)
+
+
+@case("macro.exit_run.records")
+def bench_exit_run_records(quick: bool) -> dict[str, float]:
+    """``exit_run`` over a million results with ``unhump_results``."""
+    count = 10_000 if quick else 1_000_000
+    results = make_results(count)
+    logger = Logging(enable_console=False, enable_file=False)
+
+    def run() -> None:
+        logger.exit_run(results, unhump_results=True, exit_on_completion=False)
+
+    with _in_temp_dir():
+        return _per_item(
+            measure(run, number=1, repeat=1 if count > SINGLE_RUN_THRESHOLD else 3),
+            count,
+        )
+
+
+@case("macro.workload.replay")
+def bench_workload_replay(quick: bool) -> dict[str, float]:
+    """Replay a synthetic statement mix through ``logged_statement``."""
+    statements = make_statements(5_000 if quick else 50_000)
+
+    with _quiet_logger("bench_workload") as logger:
+
+        def replay() -> None:
+            for statement in statements:
+                logger.logged_statement(**statement)
+
+        return _per_item(measure(replay, number=1, repeat=3), len(statements))
+
+
+def run_suite(
+    patterns: list[str] | None = None,
+    quick: bool = False,
+) -> dict[str, dict[str, float]]:
+    """Run every registered case matching one of ``patterns``.
+
+    Args:
+        patterns: Shell-style patterns matched against case names. All cases
+            run when omitted.
+        quick: Whether to run the scaled-down inputs.
+
+    Returns:
+        dict[str, dict[str, float]]: Statistics per case name.
+    """
+    results: dict[str, dict[str, float]] = {}
+    for name, func in CASES.items():
+        if patterns and not any(fnmatch.fnmatch(name, p) for p in patterns):
+            continue
+        if quick and name.startswith("micro.add_json_data."):
+            size = PAYLOAD_SIZES[name.rsplit(".", 1)[1]]
+            if size > QUICK_PAYLOAD_LIMIT:
+                continue
+        results[name] = func(quick)
+    return results
+
+
+def suite_document(
+    results: dict[str, dict[str, float]],
+    quick: bool,
+) -> dict[str, Any]:
+    """Wrap suite results with the metadata stored alongside baselines.
+
+    Args:
+        results: Statistics per case name.
+        quick: Whether the quick inputs were used.
+
+    Returns:
+        dict[str, Any]: The document written by ``run --output``.
+    """
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "quick": quick,
+            "timestamp": int(time.time()),
+        },
+        "results": results,
+    }
+
+
+def print_results(results: dict[str, dict[str, float]]) -> None:
+    """Print suite results grouped into micro and macro tables.
+
+    Args:
+        results: Statistics per case name.
+    """
+    for group in ("micro", "macro"):
+        rows = {
+            name: stats for name, stats in results.items() if name.startswith(group)
+        }
+        if rows:
+            print_table(f"{group} benchmarks", rows)
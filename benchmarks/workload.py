@@ -0,0 +1,130 @@
+"""Synthetic workloads for the benchmark suite.
+
+The generators are deterministic for a given seed so runs stay comparable
+across machines and commits. Run ``python -m benchmarks.workload`` to write a
+statement workload as JSON lines for use outside the suite.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+# Approximate serialized size of one record from ``_payload_record``
+_RECORD_BYTES = 256
+
+# Share of generated statements per kind: suppressed by verbosity, plain,
+# carrying a payload, and warnings stored under a marker
+STATEMENT_MIX: dict[str, float] = {
+    "suppressed": 0.6,
+    "plain": 0.25,
+    "payload": 0.1,
+    "stored_warning": 0.05,
+}
+
+_MARKERS = ("setup", "sync", "reconcile", "teardown")
+
+
+def _payload_record(rng: random.Random, index: int) -> dict[str, Any]:
+    return {
+        "resourceId": f"res-{index:08d}",
+        "accountName": f"account-{rng.randrange(1000):04d}",
+        "regionName": rng.choice(("us-east-1", "eu-west-1", "ap-south-1")),
+        "sizeBytes": rng.randrange(1 << 30),
+        "isEnabled": rng.random() < 0.5,  # noqa: PLR2004
+        "tagList": [f"tag-{rng.randrange(100)}" for _ in range(3)],
+        "nestedConfig": {"retryCount": rng.randrange(5), "timeoutSeconds": 30},
+        "description": "synthetic resource " * 4,
+    }
+
+
+def make_payload(size_bytes: int, seed: int = 0) -> dict[str, Any]:
+    """Build a payload whose JSON form is roughly ``size_bytes`` long.
+
+    Args:
+        size_bytes: Target serialized size in bytes.
+        seed: Random seed.
+
+    Returns:
+        dict[str, Any]: A mapping of resource ids to resource records.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    count = max(1, size_bytes // _RECORD_BYTES)
+    return {f"res-{index:08d}": _payload_record(rng, index) for index in range(count)}
+
+
+def make_results(count: int, seed: int = 0) -> dict[str, dict[str, Any]]:
+    """Build ``exit_run`` results with camelCase keys at two levels.
+
+    Args:
+        count: Number of top-level results.
+        seed: Random seed.
+
+    Returns:
+        dict[str, dict[str, Any]]: The results.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    return {f"resource{index}": _payload_record(rng, index) for index in range(count)}
+
+
+def make_statements(count: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Build ``logged_statement`` keyword arguments following ``STATEMENT_MIX``.
+
+    Args:
+        count: Number of statements.
+        seed: Random seed.
+
+    Returns:
+        list[dict[str, Any]]: One mapping of keyword arguments per statement.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    kinds = list(STATEMENT_MIX)
+    weights = list(STATEMENT_MIX.values())
+    statements: list[dict[str, Any]] = []
+    for index, kind in enumerate(rng.choices(kinds, weights, k=count)):
+        statement: dict[str, Any] = {
+            "msg": f"Processed item {index}",
+            "context_marker": rng.choice(_MARKERS),
+            "log_level": "info",
+        }
+        if kind == "suppressed":
+            statement.update(verbose=True, verbosity=2, log_level="debug")
+        elif kind == "payload":
+            statement["json_data"] = _payload_record(rng, index)
+        elif kind == "stored_warning":
+            statement.update(log_level="warning", storage_marker="warnings")
+        statements.append(statement)
+    return statements
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Write a statement workload as JSON lines.
+
+    Args:
+        argv: Command line arguments, defaulting to ``sys.argv``.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--statements", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="defaults to stdout")
+    args = parser.parse_args(argv)
+
+    lines = b"".join(
+        orjson.dumps(statement) + b"\n"
+        for statement in make_statements(args.statements, args.seed)
+    )
+    if args.output:
+        args.output.write_bytes(lines)
+    else:
+        sys.stdout.buffer.write(lines)
+
+
+if __name__ == "__main__":
+    main()
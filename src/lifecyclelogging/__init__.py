@@ -9,7 +9,44 @@ from __future__ import annotations
 
 __version__ = "0.2.1"
 
-from lifecyclelogging.logging import ExitRunError, KeyTransform, Logging
+from lifecyclelogging.adaptive import AdaptiveVerbosity
+from lifecyclelogging.artifacts import ArtifactStore
+from lifecyclelogging.bound import BoundLogging
+from lifecyclelogging.cache import PayloadCache
+from lifecyclelogging.config import ConfigWatcher, LoggingConfig
+from lifecyclelogging.flight import FlightRecorder
+from lifecyclelogging.limits import PayloadLimits
+from lifecyclelogging.logging import ExitRunError, Logging
+from lifecyclelogging.otlp import OTLPLogHandler
+from lifecyclelogging.spans import Span, SpanRecord
+from lifecyclelogging.storage import (
+    MemoryStorageBackend,
+    SQLiteStorageBackend,
+    StorageBackend,
+)
+from lifecyclelogging.syslog import NetworkSyslogHandler
+from lifecyclelogging.transforms import KeyPatternSet, KeyTransform, KeyTransformer
 
 
-__all__ = ["ExitRunError", "KeyTransform", "Logging"]
+__all__ = [
+    "AdaptiveVerbosity",
+    "ArtifactStore",
+    "BoundLogging",
+    "ConfigWatcher",
+    "ExitRunError",
+    "FlightRecorder",
+    "KeyPatternSet",
+    "KeyTransform",
+    "KeyTransformer",
+    "Logging",
+    "LoggingConfig",
+    "MemoryStorageBackend",
+    "NetworkSyslogHandler",
+    "OTLPLogHandler",
+    "PayloadCache",
+    "PayloadLimits",
+    "SQLiteStorageBackend",
+    "Span",
+    "SpanRecord",
+    "StorageBackend",
+]
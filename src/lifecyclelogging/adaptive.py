@@ -0,0 +1,200 @@
+"""Load-aware adjustment of the verbosity threshold.
+
+``AdaptiveVerbosity`` watches the statements ``Logging`` emits, in windows of
+``window`` seconds: how many were emitted per second, how long handlers took
+to emit each one, and how many records buffering handlers have queued. When
+any signal is over its limit at the end of a window, the effective verbosity
+threshold drops one step, down to ``floor``. It only rises again, one step at
+a time up to ``ceiling``, after ``recover_windows`` consecutive windows with
+every signal below ``recover_ratio`` of its limit. The gap between the limits
+and the time spent calm keep the threshold from oscillating around a limit.
+
+Only the verbosity threshold changes, so statements with a verbosity bypass
+marker and statements at verbosity 1 are never suppressed by adaptation.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class VerbosityChange:
+    """A change of the effective verbosity threshold.
+
+    Attributes:
+        previous: The threshold before the change.
+        threshold: The new threshold.
+        reason: ``pressure`` when lowered, ``recovered`` when raised.
+        rate: Statements emitted per second in the last window.
+        latency_ms: Mean handler latency per statement in milliseconds.
+        queue_depth: Records queued by buffering handlers.
+    """
+
+    previous: int
+    threshold: int
+    reason: str
+    rate: float
+    latency_ms: float
+    queue_depth: float
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the change as a dictionary."""
+        return asdict(self)
+
+
+class AdaptiveVerbosity:
+    """Lowers the verbosity threshold under logging pressure and restores it."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        ceiling: int,
+        floor: int = 1,
+        max_rate: float | None = 5000.0,
+        max_latency: float | None = 0.001,
+        max_queue_depth: float | None = 1000.0,
+        window: float = 1.0,
+        recover_ratio: float = 0.5,
+        recover_windows: int = 3,
+        queue_depth: Callable[[], float] | None = None,
+        on_change: Callable[[VerbosityChange], None] | None = None,
+    ) -> None:
+        """Initialize the controller at its ceiling.
+
+        Args:
+            ceiling: Highest threshold, restored once load drops.
+            floor: Lowest threshold adaptation goes down to.
+            max_rate: Statements per second above which the threshold drops.
+                None ignores throughput.
+            max_latency: Mean handler latency per statement, in seconds,
+                above which the threshold drops. None ignores latency.
+            max_queue_depth: Queued records above which the threshold drops.
+                None ignores queue depth.
+            window: Length of an evaluation window in seconds.
+            recover_ratio: Fraction of each limit every signal must stay
+                below for a window to count as calm.
+            recover_windows: Consecutive calm windows before the threshold
+                rises one step. Idle time counts as calm.
+            queue_depth: Returns the records currently queued by handlers.
+            on_change: Called with each ``VerbosityChange``.
+
+        Raises:
+            ValueError: If the floor, ceiling or window settings are invalid.
+        """
+        if floor < 1 or ceiling < floor:
+            error_message = "Adaptive verbosity needs 1 <= floor <= ceiling"
+            raise ValueError(error_message)
+        if window <= 0 or recover_windows < 1 or not 0 < recover_ratio <= 1:
+            error_message = (
+                "Adaptive verbosity needs a positive window, recover_windows "
+                "of at least 1 and recover_ratio in (0, 1]"
+            )
+            raise ValueError(error_message)
+
+        self.ceiling = ceiling
+        self.floor = floor
+        self.max_rate = max_rate
+        self.max_latency = max_latency
+        self.max_queue_depth = max_queue_depth
+        self.window = window
+        self.recover_ratio = recover_ratio
+        self.recover_windows = recover_windows
+        self.queue_depth = queue_depth
+        self.on_change = on_change
+        self.threshold = ceiling
+        self.changes = 0
+        self._window_ns = int(window * 1e9)
+        self._window_start: int | None = None
+        self._count = 0
+        self._latency_ns = 0
+        self._calm_windows = 0
+        self._lock = threading.Lock()
+
+    def observe(self, latency_ns: int, now_ns: int, count: int = 1) -> None:
+        """Record emitted statements and evaluate the window when it ends.
+
+        Args:
+            latency_ns: Time the handlers took to emit the statements.
+            now_ns: The current ``time.perf_counter_ns()``.
+            count: Number of statements emitted.
+        """
+        with self._lock:
+            self._count += count
+            self._latency_ns += latency_ns
+            if self._window_start is None:
+                self._window_start = now_ns - latency_ns
+                return
+            if now_ns - self._window_start < self._window_ns:
+                return
+            change = self._evaluate(now_ns)
+
+        # Outside the lock: the callback logs, which observes again
+        if change is not None and self.on_change is not None:
+            self.on_change(change)
+
+    def _evaluate(self, now_ns: int) -> VerbosityChange | None:
+        """Close the current window and adjust the threshold; needs the lock."""
+        start = self._window_start
+        if start is None:
+            return None
+        elapsed = (now_ns - start) / 1e9
+        count, latency_ns = self._count, self._latency_ns
+        self._window_start, self._count, self._latency_ns = now_ns, 0, 0
+
+        rate = count / elapsed
+        latency = latency_ns / count / 1e9 if count else 0.0
+        depth = self.queue_depth() if self.queue_depth is not None else 0.0
+        return self._adjust(elapsed, rate, latency, depth)
+
+    @staticmethod
+    def _over(value: float, limit: float | None, ratio: float = 1.0) -> bool:
+        return limit is not None and value > limit * ratio
+
+    def _adjust(
+        self,
+        elapsed: float,
+        rate: float,
+        latency: float,
+        depth: float,
+    ) -> VerbosityChange | None:
+        signals = (
+            (rate, self.max_rate),
+            (latency, self.max_latency),
+            (depth, self.max_queue_depth),
+        )
+        previous = self.threshold
+        if any(self._over(value, limit) for value, limit in signals):
+            self._calm_windows = 0
+            if self.threshold <= self.floor:
+                return None
+            self.threshold -= 1
+            reason = "pressure"
+        elif any(
+            self._over(value, limit, self.recover_ratio) for value, limit in signals
+        ):
+            self._calm_windows = 0
+            return None
+        else:
+            # Windows without traffic are stretched, so count each one
+            self._calm_windows += max(1, int(elapsed / self.window))
+            if (
+                self._calm_windows < self.recover_windows
+                or self.threshold >= self.ceiling
+            ):
+                return None
+            self._calm_windows = 0
+            self.threshold += 1
+            reason = "recovered"
+
+        self.changes += 1
+        return VerbosityChange(
+            previous=previous,
+            threshold=self.threshold,
+            reason=reason,
+            rate=round(rate, 1),
+            latency_ms=round(latency * 1000, 3),
+            queue_depth=depth,
+        )
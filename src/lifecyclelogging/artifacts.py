@@ -0,0 +1,414 @@
+"""Content-addressed store for results artifacts.
+
+Scheduled runs often produce exactly the results of the previous run.
+``ArtifactStore`` saves each artifact once, compressed, under the SHA-256
+digest of its canonical bytes, and records per run which digest each
+artifact name had. An artifact whose content is already stored costs a hash
+and a small manifest update instead of a full file write.
+
+Layout under the store root::
+
+    objects/<first two hex digits>/<digest>[.gz|.zst]
+    runs/<run id>.json
+
+JSON artifacts are canonicalized with sorted keys before hashing, so results
+that differ only in key order share one object. Objects and manifests are
+written to a temporary file and renamed into place, so readers never see a
+partial file. ``prune`` drops the manifests of old runs and then every object
+no remaining manifest references.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as dt
+import gzip
+import hashlib
+import os
+import shutil
+import threading
+import time
+
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from lifecyclelogging.log_types import LogCompression
+from lifecyclelogging.writers import _export_default, temporary_file, write_atomic
+
+
+_SUFFIXES: dict[str | None, str] = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+# Objects touched more recently than this are never pruned, so an object a
+# concurrent run is about to reference survives a prune in another process
+_PRUNE_GRACE_SECONDS = 3600.0
+
+_CHUNK_SIZE = 1 << 20
+
+
+def _canonical_default(obj: Any) -> Any:
+    """Convert values like the results file, with sets in a stable order."""
+    if isinstance(obj, (set, frozenset)):
+        try:
+            return sorted(obj)
+        except TypeError:
+            # Mixed element types: order them by their own canonical bytes
+            return sorted(obj, key=canonical_json)
+    return _export_default(obj)
+
+
+def canonical_json(data: Any) -> bytes:
+    """Serialize data to canonical JSON bytes.
+
+    Keys are sorted, sets are sorted, and other values are converted as for
+    the results file, so equal results always produce equal bytes.
+
+    Args:
+        data: The data to serialize.
+
+    Returns:
+        bytes: The canonical JSON document.
+    """
+    return orjson.dumps(
+        data,
+        default=_canonical_default,
+        option=orjson.OPT_SORT_KEYS
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard  # noqa: PLC0415
+    except ImportError as exc:
+        error_message = (
+            "zstd artifact compression requires the optional 'zstandard' "
+            "package: pip install lifecyclelogging[zstd]"
+        )
+        raise ImportError(error_message) from exc
+    return zstandard
+
+
+def _new_run_id() -> str:
+    now = dt.datetime.now(dt.timezone.utc)
+    return f"{now:%Y%m%dT%H%M%S%fZ}-{os.getpid()}"
+
+
+class ArtifactStore:
+    """Deduplicating, compressed store of results artifacts for one run."""
+
+    def __init__(
+        self,
+        root: str | Path = ".lifecyclelogging/artifacts",
+        compression: LogCompression | None = "gzip",
+        keep_runs: int | None = 50,
+        max_age: float | None = None,
+        run_id: str | None = None,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory holding objects and run manifests.
+            compression: Compress new objects with "gzip", "zstd" (needs the
+                ``zstandard`` package) or not at all with None. Objects
+                written with another setting stay readable.
+            keep_runs: Number of most recent run manifests ``prune`` keeps.
+                None keeps any number.
+            max_age: Age in seconds after which ``prune`` drops a run
+                manifest. None keeps runs of any age.
+            run_id: Identifier of the current run. Defaults to a UTC
+                timestamp and the process id, which sort by start time.
+
+        Raises:
+            ValueError: If the compression format or retention is invalid.
+            ImportError: If zstd compression is requested without the
+                ``zstandard`` package.
+        """
+        if compression not in _SUFFIXES:
+            error_message = f"Unknown artifact compression '{compression}'"
+            raise ValueError(error_message)
+        if keep_runs is not None and keep_runs < 1:
+            error_message = "keep_runs must be at least 1"
+            raise ValueError(error_message)
+        if compression == "zstd":
+            _zstandard()
+
+        self.root = Path(root)
+        self.compression = compression
+        self.keep_runs = keep_runs
+        self.max_age = max_age
+        self.run_id = run_id or _new_run_id()
+        self.created = time.time()
+        self.objects_written = 0
+        self.objects_reused = 0
+        self._artifacts: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def objects_dir(self) -> Path:
+        """Path: Directory holding the stored objects."""
+        return self.root / "objects"
+
+    @property
+    def runs_dir(self) -> Path:
+        """Path: Directory holding one manifest per run."""
+        return self.root / "runs"
+
+    def _object_path(self, digest: str, compression: str | None) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}{_SUFFIXES[compression]}"
+
+    def _find_object(self, digest: str) -> Path | None:
+        for compression in _SUFFIXES:
+            path = self._object_path(digest, compression)
+            if path.exists():
+                return path
+        return None
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "gzip":
+            return gzip.compress(data, compresslevel=6, mtime=0)
+        if self.compression == "zstd":
+            return bytes(_zstandard().ZstdCompressor(level=3).compress(data))
+        return data
+
+    def put(self, name: str, data: bytes, content_type: str = "json") -> str:
+        """Store an artifact for the current run.
+
+        The object is only written when no artifact with the same digest is
+        stored yet; otherwise its modification time is refreshed.
+
+        Args:
+            name: Artifact name, such as ``results.json``.
+            data: The canonical artifact bytes.
+            content_type: Format of the bytes, recorded in the manifest.
+
+        Returns:
+            str: The SHA-256 hex digest of ``data``.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        existing = self._find_object(digest)
+        if existing is None:
+            stored = self._compress(data)
+            write_atomic(self._object_path(digest, self.compression), stored)
+            return self._add(name, digest, len(data), len(stored), content_type)
+        return self._reuse(name, digest, existing, len(data), content_type)
+
+    def put_file(self, name: str, path: str | Path, content_type: str = "json") -> str:
+        """Store a file's contents as an artifact for the current run.
+
+        Like ``put``, but the file is read in chunks, so large artifacts
+        written incrementally are never held in memory. The file itself is
+        left in place.
+
+        Args:
+            name: Artifact name, such as ``results.ndjson``.
+            path: The file holding the artifact bytes.
+            content_type: Format of the bytes, recorded in the manifest.
+
+        Returns:
+            str: The SHA-256 hex digest of the file's contents.
+        """
+        path = Path(path)
+        hasher = hashlib.sha256()
+        with path.open("rb") as source:
+            for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        size = path.stat().st_size
+
+        existing = self._find_object(digest)
+        if existing is not None:
+            return self._reuse(name, digest, existing, size, content_type)
+
+        object_path = self._object_path(digest, self.compression)
+        with (
+            temporary_file(object_path) as (target, tmp_path),
+            path.open("rb") as source,
+        ):
+            if self.compression == "gzip":
+                # An empty filename keeps the temporary name out of the header
+                with gzip.GzipFile(
+                    "", "wb", compresslevel=6, fileobj=target, mtime=0
+                ) as compressed:
+                    shutil.copyfileobj(source, compressed, _CHUNK_SIZE)
+            elif self.compression == "zstd":
+                _zstandard().ZstdCompressor(level=3).copy_stream(
+                    source, target, size=size
+                )
+            else:
+                shutil.copyfileobj(source, target, _CHUNK_SIZE)
+        stored_size = tmp_path.stat().st_size
+        tmp_path.replace(object_path)
+        return self._add(name, digest, size, stored_size, content_type)
+
+    def _reuse(
+        self, name: str, digest: str, existing: Path, size: int, content_type: str
+    ) -> str:
+        with contextlib.suppress(OSError):
+            os.utime(existing)
+        return self._add(
+            name, digest, size, existing.stat().st_size, content_type, written=False
+        )
+
+    def _add(  # noqa: PLR0913
+        self,
+        name: str,
+        digest: str,
+        size: int,
+        stored_size: int,
+        content_type: str,
+        *,
+        written: bool = True,
+    ) -> str:
+        with self._lock:
+            if written:
+                self.objects_written += 1
+            else:
+                self.objects_reused += 1
+            self._artifacts[name] = {
+                "digest": digest,
+                "size": size,
+                "stored_size": stored_size,
+                "content_type": content_type,
+                "reused": not written,
+            }
+            self._write_manifest()
+        return digest
+
+    def put_json(self, name: str, data: Any) -> str:
+        """Store data as a canonical JSON artifact.
+
+        Args:
+            name: Artifact name.
+            data: The data to serialize.
+
+        Returns:
+            str: The SHA-256 hex digest of the canonical JSON.
+        """
+        return self.put(name, canonical_json(data))
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "run_id": self.run_id,
+            "created": self.created,
+            "artifacts": self._artifacts,
+        }
+        write_atomic(
+            self.runs_dir / f"{self.run_id}.json",
+            orjson.dumps(manifest, option=orjson.OPT_INDENT_2),
+        )
+
+    def runs(self) -> list[str]:
+        """Return the ids of stored runs, oldest first."""
+        if not self.runs_dir.is_dir():
+            return []
+        return sorted(path.stem for path in self.runs_dir.glob("*.json"))
+
+    def manifest(self, run_id: str | None = None) -> dict[str, Any]:
+        """Return a run's manifest.
+
+        Args:
+            run_id: The run to read. Defaults to the most recent run.
+
+        Returns:
+            dict[str, Any]: The manifest, with ``run_id``, ``created`` and
+            ``artifacts`` mapping names to digests and sizes.
+
+        Raises:
+            FileNotFoundError: If the run, or any run, does not exist.
+        """
+        if run_id is None:
+            runs = self.runs()
+            if not runs:
+                error_message = f"No runs stored in {self.root}"
+                raise FileNotFoundError(error_message)
+            run_id = runs[-1]
+        manifest: dict[str, Any] = orjson.loads(
+            (self.runs_dir / f"{run_id}.json").read_bytes()
+        )
+        return manifest
+
+    def get(self, digest: str) -> bytes:
+        """Return the decompressed bytes of a stored object.
+
+        Args:
+            digest: The object's SHA-256 hex digest.
+
+        Returns:
+            bytes: The artifact bytes.
+
+        Raises:
+            FileNotFoundError: If no object has the digest.
+        """
+        path = self._find_object(digest)
+        if path is None:
+            error_message = f"No artifact with digest {digest} in {self.root}"
+            raise FileNotFoundError(error_message)
+        if path.suffix == ".gz":
+            return gzip.decompress(path.read_bytes())
+        if path.suffix == ".zst":
+            return bytes(_zstandard().ZstdDecompressor().decompress(path.read_bytes()))
+        return path.read_bytes()
+
+    def read(self, name: str, run_id: str | None = None) -> bytes:
+        """Return the bytes an artifact had in a run.
+
+        Args:
+            name: Artifact name.
+            run_id: The run to read. Defaults to the most recent run.
+
+        Returns:
+            bytes: The artifact bytes.
+
+        Raises:
+            FileNotFoundError: If the run or artifact does not exist.
+        """
+        artifacts = self.manifest(run_id)["artifacts"]
+        if name not in artifacts:
+            error_message = f"No artifact named {name} in run {run_id or 'latest'}"
+            raise FileNotFoundError(error_message)
+        return self.get(artifacts[name]["digest"])
+
+    def prune(self) -> list[str]:
+        """Apply the retention policy.
+
+        Drops manifests beyond ``keep_runs`` or older than ``max_age``, never
+        the current run's, then deletes objects no remaining manifest
+        references.
+
+        Returns:
+            list[str]: The ids of the pruned runs.
+        """
+        runs = [run for run in self.runs() if run != self.run_id]
+        keep = len(runs) if self.keep_runs is None else self.keep_runs - 1
+        pruned = runs[: max(0, len(runs) - keep)]
+        if self.max_age is not None:
+            cutoff = time.time() - self.max_age
+            for run in runs[len(pruned) :]:
+                path = self.runs_dir / f"{run}.json"
+                with contextlib.suppress(OSError):
+                    if path.stat().st_mtime < cutoff:
+                        pruned.append(run)
+
+        for run in pruned:
+            with contextlib.suppress(FileNotFoundError):
+                (self.runs_dir / f"{run}.json").unlink()
+
+        referenced: set[str] = set()
+        for run in self.runs():
+            with contextlib.suppress(OSError, orjson.JSONDecodeError):
+                for artifact in self.manifest(run)["artifacts"].values():
+                    referenced.add(artifact["digest"])
+
+        if self.objects_dir.is_dir():
+            grace_cutoff = time.time() - _PRUNE_GRACE_SECONDS
+            for path in self.objects_dir.glob("*/*"):
+                digest = path.name.split(".", 1)[0]
+                if digest in referenced or path.name.startswith("."):
+                    continue
+                with contextlib.suppress(OSError):
+                    if path.stat().st_mtime < grace_cutoff:
+                        path.unlink()
+        return pruned
@@ -0,0 +1,162 @@
+"""Lightweight child loggers with bound context.
+
+``Logging.bind`` returns a ``BoundLogging`` that shares its parent's state
+outright: the same attribute dictionary, so the same logger and handlers,
+configuration, stored messages, error list and instrumentation, and any later
+change to one is seen by the other. Creating a child runs none of
+``Logging.__init__``; it renders the bound ``[marker] `` prefix and
+`` (ids)`` suffix once and reuses them for every statement that uses the
+bound values.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import Any
+
+from lifecyclelogging.log_types import LogLevel
+from lifecyclelogging.logging import FORWARDING_CODES, Logging
+from lifecyclelogging.utils import MessageBuilder
+
+
+class BoundLogging(Logging):
+    """A ``Logging`` view with a bound context marker, identifiers and storage marker.
+
+    Arguments passed explicitly to ``logged_statement`` or ``logged_statements``
+    override the bound values.
+    """
+
+    __slots__ = (
+        "_prefix",
+        "_suffix",
+        "bound_context_marker",
+        "bound_identifiers",
+        "bound_storage_marker",
+    )
+
+    def __init__(
+        self,
+        parent: Logging,
+        context_marker: str | None = None,
+        identifiers: Sequence[str] | None = None,
+        storage_marker: str | None = None,
+    ) -> None:
+        """Bind context to a view of ``parent``.
+
+        Args:
+            parent: The instance whose state the child shares.
+            context_marker: Context marker for statements that pass none.
+            identifiers: Identifiers for statements that pass none.
+            storage_marker: Storage marker for statements that pass none.
+        """
+        self.__dict__ = parent.__dict__
+        self.bound_context_marker = context_marker
+        self.bound_identifiers = tuple(identifiers) if identifiers else None
+        self.bound_storage_marker = storage_marker
+        self._prefix = f"[{context_marker}] " if context_marker is not None else ""
+        self._suffix = (
+            " (" + ", ".join(self.bound_identifiers) + ")"
+            if self.bound_identifiers
+            else ""
+        )
+
+    def bind(
+        self,
+        context_marker: str | None = None,
+        identifiers: Sequence[str] | None = None,
+        storage_marker: str | None = None,
+    ) -> BoundLogging:
+        """Return a child with more context bound; unset fields are inherited.
+
+        Args:
+            context_marker: Context marker replacing the bound one.
+            identifiers: Identifiers replacing the bound ones.
+            storage_marker: Storage marker replacing the bound one.
+
+        Returns:
+            BoundLogging: The new child, sharing the same state.
+        """
+        return BoundLogging(
+            self,
+            self.bound_context_marker if context_marker is None else context_marker,
+            self.bound_identifiers if identifiers is None else identifiers,
+            self.bound_storage_marker if storage_marker is None else storage_marker,
+        )
+
+    def _prepare_segments(
+        self,
+        msg: str,
+        context_marker: str | None,
+        identifiers: Sequence[str] | None,
+    ) -> MessageBuilder:
+        """Reuse the pre-rendered fragments when the bound values are used."""
+        if (
+            context_marker == self.bound_context_marker
+            and identifiers is self.bound_identifiers
+        ):
+            if context_marker is not None:
+                self.current_context_marker = context_marker
+            return MessageBuilder(self._prefix, msg, self._suffix)
+        return super()._prepare_segments(msg, context_marker, identifiers)
+
+    def logged_statement(  # noqa: PLR0913
+        self,
+        msg: str,
+        json_data: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
+        labeled_json_data: Mapping[str, Mapping[str, Any]] | None = None,
+        identifiers: Sequence[str] | None = None,
+        verbose: bool = False,
+        verbosity: int = 1,
+        context_marker: str | None = None,
+        log_level: LogLevel = "debug",
+        storage_marker: str | None = None,
+        allowed_levels: Sequence[str] | None = None,
+        denied_levels: Sequence[str] | None = None,
+        payload_cache_key: Hashable | None = None,
+    ) -> str | None:
+        """Log a statement, filling in the bound context.
+
+        See ``Logging.logged_statement`` for the arguments.
+        """
+        return super().logged_statement(
+            msg,
+            json_data,
+            labeled_json_data,
+            self.bound_identifiers if identifiers is None else identifiers,
+            verbose,
+            verbosity,
+            self.bound_context_marker if context_marker is None else context_marker,
+            log_level,
+            self.bound_storage_marker if storage_marker is None else storage_marker,
+            allowed_levels,
+            denied_levels,
+            payload_cache_key,
+        )
+
+    def logged_statements(
+        self,
+        records: Iterable[Mapping[str, Any]],
+        **defaults: Any,
+    ) -> list[str | None]:
+        """Log many statements, filling in the bound context.
+
+        See ``Logging.logged_statements`` for the arguments.
+        """
+        bound = {
+            field: value
+            for field, value in (
+                ("context_marker", self.bound_context_marker),
+                ("identifiers", self.bound_identifiers),
+                ("storage_marker", self.bound_storage_marker),
+            )
+            if value is not None
+        }
+        return super().logged_statements(records, **{**bound, **defaults})
+
+
+FORWARDING_CODES.update(
+    {
+        BoundLogging.logged_statement.__code__,
+        BoundLogging.logged_statements.__code__,
+    }
+)
@@ -0,0 +1,147 @@
+"""Cache of rendered payload text for payloads that are logged repeatedly.
+
+Logging the same large configuration or inventory object on every iteration
+re-sanitizes and re-serializes it each time. ``PayloadCache`` keeps the
+rendered text in a bounded LRU so a repeated payload costs a lookup and a
+string concatenation.
+
+Entries are keyed either by an explicit caller-supplied key or by the payload's
+identity. Identity-keyed entries are validated with a cheap fingerprint of the
+payload's top level (its keys and the identities of its values), so replacing
+a top-level value invalidates the entry. In-place changes deeper inside the
+payload are not detected; pass an explicit key that changes with the data
+(for example a version number) for payloads that are mutated that way.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping, Sequence
+from typing import Any, Callable
+
+
+class _CacheEntry:
+    """A rendered payload and what is needed to validate it."""
+
+    __slots__ = ("fingerprint", "payload", "text")
+
+    def __init__(self, payload: Any, fingerprint: int, text: str) -> None:
+        self.payload = payload
+        self.fingerprint = fingerprint
+        self.text = text
+
+
+def _fingerprint(data: Any) -> int:
+    """Return a cheap fingerprint of a payload's top level."""
+    if isinstance(data, Mapping):
+        return hash((len(data), tuple(data), tuple(map(id, data.values()))))
+    if isinstance(data, Sequence) and not isinstance(data, (str, bytes)):
+        return hash((len(data), tuple(map(id, data))))
+    return id(data)
+
+
+class PayloadCache:
+    """Bounded LRU cache of rendered payload text with a byte budget."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached payloads.
+            max_bytes: Maximum total size of cached text, counted in
+                characters. Payloads larger than this are never cached.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+
+    def render(
+        self,
+        data: Any,
+        render: Callable[[], str],
+        key: Hashable | None = None,
+        variant: Hashable = None,
+    ) -> str:
+        """Return the rendered text for a payload, rendering it on a miss.
+
+        Args:
+            data: The payload being rendered.
+            render: Callable producing the rendered text on a cache miss.
+            key: Optional explicit cache key. When omitted, the payload's
+                identity and top-level fingerprint are used.
+            variant: Anything else the rendered text depends on, such as a
+                label or the payload limits in effect.
+
+        Returns:
+            str: The rendered payload text.
+        """
+        if key is not None:
+            cache_key: Hashable = ("key", key, variant)
+            payload = None
+            fingerprint = 0
+        else:
+            cache_key = ("id", id(data), variant)
+            payload = data
+            fingerprint = _fingerprint(data)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if (
+                entry is not None
+                and entry.payload is payload
+                and entry.fingerprint == fingerprint
+            ):
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry.text
+            self.misses += 1
+
+        text = render()
+        if len(text) > self.max_bytes:
+            return text
+
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self._size -= len(previous.text)
+            self._entries[cache_key] = _CacheEntry(payload, fingerprint, text)
+            self._size += len(text)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._size > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.text)
+                self.evictions += 1
+        return text
+
+    def clear(self) -> None:
+        """Remove every cached payload."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return cache statistics.
+
+        Returns:
+            dict[str, int]: Hits, misses, evictions, entries and cached size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
@@ -0,0 +1,312 @@
+"""Runtime configuration snapshots and a control-file watcher.
+
+``Logging`` keeps the settings its statements are filtered by in one frozen
+``LoggingConfig``. ``Logging.reconfigure`` builds a new snapshot and swaps it
+in with a single attribute assignment, so a statement reads either the old
+settings or the new ones, never a mix, without taking a lock, and the next
+statement after ``reconfigure`` returns sees the change. Handlers are left
+attached throughout, so no record is dropped while settings change.
+
+``MarkerOverride`` entries turn on detailed logging for one context marker
+until they expire. ``ConfigWatcher`` applies a JSON control file whenever it
+changes, polled on a background thread or reloaded on a signal.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import logging
+import signal
+import threading
+import time
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType, MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+
+if TYPE_CHECKING:
+    from lifecyclelogging.logging import Logging
+
+
+@dataclass(frozen=True)
+class MarkerOverride:
+    """Detailed logging for one context marker until it expires.
+
+    Statements with the marker skip the verbosity check and are emitted at
+    ``levelno`` and above even when the logger's level is higher.
+
+    Attributes:
+        levelno: Lowest level emitted for the marker.
+        expires_at: ``time.monotonic()`` deadline, or None to never expire.
+    """
+
+    levelno: int = logging.DEBUG
+    expires_at: float | None = None
+
+    def active(self) -> bool:
+        """Return whether the override has not expired yet."""
+        return self.expires_at is None or time.monotonic() < self.expires_at
+
+
+@dataclass(frozen=True)
+class LoggingConfig:
+    """Immutable snapshot of the settings statements are filtered by.
+
+    Attributes:
+        verbosity_threshold: Maximum verbosity level displayed.
+        enable_verbose_output: Whether verbose statements are allowed.
+        allowed_levels: Normalized levels allowed into storage.
+        denied_levels: Normalized levels denied from storage.
+        default_storage_marker: Storage marker for statements without one.
+        marker_overrides: Active ``MarkerOverride`` per context marker.
+    """
+
+    verbosity_threshold: int = 1
+    enable_verbose_output: bool = False
+    allowed_levels: tuple[str, ...] = ()
+    denied_levels: tuple[str, ...] = ()
+    default_storage_marker: str | None = None
+    marker_overrides: Mapping[str, MarkerOverride] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    def replace(self, **changes: Any) -> LoggingConfig:
+        """Return a copy with some settings changed.
+
+        The new values are validated first, so a bad value leaves no
+        snapshot behind. Level filters are normalized to lower case, and
+        expired marker overrides are dropped from the copy.
+
+        Args:
+            **changes: New values for ``LoggingConfig`` fields.
+
+        Returns:
+            LoggingConfig: The new snapshot.
+
+        Raises:
+            TypeError: If a value has the wrong type.
+            ValueError: If a value is out of range.
+        """
+        validate_settings(changes)
+        for field_name in ("allowed_levels", "denied_levels"):
+            if field_name in changes:
+                changes[field_name] = tuple(
+                    level.lower() for level in changes[field_name] or ()
+                )
+        overrides = changes.get("marker_overrides", self.marker_overrides)
+        changes["marker_overrides"] = MappingProxyType(
+            {
+                marker: override
+                for marker, override in overrides.items()
+                if override.active()
+            }
+        )
+        return dataclasses.replace(self, **changes)
+
+    def override_for(self, context_marker: str | None) -> MarkerOverride | None:
+        """Return the active override for a context marker, if any."""
+        if not self.marker_overrides or context_marker is None:
+            return None
+        override = self.marker_overrides.get(context_marker)
+        if override is None or not override.active():
+            return None
+        return override
+
+
+def check_strings(name: str, value: Any) -> None:
+    """Check that a setting is a sequence of strings, not a bare string.
+
+    Args:
+        name: The setting's name, for the error message.
+        value: The value to check.
+
+    Raises:
+        TypeError: If the value is a string or holds anything but strings.
+    """
+    if (
+        isinstance(value, (str, bytes))
+        or not isinstance(value, Sequence)
+        or not all(isinstance(item, str) for item in value)
+    ):
+        error_message = f"{name} must be a list of strings, got {value!r}"
+        raise TypeError(error_message)
+
+
+def validate_settings(settings: Mapping[str, Any]) -> None:
+    """Check the types and ranges of new ``LoggingConfig`` values.
+
+    Args:
+        settings: New values by field name.
+
+    Raises:
+        TypeError: If a value has the wrong type.
+        ValueError: If a value is out of range.
+    """
+    if "verbosity_threshold" in settings:
+        threshold = settings["verbosity_threshold"]
+        if isinstance(threshold, bool) or not isinstance(threshold, int):
+            error_message = f"verbosity_threshold must be an integer, got {threshold!r}"
+            raise TypeError(error_message)
+        if threshold < 1:
+            error_message = f"verbosity_threshold must be at least 1, got {threshold}"
+            raise ValueError(error_message)
+    if "enable_verbose_output" in settings and not isinstance(
+        settings["enable_verbose_output"], bool
+    ):
+        error_message = (
+            "enable_verbose_output must be a boolean, "
+            f"got {settings['enable_verbose_output']!r}"
+        )
+        raise TypeError(error_message)
+    for name in ("allowed_levels", "denied_levels"):
+        if settings.get(name) is not None:
+            check_strings(name, settings[name])
+    marker = settings.get("default_storage_marker")
+    if marker is not None and not isinstance(marker, str):
+        error_message = f"default_storage_marker must be a string, got {marker!r}"
+        raise TypeError(error_message)
+    overrides = settings.get("marker_overrides")
+    if overrides is not None and not (
+        isinstance(overrides, Mapping)
+        and all(
+            isinstance(marker, str) and isinstance(override, MarkerOverride)
+            for marker, override in overrides.items()
+        )
+    ):
+        error_message = "marker_overrides must map markers to MarkerOverride"
+        raise TypeError(error_message)
+
+
+CONFIG_FIELDS: frozenset[str] = frozenset(
+    config_field.name for config_field in dataclasses.fields(LoggingConfig)
+)
+"""frozenset[str]: Settings held in a ``LoggingConfig`` snapshot."""
+
+
+class ConfigWatcher:
+    """Applies a JSON control file to a ``Logging`` instance when it changes.
+
+    The file holds ``Logging.reconfigure`` keyword arguments, for example::
+
+        {"verbosity_threshold": 3, "log_level": "INFO",
+         "debug_markers": {"sync": 300}}
+
+    ``debug_markers`` maps context markers to the number of seconds their
+    override lasts from the time the file is applied. An invalid file is
+    logged as an error and the current settings are kept.
+    """
+
+    def __init__(
+        self,
+        target: Logging,
+        path: str | Path,
+        interval: float | None = 1.0,
+        signum: int | None = None,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            target: The instance to reconfigure.
+            path: The control file.
+            interval: Seconds between checks for a changed file, or None to
+                only reload on ``signum`` or ``reload``.
+            signum: Signal that forces a reload, such as ``signal.SIGHUP``.
+                Signal handlers can only be installed from the main thread;
+                the reload itself runs on the watcher thread.
+        """
+        self.target = target
+        self.path = Path(path)
+        self.interval = interval
+        self.signum = signum
+        self.applied = 0
+        self._mtime_ns: int | None = None
+        self._force = False
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._previous_handler: Any = None
+
+    def reload(self, force: bool = False) -> bool:
+        """Apply the control file if it changed since it was last applied.
+
+        Args:
+            force: Apply the file even if it did not change.
+
+        Returns:
+            bool: True if the file was applied.
+        """
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if not force and mtime_ns == self._mtime_ns:
+            return False
+        self._mtime_ns = mtime_ns
+
+        try:
+            settings = orjson.loads(self.path.read_bytes())
+            if not isinstance(settings, dict):
+                error_message = "the control file must hold a JSON object"
+                raise TypeError(error_message)
+            self.target.reconfigure(**settings)
+        except (OSError, orjson.JSONDecodeError, TypeError, ValueError) as exc:
+            self.target.logger.error(
+                "Invalid logging control file %s: %s", self.path, exc
+            )
+            return False
+
+        self.applied += 1
+        self.target.logger.info("Applied logging control file %s", self.path)
+        return True
+
+    def _on_signal(self, signum: int, frame: FrameType | None) -> None:  # noqa: ARG002
+        # Logging from a signal handler can deadlock on a handler lock the
+        # interrupted code holds, so the reload runs on the watcher thread
+        self._force = True
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                return
+            force, self._force = self._force, False
+            with contextlib.suppress(Exception):
+                self.reload(force=force)
+
+    def start(self) -> ConfigWatcher:
+        """Apply the file now and start watching it.
+
+        Returns:
+            ConfigWatcher: This watcher.
+        """
+        self.reload()
+        if self.signum is not None:
+            self._previous_handler = signal.signal(self.signum, self._on_signal)
+        if self._thread is None and (
+            self.interval is not None or self.signum is not None
+        ):
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="lifecyclelogging-config", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop watching and restore the previous signal handler."""
+        if self.signum is not None and self._previous_handler is not None:
+            signal.signal(self.signum, self._previous_handler)
+            self._previous_handler = None
+        self._stop.set()
+        self._wake.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
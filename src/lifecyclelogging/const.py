@@ -13,3 +13,10 @@ DEFAULT_LOG_LEVEL: int = logging.DEBUG
 
 VERBOSITY: int = 1
 """int: The default verbosity level for logging output."""
+
+STATEMENT_ATTRIBUTE: str = "lifecyclelogging"
+"""str: ``LogRecord`` attribute holding the unrendered parts of a statement.
+
+Set when ``Logging.structured_records`` is enabled, for sinks that export the
+message, markers, identifiers and payloads as separate fields.
+"""
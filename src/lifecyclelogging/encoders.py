@@ -0,0 +1,163 @@
+"""Binary encodings for results: MessagePack and CBOR.
+
+Both formats are optional dependencies (``msgpack`` and ``cbor2``), imported
+only when used. A missing package raises ``ImportError`` naming the extra to
+install.
+
+Values the formats cannot represent natively are handled the way the JSON
+output handles them with ``default=str``, except where the format has a
+standard extension: timezone-aware datetimes use the MessagePack timestamp
+extension and the CBOR datetime tag, and CBOR also tags decimals, UUIDs and
+sets natively. CBOR treats naive datetimes as UTC; MessagePack writes them
+as strings, like JSON.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import importlib
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable
+
+
+BINARY_FORMATS: dict[str, str] = {"msgpack": ".msgpack", "cbor": ".cbor"}
+"""dict[str, str]: Default file extension per binary format."""
+
+EXTENSION_FORMATS: dict[str, str] = {
+    ".msgpack": "msgpack",
+    ".mpk": "msgpack",
+    ".cbor": "cbor",
+}
+"""dict[str, str]: Binary format used for each recognized file extension."""
+
+_PACKAGES: dict[str, tuple[str, str]] = {
+    "msgpack": ("msgpack", "msgpack"),
+    "cbor": ("cbor2", "cbor"),
+}
+
+
+def require_format(output_format: str) -> Any:
+    """Import the package implementing a binary format.
+
+    Args:
+        output_format: ``msgpack`` or ``cbor``.
+
+    Returns:
+        Any: The ``msgpack`` or ``cbor2`` module.
+
+    Raises:
+        ValueError: If the format is not a binary format.
+        ImportError: If the optional package is not installed.
+    """
+    if output_format not in _PACKAGES:
+        available = ", ".join(BINARY_FORMATS)
+        error_message = (
+            f"Unknown binary format '{output_format}'. Available: {available}"
+        )
+        raise ValueError(error_message)
+
+    module_name, extra = _PACKAGES[output_format]
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as exc:
+        error_message = (
+            f"{output_format} output requires the optional '{module_name}' "
+            f"package: pip install lifecyclelogging[{extra}]"
+        )
+        raise ImportError(error_message) from exc
+
+
+def format_for_path(path: str | Path) -> str | None:
+    """Return the binary format implied by a file extension, if any.
+
+    Args:
+        path: The file path or extension.
+
+    Returns:
+        str | None: ``msgpack``, ``cbor`` or None for any other extension.
+    """
+    suffix = Path(path).suffix or str(path)
+    return EXTENSION_FORMATS.get(suffix.lower())
+
+
+def _msgpack_default(
+    msgpack: Any,
+    default: Callable[[Any], Any],
+) -> Callable[[Any], Any]:
+    def encode(value: Any) -> Any:
+        if isinstance(value, dt.datetime) and value.tzinfo is not None:
+            return msgpack.Timestamp.from_datetime(value)
+        if isinstance(value, (set, frozenset, tuple)):
+            return list(value)
+        if isinstance(value, Mapping):
+            return dict(value)
+        return default(value)
+
+    return encode
+
+
+def _cbor_default(default: Callable[[Any], Any]) -> Callable[[Any, Any], None]:
+    def encode(encoder: Any, value: Any) -> None:
+        if isinstance(value, Mapping):
+            encoder.encode(dict(value))
+        else:
+            encoder.encode(default(value))
+
+    return encode
+
+
+def encode_binary(
+    data: Any,
+    output_format: str,
+    default: Callable[[Any], Any] = str,
+) -> bytes:
+    """Encode data as MessagePack or CBOR.
+
+    Args:
+        data: The data to encode.
+        output_format: ``msgpack`` or ``cbor``.
+        default: Fallback for values the format cannot represent.
+
+    Returns:
+        bytes: The encoded data.
+
+    Raises:
+        ValueError: If the format is not a binary format.
+        ImportError: If the format's optional package is not installed.
+    """
+    module = require_format(output_format)
+    if output_format == "msgpack":
+        return module.packb(
+            data,
+            default=_msgpack_default(module, default),
+            use_bin_type=True,
+            datetime=False,
+        )
+    return module.dumps(
+        data,
+        default=_cbor_default(default),
+        timezone=dt.timezone.utc,
+        value_sharing=False,
+    )
+
+
+def decode_binary(data: bytes, output_format: str) -> Any:
+    """Decode MessagePack or CBOR data.
+
+    Args:
+        data: The encoded data.
+        output_format: ``msgpack`` or ``cbor``.
+
+    Returns:
+        Any: The decoded data. MessagePack timestamps decode to datetimes.
+
+    Raises:
+        ValueError: If the format is not a binary format.
+        ImportError: If the format's optional package is not installed.
+    """
+    module = require_format(output_format)
+    if output_format == "msgpack":
+        return module.unpackb(data, raw=False, timestamp=3, strict_map_key=False)
+    return module.loads(data)
@@ -0,0 +1,271 @@
+"""In-memory flight recorder for suppressed statements.
+
+A run logging at INFO throws away the DEBUG statements that would explain an
+error. ``FlightRecorder`` keeps the most recent suppressed statements in a
+fixed-size ring instead, without rendering them: each slot holds the message,
+payload references and markers exactly as they were passed, so recording
+costs a tuple and a lock rather than serializing payloads. When an error is
+logged, ``error_list`` grows or ``exit_run`` fails, ``Logging`` renders the
+recorded statements and hands them to its handlers ahead of the error.
+
+Payloads are kept by reference, so a payload mutated after it was recorded
+is rendered with its later contents.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, NamedTuple, SupportsIndex
+
+
+class FlightRecord(NamedTuple):
+    """One suppressed statement, as it was passed to ``logged_statement``."""
+
+    created: float
+    levelno: int
+    msg: str
+    json_data: Any
+    labeled_json_data: Any
+    identifiers: Sequence[str] | None
+    context_marker: str | None
+    thread_name: str | None
+    size: int
+
+
+class FlightRecorder:
+    """Fixed-capacity ring of the most recent suppressed statements.
+
+    The ring is bounded both by a number of records and by an estimate of
+    their size in bytes; the oldest records are evicted first. The size of a
+    record is the length of its message and identifiers plus
+    ``payload_bytes`` per payload, since payloads are not rendered until the
+    recorder is flushed.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        max_bytes: int | None = 1 << 20,
+        payload_bytes: int = 256,
+    ) -> None:
+        """Initialize the recorder.
+
+        Args:
+            capacity: Maximum number of records kept.
+            max_bytes: Maximum estimated size of the kept records. None
+                bounds the ring by ``capacity`` only.
+            payload_bytes: Estimated size charged for each recorded payload.
+
+        Raises:
+            ValueError: If the capacity or byte limit is not positive.
+        """
+        if capacity < 1:
+            error_message = "Flight recorder capacity must be at least 1"
+            raise ValueError(error_message)
+        if max_bytes is not None and max_bytes < 1:
+            error_message = "Flight recorder max_bytes must be at least 1"
+            raise ValueError(error_message)
+
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.payload_bytes = payload_bytes
+        self.recorded = 0
+        self.evicted = 0
+        self.flushed = 0
+        self._slots: list[tuple[Any, ...] | None] = [None] * capacity
+        self._next = 0
+        self._count = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of records currently kept."""
+        return self._count
+
+    @property
+    def size_bytes(self) -> int:
+        """int: Estimated size of the kept records."""
+        return self._bytes
+
+    def _trim(self, max_bytes: int) -> None:
+        """Evict the oldest records until the kept ones fit in ``max_bytes``."""
+        slots = self._slots
+        while self._bytes > max_bytes and self._count > 1:
+            oldest = (self._next - self._count) % self.capacity
+            entry = slots[oldest]
+            slots[oldest] = None
+            self._count -= 1
+            self._bytes -= entry[-1] if entry is not None else 0
+            self.evicted += 1
+
+    def record(  # noqa: PLR0913
+        self,
+        levelno: int,
+        msg: str,
+        json_data: Any = None,
+        labeled_json_data: Any = None,
+        identifiers: Sequence[str] | None = None,
+        context_marker: str | None = None,
+    ) -> None:
+        """Keep a suppressed statement, evicting the oldest when full.
+
+        Args:
+            levelno: The numeric level the statement was logged at.
+            msg: The unrendered message.
+            json_data: The statement's ``json_data``, kept by reference.
+            labeled_json_data: The statement's ``labeled_json_data``.
+            identifiers: The statement's identifiers.
+            context_marker: The statement's context marker.
+        """
+        size = len(msg)
+        if identifiers:
+            size += sum(map(len, identifiers)) + 2 * len(identifiers)
+        if json_data is not None:
+            size += self.payload_bytes
+        if labeled_json_data is not None:
+            size += self.payload_bytes
+        # A plain tuple is several times cheaper to build than the named
+        # tuple; drain() converts the kept records
+        entry = (
+            time.time(),
+            levelno,
+            msg,
+            json_data,
+            labeled_json_data,
+            identifiers,
+            context_marker,
+            threading.current_thread().name,
+            size,
+        )
+
+        with self._lock:
+            index = self._next
+            replaced = self._slots[index]
+            self._slots[index] = entry
+            self._next = index + 1 if index + 1 < self.capacity else 0
+            if replaced is None:
+                self._count += 1
+            else:
+                self._bytes -= replaced[-1]
+                self.evicted += 1
+            self._bytes += size
+            self.recorded += 1
+            if self.max_bytes is not None and self._bytes > self.max_bytes:
+                self._trim(self.max_bytes)
+
+    def drain(self) -> list[FlightRecord]:
+        """Remove and return the kept records, oldest first."""
+        with self._lock:
+            slots, count, start = (
+                self._slots,
+                self._count,
+                (self._next - self._count) % self.capacity,
+            )
+            self._slots = [None] * self.capacity
+            self._next = 0
+            self._count = 0
+            self._bytes = 0
+            self.flushed += count
+
+        records = []
+        for offset in range(count):
+            entry = slots[(start + offset) % self.capacity]
+            if entry is not None:
+                records.append(FlightRecord._make(entry))
+        return records
+
+    def clear(self) -> None:
+        """Drop the kept records without flushing them."""
+        with self._lock:
+            self._slots = [None] * self.capacity
+            self._next = 0
+            self._count = 0
+            self._bytes = 0
+
+    def make_log_record(
+        self,
+        logger: logging.Logger,
+        entry: FlightRecord,
+        msg: str,
+    ) -> logging.LogRecord:
+        """Create the ``LogRecord`` replaying a recorded statement.
+
+        The record keeps the statement's original time, level and thread,
+        and has ``flight_recorder`` set so handlers can tell replays apart.
+
+        Args:
+            logger: The logger the record is dispatched through.
+            entry: The recorded statement.
+            msg: The statement's rendered message.
+
+        Returns:
+            logging.LogRecord: The replay record.
+        """
+        record = logger.makeRecord(
+            logger.name,
+            entry.levelno,
+            "(flight recorder)",
+            0,
+            msg,
+            (),
+            None,
+            extra={"flight_recorder": True},
+        )
+        offset = record.created - entry.created
+        record.created = entry.created
+        record.msecs = (entry.created - int(entry.created)) * 1000
+        record.relativeCreated -= offset * 1000
+        record.threadName = entry.thread_name
+        return record
+
+
+class ErrorList(list[str]):
+    """A ``list`` of error messages that reports when it grows.
+
+    ``Logging.error_list`` is an ``ErrorList`` so appending an error can
+    flush the flight recorder. It behaves as a plain list otherwise.
+    """
+
+    def __init__(
+        self,
+        on_grow: Callable[[], None] | None = None,
+        errors: Iterable[str] = (),
+    ) -> None:
+        """Initialize the list.
+
+        Args:
+            on_grow: Called without arguments after errors are added.
+            errors: Initial errors, added without calling ``on_grow``.
+        """
+        super().__init__(errors)
+        self.on_grow = on_grow
+
+    def _grew(self) -> None:
+        if self.on_grow is not None:
+            self.on_grow()
+
+    def append(self, error: str) -> None:
+        """Append an error."""
+        super().append(error)
+        self._grew()
+
+    def extend(self, errors: Iterable[str]) -> None:
+        """Append several errors."""
+        size = len(self)
+        super().extend(errors)
+        if len(self) > size:
+            self._grew()
+
+    def insert(self, index: SupportsIndex, error: str) -> None:
+        """Insert an error before ``index``."""
+        super().insert(index, error)
+        self._grew()
+
+    def __iadd__(self, errors: Iterable[str]) -> ErrorList:  # type: ignore[override,misc]  # noqa: PYI034
+        """Append several errors with ``+=``."""
+        self.extend(errors)
+        return self
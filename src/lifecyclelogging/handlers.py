@@ -4,18 +4,602 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
+import threading
+import time
+import traceback
+import zlib
 
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Any, TextIO, cast
 
+import orjson
+
+from rich.console import Console
 from rich.logging import RichHandler
 
+from lifecyclelogging.formatters import CompiledFormatter
+from lifecyclelogging.log_types import ConsoleMode, LogCompression
+from lifecyclelogging.tracebacks import (
+    TracebackFormatter,
+    TracebackPolicy,
+    get_default_traceback_policy,
+)
+
+
+CONSOLE_MODES: tuple[str, ...] = ("rich", "plain", "jsonl", "auto")
+"""tuple[str, ...]: The supported console output modes."""
+
+PLAIN_CONSOLE_FORMAT = "[%(created)d] [%(threadName)s] [%(levelname)-8s] %(message)s"
+"""str: Line layout used by the plain console mode, matching the log file."""
+
+COMPRESSION_SUFFIXES: dict[str, str] = {"gzip": ".gz", "zstd": ".zst"}
+"""dict[str, str]: File suffix appended to compressed log files per format."""
+
+_shared_console: Console | None = None
+
+
+def get_shared_console() -> Console:
+    """Return the Rich console shared by every Rich console handler.
+
+    Returns:
+        Console: The shared console, created on first use.
+    """
+    global _shared_console  # noqa: PLW0603
+    if _shared_console is None:
+        _shared_console = Console()
+    return _shared_console
+
+
+def resolve_console_mode(mode: str) -> str:
+    """Resolve a console mode, turning ``auto`` into a concrete mode.
+
+    Args:
+        mode: One of ``CONSOLE_MODES``.
+
+    Returns:
+        str: ``rich``, ``plain`` or ``jsonl``.
+
+    Raises:
+        ValueError: If the mode is not recognized.
+    """
+    mode = mode.lower()
+    if mode not in CONSOLE_MODES:
+        available = ", ".join(CONSOLE_MODES)
+        error_message = f"Unknown console mode '{mode}'. Available: {available}"
+        raise ValueError(error_message)
+
+    if mode == "auto":
+        isatty = getattr(sys.stdout, "isatty", None)
+        return "rich" if isatty is not None and isatty() else "plain"
+    return mode
+
+
+class BatchHandlerMixin:
+    """Adds the batch-aware emit protocol used by ``Logging.logged_statements``.
+
+    ``handle_batch`` filters a batch of records and emits all of them under a
+    single acquisition of the handler lock. Subclasses override ``emit_batch``
+    to write the whole batch at once; the default emits records one by one.
+    """
+
+    def handle_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """Filter a batch of records and emit the accepted ones together.
+
+        Args:
+            records: The records to handle, in order.
+        """
+        handler = cast(logging.Handler, self)
+        accepted = []
+        for record in records:
+            result = handler.filter(record)
+            if isinstance(result, logging.LogRecord):
+                accepted.append(result)
+            elif result:
+                accepted.append(record)
+        if not accepted:
+            return
+
+        handler.acquire()
+        try:
+            self.emit_batch(accepted)
+        finally:
+            handler.release()
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """Emit a batch of records. The handler lock is already held.
+
+        Args:
+            records: The records to emit, in order.
+        """
+        handler = cast(logging.Handler, self)
+        for record in records:
+            handler.emit(record)
+
+    def format_batch(self, records: Sequence[logging.LogRecord]) -> str:
+        """Format a batch of records into one string of terminated lines.
+
+        Records that fail to format are reported through ``handleError`` and
+        left out, as they would be when emitted one at a time.
+
+        Args:
+            records: The records to format.
+
+        Returns:
+            str: The formatted records, each followed by the terminator.
+        """
+        handler = cast(logging.StreamHandler, self)  # type: ignore[type-arg]
+        terminator = handler.terminator
+        try:
+            return "".join([handler.format(record) + terminator for record in records])
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001, S110
+            # Fall back to formatting record by record to isolate the failure.
+            pass
+
+        lines = []
+        for record in records:
+            try:
+                lines.append(handler.format(record) + terminator)
+            except Exception:  # noqa: BLE001, PERF203
+                handler.handleError(record)
+        return "".join(lines)
+
+
+class BatchFileHandler(BatchHandlerMixin, logging.FileHandler):
+    """File handler that writes a batch of records with one write and flush."""
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """Write a batch of records to the log file at once.
+
+        Args:
+            records: The records to write, in order.
+        """
+        if self.stream is None:
+            if self.mode == "w" and self._closed:  # type: ignore[attr-defined]
+                return
+            self.stream = self._open()
+
+        text = self.format_batch(records)
+        if not text:
+            return
+        try:
+            self.stream.write(text)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            self.handleError(records[-1])
+
+
+class BufferedStreamHandler(BatchHandlerMixin, logging.StreamHandler):  # type: ignore[type-arg]
+    """Stream handler that flushes in batches instead of after every record.
+
+    ``logging.StreamHandler`` flushes the stream after each record, which
+    dominates the cost of writing to a pipe or file. This handler flushes
+    once ``flush_every`` records are pending, whenever a record at or above
+    ``flush_level`` is written, and when the handler is flushed or closed.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        flush_every: int = 64,
+        flush_level: int = logging.WARNING,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            stream: The stream to write to. Defaults to ``sys.stdout``.
+            flush_every: Number of records written between flushes.
+            flush_level: Records at or above this level are flushed at once.
+        """
+        super().__init__(stream if stream is not None else sys.stdout)
+        self.flush_every = flush_every
+        self.flush_level = flush_level
+        self._pending = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a formatted record, flushing only when a batch is complete.
+
+        Args:
+            record: The record to write.
+        """
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if self._pending >= self.flush_every or record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """Write a batch of records with a single write.
+
+        Args:
+            records: The records to write, in order.
+        """
+        text = self.format_batch(records)
+        if not text:
+            return
+        try:
+            self.stream.write(text)
+            self._pending += len(records)
+            if self._pending >= self.flush_every or any(
+                record.levelno >= self.flush_level for record in records
+            ):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            self.handleError(records[-1])
+
+    def flush(self) -> None:
+        """Flush the underlying stream and reset the pending count."""
+        self._pending = 0
+        super().flush()
+
+
+class _GzipStream:
+    """Streaming gzip compressor with sync-flush points."""
+
+    def __init__(self, level: int | None) -> None:
+        self._compressor = zlib.compressobj(
+            1 if level is None else level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def sync(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
 
-def add_file_handler(logger: logging.Logger, log_file_name: str) -> None:
+
+class _ZstdStream:
+    """Streaming Zstandard compressor with block-flush points."""
+
+    def __init__(self, level: int | None) -> None:
+        try:
+            import zstandard  # noqa: PLC0415
+        except ImportError as exc:
+            error_message = (
+                "zstd log compression requires the optional 'zstandard' package: "
+                "pip install lifecyclelogging[zstd]"
+            )
+            raise ImportError(error_message) from exc
+
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(
+            level=3 if level is None else level
+        ).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def sync(self) -> bytes:
+        return self._compressor.flush(self._flush_block)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+_COMPRESSORS: dict[str, Any] = {"gzip": _GzipStream, "zstd": _ZstdStream}
+
+
+class CompressedFileHandler(BatchHandlerMixin, logging.Handler):
+    """File handler that streams records through gzip or zstd compression.
+
+    The emitting thread only formats the record and appends it to an
+    in-memory buffer. A background thread compresses the buffer and writes it
+    to the file. At least every ``sync_interval`` seconds, and on ``flush``,
+    the compressor emits a sync-flush point and the file is flushed, so
+    everything up to that point can be decompressed even if the process
+    crashes before ``close`` writes the end of the stream.
+
+    ``queue_depth`` reports the number of buffered records, which the metrics
+    collector samples as the handler queue depth.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        filename: str | Path,
+        compression: LogCompression = "gzip",
+        level: int | None = None,
+        sync_interval: float = 1.0,
+        max_pending_bytes: int = 64 * 1024 * 1024,
+        mode: str = "ab",
+    ) -> None:
+        """Initialize the handler and start its compression thread.
+
+        Args:
+            filename: The compressed log file to write.
+            compression: ``gzip`` or ``zstd``.
+            level: Compression level. Defaults to 1 for gzip, favouring
+                throughput as ``gzip --fast`` does, and 3 for zstd.
+            sync_interval: Maximum seconds between sync-flush points.
+            max_pending_bytes: Emitting threads wait once this many bytes are
+                buffered and not yet compressed, bounding memory use.
+            mode: File open mode, ``ab`` to append a new compressed member or
+                ``wb`` to truncate.
+
+        Raises:
+            ValueError: If the compression format is not recognized.
+            ImportError: If zstd is requested but ``zstandard`` is missing.
+        """
+        if compression not in _COMPRESSORS:
+            available = ", ".join(_COMPRESSORS)
+            error_message = (
+                f"Unknown log compression '{compression}'. Available: {available}"
+            )
+            raise ValueError(error_message)
+
+        super().__init__()
+        self.baseFilename = str(Path(filename).resolve())
+        self.compression = compression
+        self.sync_interval = sync_interval
+        self.max_pending_bytes = max_pending_bytes
+        self.chunk_bytes = min(64 * 1024, max_pending_bytes)
+        self.terminator = "\n"
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._codec = _COMPRESSORS[compression](level)
+        self._file = open(self.baseFilename, mode)  # noqa: PTH123, SIM115
+        self._buffer: list[str] = []
+        self._pending_bytes = 0
+        self._sync_requested = False
+        self._synced_generation = 0
+        self._generation = 0
+        self._stopping = False
+        self._condition = threading.Condition()
+        self._worker = threading.Thread(
+            target=self._run, name=f"{type(self).__name__}-worker", daemon=True
+        )
+        self._worker.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """int: Number of records buffered and not yet compressed."""
+        return len(self._buffer)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format a record and append it to the compression buffer.
+
+        Args:
+            record: The record to write.
+        """
+        try:
+            self._append(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """Format a batch of records and append it to the buffer at once.
+
+        Args:
+            records: The records to write, in order.
+        """
+        text = self.format_batch(records)
+        if text:
+            self._append(text)
+
+    def _append(self, text: str) -> None:
+        with self._condition:
+            while self._pending_bytes >= self.max_pending_bytes and not self._stopping:
+                self._condition.wait()
+            self._buffer.append(text)
+            self._pending_bytes += len(text)
+            # Wake the worker only once a chunk is worth compressing; smaller
+            # amounts are picked up at the next sync interval
+            if self._pending_bytes >= self.chunk_bytes:
+                self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Compress everything buffered so far and write a sync-flush point."""
+        with self._condition:
+            if self._stopping:
+                return
+            self._sync_requested = True
+            self._generation += 1
+            target = self._generation
+            self._condition.notify_all()
+            while self._synced_generation < target and self._worker.is_alive():
+                self._condition.wait(timeout=self.sync_interval)
+
+    def close(self) -> None:
+        """Drain the buffer, finish the compressed stream and close the file."""
+        with self._condition:
+            already_stopping = self._stopping
+            self._stopping = True
+            self._condition.notify_all()
+        if not already_stopping:
+            self._worker.join()
+        super().close()
+
+    def _run(self) -> None:
+        """Compress and write buffered records until the handler is closed."""
+        last_sync = time.monotonic()
+        dirty = False
+        while True:
+            with self._condition:
+                if not (self._buffer or self._sync_requested or self._stopping):
+                    # Sleep until a chunk is buffered or the next sync-flush
+                    # point is due
+                    self._condition.wait(
+                        timeout=max(
+                            self.sync_interval - (time.monotonic() - last_sync), 0
+                        )
+                        if dirty
+                        else self.sync_interval
+                    )
+                chunks = self._buffer
+                self._buffer = []
+                self._pending_bytes = 0
+                sync = self._sync_requested
+                self._sync_requested = False
+                generation = self._generation
+                stopping = self._stopping
+                self._condition.notify_all()
+
+            try:
+                if chunks:
+                    data = "".join(chunks).encode("utf-8")
+                    self.bytes_in += len(data)
+                    self._write(self._codec.compress(data))
+                    dirty = True
+                if stopping:
+                    self._write(self._codec.finish())
+                    self._file.close()
+                elif dirty and (
+                    sync or time.monotonic() - last_sync >= self.sync_interval
+                ):
+                    self._write(self._codec.sync())
+                    self._file.flush()
+                    last_sync = time.monotonic()
+                    dirty = False
+            except Exception:  # noqa: BLE001
+                if logging.raiseExceptions:
+                    traceback.print_exc(file=sys.stderr)
+
+            with self._condition:
+                self._synced_generation = generation
+                self._condition.notify_all()
+            if stopping:
+                return
+
+    def _write(self, data: bytes) -> None:
+        if data:
+            self._file.write(data)
+            self.bytes_out += len(data)
+
+
+def read_compressed_log(path: str | Path) -> str:
+    """Read a compressed log file, including one whose writer crashed.
+
+    Everything up to the last sync-flush point is returned even when the
+    stream was never finished. Files holding several compressed members, as
+    left by reopening a log in append mode, are read in full.
+
+    Args:
+        path: The ``.gz`` or ``.zst`` log file.
+
+    Returns:
+        str: The decompressed log text.
+    """
+    data = Path(path).read_bytes()
+    parts: list[bytes] = []
+    if str(path).endswith(COMPRESSION_SUFFIXES["zstd"]):
+        import zstandard  # noqa: PLC0415
+
+        while data:
+            zstd_decompressor = zstandard.ZstdDecompressor().decompressobj()
+            parts.append(zstd_decompressor.decompress(data))
+            data = zstd_decompressor.unused_data
+    else:
+        while data:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            parts.append(decompressor.decompress(data))
+            data = decompressor.unused_data
+    return b"".join(parts).decode("utf-8", errors="replace")
+
+
+class JsonLinesFormatter(TracebackFormatter):
+    """Formats each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a JSON line.
+
+        Args:
+            record: The record to format.
+
+        Returns:
+            str: The JSON-encoded record.
+        """
+        entry: dict[str, object] = {
+            "created": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode("utf-8")
+
+
+class TracebackRichHandler(RichHandler):
+    """Rich handler that renders tracebacks through a ``TracebackPolicy``.
+
+    Rich tracebacks are only rendered for terminals and for exceptions the
+    policy allows in full. Otherwise the formatter renders the policy's plain
+    text, which is cached per frame and summarized past the rate limit.
+    """
+
+    def __init__(
+        self,
+        console: Console | None = None,
+        policy: TracebackPolicy | None = None,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            console: The Rich console to print to.
+            policy: The traceback policy. Defaults to the shared policy.
+        """
+        self.policy = policy or get_default_traceback_policy()
+        super().__init__(
+            console=console,
+            rich_tracebacks=True,
+            tracebacks_show_locals=self.policy.show_locals,
+            tracebacks_max_frames=self.policy.max_frames,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a record, choosing the traceback renderer by the policy.
+
+        Args:
+            record: The record to emit.
+        """
+        exc = record.exc_info[1] if record.exc_info else None
+        if exc is None or (self.console.is_terminal and self.policy.allow_full(exc)):
+            super().emit(record)
+            return
+
+        # Handler.handle holds the handler lock, so toggling is safe here
+        self.rich_tracebacks = False
+        try:
+            super().emit(record)
+        finally:
+            self.rich_tracebacks = True
+
+
+def add_file_handler(
+    logger: logging.Logger,
+    log_file_name: str,
+    compression: LogCompression | None = None,
+    traceback_policy: TracebackPolicy | None = None,
+    log_format: str | None = None,
+) -> None:
     """Add a file handler to the logger, ensuring the file name is valid.
 
     Args:
         logger (logging.Logger): The logger to which the file handler will be added.
         log_file_name (str): The name of the log file.
+        compression (LogCompression | None): Stream the file through ``gzip``
+            or ``zstd`` compression, appending ``.gz`` or ``.zst`` to its name.
+        traceback_policy (TracebackPolicy | None): How tracebacks are
+            rendered. Defaults to the shared policy.
+        log_format (str | None): ``%``-style line layout, which may use
+            ``%(timestamp)s`` and ``%(sequence)d``. Defaults to
+            ``PLAIN_CONSOLE_FORMAT``.
     """
     # Convert to Path object to separate directory from filename
     original_path = Path(log_file_name)
@@ -41,21 +625,59 @@ def add_file_handler(logger: logging.Logger, log_file_name: str) -> None:
     log_file_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Add the file handler
-    file_handler = logging.FileHandler(log_file_path)
-    file_formatter = logging.Formatter(
-        "[%(created)d] [%(threadName)s] [%(levelname)-8s] %(message)s",
+    file_handler: logging.Handler
+    if compression:
+        file_handler = CompressedFileHandler(
+            log_file_path.with_name(
+                log_file_path.name + COMPRESSION_SUFFIXES.get(compression, "")
+            ),
+            compression,
+        )
+    else:
+        file_handler = BatchFileHandler(log_file_path)
+    file_formatter = CompiledFormatter(
+        log_format or PLAIN_CONSOLE_FORMAT, policy=traceback_policy
     )
     file_handler.setFormatter(file_formatter)
     logger.addHandler(file_handler)
 
 
-def add_console_handler(logger: logging.Logger) -> None:
-    """Adds a Rich console handler to the logger.
+def add_console_handler(
+    logger: logging.Logger,
+    mode: ConsoleMode = "rich",
+    traceback_policy: TracebackPolicy | None = None,
+    log_format: str | None = None,
+) -> None:
+    """Adds a console handler to the logger.
 
     Args:
         logger (logging.Logger): The logger to which the console handler will be added.
+        mode (ConsoleMode): ``rich`` for Rich rendering through the shared
+            console, ``plain`` or ``jsonl`` for a buffered stdout writer, or
+            ``auto`` to use Rich only when stdout is a terminal.
+        traceback_policy (TracebackPolicy | None): How tracebacks are
+            rendered. Defaults to the shared policy.
+        log_format (str | None): Line layout of the ``plain`` mode, as for
+            ``add_file_handler``. Defaults to ``PLAIN_CONSOLE_FORMAT``.
     """
-    console_handler = RichHandler(rich_tracebacks=True)
-    console_formatter = logging.Formatter("%(message)s", datefmt="[%X]")
+    resolved_mode = resolve_console_mode(mode)
+    console_handler: logging.Handler
+    console_formatter: logging.Formatter
+    if resolved_mode == "rich":
+        console_handler = TracebackRichHandler(
+            console=get_shared_console(), policy=traceback_policy
+        )
+        console_formatter = TracebackFormatter(
+            "%(message)s", datefmt="[%X]", policy=traceback_policy
+        )
+    elif resolved_mode == "jsonl":
+        console_handler = BufferedStreamHandler()
+        console_formatter = JsonLinesFormatter(policy=traceback_policy)
+    else:
+        console_handler = BufferedStreamHandler()
+        console_formatter = CompiledFormatter(
+            log_format or PLAIN_CONSOLE_FORMAT, policy=traceback_policy
+        )
+
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
@@ -0,0 +1,171 @@
+"""Size guards for JSON payloads attached to log messages.
+
+``PayloadLimits`` caps how much of a ``json_data`` or ``labeled_json_data``
+payload is rendered. ``limit_payload`` walks the payload once, stops at the
+configured item, depth, string and byte budgets, and leaves truncation markers
+that record the original sizes. Its cost is bounded by the limits rather than
+by the size of the input.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+TRUNCATION_KEY = "..."
+"""str: Key used for the truncation marker added to truncated mappings."""
+
+_SCALAR_COST = 8
+_CONTAINER_COST = 2
+
+
+@dataclass(frozen=True)
+class PayloadLimits:
+    """Limits applied to payloads before they are serialized into a message.
+
+    Any limit left as None is not enforced.
+
+    Attributes:
+        max_bytes: Approximate maximum serialized size of a payload in bytes.
+        max_items: Maximum number of entries rendered per mapping or list.
+        max_depth: Maximum nesting depth rendered; deeper containers are
+            replaced by a summary.
+        max_string_length: Maximum number of characters rendered per string.
+    """
+
+    max_bytes: int | None = None
+    max_items: int | None = None
+    max_depth: int | None = None
+    max_string_length: int | None = None
+
+
+class _Truncator:
+    """Single-pass, budgeted copy of a payload."""
+
+    def __init__(self, limits: PayloadLimits) -> None:
+        self.limits = limits
+        self.remaining = limits.max_bytes
+        self.truncated = False
+
+    def exhausted(self) -> bool:
+        return self.remaining is not None and self.remaining <= 0
+
+    def spend(self, cost: int) -> None:
+        if self.remaining is not None:
+            self.remaining -= cost
+
+    def visit(self, value: Any, depth: int) -> Any:
+        if isinstance(value, str):
+            return self.visit_string(value)
+        if isinstance(value, Mapping):
+            return self.visit_mapping(value, depth)
+        if isinstance(value, Sequence) and not isinstance(value, (bytes, bytearray)):
+            return self.visit_sequence(value, depth)
+
+        self.spend(_SCALAR_COST)
+        return value
+
+    def visit_string(self, value: str) -> str:
+        limit = self.limits.max_string_length
+        if self.remaining is not None:
+            limit = (
+                max(self.remaining, 0) if limit is None else min(limit, self.remaining)
+            )
+        if limit is not None and len(value) > limit:
+            self.truncated = True
+            self.spend(limit)
+            return f"{value[:limit]}...[truncated, {len(value)} chars total]"
+
+        self.spend(len(value) + _CONTAINER_COST)
+        return value
+
+    def summarize(self, value: Mapping[Any, Any] | Sequence[Any]) -> str:
+        self.truncated = True
+        self.spend(_SCALAR_COST)
+        kind = "mapping" if isinstance(value, Mapping) else "list"
+        return f"<truncated {kind} with {len(value)} items>"
+
+    def visit_mapping(self, value: Mapping[Any, Any], depth: int) -> Any:
+        if self.limits.max_depth is not None and depth >= self.limits.max_depth:
+            return self.summarize(value)
+
+        self.spend(_CONTAINER_COST)
+        result: dict[Any, Any] = {}
+        max_items = self.limits.max_items
+        for key, item in value.items():
+            if (max_items is not None and len(result) >= max_items) or (
+                self.exhausted()
+            ):
+                self.truncated = True
+                result[TRUNCATION_KEY] = (
+                    f"{len(value) - len(result)} more items truncated "
+                    f"({len(value)} total)"
+                )
+                break
+            self.spend(len(str(key)) + _CONTAINER_COST)
+            result[key] = self.visit(item, depth + 1)
+        return result
+
+    def visit_sequence(self, value: Sequence[Any], depth: int) -> Any:
+        if self.limits.max_depth is not None and depth >= self.limits.max_depth:
+            return self.summarize(value)
+
+        self.spend(_CONTAINER_COST)
+        result: list[Any] = []
+        max_items = self.limits.max_items
+        for item in value:
+            if (max_items is not None and len(result) >= max_items) or (
+                self.exhausted()
+            ):
+                self.truncated = True
+                result.append(
+                    f"... {len(value) - len(result)} more items truncated "
+                    f"({len(value)} total)"
+                )
+                break
+            result.append(self.visit(item, depth + 1))
+        return result
+
+
+def limit_payload(data: Any, limits: PayloadLimits) -> tuple[Any, bool]:
+    """Copy a payload, cutting it short wherever a limit is reached.
+
+    Containers are copied only up to the limits, so the work done is bounded by
+    the limits rather than by the size of ``data``. The input is never mutated.
+
+    Args:
+        data: The payload to limit.
+        limits: The limits to apply.
+
+    Returns:
+        tuple[Any, bool]: The limited copy and whether anything was truncated.
+    """
+    truncator = _Truncator(limits)
+    return truncator.visit(data, 0), truncator.truncated
+
+
+def cap_serialized(text: str, limits: PayloadLimits) -> str:
+    """Cut serialized payload text that still exceeds ``max_bytes``.
+
+    ``limit_payload`` budgets with size estimates, so the serialized text can
+    overshoot slightly. This enforces the byte limit as a hard cap.
+
+    Args:
+        text: The serialized payload.
+        limits: The limits to apply.
+
+    Returns:
+        str: The text, cut short with a marker if it exceeded ``max_bytes``.
+    """
+    max_bytes = limits.max_bytes
+    if max_bytes is None or len(text) <= max_bytes // 4:
+        return text
+
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+
+    head = encoded[:max_bytes].decode("utf-8", errors="ignore")
+    return f"{head}...[truncated at {max_bytes} bytes, {len(encoded)} bytes total]"
@@ -23,3 +23,56 @@ Valid values are:
 - "fatal"
 - "critical"
 """
+
+ConsoleMode: TypeAlias = Literal["rich", "plain", "jsonl", "auto"]
+"""A type alias representing the console output modes.
+
+Valid values are:
+- "rich": Rich-rendered output (the default)
+- "plain": Buffered plain-text lines
+- "jsonl": Buffered JSON lines
+- "auto": "rich" when stdout is a terminal, otherwise "plain"
+"""
+
+LogCompression: TypeAlias = Literal["gzip", "zstd"]
+"""A type alias representing the log file compression formats.
+
+Valid values are:
+- "gzip": Streaming gzip, using only the standard library
+- "zstd": Streaming Zstandard, requires the optional ``zstandard`` package
+"""
+
+OutputFormat: TypeAlias = Literal["json", "ndjson", "msgpack", "cbor"]
+"""A type alias representing the ``exit_run`` output formats.
+
+Valid values are:
+- "json": One JSON document (the default)
+- "ndjson": One JSON line per top-level result, streamed as it is ready
+- "msgpack": One MessagePack document (needs the ``msgpack`` extra)
+- "cbor": One CBOR document (needs the ``cbor`` extra)
+"""
+
+OverflowPolicy: TypeAlias = Literal["drop", "block"]
+"""A type alias representing what network sinks do when their buffer is full.
+
+Valid values are:
+- "drop": Discard the new record and count it (the default)
+- "block": Wait for room, slowing the logging thread down
+"""
+
+SyslogTransport: TypeAlias = Literal["tcp", "udp"]
+"""A type alias representing the transports of the network syslog sink.
+
+Valid values are:
+- "tcp": One stream, RFC 6587 octet-counted frames, batched into few writes
+- "udp": One RFC 5426 datagram per record
+"""
+
+TimestampPrecision: TypeAlias = Literal["s", "ms", "us"]
+"""A type alias representing the precision of ``%(timestamp)s`` in log lines.
+
+Valid values are:
+- "s": Whole seconds
+- "ms": Milliseconds (the default)
+- "us": Microseconds
+"""
@@ -14,15 +14,19 @@ and output across different logging contexts.
 from __future__ import annotations
 
 import base64
+import contextlib
+import functools
 import logging
 import os
 import sys
+import threading
+import time
 
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
-from copy import deepcopy
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
@@ -42,19 +46,94 @@ from extended_data_types import (
     wrap_raw_data_for_export,
 )
 
-from lifecyclelogging.const import VERBOSITY
-from lifecyclelogging.handlers import add_console_handler, add_file_handler
-from lifecyclelogging.log_types import LogLevel
+from lifecyclelogging.adaptive import AdaptiveVerbosity, VerbosityChange
+from lifecyclelogging.artifacts import ArtifactStore, canonical_json
+from lifecyclelogging.cache import PayloadCache
+from lifecyclelogging.config import (
+    CONFIG_FIELDS,
+    ConfigWatcher,
+    LoggingConfig,
+    MarkerOverride,
+    check_strings,
+)
+from lifecyclelogging.const import STATEMENT_ATTRIBUTE, VERBOSITY
+from lifecyclelogging.encoders import (
+    BINARY_FORMATS,
+    encode_binary,
+    format_for_path,
+    require_format,
+)
+from lifecyclelogging.flight import ErrorList, FlightRecord, FlightRecorder
+from lifecyclelogging.handlers import (
+    CONSOLE_MODES,
+    add_console_handler,
+    add_file_handler,
+)
+from lifecyclelogging.limits import PayloadLimits
+from lifecyclelogging.log_types import (
+    ConsoleMode,
+    LogCompression,
+    LogLevel,
+    OutputFormat,
+)
+from lifecyclelogging.metrics import LoggingMetrics
+from lifecyclelogging.network import BackgroundBatchHandler
+from lifecyclelogging.profiling import CallSiteProfiler
+from lifecyclelogging.spans import Span, SpanRecord, SpanRecorder
+from lifecyclelogging.storage import MemoryStorageBackend, StorageBackend
+from lifecyclelogging.tracebacks import TracebackPolicy, get_default_traceback_policy
+from lifecyclelogging.transforms import (
+    KeyTransform,
+    KeyTransformer,
+    compile_prefix_rule,
+)
 from lifecyclelogging.utils import (
-    add_json_data,
+    MessageBuilder,
+    append_json_data,
     clear_existing_handlers,
     find_logger,
     get_log_level,
 )
+from lifecyclelogging.writers import (
+    BackgroundWriter,
+    dump_results,
+    temporary_file,
+    write_atomic,
+)
+
+
+if TYPE_CHECKING:
+    from types import CodeType, FrameType
+
+    from lifecyclelogging.bound import BoundLogging
+    from lifecyclelogging.log_types import SyslogTransport
+    from lifecyclelogging.otlp import OTLPLogHandler
+    from lifecyclelogging.syslog import NetworkSyslogHandler
+
+
+# Code of wrappers that forward to logged_statement(s), such as
+# BoundLogging's; call sites are attributed to the wrapper's caller
+FORWARDING_CODES: set[CodeType] = set()
 
 
-# Type alias for key transformation functions
-KeyTransform = Callable[[str], str]
+def _statement_caller() -> FrameType:
+    """Return the frame that called logged_statement or logged_statements."""
+    caller = sys._getframe(2)
+    while caller.f_code in FORWARDING_CODES and caller.f_back is not None:
+        caller = caller.f_back
+    return caller
+
+
+def _config_property(name: str, doc: str) -> Any:
+    """Expose a ``LoggingConfig`` field; assigning it calls ``reconfigure``."""
+
+    def get(self: Logging) -> Any:
+        return getattr(self.config, name)
+
+    def set_(self: Logging, value: Any) -> None:
+        self.reconfigure(**{name: value})
+
+    return property(get, set_, doc=doc)
 
 
 class ExitRunError(Exception):
@@ -72,6 +151,24 @@ class Logging:
     which will cause messages with those markers to ignore verbosity settings entirely.
     """
 
+    # Filtering settings live in the immutable ``config`` snapshot; assigning
+    # one of these swaps in a new snapshot
+    verbosity_threshold = _config_property(
+        "verbosity_threshold", "int: Maximum verbosity level (1-5) to display."
+    )
+    enable_verbose_output = _config_property(
+        "enable_verbose_output", "bool: Whether verbose messages are allowed."
+    )
+    allowed_levels = _config_property(
+        "allowed_levels", "tuple[str, ...]: Levels allowed into storage."
+    )
+    denied_levels = _config_property(
+        "denied_levels", "tuple[str, ...]: Levels denied from storage."
+    )
+    default_storage_marker = _config_property(
+        "default_storage_marker", "str | None: Default marker for storing messages."
+    )
+
     def __init__(
         self,
         enable_console: bool = False,
@@ -84,6 +181,16 @@ class Logging:
         denied_levels: Sequence[str] | None = None,
         enable_verbose_output: bool = False,
         verbosity_threshold: int = VERBOSITY,
+        storage_backend: StorageBackend | None = None,
+        payload_limits: PayloadLimits | None = None,
+        payload_cache: PayloadCache | None = None,
+        console_mode: ConsoleMode | None = None,
+        log_compression: LogCompression | None = None,
+        artifact_store: ArtifactStore | None = None,
+        results_indent: bool = False,
+        background_results: bool = False,
+        traceback_policy: TracebackPolicy | None = None,
+        log_format: str | None = None,
     ) -> None:
         """Initialize the Logging class with options for console and file logging.
 
@@ -102,44 +209,130 @@ class Logging:
             denied_levels: List of denied log levels.
             enable_verbose_output: Whether to allow verbose messages.
             verbosity_threshold: Maximum verbosity level (1-5) to display.
+            storage_backend: Backend for stored messages. Defaults to an
+                in-memory ``defaultdict(set)``; pass a ``SQLiteStorageBackend``
+                to spill to disk during very long runs.
+            payload_limits: Size limits applied to ``json_data`` and
+                ``labeled_json_data`` payloads before they are serialized.
+            payload_cache: Cache of rendered payload text, so payloads that
+                are logged repeatedly are only serialized once.
+            console_mode: Console output mode: "rich", "plain", "jsonl" or
+                "auto". Defaults to the LOG_CONSOLE_MODE env var, else "rich".
+                An unknown env value is ignored with a warning.
+            log_compression: Stream the log file through "gzip" or "zstd"
+                compression on a background thread. Defaults to the
+                LOG_COMPRESSION env var, else uncompressed.
+            artifact_store: Content-addressed store that ``log_results``
+                writes to instead of plain files, skipping content that is
+                already stored. Defaults to a store rooted at the
+                LOG_ARTIFACT_STORE env var when set, else plain files.
+            results_indent: Indent JSON results files by two spaces.
+            background_results: Write results files on a background thread,
+                so ``exit_run`` keeps transforming while the file is written.
+                ``exit_run`` waits for pending writes before it exits.
+            traceback_policy: How the console and file handlers render
+                tracebacks: cached plain-text frames, locals only on request
+                and a per-exception-type limit on full renders. Defaults to
+                a policy shared by every instance.
+            log_format: ``%``-style line layout of the log file and the plain
+                console, compiled once into a fast formatter. Besides the
+                record attributes it may use ``%(timestamp)s`` (UTC ISO 8601
+                with milliseconds) and ``%(sequence)d``. Defaults to the
+                LOG_FORMAT env var, else ``PLAIN_CONSOLE_FORMAT``.
 
         The logger configured will have the following characteristics:
         - Non-propagating (won't pass messages to parent loggers)
         - Level set from LOG_LEVEL env var or DEBUG if not set
         - Console/file output based on parameters and env vars
+        - Console rendering mode from console_mode or LOG_CONSOLE_MODE
+        - Log file compression from log_compression or LOG_COMPRESSION
+        - Log line layout from log_format or LOG_FORMAT
         - Gunicorn logger integration if available
         """
         # Output configuration
         self.enable_console = enable_console
         self.enable_file = enable_file
+        # A typo in the environment must not stop the program from logging,
+        # so an unknown env value falls back to "rich" with a warning
+        env_console_mode = os.getenv("LOG_CONSOLE_MODE") or None
+        ignored_console_mode = None
+        if (
+            console_mode is None
+            and env_console_mode is not None
+            and env_console_mode.lower() not in CONSOLE_MODES
+        ):
+            ignored_console_mode, env_console_mode = env_console_mode, None
+        self.console_mode = cast(
+            ConsoleMode, console_mode or env_console_mode or "rich"
+        )
+        self.log_compression = cast(
+            "LogCompression | None",
+            log_compression or os.getenv("LOG_COMPRESSION") or None,
+        )
+        self.traceback_policy = traceback_policy or get_default_traceback_policy()
+        self.log_format = log_format or os.getenv("LOG_FORMAT") or None
         self.logger = self._configure_logger(
             logger=logger,
             logger_name=logger_name,
             log_file_name=log_file_name,
         )
+        if ignored_console_mode is not None:
+            self.logger.warning(
+                "Ignoring unknown LOG_CONSOLE_MODE '%s', using 'rich'. Available: %s",
+                ignored_console_mode,
+                ", ".join(CONSOLE_MODES),
+            )
+
+        # Results artifacts
+        artifact_root = os.getenv("LOG_ARTIFACT_STORE")
+        self.artifact_store = (
+            artifact_store
+            if artifact_store is not None or not artifact_root
+            else ArtifactStore(artifact_root)
+        )
+        self.results_indent = results_indent
+        self.results_writer = BackgroundWriter() if background_results else None
 
         # Message storage
-        self.stored_messages: defaultdict[str, set[str]] = defaultdict(set)
-        self.error_list: list[str] = []
+        self.stored_messages: StorageBackend = (
+            storage_backend if storage_backend is not None else MemoryStorageBackend()
+        )
+        self.error_list: list[str] = ErrorList(self._on_error_added)
         self.last_error_instance: Any = None
         self.last_error_text: str | None = None
 
         # Message categorization and marking
-        self.default_storage_marker = default_storage_marker
         self.current_context_marker: str | None = None
         self.verbosity_bypass_markers: list[str] = []
 
-        # Log level filtering
-        self.allowed_levels = self._normalize_levels(allowed_levels)
-        self.denied_levels = self._normalize_levels(denied_levels)
+        # Storage level filtering, storage marker and verbosity control,
+        # swapped as one snapshot by reconfigure
+        self.config = LoggingConfig(
+            verbosity_threshold=verbosity_threshold,
+            enable_verbose_output=enable_verbose_output,
+            allowed_levels=self._normalize_levels(allowed_levels),
+            denied_levels=self._normalize_levels(denied_levels),
+            default_storage_marker=default_storage_marker,
+        )
+        self._config_lock = threading.Lock()
 
-        # Verbosity control
-        self.enable_verbose_output = enable_verbose_output
-        self.verbosity_threshold = verbosity_threshold
+        # Payload rendering
+        self.payload_limits = payload_limits
+        self.payload_cache = payload_cache
 
         # File management
         self.log_rotation_count = 0
 
+        # Instrumentation (opt-in)
+        self.metrics: LoggingMetrics | None = None
+        self.profiler: CallSiteProfiler | None = None
+        self.spans = SpanRecorder()
+        self.flight_recorder: FlightRecorder | None = None
+        self.adaptive_verbosity: AdaptiveVerbosity | None = None
+
+        # Attach the statement's unrendered parts to records for exporters
+        self.structured_records = False
+
     @staticmethod
     def _normalize_levels(levels: Sequence[str] | None) -> tuple[str, ...]:
         """Normalize provided log levels to lower-case tuples."""
@@ -153,6 +346,554 @@ class Logging:
         if marker not in self.verbosity_bypass_markers:
             self.verbosity_bypass_markers.append(marker)
 
+    def reconfigure(
+        self,
+        log_level: str | int | None = None,
+        handler_levels: Mapping[str, str | int] | None = None,
+        debug_markers: Mapping[str, float | None] | None = None,
+        verbosity_bypass_markers: Sequence[str] | None = None,
+        **settings: Any,
+    ) -> LoggingConfig:
+        """Change filtering settings of the running instance.
+
+        The ``LoggingConfig`` settings are validated, copied into a new
+        immutable snapshot and swapped in with one assignment: statements
+        never see half of a change, and the next statement sees all of it.
+        Handlers stay attached and files stay open, so no record is dropped.
+
+        Args:
+            log_level: New level of the underlying logger.
+            handler_levels: New levels for handlers, by handler name or by
+                ``<HandlerClass>-<index>`` for unnamed handlers.
+            debug_markers: Context markers to log in full, mapped to the
+                number of seconds the override lasts (None for no expiry).
+                Their statements skip the verbosity check and are emitted at
+                any level the logger would otherwise drop.
+            verbosity_bypass_markers: Replacement list of verbosity bypass
+                markers.
+            **settings: New values for ``verbosity_threshold``,
+                ``enable_verbose_output``, ``allowed_levels``,
+                ``denied_levels`` or ``default_storage_marker``.
+
+        Returns:
+            LoggingConfig: The snapshot now in effect.
+
+        Raises:
+            TypeError: If a setting is unknown or a value has the wrong type,
+                such as a bare string where a list of strings is expected.
+            ValueError: If a value is out of range or a handler name is
+                unknown.
+
+        Examples:
+            # Full detail for one component for five minutes
+            logging.reconfigure(debug_markers={"sync": 300})
+        """
+        unknown = settings.keys() - CONFIG_FIELDS
+        if unknown:
+            error_message = f"Unknown logging settings: {sorted(unknown)}"
+            raise TypeError(error_message)
+        # LoggingConfig.replace validates the settings; check the rest
+        # before anything changes
+        if log_level is not None and (
+            isinstance(log_level, bool) or not isinstance(log_level, (str, int))
+        ):
+            error_message = f"log_level must be a name or number, got {log_level!r}"
+            raise TypeError(error_message)
+        if handler_levels is not None and not isinstance(handler_levels, Mapping):
+            error_message = (
+                "handler_levels must map handler names to levels, "
+                f"got {handler_levels!r}"
+            )
+            raise TypeError(error_message)
+        if verbosity_bypass_markers is not None:
+            check_strings("verbosity_bypass_markers", verbosity_bypass_markers)
+        if debug_markers is not None and not (
+            isinstance(debug_markers, Mapping)
+            and all(
+                isinstance(marker, str)
+                and (
+                    duration is None
+                    or (
+                        isinstance(duration, (int, float))
+                        and not isinstance(duration, bool)
+                    )
+                )
+                for marker, duration in debug_markers.items()
+            )
+        ):
+            error_message = (
+                "debug_markers must map context markers to seconds or None, "
+                f"got {debug_markers!r}"
+            )
+            raise TypeError(error_message)
+
+        handlers = {
+            handler.get_name() or f"{type(handler).__name__}-{index}": handler
+            for index, handler in enumerate(self.logger.handlers)
+        }
+        new_levels = {
+            name: get_log_level(level) for name, level in (handler_levels or {}).items()
+        }
+        missing = new_levels.keys() - handlers.keys()
+        if missing:
+            error_message = f"Unknown handlers: {sorted(missing)}"
+            raise ValueError(error_message)
+
+        with self._config_lock:
+            if debug_markers:
+                now = time.monotonic()
+                settings["marker_overrides"] = {
+                    **self.config.marker_overrides,
+                    **{
+                        marker: MarkerOverride(
+                            expires_at=None if duration is None else now + duration
+                        )
+                        for marker, duration in debug_markers.items()
+                    },
+                }
+            self.config = self.config.replace(**settings)
+
+        if verbosity_bypass_markers is not None:
+            self.verbosity_bypass_markers = list(verbosity_bypass_markers)
+        if log_level is not None:
+            self.logger.setLevel(get_log_level(log_level))
+        for name, level in new_levels.items():
+            handlers[name].setLevel(level)
+        return self.config
+
+    def watch_config(
+        self,
+        path: str | Path,
+        interval: float | None = 1.0,
+        signum: int | None = None,
+    ) -> ConfigWatcher:
+        """Apply a JSON control file now and whenever it changes.
+
+        The file holds ``reconfigure`` keyword arguments. It is checked every
+        ``interval`` seconds on a background thread, and reloaded when
+        ``signum`` (such as ``signal.SIGHUP``) is received.
+
+        Args:
+            path: The control file.
+            interval: Seconds between checks, or None to only reload on the
+                signal.
+            signum: Signal forcing a reload. Only installable from the main
+                thread.
+
+        Returns:
+            ConfigWatcher: The started watcher; call ``stop`` to end it.
+        """
+        return ConfigWatcher(self, path, interval=interval, signum=signum).start()
+
+    def bind(
+        self,
+        context_marker: str | None = None,
+        identifiers: Sequence[str] | None = None,
+        storage_marker: str | None = None,
+    ) -> BoundLogging:
+        """Return a lightweight child with context bound to every statement.
+
+        The child shares this instance's logger, handlers, configuration,
+        storage and instrumentation instead of configuring its own, so it is
+        cheap to create per component or per request. Its ``[marker]`` prefix
+        and ``(ids)`` suffix are rendered once. Values passed explicitly to
+        the child's ``logged_statement`` override the bound ones.
+
+        Args:
+            context_marker: Context marker for the child's statements.
+            identifiers: Identifiers for the child's statements.
+            storage_marker: Storage marker for the child's statements.
+
+        Returns:
+            BoundLogging: The child.
+
+        Examples:
+            sync_log = logging.bind(context_marker="sync", identifiers=[account])
+            sync_log.logged_statement("Started", log_level="info")
+        """
+        from lifecyclelogging.bound import BoundLogging  # noqa: PLC0415
+
+        return BoundLogging(self, context_marker, identifiers, storage_marker)
+
+    def add_otlp_exporter(
+        self,
+        endpoint: str = "http://localhost:4318/v1/logs",
+        **options: Any,
+    ) -> OTLPLogHandler:
+        """Export records to an OpenTelemetry collector over OTLP/HTTP.
+
+        Attaches an ``OTLPLogHandler`` and enables ``structured_records``, so
+        statements are exported with their message as the body and their
+        context marker, identifiers, storage marker and payloads as separate
+        attributes. Records are sent in batches from a background worker;
+        ``exit_run`` and ``logging.shutdown`` send what is still queued.
+
+        Args:
+            endpoint: The collector's OTLP/HTTP logs URL.
+            **options: ``OTLPLogHandler`` options, such as ``service_name``,
+                ``headers``, ``max_batch`` or ``overflow``.
+
+        Returns:
+            OTLPLogHandler: The attached handler.
+        """
+        from lifecyclelogging.otlp import OTLPLogHandler  # noqa: PLC0415
+
+        handler = OTLPLogHandler(endpoint, **options)
+        self.logger.addHandler(handler)
+        self.structured_records = True
+        return handler
+
+    def add_syslog_sink(
+        self,
+        address: tuple[str, int] = ("localhost", 514),
+        transport: SyslogTransport = "tcp",
+        **options: Any,
+    ) -> NetworkSyslogHandler:
+        """Send records to a syslog relay as RFC 5424 messages.
+
+        Attaches a ``NetworkSyslogHandler`` and enables
+        ``structured_records``, so each message carries the statement's
+        context marker as its ``MSGID`` and its identifiers and storage
+        marker as structured data. Records are written in batches by a
+        background worker on a reused connection that is reopened after a
+        failure.
+
+        Args:
+            address: Host and port of the relay.
+            transport: ``tcp`` for octet-counted frames, or ``udp`` for one
+                datagram per record.
+            **options: ``NetworkSyslogHandler`` options, such as ``facility``,
+                ``app_name``, ``max_batch`` or ``overflow``.
+
+        Returns:
+            NetworkSyslogHandler: The attached handler.
+        """
+        from lifecyclelogging.syslog import NetworkSyslogHandler  # noqa: PLC0415
+
+        handler = NetworkSyslogHandler(address, transport, **options)
+        self.logger.addHandler(handler)
+        self.structured_records = True
+        return handler
+
+    @staticmethod
+    def _statement_extra(
+        msg: str,
+        context_marker: str | None,
+        identifiers: Sequence[str] | None,
+        storage_marker: str | None,
+        json_data: Any,
+        labeled_json_data: Mapping[str, Any] | None,
+        call_site: tuple[str, int, str] | None,
+    ) -> dict[str, Any]:
+        """Build the ``extra`` mapping attaching a statement's parts to its record.
+
+        ``call_site`` is the ``(filename, lineno, function)`` of the code that
+        logged the statement, which the record itself attributes to
+        ``logged_statement``.
+        """
+        return {
+            STATEMENT_ATTRIBUTE: {
+                "msg": msg,
+                "context_marker": context_marker,
+                "identifiers": identifiers,
+                "storage_marker": storage_marker,
+                "json_data": json_data,
+                "labeled_json_data": labeled_json_data,
+                "call_site": call_site,
+            }
+        }
+
+    def enable_metrics(
+        self,
+        prometheus_file: str | Path | None = None,
+    ) -> LoggingMetrics:
+        """Start collecting metrics about logging cost and volume.
+
+        Args:
+            prometheus_file: Optional file to write Prometheus text format to.
+                It is written automatically when ``exit_run`` finishes.
+
+        Returns:
+            LoggingMetrics: The metrics collector, also available as ``metrics``.
+        """
+        self.metrics = LoggingMetrics(prometheus_file=prometheus_file)
+        self.metrics.register_gauge("handler_queue_depth", self._handler_queue_depths)
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        """Stop collecting metrics and drop the collector."""
+        self.metrics = None
+
+    def enable_profiling(
+        self,
+        top_n: int = 20,
+        report_on_exit: bool = True,
+        report_path: str | Path | None = None,
+    ) -> CallSiteProfiler:
+        """Start attributing logging cost to the call sites of ``logged_statement``.
+
+        Args:
+            top_n: Default number of call sites included in reports.
+            report_on_exit: Whether ``exit_run`` logs a report when it finishes.
+            report_path: Optional file written at ``exit_run``. A ``.prof`` or
+                ``.pstats`` suffix writes pstats data, anything else writes JSON.
+
+        Returns:
+            CallSiteProfiler: The profiler, also available as ``profiler``.
+        """
+        self.profiler = CallSiteProfiler(
+            top_n=top_n,
+            report_on_exit=report_on_exit,
+            report_path=report_path,
+        )
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """Stop profiling call sites and drop the profiler."""
+        self.profiler = None
+
+    def enable_adaptive_verbosity(
+        self,
+        floor: int = 1,
+        ceiling: int | None = None,
+        max_rate: float | None = 5000.0,
+        max_latency: float | None = 0.001,
+        max_queue_depth: float | None = 1000.0,
+        window: float = 1.0,
+        recover_ratio: float = 0.5,
+        recover_windows: int = 3,
+    ) -> AdaptiveVerbosity:
+        """Lower the verbosity threshold automatically under logging pressure.
+
+        Throughput, handler latency and handler queue depth are measured over
+        windows of ``window`` seconds. A window over any limit lowers the
+        effective threshold by one, down to ``floor``; ``recover_windows``
+        calm windows in a row raise it by one, up to ``ceiling``. Each change
+        is logged with its measurements: lowering at WARNING, raising at INFO.
+        Verbosity bypass markers keep working, and ``verbosity_threshold``
+        still caps the effective threshold. Adaptation needs room between
+        ``floor`` and ``ceiling``: with the default ``verbosity_threshold``
+        of 1 and floor 1 there is nothing to lower, so a warning is logged
+        and the threshold never changes.
+
+        Args:
+            floor: Lowest threshold adaptation goes down to.
+            ceiling: Highest threshold. Defaults to ``verbosity_threshold``.
+            max_rate: Statements emitted per second considered pressure.
+            max_latency: Mean handler latency per statement, in seconds,
+                considered pressure.
+            max_queue_depth: Records queued by buffering handlers considered
+                pressure.
+            window: Length of an evaluation window in seconds.
+            recover_ratio: Fraction of each limit every measurement must stay
+                below for a window to count as calm.
+            recover_windows: Calm windows needed before each step back up.
+
+        Returns:
+            AdaptiveVerbosity: The controller, also available as
+            ``adaptive_verbosity``.
+        """
+        self.adaptive_verbosity = AdaptiveVerbosity(
+            ceiling=self.verbosity_threshold if ceiling is None else ceiling,
+            floor=floor,
+            max_rate=max_rate,
+            max_latency=max_latency,
+            max_queue_depth=max_queue_depth,
+            window=window,
+            recover_ratio=recover_ratio,
+            recover_windows=recover_windows,
+            queue_depth=lambda: sum(self._handler_queue_depths().values()),
+            on_change=self._log_verbosity_change,
+        )
+        if self.adaptive_verbosity.ceiling == self.adaptive_verbosity.floor:
+            self.logger.warning(
+                "Adaptive verbosity has no effect: its ceiling and floor are "
+                "both %d. Raise verbosity_threshold or pass a higher ceiling",
+                floor,
+            )
+        return self.adaptive_verbosity
+
+    def disable_adaptive_verbosity(self) -> None:
+        """Stop adapting and restore the configured verbosity threshold."""
+        self.adaptive_verbosity = None
+
+    def _log_verbosity_change(self, change: VerbosityChange) -> None:
+        """Log a structured notice of an adaptive threshold change."""
+        notice = change.as_dict()
+        builder = MessageBuilder(
+            f"Adaptive verbosity threshold {change.previous} -> {change.threshold}"
+            f" ({change.reason})"
+        )
+        append_json_data(builder, notice, None, None, None, None)
+        self.logger.log(
+            logging.WARNING if change.reason == "pressure" else logging.INFO,
+            builder.build(),
+            extra={"adaptive_verbosity": notice},
+        )
+
+    def enable_flight_recorder(
+        self,
+        capacity: int = 1000,
+        max_bytes: int | None = 1 << 20,
+    ) -> FlightRecorder:
+        """Keep recent suppressed statements and replay them when an error occurs.
+
+        Statements suppressed by verbosity, and statements below the logger's
+        level that are not stored, are kept unrendered in a ring buffer
+        instead of being discarded. The buffer is rendered and handed to the
+        handlers, oldest first, when a record at ERROR or above is logged,
+        when an error is added to ``error_list`` and when ``exit_run`` fails.
+        While the recorder is enabled, ``logged_statement`` returns None for
+        statements below the logger's level that it records.
+
+        Args:
+            capacity: Maximum number of statements kept.
+            max_bytes: Maximum estimated size of the kept statements, counting
+                message text and a fixed estimate per payload. None bounds the
+                buffer by ``capacity`` only.
+
+        Returns:
+            FlightRecorder: The recorder, also available as ``flight_recorder``.
+        """
+        self.flight_recorder = FlightRecorder(capacity=capacity, max_bytes=max_bytes)
+        self.logger.removeFilter(self._flight_recorder_filter)
+        self.logger.addFilter(self._flight_recorder_filter)
+        return self.flight_recorder
+
+    def disable_flight_recorder(self) -> None:
+        """Stop recording suppressed statements and drop the recorder."""
+        self.flight_recorder = None
+        self.logger.removeFilter(self._flight_recorder_filter)
+
+    def _flight_recorder_filter(self, record: logging.LogRecord) -> bool:
+        """Logger filter flushing the flight recorder ahead of error records."""
+        if record.levelno >= logging.ERROR:
+            self.flush_flight_recorder()
+        return True
+
+    def _on_error_added(self) -> None:
+        self.flush_flight_recorder()
+
+    def flush_flight_recorder(self) -> int:
+        """Render the recorded statements and hand them to the handlers.
+
+        Returns:
+            int: The number of statements flushed.
+        """
+        recorder = self.flight_recorder
+        if recorder is None or not len(recorder):
+            return 0
+
+        entries = recorder.drain()
+        log_records = [
+            recorder.make_log_record(
+                self.logger,
+                entry,
+                self._render_flight_record(entry),
+            )
+            for entry in entries
+        ]
+        if self.structured_records:
+            for entry, record in zip(entries, log_records):
+                record.__dict__.update(
+                    self._statement_extra(
+                        entry.msg,
+                        entry.context_marker,
+                        entry.identifiers,
+                        None,
+                        entry.json_data,
+                        entry.labeled_json_data,
+                        None,
+                    )
+                )
+        self._dispatch_records(log_records)
+        return len(log_records)
+
+    def _render_flight_record(self, entry: FlightRecord) -> str:
+        """Render a recorded statement as ``logged_statement`` would have."""
+        builder = MessageBuilder()
+        if entry.context_marker is not None:
+            builder.append(f"[{entry.context_marker}] ")
+        builder.append(entry.msg)
+        if entry.identifiers:
+            builder.append(" (" + ", ".join(entry.identifiers) + ")")
+        append_json_data(
+            builder,
+            entry.json_data,
+            entry.labeled_json_data,
+            self.payload_limits,
+            self.payload_cache,
+            None,
+        )
+        return builder.build()
+
+    def span(
+        self,
+        name: str,
+        context_marker: str | None = None,
+        storage_marker: str | None = None,
+        log_level: LogLevel = "debug",
+    ) -> Span:
+        """Time a lifecycle phase.
+
+        The returned span works as a context manager (``with`` or
+        ``async with``) and as a decorator for functions and coroutine
+        functions. Spans started inside another span record it as their
+        parent. Each completed span is logged as a structured record and added
+        to the per-name aggregates returned by ``span_summary``.
+
+        Args:
+            name: The span name, used to group aggregates.
+            context_marker: Context marker for the logged span record.
+            storage_marker: Storage marker for the logged span record.
+            log_level: Level the span record is logged at.
+
+        Returns:
+            Span: The span.
+
+        Examples:
+            with logging.span("load", context_marker="setup"):
+                load_inputs()
+
+            @logging.span("sync")
+            async def sync_repos() -> None: ...
+        """
+
+        def emit(record: SpanRecord) -> None:
+            self._log_span(record, log_level)
+
+        return Span(self.spans, name, emit, context_marker, storage_marker)
+
+    def _log_span(self, record: SpanRecord, log_level: LogLevel) -> None:
+        """Log a completed span as a structured record."""
+        outcome = f"failed with {record.error}" if record.error else "finished"
+        self.logged_statement(
+            f"Span {record.name} {outcome} in {record.duration_ns / 1e6:.3f} ms",
+            labeled_json_data={"span": record.to_dict()},
+            context_marker=record.context_marker,
+            storage_marker=record.storage_marker,
+            log_level=log_level,
+        )
+
+    def span_summary(self) -> dict[str, dict[str, int]]:
+        """Return per-name aggregates of completed spans.
+
+        Returns:
+            dict[str, dict[str, int]]: For each span name, its ``count`` and
+            ``total_ns``, ``p50_ns``, ``p95_ns`` and ``max_ns`` durations.
+        """
+        return self.spans.summary()
+
+    def _handler_queue_depths(self) -> dict[str, float]:
+        """Sample the queue depth of every handler that buffers records."""
+        return {
+            handler.get_name() or f"{type(handler).__name__}-{index}": float(
+                handler.queue_depth
+            )
+            for index, handler in enumerate(self.logger.handlers)
+            if hasattr(handler, "queue_depth")
+        }
+
     def _configure_logger(
         self,
         logger: logging.Logger | None = None,
@@ -198,11 +939,19 @@ class Logging:
             return
 
         if self.enable_console or strtobool(os.getenv("OVERRIDE_TO_CONSOLE", "False")):
-            add_console_handler(logger)
+            add_console_handler(
+                logger, self.console_mode, self.traceback_policy, self.log_format
+            )
 
         if self.enable_file or strtobool(os.getenv("OVERRIDE_TO_FILE", "False")):
             # Pass the log file name directly
-            add_file_handler(logger, log_file_name)
+            add_file_handler(
+                logger,
+                log_file_name,
+                self.log_compression,
+                self.traceback_policy,
+                self.log_format,
+            )
 
     def verbosity_exceeded(self, verbose: bool, verbosity: int) -> bool:
         """Determines if a message should be suppressed based on verbosity settings.
@@ -220,6 +969,15 @@ class Logging:
         - verbose=False, or
         - verbose=True and verbose output is enabled
         """
+        return self._verbosity_exceeded(self.config, verbose, verbosity)
+
+    def _verbosity_exceeded(
+        self,
+        config: LoggingConfig,
+        verbose: bool,
+        verbosity: int,
+    ) -> bool:
+        """Apply ``verbosity_exceeded`` against one configuration snapshot."""
         if (
             self.current_context_marker
             and self.current_context_marker in self.verbosity_bypass_markers
@@ -229,18 +987,22 @@ class Logging:
         if verbosity > 1:
             verbose = True
 
-        if verbose and not self.enable_verbose_output:
+        if verbose and not config.enable_verbose_output:
             return True
 
-        return verbosity > self.verbosity_threshold
+        adaptive = self.adaptive_verbosity
+        if adaptive is not None and adaptive.threshold < config.verbosity_threshold:
+            return verbosity > adaptive.threshold
 
-    def _prepare_message(
+        return verbosity > config.verbosity_threshold
+
+    def _prepare_segments(
         self,
         msg: str,
         context_marker: str | None,
         identifiers: Sequence[str] | None,
-    ) -> str:
-        """Prepare the log message with context markers and identifiers.
+    ) -> MessageBuilder:
+        """Collect the context marker prefix, message and identifiers as segments.
 
         Args:
             msg: The base message to prepare.
@@ -248,16 +1010,37 @@ class Logging:
             identifiers: Optional identifiers to append in parentheses.
 
         Returns:
-            str: The prepared message with any context marker prefix and identifiers.
+            MessageBuilder: A builder holding the prepared message segments.
         """
+        builder = MessageBuilder()
         if context_marker is not None:
             self.current_context_marker = context_marker
-            msg = f"[{self.current_context_marker}] {msg}"
+            builder.append(f"[{context_marker}] ")
+
+        builder.append(msg)
 
         if identifiers:
-            msg += " (" + ", ".join(cast(list[str], identifiers)) + ")"
+            builder.append(" (" + ", ".join(cast(list[str], identifiers)) + ")")
+
+        return builder
+
+    def _prepare_message(
+        self,
+        msg: str,
+        context_marker: str | None,
+        identifiers: Sequence[str] | None,
+    ) -> str:
+        """Prepare the log message with context markers and identifiers.
 
-        return msg
+        Args:
+            msg: The base message to prepare.
+            context_marker: Optional marker to prefix message with and set as current context.
+            identifiers: Optional identifiers to append in parentheses.
+
+        Returns:
+            str: The prepared message with any context marker prefix and identifiers.
+        """
+        return self._prepare_segments(msg, context_marker, identifiers).build()
 
     def _store_logged_message(
         self,
@@ -266,7 +1049,7 @@ class Logging:
         storage_marker: str | None,
         allowed_levels: tuple[str, ...],
         denied_levels: tuple[str, ...],
-    ) -> None:
+    ) -> bool:
         """Store the logged message if it meets the filtering criteria.
 
         Args:
@@ -276,6 +1059,9 @@ class Logging:
             allowed_levels: Normalized levels that are allowed (if empty, all allowed).
             denied_levels: Normalized levels that are denied.
 
+        Returns:
+            bool: True if the message was stored.
+
         Messages are stored in self.stored_messages under their storage_marker if:
         1. A storage_marker is provided
         2. The log_level is in allowed_levels (or allowed_levels is empty)
@@ -284,14 +1070,29 @@ class Logging:
         Warning-level and above messages are prefixed with ':warning:'.
         """
         if not storage_marker:
-            return
+            return False
+
+        stored_msg = self._storage_text(msg, log_level, allowed_levels, denied_levels)
+        if stored_msg is None:
+            return False
+
+        self.stored_messages.add(storage_marker, stored_msg)
+        return True
 
+    @staticmethod
+    def _storage_text(
+        msg: str,
+        log_level: str,
+        allowed_levels: tuple[str, ...],
+        denied_levels: tuple[str, ...],
+    ) -> str | None:
+        """Return the text to store for a message, or None if it is filtered out."""
         if (
             not allowed_levels or log_level in allowed_levels
         ) and log_level not in denied_levels:
-            self.stored_messages[storage_marker].add(
-                f":warning: {msg}" if log_level not in ["debug", "info"] else msg,
-            )
+            return f":warning: {msg}" if log_level not in ["debug", "info"] else msg
+
+        return None
 
     def logged_statement(
         self,
@@ -306,6 +1107,7 @@ class Logging:
         storage_marker: str | None = None,
         allowed_levels: Sequence[str] | None = None,
         denied_levels: Sequence[str] | None = None,
+        payload_cache_key: Hashable | None = None,
     ) -> str | None:
         """Log a statement with optional data, context marking, and storage.
 
@@ -321,42 +1123,481 @@ class Logging:
             storage_marker: Marker for storing in message collections.
             allowed_levels: Override of allowed log levels.
             denied_levels: Override of denied log levels.
+            payload_cache_key: Explicit key for the payload cache, used instead
+                of the payloads' identity. Change it whenever the data changes.
 
         Returns:
-            str | None: The final message if logged, None if suppressed by verbosity.
+            str | None: The final message if logged, None if suppressed by
+            verbosity or kept unrendered by the flight recorder.
         """
-        if self.verbosity_exceeded(verbose, verbosity) and not (
-            context_marker and context_marker in self.verbosity_bypass_markers
+        # One snapshot for the whole call, so a concurrent reconfigure
+        # applies to the next statement rather than half of this one
+        config = self.config
+        metrics = self.metrics
+        profiler = self.profiler
+        recorder = self.flight_recorder
+        override = (
+            config.override_for(context_marker) if config.marker_overrides else None
+        )
+        if (
+            override is None
+            and self._verbosity_exceeded(config, verbose, verbosity)
+            and not (context_marker and context_marker in self.verbosity_bypass_markers)
         ):
+            if metrics is not None:
+                metrics.increment("suppressed_verbosity", log_level, context_marker)
+            if recorder is not None:
+                recorder.record(
+                    logging.getLevelName(log_level.upper()),
+                    msg,
+                    json_data,
+                    labeled_json_data,
+                    identifiers,
+                    context_marker,
+                )
             return None
 
-        final_msg = self._prepare_message(msg, context_marker, identifiers)
-        final_msg = add_json_data(final_msg, json_data, labeled_json_data)
+        if (
+            recorder is not None
+            and override is None
+            and not (storage_marker or config.default_storage_marker)
+        ):
+            levelno = logging.getLevelName(log_level.upper())
+            if not self.logger.isEnabledFor(levelno):
+                if context_marker is not None:
+                    self.current_context_marker = context_marker
+                if metrics is not None:
+                    metrics.increment("suppressed_level", log_level, context_marker)
+                recorder.record(
+                    levelno,
+                    msg,
+                    json_data,
+                    labeled_json_data,
+                    identifiers,
+                    context_marker,
+                )
+                return None
+
+        instrumented = metrics is not None or profiler is not None
+        if not instrumented:
+            builder = self._prepare_segments(msg, context_marker, identifiers)
+            append_json_data(
+                builder,
+                json_data,
+                labeled_json_data,
+                self.payload_limits,
+                self.payload_cache,
+                payload_cache_key,
+            )
+            final_msg = builder.build()
+        else:
+            started = time.perf_counter_ns()
+            builder = self._prepare_segments(msg, context_marker, identifiers)
+            prepared_segments = len(builder)
+            prepared = time.perf_counter_ns()
+            append_json_data(
+                builder,
+                json_data,
+                labeled_json_data,
+                self.payload_limits,
+                self.payload_cache,
+                payload_cache_key,
+            )
+            final_msg = builder.build()
+            serialized = time.perf_counter_ns()
+            payload_bytes = sum(
+                len(segment.encode("utf-8"))
+                for segment in builder.segments[prepared_segments:]
+            )
+            if metrics is not None:
+                metrics.observe_time("prepare_message", prepared - started)
+                metrics.observe_time("add_json_data", serialized - prepared)
+                if payload_bytes:
+                    metrics.observe_payload(payload_bytes)
 
         # Normalize levels once here before passing to storage
         final_allowed = (
             self._normalize_levels(allowed_levels)
             if allowed_levels is not None
-            else self.allowed_levels
+            else config.allowed_levels
         )
         final_denied = (
             self._normalize_levels(denied_levels)
             if denied_levels is not None
-            else self.denied_levels
+            else config.denied_levels
         )
 
-        self._store_logged_message(
+        final_storage_marker = storage_marker or config.default_storage_marker
+        stored = self._store_logged_message(
             final_msg,
             log_level,
-            storage_marker or self.default_storage_marker,
+            final_storage_marker,
             final_allowed,
             final_denied,
         )
 
+        extra = None
+        if self.structured_records:
+            caller = _statement_caller()
+            extra = self._statement_extra(
+                msg,
+                context_marker,
+                identifiers,
+                final_storage_marker,
+                json_data,
+                labeled_json_data,
+                (caller.f_code.co_filename, caller.f_lineno, caller.f_code.co_name),
+            )
+
+        if override is not None:
+            levelno = logging.getLevelName(log_level.upper())
+            if levelno >= override.levelno and not self.logger.isEnabledFor(levelno):
+                # The logger's level would drop the record; hand it to the
+                # handlers directly, as logger.handle does once a level passes
+                caller = _statement_caller()
+                self._dispatch_records(
+                    [
+                        self.logger.makeRecord(
+                            self.logger.name,
+                            levelno,
+                            caller.f_code.co_filename,
+                            caller.f_lineno,
+                            final_msg,
+                            (),
+                            None,
+                            caller.f_code.co_name,
+                            extra,
+                        )
+                    ]
+                )
+                return final_msg
+
         logger_method = getattr(self.logger, log_level)
-        logger_method(final_msg)
+        if extra is not None:
+            logger_method = functools.partial(logger_method, extra=extra)
+        adaptive = self.adaptive_verbosity
+        if not instrumented:
+            if adaptive is None:
+                logger_method(final_msg)
+            else:
+                self._emit_adaptive(adaptive, logger_method, final_msg)
+            return final_msg
+
+        if metrics is None:
+            if adaptive is None:
+                logger_method(final_msg)
+            else:
+                self._emit_adaptive(adaptive, logger_method, final_msg)
+        else:
+            if stored:
+                metrics.increment("stored", log_level, final_storage_marker)
+            if self.logger.isEnabledFor(logging.getLevelName(log_level.upper())):
+                emit_started = time.perf_counter_ns()
+                logger_method(final_msg)
+                emitted = time.perf_counter_ns()
+                metrics.observe_time("handler_emit", emitted - emit_started)
+                metrics.increment("emitted", log_level, context_marker)
+                if adaptive is not None:
+                    adaptive.observe(emitted - emit_started, emitted)
+            else:
+                metrics.increment("suppressed_level", log_level, context_marker)
+
+        if profiler is not None:
+            caller = _statement_caller()
+            profiler.record(
+                (caller.f_code.co_filename, caller.f_lineno, caller.f_code.co_name),
+                serialized - prepared,
+                time.perf_counter_ns() - started,
+                payload_bytes,
+            )
         return final_msg
 
+    @staticmethod
+    def _emit_adaptive(
+        adaptive: AdaptiveVerbosity,
+        logger_method: Callable[[str], None],
+        final_msg: str,
+    ) -> None:
+        """Emit a message, reporting its handler latency to adaptation."""
+        started = time.perf_counter_ns()
+        logger_method(final_msg)
+        emitted = time.perf_counter_ns()
+        adaptive.observe(emitted - started, emitted)
+
+    # Fields accepted in each record passed to logged_statements
+    STATEMENT_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "msg",
+            "json_data",
+            "labeled_json_data",
+            "identifiers",
+            "verbose",
+            "verbosity",
+            "context_marker",
+            "log_level",
+            "storage_marker",
+            "allowed_levels",
+            "denied_levels",
+            "payload_cache_key",
+        }
+    )
+
+    def logged_statements(
+        self,
+        records: Iterable[Mapping[str, Any]],
+        **defaults: Any,
+    ) -> list[str | None]:
+        """Log many statements in one call.
+
+        Each record holds the keyword arguments of one ``logged_statement``
+        call; ``defaults`` supplies values shared by every record. The result
+        matches calling ``logged_statement`` once per record, but the verbosity
+        decision and level normalization are evaluated once per distinct set of
+        inputs, stored messages are added in bulk, and the emitted records are
+        handed to each handler as one batch. Handlers implementing
+        ``handle_batch`` write the whole batch under a single lock acquisition.
+
+        Args:
+            records: Mappings of ``logged_statement`` keyword arguments.
+            **defaults: Keyword arguments applied to every record unless the
+                record overrides them.
+
+        Returns:
+            list[str | None]: The final message for each record, or None where
+            a record was suppressed by verbosity or kept unrendered by the
+            flight recorder.
+
+        Raises:
+            TypeError: If a record contains an unknown field or has no message.
+        """
+        config = self.config
+        metrics = self.metrics
+        recorder = self.flight_recorder
+        decisions: dict[tuple[Any, ...], bool] = {}
+        normalized: dict[tuple[str, ...], tuple[str, ...]] = {}
+        enabled: dict[str, bool] = {}
+        to_store: defaultdict[str, list[str]] = defaultdict(list)
+        log_records: list[logging.LogRecord] = []
+        results: list[str | None] = []
+        caller = _statement_caller()
+        caller_site = (
+            caller.f_code.co_filename,
+            caller.f_lineno,
+            caller.f_code.co_name,
+        )
+
+        for record in records:
+            options = {**defaults, **record} if defaults else record
+            unknown = options.keys() - self.STATEMENT_FIELDS
+            if unknown or "msg" not in options:
+                error_message = (
+                    f"Invalid logged_statements record: unknown fields {sorted(unknown)}"
+                    if unknown
+                    else "Invalid logged_statements record: missing 'msg'"
+                )
+                raise TypeError(error_message)
+
+            verbose = options.get("verbose", False)
+            verbosity = options.get("verbosity", 1)
+            context_marker = options.get("context_marker")
+            log_level = options.get("log_level", "debug")
+
+            decision_key = (
+                verbose,
+                verbosity,
+                context_marker,
+                self.current_context_marker,
+            )
+            override = (
+                config.override_for(context_marker) if config.marker_overrides else None
+            )
+            suppressed = False if override is not None else decisions.get(decision_key)
+            if suppressed is None:
+                suppressed = decisions[decision_key] = self._verbosity_exceeded(
+                    config, verbose, verbosity
+                ) and not (
+                    context_marker and context_marker in self.verbosity_bypass_markers
+                )
+            if suppressed:
+                if metrics is not None:
+                    metrics.increment("suppressed_verbosity", log_level, context_marker)
+                if recorder is not None:
+                    recorder.record(
+                        logging.getLevelName(log_level.upper()),
+                        options["msg"],
+                        options.get("json_data"),
+                        options.get("labeled_json_data"),
+                        options.get("identifiers"),
+                        context_marker,
+                    )
+                results.append(None)
+                continue
+
+            levelno = logging.getLevelName(log_level.upper())
+            is_enabled = enabled.get(log_level)
+            if is_enabled is None:
+                is_enabled = enabled[log_level] = self.logger.isEnabledFor(levelno)
+            storage_marker = (
+                options.get("storage_marker") or config.default_storage_marker
+            )
+            if (
+                recorder is not None
+                and override is None
+                and not storage_marker
+                and not is_enabled
+            ):
+                if context_marker is not None:
+                    self.current_context_marker = context_marker
+                if metrics is not None:
+                    metrics.increment("suppressed_level", log_level, context_marker)
+                recorder.record(
+                    levelno,
+                    options["msg"],
+                    options.get("json_data"),
+                    options.get("labeled_json_data"),
+                    options.get("identifiers"),
+                    context_marker,
+                )
+                results.append(None)
+                continue
+
+            builder = self._prepare_segments(
+                options["msg"], context_marker, options.get("identifiers")
+            )
+            append_json_data(
+                builder,
+                options.get("json_data"),
+                options.get("labeled_json_data"),
+                self.payload_limits,
+                self.payload_cache,
+                options.get("payload_cache_key"),
+            )
+            final_msg = builder.build()
+            results.append(final_msg)
+
+            if storage_marker:
+                stored_msg = self._storage_text(
+                    final_msg,
+                    log_level,
+                    self._cached_levels(
+                        options.get("allowed_levels"), config.allowed_levels, normalized
+                    ),
+                    self._cached_levels(
+                        options.get("denied_levels"), config.denied_levels, normalized
+                    ),
+                )
+                if stored_msg is not None:
+                    to_store[storage_marker].append(stored_msg)
+                    if metrics is not None:
+                        metrics.increment("stored", log_level, storage_marker)
+
+            if not is_enabled and (override is None or levelno < override.levelno):
+                if metrics is not None:
+                    metrics.increment("suppressed_level", log_level, context_marker)
+                continue
+
+            log_records.append(
+                self.logger.makeRecord(
+                    self.logger.name,
+                    levelno,
+                    caller_site[0],
+                    caller_site[1],
+                    final_msg,
+                    (),
+                    None,
+                    caller_site[2],
+                    self._statement_extra(
+                        options["msg"],
+                        context_marker,
+                        options.get("identifiers"),
+                        storage_marker,
+                        options.get("json_data"),
+                        options.get("labeled_json_data"),
+                        caller_site,
+                    )
+                    if self.structured_records
+                    else None,
+                )
+            )
+            if metrics is not None:
+                metrics.increment("emitted", log_level, context_marker)
+
+        for storage_marker, stored_msgs in to_store.items():
+            self.stored_messages.add_many(storage_marker, stored_msgs)
+
+        if log_records:
+            started = time.perf_counter_ns()
+            self._dispatch_records(log_records)
+            emitted = time.perf_counter_ns()
+            if metrics is not None:
+                metrics.observe_time("handler_emit_batch", emitted - started)
+            if self.adaptive_verbosity is not None:
+                self.adaptive_verbosity.observe(
+                    emitted - started, emitted, len(log_records)
+                )
+
+        return results
+
+    def _cached_levels(
+        self,
+        levels: Sequence[str] | None,
+        default: tuple[str, ...],
+        cache: dict[tuple[str, ...], tuple[str, ...]],
+    ) -> tuple[str, ...]:
+        """Normalize a level override, memoizing the result for the batch."""
+        if levels is None:
+            return default
+
+        key = tuple(levels)
+        cached = cache.get(key)
+        if cached is None:
+            cached = cache[key] = self._normalize_levels(levels)
+        return cached
+
+    def _dispatch_records(self, records: list[logging.LogRecord]) -> None:
+        """Hand already-created records to the logger's handlers as a batch.
+
+        Mirrors ``logging.Logger.handle``: logger filters are applied per
+        record and handlers are collected up the hierarchy while loggers
+        propagate. Each handler receives every record at or above its level,
+        through ``handle_batch`` when it supports the batch protocol and one
+        record at a time otherwise.
+
+        Args:
+            records: The records to dispatch, in order.
+        """
+        logger = self.logger
+        if logger.disabled:
+            return
+        if logger.filters:
+            records = [record for record in records if logger.filter(record)]
+        if not records:
+            return
+
+        handlers: list[logging.Handler] = []
+        current: logging.Logger | None = logger
+        while current is not None:
+            handlers.extend(current.handlers)
+            if not current.propagate:
+                break
+            current = current.parent
+
+        if not handlers:
+            for record in records:
+                logger.handle(record)
+            return
+
+        for handler in handlers:
+            eligible = [record for record in records if record.levelno >= handler.level]
+            if not eligible:
+                continue
+            handle_batch = getattr(handler, "handle_batch", None)
+            if handle_batch is not None:
+                handle_batch(eligible)
+            else:
+                for record in eligible:
+                    handler.handle(record)
+
     def log_results(
         self,
         results: Any,
@@ -365,31 +1606,75 @@ class Logging:
         ext: str | None = None,
         verbose: bool = False,
         verbosity: int = 0,
+        indent: bool | None = None,
     ) -> None:
         """Log results to a file.
 
+        JSON is serialized straight to bytes with orjson, and the file is
+        replaced atomically so readers never see a partial write. With an
+        ``artifact_store``, results are stored there under the digest of
+        their canonical bytes instead, and nothing is written when the same
+        content is already stored. With ``background_results``, the write
+        happens on a worker thread that ``exit_run`` joins before exiting.
+
         Args:
             results: The results to log.
             log_file_name: Base name for the log file.
             no_formatting: If True, write results as-is without JSON formatting.
-            ext: File extension (defaults to ".json").
+            ext: File extension (defaults to ".json"). ".msgpack" or ".mpk"
+                write MessagePack and ".cbor" writes CBOR instead of JSON.
             verbose: Whether this is a verbose log.
             verbosity: Verbosity level for this log.
+            indent: Indent JSON by two spaces. Defaults to ``results_indent``.
+
+        Raises:
+            ImportError: If a binary extension's optional package is missing.
         """
         if self.verbosity_exceeded(verbose, verbosity):
             return
 
         log_file_path = Path(f"./{log_file_name}").with_suffix(ext or ".json")
-        log_file_path.parent.mkdir(parents=True, exist_ok=True)
+        binary_format = format_for_path(log_file_path)
 
+        # Serialize on the calling thread so later changes to the results
+        # cannot leak into a write that is still queued
+        content_type = binary_format or "json"
         if no_formatting:
-            log_file_path.write_text(str(results))
+            data = str(results).encode("utf-8")
+            content_type = "text"
+        elif binary_format is not None:
+            data = encode_binary(results, binary_format)
+        elif self.artifact_store is not None:
+            data = canonical_json(results)
         else:
-            log_file_path.write_text(
-                wrap_raw_data_for_export(results, allow_encoding=True)
+            data = dump_results(
+                results, self.results_indent if indent is None else indent
             )
 
-        self.logged_statement(f"New results log: {log_file_path}")
+        write: Callable[[], None]
+        store = self.artifact_store
+        if store is not None:
+            artifact_name = Path(log_file_name).with_suffix(ext or ".json").as_posix()
+
+            def write() -> None:
+                digest = store.put(artifact_name, data, content_type)
+                self.logged_statement(
+                    f"Results artifact {artifact_name}: sha256 {digest}"
+                )
+
+        else:
+
+            def write() -> None:
+                write_atomic(log_file_path, data)
+                self.logged_statement(f"New results log: {log_file_path}")
+
+        if self.results_writer is not None:
+            self.results_writer.submit(write)
+        else:
+            write()
+
+    # Output formats supported by exit_run
+    OUTPUT_FORMATS: ClassVar[tuple[str, ...]] = ("json", "ndjson", "msgpack", "cbor")
 
     # Built-in key transforms from extended-data-types
     KEY_TRANSFORMS: ClassVar[dict[str, KeyTransform]] = {
@@ -438,37 +1723,22 @@ class Logging:
         self,
         data: Mapping[str, Any],
         transform_fn: KeyTransform,
-    ) -> dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Recursively transform all keys in a nested mapping.
 
         Args:
-            data: The mapping to transform.
+            data: The mapping to transform. It is never mutated.
             transform_fn: Function to apply to each key.
 
         Returns:
-            A new dict with all keys transformed.
+            The transformed mapping. Subtrees whose keys do not change are
+            shared with ``data`` rather than copied.
         """
-        result = {}
-        for key, value in data.items():
-            transformed_key = transform_fn(key)
-            if isinstance(value, Mapping):
-                result[transformed_key] = self._transform_nested_keys(
-                    value, transform_fn
-                )
-            elif isinstance(value, list):
-                result[transformed_key] = [
-                    self._transform_nested_keys(item, transform_fn)
-                    if isinstance(item, Mapping)
-                    else item
-                    for item in value
-                ]
-            else:
-                result[transformed_key] = value
-        return result
+        return KeyTransformer(transform_fn).transform(data)
 
     def exit_run(
         self,
-        results: Mapping[str, Any] | None = None,
+        results: Mapping[str, Any] | Iterable[tuple[str, Any]] | None = None,
         unhump_results: bool = False,
         key_transform: KeyTransform | str | None = None,
         prefix: str | None = None,
@@ -481,6 +1751,7 @@ class Logging:
         encode_all_values_to_base64: bool = False,
         key: str | None = None,
         exit_on_completion: bool = True,
+        output_format: OutputFormat = "json",
         **format_opts: Any,
     ) -> Any:
         """Format results and optionally exit the program cleanly.
@@ -490,11 +1761,14 @@ class Logging:
         - Error aggregation and reporting
         - Result transformation (key transforms, prefixing, sorting)
         - Base64 encoding
-        - JSON serialization
+        - JSON serialization, as one document or streamed as JSON lines
+        - MessagePack or CBOR serialization
         - Clean stdout output and exit
 
         Args:
             results: The results to format and output. Defaults to empty dict.
+                May also be an iterable, such as a generator, of
+                ``(key, value)`` pairs.
             unhump_results: Convert camelCase keys to snake_case (shorthand for
                 key_transform="snake_case").
             key_transform: Transform function for result keys. Can be:
@@ -504,8 +1778,10 @@ class Logging:
                 - None to skip transformation
                 When unhump_results=True, defaults to "snake_case".
             prefix: Prefix to add to result keys (implies key transformation).
-            prefix_allowlist: Keys to include when prefixing.
-            prefix_denylist: Keys to exclude when prefixing.
+            prefix_allowlist: Keys to include when prefixing. Entries may be
+                exact names, shell-style globs ("*_id") or regular
+                expressions prefixed with "re:".
+            prefix_denylist: Keys to exclude when prefixing, in the same forms.
             prefix_delimiter: Delimiter between prefix and key (default "_").
             sort_by_field: Sort results by this field's value.
             format_results: Whether to format results before base64 encoding.
@@ -514,6 +1790,18 @@ class Logging:
             key: Wrap results in a dict with this key.
             exit_on_completion: If True, write to stdout and exit(0).
                 If False, return the formatted results.
+            output_format: "json" writes one JSON document. "ndjson" writes
+                each top-level result as a ``{key: value}`` JSON line as soon
+                as it has been sorted, transformed and encoded, so memory use
+                does not grow with the number of results; with
+                ``exit_on_completion=False`` it returns an iterator of the
+                encoded lines instead, and the end-of-run flushing and
+                reports happen once that iterator is exhausted or fails.
+                "ndjson" cannot be combined with ``encode_to_base64`` or
+                ``key``. "msgpack" and "cbor" write one binary document to
+                stdout and need the optional ``msgpack`` or ``cbor2``
+                package; with ``encode_to_base64`` the binary document is
+                base64 encoded instead of JSON.
             **format_opts: Additional options for wrap_raw_data_for_export.
 
         Returns:
@@ -523,6 +1811,9 @@ class Logging:
         Raises:
             RuntimeError: If there are accumulated errors in error_list.
             ExitRunError: If result formatting fails.
+            ValueError: If the output format or its options are invalid.
+            ImportError: If a binary output format's optional package is
+                missing.
 
         Examples:
             # Simple snake_case transformation (most common)
@@ -538,15 +1829,77 @@ class Logging:
         transform_fn = self._resolve_key_transform(
             key_transform, unhump_results, prefix
         )
+        if output_format not in self.OUTPUT_FORMATS:
+            available = ", ".join(self.OUTPUT_FORMATS)
+            raise ValueError(
+                f"Unknown output_format '{output_format}'. Available: {available}"
+            )
+        if output_format == "ndjson" and (encode_to_base64 or key):
+            error_message = (
+                "output_format 'ndjson' cannot be combined with encode_to_base64 or key"
+            )
+            raise ValueError(error_message)
+        if output_format in BINARY_FORMATS:
+            # Fail before any output is written
+            require_format(output_format)
+
+        transformer: KeyTransformer | None = None
+        if transform_fn is not None:
+            # Copy-on-write: the caller's results are never mutated and
+            # only paths where a key changes are copied
+            transformer = KeyTransformer(
+                transform_fn,
+                prefix=prefix or None,
+                prefix_rule=compile_prefix_rule(prefix_allowlist, prefix_denylist),
+                prefix_delimiter=prefix_delimiter,
+            )
+
+        if "default" not in format_opts:
+            format_opts["default"] = str
+
+        def encode_result_with_base64(r: Any) -> str:
+            if format_results:
+                self.logger.info("Formatting results before encoding them with base64")
+                r = wrap_raw_data_for_export(r, **format_opts)
+
+            # Ensure we have a string for encoding
+            if isinstance(r, bytes):
+                return base64.b64encode(r).decode("utf-8")
+            if isinstance(r, str):
+                return base64.b64encode(r.encode("utf-8")).decode("utf-8")
+            return base64.b64encode(str(r).encode("utf-8")).decode("utf-8")
+
+        finalize = True
         try:
+            if output_format == "ndjson":
+                if self.error_list:
+                    raise RuntimeError(os.linesep.join(self.error_list))
+
+                lines = self._ndjson_lines(
+                    results if results is not None else {},
+                    sort_by_field,
+                    transformer,
+                    encode_result_with_base64 if encode_all_values_to_base64 else None,
+                )
+                if not exit_on_completion:
+                    # The lines are produced after this returns, so the
+                    # iterator finalizes the run once it is done
+                    finalize = False
+                    return self._finalizing(lines)
+
+                self._write_ndjson(lines)
+                if self.error_list:
+                    raise RuntimeError(os.linesep.join(self.error_list))
+                sys.exit(0)
+
+            if results is not None and not isinstance(results, Mapping):
+                results = dict(results)
+
             self.log_results(results, "results")
 
             if self.error_list:
                 raise RuntimeError(os.linesep.join(self.error_list))
 
-            prefix_allowlist = list(prefix_allowlist) if prefix_allowlist else []
-            prefix_denylist = list(prefix_denylist) if prefix_denylist else []
-
             if results is None:
                 results = {}
 
@@ -554,103 +1907,51 @@ class Logging:
                 sorted_results = {}
                 field_value_counts: dict[str, int] = {}
                 for top_level_key, top_level_value in results.items():
-                    field_data = top_level_value.get(sort_by_field)
-                    if is_nothing(field_data):
-                        raise ExitRunError(
-                            f"Cannot return results when top level key {top_level_key}'s "
-                            f"value for sort by field {sort_by_field} is empty or does not exist"
-                        )
-                    # Handle duplicate field values by appending a suffix
-                    new_key = str(field_data)
-                    if new_key in field_value_counts:
-                        field_value_counts[new_key] += 1
-                        new_key = f"{new_key}_{field_value_counts[new_key]}"
-                    else:
-                        field_value_counts[new_key] = 0
+                    new_key = self._sort_key(
+                        top_level_key,
+                        top_level_value,
+                        sort_by_field,
+                        field_value_counts,
+                    )
                     sorted_results[new_key] = top_level_value
                 results = sorted_results
 
-            if transform_fn is not None:
-                if prefix:
-                    for top_level_key, top_level_value in results.items():
-                        if not isinstance(top_level_value, Mapping):
-                            results[top_level_key] = top_level_value
-                            continue
-
-                        transformed_result = {}
-                        for field_name, field_data in top_level_value.items():
-                            transformed_key = transform_fn(field_name)
-
-                            if (
-                                (
-                                    is_nothing(prefix_allowlist)
-                                    or field_name in prefix_allowlist
-                                    or transformed_key in prefix_allowlist
-                                )
-                                and field_name not in prefix_denylist
-                                and transformed_key not in prefix_denylist
-                            ):
-                                transformed_key = prefix_delimiter.join(
-                                    [prefix, transformed_key]
-                                )
-
-                            if isinstance(field_data, Mapping):
-                                transformed_result[transformed_key] = (
-                                    self._transform_nested_keys(
-                                        field_data, transform_fn
-                                    )
-                                )
-                            elif isinstance(field_data, list):
-                                transformed_result[transformed_key] = [
-                                    self._transform_nested_keys(item, transform_fn)
-                                    if isinstance(item, Mapping)
-                                    else item
-                                    for item in field_data
-                                ]
-                            else:
-                                transformed_result[transformed_key] = field_data
-
-                        results[top_level_key] = transformed_result
-                else:
-                    results = self._transform_nested_keys(results, transform_fn)
+            if transformer is not None:
+                results = transformer.transform_results(results)
 
             if not exit_on_completion:
                 return results
 
-            if "default" not in format_opts:
-                format_opts["default"] = str
-
-            def encode_result_with_base64(r: Any) -> str:
-                if format_results:
-                    self.logger.info(
-                        "Formatting results before encoding them with base64"
-                    )
-                    r = wrap_raw_data_for_export(r, **format_opts)
-
-                # Ensure we have a string for encoding
-                if isinstance(r, bytes):
-                    return base64.b64encode(r).decode("utf-8")
-                if isinstance(r, str):
-                    return base64.b64encode(r.encode("utf-8")).decode("utf-8")
-                return base64.b64encode(str(r).encode("utf-8")).decode("utf-8")
-
             if encode_all_values_to_base64:
                 self.logger.info("Encoding all top-level values in results with base64")
                 results = {
                     top_level_key: encode_result_with_base64(top_level_value)
-                    for top_level_key, top_level_value in deepcopy(results).items()
+                    for top_level_key, top_level_value in results.items()
                 }
                 self.log_results(results, "results_values_base64_encoded")
 
             if encode_to_base64:
                 self.logger.info("Encoding results with base64")
-                results = encode_result_with_base64(results)
+                results = (
+                    base64.b64encode(
+                        encode_binary(results, output_format, format_opts["default"])
+                    ).decode("utf-8")
+                    if output_format in BINARY_FORMATS
+                    else encode_result_with_base64(results)
+                )
                 self.log_results(results, "results_base64_encoded")
 
             if key:
                 self.logger.info("Wrapping results in key %s", key)
                 results = {key: results}
 
+            if output_format in BINARY_FORMATS and not isinstance(results, str):
+                self.logger.info("Dumping results to %s", output_format)
+                self._write_stdout_bytes(
+                    encode_binary(results, output_format, format_opts["default"])
+                )
+                sys.exit(0)
+
             if not isinstance(results, str):
                 self.logger.info("Dumping results to JSON")
                 results = orjson.dumps(results, default=str).decode("utf-8")
@@ -658,8 +1959,187 @@ class Logging:
             sys.stdout.write(results)
             sys.exit(0)
         except ExitRunError as exc:
-            err_msg = (
-                f"Failed to dump results because of a formatting error:\n\n{results}"
+            raise self._formatting_error(exc) from exc
+        except Exception:
+            self.flush_flight_recorder()
+            raise
+        finally:
+            if finalize:
+                self._finalize_run()
+
+    def _formatting_error(self, exc: ExitRunError) -> RuntimeError:
+        """Log a result formatting failure and return the error to raise."""
+        # The results can be huge; log the cause, not a dump of the data
+        err_msg = f"Failed to dump results because of a formatting error: {exc}"
+        self.logger.critical(err_msg, exc_info=exc)
+        return RuntimeError(err_msg)
+
+    def _finalizing(self, lines: Iterator[bytes]) -> Iterator[bytes]:
+        """Yield JSON lines, then finalize the run as ``exit_run`` does."""
+        try:
+            yield from lines
+        except ExitRunError as exc:
+            raise self._formatting_error(exc) from exc
+        except Exception:
+            self.flush_flight_recorder()
+            raise
+        finally:
+            self._finalize_run()
+
+    @staticmethod
+    def _sort_key(
+        top_level_key: str,
+        top_level_value: Mapping[str, Any],
+        sort_by_field: str,
+        field_value_counts: dict[str, int],
+    ) -> str:
+        """Return the key a result is re-keyed to by ``sort_by_field``.
+
+        Raises:
+            ExitRunError: If the result has no value for the field.
+        """
+        field_data = top_level_value.get(sort_by_field)
+        if is_nothing(field_data):
+            raise ExitRunError(
+                f"Cannot return results when top level key {top_level_key}'s "
+                f"value for sort by field {sort_by_field} is empty or does not exist"
             )
-            self.logger.critical(err_msg, exc_info=True)
-            raise RuntimeError(err_msg) from exc
+        # Handle duplicate field values by appending a suffix
+        new_key = str(field_data)
+        if new_key in field_value_counts:
+            field_value_counts[new_key] += 1
+            new_key = f"{new_key}_{field_value_counts[new_key]}"
+        else:
+            field_value_counts[new_key] = 0
+        return new_key
+
+    def _ndjson_lines(
+        self,
+        results: Mapping[str, Any] | Iterable[tuple[str, Any]],
+        sort_by_field: str | None,
+        transformer: KeyTransformer | None,
+        encode_value: Callable[[Any], str] | None,
+    ) -> Iterator[bytes]:
+        """Yield one encoded JSON line per top-level result, lazily."""
+        items = results.items() if isinstance(results, Mapping) else results
+        field_value_counts: dict[str, int] = {}
+        for top_level_key, top_level_value in items:
+            result_key, result_value = top_level_key, top_level_value
+            if sort_by_field:
+                result_key = self._sort_key(
+                    result_key, result_value, sort_by_field, field_value_counts
+                )
+            if transformer is not None:
+                result_key, result_value = transformer.transform_item(
+                    result_key, result_value
+                )
+            if encode_value is not None:
+                result_value = encode_value(result_value)
+            yield orjson.dumps(
+                {result_key: result_value},
+                default=str,
+                option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+            )
+
+    @staticmethod
+    def _write_stdout_bytes(data: bytes) -> None:
+        """Write a binary document to stdout.
+
+        Raises:
+            TypeError: If stdout is a text stream without a binary buffer.
+        """
+        sys.stdout.flush()
+        stdout = getattr(sys.stdout, "buffer", None)
+        if stdout is None:
+            error_message = (
+                "Binary output formats need a stdout with a binary buffer; "
+                "use encode_to_base64 to write text"
+            )
+            raise TypeError(error_message)
+        stdout.write(data)
+        stdout.flush()
+
+    def _write_ndjson(self, lines: Iterable[bytes]) -> None:
+        """Stream JSON lines to stdout, and to the results log, as they arrive.
+
+        Each line is flushed as soon as it is written so consumers can start
+        processing while later results are still being produced. The results
+        log is written to a temporary file and, once every line is written,
+        renamed into place or stored in the ``artifact_store`` like
+        ``log_results`` does, so an interrupted run leaves the previous
+        results in place.
+        """
+        sys.stdout.flush()
+        stdout = getattr(sys.stdout, "buffer", None)
+        log_file_path = (
+            None if self.verbosity_exceeded(False, 0) else Path("./results.ndjson")
+        )
+        with contextlib.ExitStack() as stack:
+            log_file, tmp_path = (
+                stack.enter_context(temporary_file(log_file_path))
+                if log_file_path is not None
+                else (None, None)
+            )
+            for line in lines:
+                if stdout is not None:
+                    stdout.write(line)
+                    stdout.flush()
+                else:
+                    sys.stdout.write(line.decode("utf-8"))
+                    sys.stdout.flush()
+                if log_file is not None:
+                    log_file.write(line)
+
+        if log_file_path is None or tmp_path is None:
+            return
+
+        write: Callable[[], None]
+        store = self.artifact_store
+        if store is not None:
+            artifact_name = log_file_path.name
+
+            def write() -> None:
+                try:
+                    digest = store.put_file(artifact_name, tmp_path, "ndjson")
+                finally:
+                    with contextlib.suppress(OSError):
+                        tmp_path.unlink()
+                self.logged_statement(
+                    f"Results artifact {artifact_name}: sha256 {digest}"
+                )
+
+        else:
+
+            def write() -> None:
+                tmp_path.replace(log_file_path)
+                self.logged_statement(f"New results log: {log_file_path}")
+
+        if self.results_writer is not None:
+            self.results_writer.submit(write)
+        else:
+            write()
+
+    def _finalize_run(self) -> None:
+        """Write end-of-run reports once ``exit_run`` finishes or fails."""
+        for handler in self.logger.handlers:
+            if isinstance(handler, BackgroundBatchHandler):
+                handler.flush()
+
+        if self.results_writer is not None:
+            for error in self.results_writer.join():
+                self.logger.error("Failed to write results: %s", error, exc_info=error)
+
+        if self.metrics is not None and self.metrics.prometheus_file is not None:
+            self.metrics.write_prometheus()
+
+        if self.profiler is not None and self.profiler.report_on_exit:
+            self.logger.info("Logging cost by call site:\n%s", self.profiler.report())
+            self.profiler.write_report()
+
+        if self.spans.summary_on_exit and self.spans.summary():
+            self.logger.info("Lifecycle spans:\n%s", self.spans.report())
+
+        if self.artifact_store is not None:
+            pruned = self.artifact_store.prune()
+            if pruned:
+                self.logger.info("Pruned %d results artifact runs", len(pruned))
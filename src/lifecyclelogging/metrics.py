@@ -0,0 +1,274 @@
+"""Opt-in metrics describing the cost and volume of logging.
+
+``Logging.enable_metrics`` attaches a ``LoggingMetrics`` instance that counts
+emitted, suppressed and stored calls, times the message pipeline stages, and
+records payload sizes. When metrics are disabled the hot path only pays for a
+single ``is None`` check.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Callable
+
+
+TIME_BUCKETS_SECONDS: tuple[float, ...] = (
+    1e-6,
+    5e-6,
+    1e-5,
+    5e-5,
+    1e-4,
+    5e-4,
+    1e-3,
+    5e-3,
+    1e-2,
+    1e-1,
+    1.0,
+)
+"""tuple[float, ...]: Upper bounds of the stage timing histogram buckets."""
+
+SIZE_BUCKETS_BYTES: tuple[float, ...] = tuple(float(4**n * 64) for n in range(10))
+"""tuple[float, ...]: Upper bounds of the payload size histogram buckets."""
+
+GaugeCallback = Callable[[], Mapping[str, float]]
+
+
+class Histogram:
+    """A fixed-bucket histogram compatible with the Prometheus exposition model."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Initialize the histogram.
+
+        Args:
+            buckets: Sorted upper bounds of the finite buckets.
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a single observation.
+
+        Args:
+            value: The observed value.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return cumulative bucket counts keyed by their ``le`` label.
+
+        Returns:
+            list[tuple[str, int]]: ``(le, count)`` pairs ending with ``+Inf``.
+        """
+        running = 0
+        result = []
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            running += count
+            result.append((_format_bound(bound), running))
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the histogram as a plain dict.
+
+        Returns:
+            dict[str, Any]: The count, sum and cumulative buckets.
+        """
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "buckets": dict(self.cumulative()),
+        }
+
+
+def _format_bound(bound: float) -> str:
+    """Format a bucket bound the way Prometheus expects."""
+    if bound == float("inf"):
+        return "+Inf"
+    return repr(bound)
+
+
+def _escape_label(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class LoggingMetrics:
+    """Counters, timing histograms and gauges for a ``Logging`` instance.
+
+    Counters are keyed by event (``emitted``, ``suppressed_verbosity``,
+    ``suppressed_level``, ``stored``), log level and marker. Timings are kept
+    per pipeline stage in seconds, and payload sizes in bytes.
+    """
+
+    def __init__(self, prometheus_file: str | Path | None = None) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            prometheus_file: Optional path that ``write_prometheus`` writes to
+                by default, including automatically at ``exit_run``.
+        """
+        self.prometheus_file = Path(prometheus_file) if prometheus_file else None
+        self._lock = threading.Lock()
+        self._counters: defaultdict[tuple[str, str, str], int] = defaultdict(int)
+        self._timings: dict[str, Histogram] = {}
+        self._payload_bytes = Histogram(SIZE_BUCKETS_BYTES)
+        self._gauges: dict[str, GaugeCallback] = {}
+
+    def increment(self, event: str, level: str, marker: str | None = None) -> None:
+        """Increment the counter for an event.
+
+        Args:
+            event: The event name, for example ``emitted``.
+            level: The log level of the call.
+            marker: The context or storage marker of the call, if any.
+        """
+        with self._lock:
+            self._counters[event, level, marker or ""] += 1
+
+    def observe_time(self, stage: str, elapsed_ns: int) -> None:
+        """Record the time spent in a pipeline stage.
+
+        Args:
+            stage: The stage name, for example ``add_json_data``.
+            elapsed_ns: The elapsed time in nanoseconds.
+        """
+        with self._lock:
+            histogram = self._timings.get(stage)
+            if histogram is None:
+                histogram = self._timings[stage] = Histogram(TIME_BUCKETS_SECONDS)
+            histogram.observe(elapsed_ns / 1e9)
+
+    def observe_payload(self, size: int) -> None:
+        """Record the serialized size of a payload.
+
+        Args:
+            size: The payload size in bytes.
+        """
+        with self._lock:
+            self._payload_bytes.observe(size)
+
+    def register_gauge(self, name: str, callback: GaugeCallback) -> None:
+        """Register a gauge sampled whenever a snapshot is taken.
+
+        Args:
+            name: The gauge name.
+            callback: A callable returning gauge values keyed by label.
+        """
+        self._gauges[name] = callback
+
+    def reset(self) -> None:
+        """Clear all counters and histograms. Registered gauges are kept."""
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+            self._payload_bytes = Histogram(SIZE_BUCKETS_BYTES)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current metrics as a plain dict.
+
+        Returns:
+            dict[str, Any]: Counters nested by event, level and marker, stage
+            timings, payload sizes and sampled gauges.
+        """
+        counters: dict[str, dict[str, dict[str, int]]] = {}
+        with self._lock:
+            for (event, level, marker), value in self._counters.items():
+                counters.setdefault(event, {}).setdefault(level, {})[marker] = value
+            timings = {
+                stage: histogram.snapshot()
+                for stage, histogram in self._timings.items()
+            }
+            payload_bytes = self._payload_bytes.snapshot()
+
+        return {
+            "counters": counters,
+            "timings": timings,
+            "payload_bytes": payload_bytes,
+            "gauges": {
+                name: dict(callback()) for name, callback in self._gauges.items()
+            },
+        }
+
+    def to_prometheus(self, namespace: str = "lifecyclelogging") -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            namespace: Prefix for every metric name.
+
+        Returns:
+            str: The metrics in Prometheus text format.
+        """
+        lines = [f"# TYPE {namespace}_calls_total counter"]
+        with self._lock:
+            for (event, level, marker), value in sorted(self._counters.items()):
+                labels = (
+                    f'event="{_escape_label(event)}",level="{_escape_label(level)}",'
+                    f'marker="{_escape_label(marker)}"'
+                )
+                lines.append(f"{namespace}_calls_total{{{labels}}} {value}")
+
+            lines.append(f"# TYPE {namespace}_stage_seconds histogram")
+            for stage, histogram in sorted(self._timings.items()):
+                label = f'stage="{_escape_label(stage)}"'
+                lines.extend(
+                    _histogram_lines(f"{namespace}_stage_seconds", label, histogram)
+                )
+
+            lines.append(f"# TYPE {namespace}_payload_bytes histogram")
+            lines.extend(
+                _histogram_lines(f"{namespace}_payload_bytes", "", self._payload_bytes)
+            )
+
+        for name, callback in sorted(self._gauges.items()):
+            lines.append(f"# TYPE {namespace}_{name} gauge")
+            lines.extend(
+                f'{namespace}_{name}{{label="{_escape_label(label)}"}} {value}'
+                for label, value in sorted(callback().items())
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | Path | None = None) -> Path:
+        """Atomically write the metrics in Prometheus text format to a file.
+
+        Args:
+            path: Destination file. Defaults to ``prometheus_file``.
+
+        Returns:
+            Path: The file that was written.
+
+        Raises:
+            ValueError: If no path is given and no default is configured.
+        """
+        target = Path(path) if path else self.prometheus_file
+        if target is None:
+            error_message = "No Prometheus output file configured"
+            raise ValueError(error_message)
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        temp_path.write_text(self.to_prometheus())
+        temp_path.replace(target)
+        return target
+
+
+def _histogram_lines(name: str, labels: str, histogram: Histogram) -> list[str]:
+    """Render one histogram as Prometheus text lines."""
+    separator = "," if labels else ""
+    lines = [
+        f'{name}_bucket{{{labels}{separator}le="{le}"}} {count}'
+        for le, count in histogram.cumulative()
+    ]
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{suffix} {histogram.total}")
+    lines.append(f"{name}_count{suffix} {histogram.count}")
+    return lines
@@ -0,0 +1,328 @@
+"""Base class for handlers that ship records over the network in batches.
+
+``BackgroundBatchHandler`` does the minimum on the logging thread: it
+converts each record into a transport-specific item and puts it on a bounded
+queue. Worker threads take items off the queue in batches of up to
+``max_batch``, waiting at most ``linger`` seconds for a batch to fill, and
+hand each batch to ``send``. A failed send is retried with exponential
+backoff and jitter; a batch that still fails, or fails with an error that
+retrying cannot fix, is counted and dropped.
+
+When the queue is full, the ``drop`` overflow policy discards the new record
+and counts it, so a slow or unreachable destination never stalls the
+application; ``block`` waits for room instead, applying backpressure.
+
+Subclasses must implement the abstract ``prepare`` and ``send``, and
+``close_transport`` if they hold connections.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import random
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
+
+from lifecyclelogging.handlers import BatchHandlerMixin
+from lifecyclelogging.log_types import OverflowPolicy
+
+
+OVERFLOW_POLICIES: tuple[str, ...] = ("drop", "block")
+"""tuple[str, ...]: The supported overflow policies."""
+
+_STOP = object()
+
+
+class DeliveryError(Exception):
+    """Raised by ``send`` when a batch was not delivered.
+
+    Attributes:
+        retryable: Whether sending the batch again may succeed.
+        retry_after: Seconds the destination asked to wait, if any.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        retryable: bool = True,
+        retry_after: float | None = None,
+    ) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Description of the failure.
+            retryable: Whether sending the batch again may succeed.
+            retry_after: Seconds the destination asked to wait, if any.
+        """
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+class BackgroundBatchHandler(BatchHandlerMixin, logging.Handler, ABC):
+    """Queues prepared records and sends them in batches on worker threads.
+
+    Attributes:
+        sent: Records delivered.
+        dropped: Records discarded because the queue was full.
+        failed: Records discarded after delivery failed.
+        retries: Send attempts repeated after a failure.
+        batches: Batches delivered.
+        last_error: The most recent delivery failure, if any.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_batch: int = 512,
+        linger: float = 0.05,
+        max_queue: int = 8192,
+        overflow: OverflowPolicy = "drop",
+        max_retries: int = 5,
+        backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        workers: int = 1,
+        close_timeout: float = 5.0,
+    ) -> None:
+        """Initialize the handler and start its worker threads.
+
+        Args:
+            max_batch: Maximum records sent together.
+            linger: Seconds a worker waits for more records before sending a
+                partial batch.
+            max_queue: Maximum records waiting to be sent.
+            overflow: ``drop`` to discard records when the queue is full, or
+                ``block`` to wait for room.
+            max_retries: Attempts after the first before a batch is dropped.
+            backoff: Delay before the first retry, doubled on each retry.
+            max_backoff: Upper bound of the retry delay.
+            workers: Number of worker threads sending concurrently. With more
+                than one, batches may arrive out of order.
+            close_timeout: Seconds ``close`` waits for queued records.
+
+        Raises:
+            ValueError: If the overflow policy or a size is invalid.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            available = ", ".join(OVERFLOW_POLICIES)
+            error_message = (
+                f"Unknown overflow policy '{overflow}'. Available: {available}"
+            )
+            raise ValueError(error_message)
+        if max_batch < 1 or max_queue < 1 or workers < 1:
+            error_message = "max_batch, max_queue and workers must be at least 1"
+            raise ValueError(error_message)
+
+        super().__init__()
+        self.max_batch = max_batch
+        self.linger = linger
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.close_timeout = close_timeout
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+        self.retries = 0
+        self.batches = 0
+        self.last_error: BaseException | None = None
+        self._queue: queue.Queue[Any] = queue.Queue(max_queue)
+        self._stats_lock = threading.Lock()
+        self._closing = threading.Event()
+        self._workers = [
+            threading.Thread(
+                target=self._run,
+                name=f"{type(self).__name__}-worker-{index}",
+                daemon=True,
+            )
+            for index in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """int: Number of records waiting to be sent."""
+        return self._queue.qsize()
+
+    @abstractmethod
+    def prepare(self, record: logging.LogRecord) -> Any:
+        """Convert a record into the item ``send`` receives.
+
+        Runs on the logging thread, so values the record refers to are
+        captured before the caller can change them.
+
+        Args:
+            record: The record to convert.
+
+        Returns:
+            Any: The transport-specific item.
+        """
+
+    @abstractmethod
+    def send(self, items: Sequence[Any]) -> None:
+        """Deliver a batch of prepared items. Runs on a worker thread.
+
+        Args:
+            items: The items, in the order they were logged.
+
+        Raises:
+            DeliveryError: If the batch was not delivered. Any other
+                exception is treated as a retryable failure.
+        """
+
+    def close_transport(self) -> None:
+        """Release connections once the workers have stopped."""
+
+    def _enqueue(self, item: Any) -> None:
+        if self._closing.is_set():
+            with self._stats_lock:
+                self.dropped += 1
+            return
+        if self.overflow == "block":
+            self._queue.put(item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped += 1
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Prepare a record and queue it for sending.
+
+        Args:
+            record: The record to send.
+        """
+        try:
+            item = self.prepare(record)
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+            return
+        self._enqueue(item)
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """Prepare a batch of records and queue them for sending.
+
+        Args:
+            records: The records to send, in order.
+        """
+        for record in records:
+            self.emit(record)
+
+    def _next_batch(self) -> list[Any] | None:
+        first = self._queue.get()
+        if first is _STOP:
+            self._queue.task_done()
+            return None
+
+        batch = [first]
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is _STOP:
+                # Leave the sentinel for this worker's next call
+                self._queue.task_done()
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self._deliver(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _retry_delay(self, attempt: int, retry_after: float | None) -> float:
+        delay = min(self.max_backoff, self.backoff * 2**attempt)
+        delay *= random.uniform(0.5, 1.0)  # noqa: S311
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+    def _deliver(self, batch: list[Any]) -> None:
+        attempt = 0
+        while True:
+            try:
+                self.send(batch)
+            except Exception as exc:  # noqa: BLE001, PERF203
+                retryable = not isinstance(exc, DeliveryError) or exc.retryable
+                retry_after = (
+                    exc.retry_after if isinstance(exc, DeliveryError) else None
+                )
+                with self._stats_lock:
+                    self.last_error = exc
+                    if not retryable or attempt >= self.max_retries:
+                        self.failed += len(batch)
+                        return
+                    self.retries += 1
+                # A closing handler gives up instead of sleeping through backoff
+                if self._closing.wait(self._retry_delay(attempt, retry_after)):
+                    with self._stats_lock:
+                        self.failed += len(batch)
+                    return
+                attempt += 1
+            else:
+                with self._stats_lock:
+                    self.sent += len(batch)
+                    self.batches += 1
+                return
+
+    def flush(self, timeout: float | None = None) -> bool:  # type: ignore[override]
+        """Wait until every queued record has been sent or dropped.
+
+        Args:
+            timeout: Maximum seconds to wait. Defaults to ``close_timeout``, so
+                ``logging.shutdown`` cannot hang on an unreachable destination.
+
+        Returns:
+            bool: True if the queue drained within the timeout.
+        """
+        deadline = time.monotonic() + (
+            self.close_timeout if timeout is None else timeout
+        )
+        condition = self._queue.all_tasks_done
+        with condition:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                condition.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        """Send what is queued, within ``close_timeout``, and stop the workers."""
+        if not self._closing.is_set():
+            self.flush()
+            self._closing.set()
+            for _ in self._workers:
+                try:
+                    self._queue.put(_STOP, timeout=self.close_timeout)
+                except queue.Full:  # noqa: PERF203
+                    break
+            for worker in self._workers:
+                worker.join(self.close_timeout)
+            self.close_transport()
+        super().close()
@@ -0,0 +1,336 @@
+"""Native OpenTelemetry log export over OTLP/HTTP.
+
+``OTLPLogHandler`` maps each record to an OTLP ``LogRecord`` on the logging
+thread and posts batches of them to a collector's ``/v1/logs`` endpoint as
+OTLP/JSON, from background workers that reuse pooled keep-alive connections.
+Responses the OTLP specification marks as retryable (429, 502, 503 and 504)
+and connection failures are retried with backoff, honouring ``Retry-After``.
+
+Records logged through ``Logging`` with ``structured_records`` enabled carry
+the statement's parts, which are exported separately: the message as the
+body, and the context marker, identifiers, storage marker and payloads as
+attributes. Other records export their rendered message as the body.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import http.client
+import logging
+import queue
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+from urllib.parse import urlsplit
+
+import orjson
+
+from lifecyclelogging.const import STATEMENT_ATTRIBUTE
+from lifecyclelogging.network import BackgroundBatchHandler, DeliveryError
+from lifecyclelogging.tracebacks import get_default_traceback_policy
+
+
+DEFAULT_OTLP_ENDPOINT = "http://localhost:4318/v1/logs"
+"""str: The OTLP/HTTP logs endpoint of a collector on the local host."""
+
+RETRYABLE_STATUSES: frozenset[int] = frozenset({429, 502, 503, 504})
+"""frozenset[int]: HTTP statuses after which a batch is sent again."""
+
+_MAX_VALUE_DEPTH = 16
+_ARRAY_TYPES = (list, tuple, set, frozenset)
+
+
+def severity_number(levelno: int) -> int:
+    """Map a ``logging`` level to an OTLP severity number.
+
+    Args:
+        levelno: The numeric ``logging`` level.
+
+    Returns:
+        int: 5 (DEBUG), 9 (INFO), 13 (WARN), 17 (ERROR) or 21 (FATAL).
+    """
+    if levelno <= logging.DEBUG:
+        return 5
+    if levelno <= logging.INFO:
+        return 9
+    if levelno <= logging.WARNING:
+        return 13
+    if levelno <= logging.ERROR:
+        return 17
+    return 21
+
+
+def to_any_value(value: Any, depth: int = 0) -> dict[str, Any]:  # noqa: PLR0911
+    """Convert a Python value to an OTLP/JSON ``AnyValue``.
+
+    Args:
+        value: The value to convert. Values without an OTLP type, and values
+            nested too deeply, become strings.
+        depth: Current nesting depth.
+
+    Returns:
+        dict[str, Any]: The ``AnyValue``.
+    """
+    # Exact types first: the abstract base class checks below are slow
+    kind = type(value)
+    if kind is str:
+        return {"stringValue": value}
+    if value is None:
+        return {}
+    if kind is bool:
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, str):
+        return {"stringValue": str(value)}
+    if isinstance(value, (bytes, bytearray)):
+        return {"bytesValue": base64.b64encode(value).decode("ascii")}
+    if depth < _MAX_VALUE_DEPTH:
+        if kind is dict or isinstance(value, Mapping):
+            return {
+                "kvlistValue": {
+                    "values": [
+                        {"key": str(key), "value": to_any_value(item, depth + 1)}
+                        for key, item in value.items()
+                    ]
+                }
+            }
+        if kind in _ARRAY_TYPES or isinstance(value, Sequence):
+            return {
+                "arrayValue": {
+                    "values": [to_any_value(item, depth + 1) for item in value]
+                }
+            }
+    return {"stringValue": str(value)}
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    return {"key": key, "value": to_any_value(value)}
+
+
+def record_to_otlp(record: logging.LogRecord) -> dict[str, Any]:
+    """Map a ``logging`` record to an OTLP/JSON ``LogRecord``.
+
+    Args:
+        record: The record to map.
+
+    Returns:
+        dict[str, Any]: The OTLP log record.
+    """
+    statement = getattr(record, STATEMENT_ATTRIBUTE, None)
+    call_site = (statement or {}).get("call_site") or (
+        record.pathname,
+        record.lineno,
+        record.funcName,
+    )
+    attributes = [
+        _attribute("code.filepath", call_site[0]),
+        _attribute("code.lineno", call_site[1]),
+        _attribute("code.function", call_site[2]),
+        _attribute("thread.name", record.threadName),
+        _attribute("logger.name", record.name),
+    ]
+
+    if statement is not None:
+        body = statement["msg"]
+        for field in ("context_marker", "identifiers", "storage_marker", "json_data"):
+            value = statement.get(field)
+            if value:
+                attributes.append(_attribute(f"lifecyclelogging.{field}", value))
+        for label, payload in (statement.get("labeled_json_data") or {}).items():
+            attributes.append(_attribute(f"lifecyclelogging.labeled.{label}", payload))
+    else:
+        body = record.getMessage()
+
+    if record.exc_info and record.exc_info[1] is not None:
+        exc = record.exc_info[1]
+        attributes.extend(
+            [
+                _attribute("exception.type", type(exc).__qualname__),
+                _attribute("exception.message", str(exc)),
+                _attribute(
+                    "exception.stacktrace",
+                    get_default_traceback_policy().format_exception(record.exc_info),
+                ),
+            ]
+        )
+
+    time_unix_nano = str(int(record.created * 1e9))
+    return {
+        "timeUnixNano": time_unix_nano,
+        "observedTimeUnixNano": time_unix_nano,
+        "severityNumber": severity_number(record.levelno),
+        "severityText": record.levelname,
+        "body": to_any_value(body),
+        "attributes": attributes,
+    }
+
+
+class _ConnectionPool:
+    """Keep-alive HTTP connections shared by the worker threads."""
+
+    def __init__(self, endpoint: str, timeout: float, size: int) -> None:
+        parts = urlsplit(endpoint)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            error_message = f"OTLP endpoint must be an http(s) URL: {endpoint}"
+            raise ValueError(error_message)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path or "/v1/logs"
+        self.timeout = timeout
+        self.created = 0
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(size)
+
+    def acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            self.created += 1
+            connection_class = (
+                http.client.HTTPSConnection
+                if self.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            return connection_class(self.host, self.port, timeout=self.timeout)
+
+    def release(self, connection: http.client.HTTPConnection, reuse: bool) -> None:
+        if reuse:
+            try:
+                self._idle.put_nowait(connection)
+            except queue.Full:
+                pass
+            else:
+                return
+        connection.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:  # noqa: PERF203
+                return
+
+
+class OTLPLogHandler(BackgroundBatchHandler):
+    """Exports records to an OpenTelemetry collector over OTLP/HTTP."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        endpoint: str = DEFAULT_OTLP_ENDPOINT,
+        service_name: str | None = None,
+        resource_attributes: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        compression: str | None = None,
+        timeout: float = 10.0,
+        **batch_options: Any,
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            endpoint: The collector's OTLP/HTTP logs URL.
+            service_name: ``service.name`` resource attribute.
+            resource_attributes: Further resource attributes.
+            headers: Extra request headers, such as authentication.
+            compression: ``gzip`` to compress request bodies, or None.
+            timeout: Socket timeout of each request in seconds.
+            **batch_options: Batching, buffering and retry options of
+                ``BackgroundBatchHandler``.
+
+        Raises:
+            ValueError: If the endpoint or compression is not supported.
+        """
+        if compression not in {None, "gzip"}:
+            error_message = f"Unsupported OTLP compression '{compression}'"
+            raise ValueError(error_message)
+        self._pool = _ConnectionPool(endpoint, timeout, batch_options.get("workers", 1))
+        self.endpoint = endpoint
+        self.compression = compression
+        self.headers = {
+            "Content-Type": "application/json",
+            **({"Content-Encoding": "gzip"} if compression else {}),
+            **(headers or {}),
+        }
+        resource = {
+            **({"service.name": service_name} if service_name else {}),
+            **(resource_attributes or {}),
+        }
+        self.resource = {
+            "attributes": [_attribute(key, value) for key, value in resource.items()]
+        }
+        super().__init__(**batch_options)
+
+    @property
+    def connections_opened(self) -> int:
+        """int: Number of HTTP connections opened so far."""
+        return self._pool.created
+
+    def prepare(self, record: logging.LogRecord) -> dict[str, Any]:
+        """Map a record to an OTLP log record on the logging thread."""
+        return record_to_otlp(record)
+
+    def encode(self, items: Sequence[dict[str, Any]]) -> bytes:
+        """Build the ``ExportLogsServiceRequest`` body for a batch.
+
+        Args:
+            items: OTLP log records.
+
+        Returns:
+            bytes: The JSON request body, compressed if configured.
+        """
+        body = orjson.dumps(
+            {
+                "resourceLogs": [
+                    {
+                        "resource": self.resource,
+                        "scopeLogs": [
+                            {
+                                "scope": {"name": "lifecyclelogging"},
+                                "logRecords": list(items),
+                            }
+                        ],
+                    }
+                ]
+            },
+            default=str,
+        )
+        if self.compression == "gzip":
+            return gzip.compress(body, compresslevel=1)
+        return body
+
+    def send(self, items: Sequence[dict[str, Any]]) -> None:
+        """Post a batch to the collector over a pooled connection.
+
+        Raises:
+            DeliveryError: If the collector rejected the batch.
+        """
+        body = self.encode(items)
+        connection = self._pool.acquire()
+        reuse = False
+        try:
+            connection.request("POST", self._pool.path, body, self.headers)
+            response = connection.getresponse()
+            # Reading the whole response lets the connection be reused
+            response.read()
+            reuse = not response.will_close
+        finally:
+            self._pool.release(connection, reuse)
+
+        if 200 <= response.status < 300:  # noqa: PLR2004
+            return
+        retry_after = response.getheader("Retry-After")
+        error_message = f"OTLP collector returned HTTP {response.status}"
+        raise DeliveryError(
+            error_message,
+            retryable=response.status in RETRYABLE_STATUSES,
+            retry_after=float(retry_after)
+            if retry_after and retry_after.isdigit()
+            else None,
+        )
+
+    def close_transport(self) -> None:
+        """Close the pooled connections."""
+        self._pool.close()
@@ -0,0 +1,209 @@
+"""Attribute logging cost to the call sites that produce it.
+
+``Logging.enable_profiling`` attaches a ``CallSiteProfiler`` that records, for
+every emitted ``logged_statement``, the caller's ``file:line``, the time spent
+serializing payloads, the total time spent in the call, and the payload size.
+Reports rank the most expensive call sites and can be written as JSON or as a
+``pstats``-compatible file for existing profiling tools.
+"""
+
+from __future__ import annotations
+
+import marshal
+import threading
+
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+CallSite = tuple[str, int, str]
+"""tuple[str, int, str]: A call site as ``(filename, lineno, function name)``."""
+
+SORT_KEYS: tuple[str, ...] = ("serialize_ns", "total_ns", "payload_bytes", "calls")
+"""tuple[str, ...]: Statistics that reports can be ranked by."""
+
+
+class CallSiteStats:
+    """Cumulative statistics for a single call site."""
+
+    __slots__ = ("calls", "payload_bytes", "serialize_ns", "total_ns")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.calls = 0
+        self.serialize_ns = 0
+        self.total_ns = 0
+        self.payload_bytes = 0
+
+
+class CallSiteProfiler:
+    """Collects per-call-site logging cost."""
+
+    def __init__(
+        self,
+        top_n: int = 20,
+        report_on_exit: bool = True,
+        report_path: str | Path | None = None,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            top_n: Default number of call sites included in reports.
+            report_on_exit: Whether ``exit_run`` logs a report when it finishes.
+            report_path: Optional file written at ``exit_run``. A ``.prof`` or
+                ``.pstats`` suffix writes pstats data, anything else writes JSON.
+        """
+        self.top_n = top_n
+        self.report_on_exit = report_on_exit
+        self.report_path = Path(report_path) if report_path else None
+        self._lock = threading.Lock()
+        self._sites: dict[CallSite, CallSiteStats] = {}
+
+    def record(
+        self,
+        site: CallSite,
+        serialize_ns: int,
+        total_ns: int,
+        payload_bytes: int,
+    ) -> None:
+        """Record one logged statement.
+
+        Args:
+            site: The caller's ``(filename, lineno, function name)``.
+            serialize_ns: Nanoseconds spent serializing payloads.
+            total_ns: Nanoseconds spent in the whole call.
+            payload_bytes: Size of the serialized payloads in bytes.
+        """
+        with self._lock:
+            stats = self._sites.get(site)
+            if stats is None:
+                stats = self._sites[site] = CallSiteStats()
+            stats.calls += 1
+            stats.serialize_ns += serialize_ns
+            stats.total_ns += total_ns
+            stats.payload_bytes += payload_bytes
+
+    def reset(self) -> None:
+        """Discard all recorded statistics."""
+        with self._lock:
+            self._sites.clear()
+
+    def top(
+        self, n: int | None = None, sort_by: str = "serialize_ns"
+    ) -> list[dict[str, Any]]:
+        """Return the most expensive call sites.
+
+        Args:
+            n: Number of call sites to return. Defaults to ``top_n``.
+            sort_by: Statistic to rank by, one of ``SORT_KEYS``.
+
+        Returns:
+            list[dict[str, Any]]: One dict per call site, most expensive first.
+
+        Raises:
+            ValueError: If ``sort_by`` is not a known statistic.
+        """
+        if sort_by not in SORT_KEYS:
+            available = ", ".join(SORT_KEYS)
+            error_message = f"Unknown sort_by '{sort_by}'. Available: {available}"
+            raise ValueError(error_message)
+
+        with self._lock:
+            rows: list[dict[str, Any]] = [
+                {
+                    "site": f"{filename}:{lineno}",
+                    "function": function,
+                    "calls": stats.calls,
+                    "serialize_ns": stats.serialize_ns,
+                    "total_ns": stats.total_ns,
+                    "payload_bytes": stats.payload_bytes,
+                }
+                for (filename, lineno, function), stats in self._sites.items()
+            ]
+
+        rows.sort(key=lambda row: row[sort_by], reverse=True)
+        return rows[: n or self.top_n]
+
+    def report(self, n: int | None = None, sort_by: str = "serialize_ns") -> str:
+        """Render the top call sites as a plain-text table.
+
+        Args:
+            n: Number of call sites to include. Defaults to ``top_n``.
+            sort_by: Statistic to rank by, one of ``SORT_KEYS``.
+
+        Returns:
+            str: The rendered report.
+        """
+        lines = [
+            f"{'calls':>8} {'serialize ms':>12} {'total ms':>10} {'bytes':>12}  site",
+        ]
+        lines.extend(
+            f"{row['calls']:>8} {row['serialize_ns'] / 1e6:>12.3f} "
+            f"{row['total_ns'] / 1e6:>10.3f} {row['payload_bytes']:>12}  "
+            f"{row['site']} ({row['function']})"
+            for row in self.top(n, sort_by)
+        )
+        return "\n".join(lines)
+
+    def to_json(self, n: int | None = None, sort_by: str = "serialize_ns") -> str:
+        """Render the top call sites as JSON.
+
+        Args:
+            n: Number of call sites to include. Defaults to ``top_n``.
+            sort_by: Statistic to rank by, one of ``SORT_KEYS``.
+
+        Returns:
+            str: A JSON array of call site statistics.
+        """
+        return orjson.dumps(self.top(n, sort_by)).decode("utf-8")
+
+    def dump_stats(self, path: str | Path) -> Path:
+        """Write all call sites in the format read by ``pstats.Stats``.
+
+        Each call site becomes a pseudo-function whose internal time is the
+        serialization time and whose cumulative time is the total call time.
+
+        Args:
+            path: Destination file.
+
+        Returns:
+            Path: The file that was written.
+        """
+        with self._lock:
+            stats: dict[CallSite, tuple[Any, ...]] = {
+                site: (
+                    entry.calls,
+                    entry.calls,
+                    entry.serialize_ns / 1e9,
+                    entry.total_ns / 1e9,
+                    {},
+                )
+                for site, entry in self._sites.items()
+            }
+
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("wb") as stats_file:
+            marshal.dump(stats, stats_file)
+        return target
+
+    def write_report(self, path: str | Path | None = None) -> Path | None:
+        """Write the report to ``path`` or ``report_path``.
+
+        Args:
+            path: Destination file. Defaults to ``report_path``.
+
+        Returns:
+            Path | None: The file that was written, or None if no path is set.
+        """
+        target = Path(path) if path else self.report_path
+        if target is None:
+            return None
+        if target.suffix in {".prof", ".pstats"}:
+            return self.dump_stats(target)
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(self.to_json())
+        return target
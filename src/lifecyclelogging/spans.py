@@ -0,0 +1,369 @@
+"""Timing spans for lifecycle phases.
+
+``Logging.span`` returns a ``Span`` that measures how long a block of code or a
+function call takes. Spans work as context managers and decorators for both
+synchronous and asynchronous code, and nest: a span started while another is
+active records it as its parent. The active span is tracked in a context
+variable, so nesting follows threads and asyncio tasks correctly.
+
+Every completed span produces a ``SpanRecord`` with wall-clock start and end
+times and a duration measured on the monotonic ``perf_counter`` clock. A
+``SpanRecorder`` keeps bounded per-name aggregates for summaries: exact
+count, total, min and max, and p50 and p95 from a fixed-size uniform sample
+of the durations, so memory does not grow with the number of spans.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import itertools
+import math
+import random
+import threading
+import time
+
+from contextvars import ContextVar, Token
+from dataclasses import asdict, dataclass
+from types import TracebackType
+from typing import Any, Callable, TypeVar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    """A completed span.
+
+    Attributes:
+        name: The span name.
+        span_id: Identifier of the span, unique within its recorder.
+        parent_id: Identifier of the enclosing span, if any.
+        depth: Nesting depth, 0 for a top-level span.
+        start_ns: Wall-clock start time in nanoseconds since the epoch.
+        end_ns: Wall-clock end time in nanoseconds since the epoch.
+        duration_ns: Monotonic duration in nanoseconds.
+        context_marker: Context marker the span was logged under.
+        storage_marker: Storage marker the span record was stored under.
+        error: Name of the exception type that ended the span, if any.
+    """
+
+    name: str
+    span_id: int
+    parent_id: int | None
+    depth: int
+    start_ns: int
+    end_ns: int
+    duration_ns: int
+    context_marker: str | None = None
+    storage_marker: str | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the record as a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+def _percentile(ordered: list[int], fraction: float) -> int:
+    """Return the nearest-rank percentile of sorted durations."""
+    index = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+class SpanStats:
+    """Bounded duration aggregates for one span name.
+
+    Percentiles come from a reservoir sample: every duration has the same
+    chance of being kept, so they are exact up to ``size`` spans and
+    estimates beyond.
+    """
+
+    __slots__ = ("count", "max_ns", "min_ns", "samples", "total_ns")
+
+    def __init__(self) -> None:
+        """Initialize empty aggregates."""
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.samples: list[int] = []
+
+    def add(self, duration_ns: int, size: int) -> None:
+        """Add a duration, keeping at most ``size`` samples.
+
+        Args:
+            duration_ns: The span's duration in nanoseconds.
+            size: The reservoir size.
+        """
+        self.count += 1
+        self.total_ns += duration_ns
+        if self.count == 1 or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+        if len(self.samples) < size:
+            self.samples.append(duration_ns)
+        else:
+            slot = random.randrange(self.count)  # noqa: S311
+            if slot < size:
+                self.samples[slot] = duration_ns
+
+
+class SpanRecorder:
+    """Collects completed spans and per-name duration aggregates."""
+
+    def __init__(self, summary_on_exit: bool = False, sample_size: int = 1024) -> None:
+        """Initialize the recorder.
+
+        Args:
+            summary_on_exit: Whether ``exit_run`` logs the span summary when
+                it finishes.
+            sample_size: Durations sampled per span name for percentiles.
+
+        Raises:
+            ValueError: If the sample size is not positive.
+        """
+        if sample_size < 1:
+            error_message = "sample_size must be at least 1"
+            raise ValueError(error_message)
+        self.summary_on_exit = summary_on_exit
+        self.sample_size = sample_size
+        self.current: ContextVar[Span | None] = ContextVar(
+            f"lifecyclelogging_span_{id(self)}", default=None
+        )
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._stats: dict[str, SpanStats] = {}
+
+    def next_id(self) -> int:
+        """Return a new span identifier."""
+        return next(self._ids)
+
+    def record(self, span: SpanRecord) -> None:
+        """Add a completed span to the aggregates.
+
+        Args:
+            span: The completed span.
+        """
+        with self._lock:
+            stats = self._stats.get(span.name)
+            if stats is None:
+                stats = self._stats[span.name] = SpanStats()
+            stats.add(span.duration_ns, self.sample_size)
+
+    def reset(self) -> None:
+        """Discard all recorded aggregates."""
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        """Return per-name aggregates of completed spans.
+
+        Returns:
+            dict[str, dict[str, int]]: For each span name, its ``count`` and
+            ``total_ns``, ``min_ns``, ``p50_ns``, ``p95_ns`` and ``max_ns``
+            durations.
+        """
+        with self._lock:
+            snapshot = [
+                (
+                    name,
+                    stats.count,
+                    stats.total_ns,
+                    stats.min_ns,
+                    stats.max_ns,
+                    sorted(stats.samples),
+                )
+                for name, stats in self._stats.items()
+            ]
+
+        return {
+            name: {
+                "count": count,
+                "total_ns": total_ns,
+                "min_ns": min_ns,
+                "p50_ns": _percentile(ordered, 0.5),
+                "p95_ns": _percentile(ordered, 0.95),
+                "max_ns": max_ns,
+            }
+            for name, count, total_ns, min_ns, max_ns, ordered in snapshot
+        }
+
+    def report(self) -> str:
+        """Render the summary as a plain-text table in milliseconds.
+
+        Returns:
+            str: One line per span name, slowest total first.
+        """
+        summary = self.summary()
+        lines = [
+            (
+                f"{'span':<32} {'count':>8} {'total ms':>12} {'p50 ms':>10} "
+                f"{'p95 ms':>10} {'max ms':>10}"
+            )
+        ]
+        for name, stats in sorted(
+            summary.items(), key=lambda item: item[1]["total_ns"], reverse=True
+        ):
+            lines.append(
+                f"{name:<32} {stats['count']:>8} {stats['total_ns'] / 1e6:>12.3f} "
+                f"{stats['p50_ns'] / 1e6:>10.3f} {stats['p95_ns'] / 1e6:>10.3f} "
+                f"{stats['max_ns'] / 1e6:>10.3f}"
+            )
+        return "\n".join(lines)
+
+
+class Span:
+    """Times a lifecycle phase as a context manager or decorator.
+
+    A ``Span`` instance times one block at a time. Used as a decorator, it
+    starts a fresh span for every call, so decorated functions may run
+    concurrently.
+    """
+
+    def __init__(
+        self,
+        recorder: SpanRecorder,
+        name: str,
+        on_complete: Callable[[SpanRecord], None] | None = None,
+        context_marker: str | None = None,
+        storage_marker: str | None = None,
+    ) -> None:
+        """Initialize the span.
+
+        Args:
+            recorder: The recorder tracking nesting and aggregates.
+            name: The span name, used to group aggregates.
+            on_complete: Callback receiving each completed ``SpanRecord``.
+            context_marker: Context marker for the emitted record.
+            storage_marker: Storage marker for the emitted record.
+        """
+        self.recorder = recorder
+        self.name = name
+        self.on_complete = on_complete
+        self.context_marker = context_marker
+        self.storage_marker = storage_marker
+        self.span_id: int | None = None
+        self.parent_id: int | None = None
+        self.depth = 0
+        self._start_ns = 0
+        self._started = 0
+        self._token: Token[Span | None] | None = None
+
+    def _copy(self) -> Span:
+        return Span(
+            self.recorder,
+            self.name,
+            self.on_complete,
+            self.context_marker,
+            self.storage_marker,
+        )
+
+    def start(self) -> Span:
+        """Start timing and make this the active span.
+
+        Returns:
+            Span: This span.
+
+        Raises:
+            RuntimeError: If the span is already running.
+        """
+        if self._token is not None:
+            error_message = f"Span {self.name!r} is already running"
+            raise RuntimeError(error_message)
+
+        parent = self.recorder.current.get()
+        self.span_id = self.recorder.next_id()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.depth = parent.depth + 1 if parent is not None else 0
+        self._token = self.recorder.current.set(self)
+        self._start_ns = time.time_ns()
+        self._started = time.perf_counter_ns()
+        return self
+
+    def finish(self, error: BaseException | None = None) -> SpanRecord:
+        """Stop timing, record the span and hand it to the completion callback.
+
+        Args:
+            error: The exception that ended the span, if any.
+
+        Returns:
+            SpanRecord: The completed span.
+
+        Raises:
+            RuntimeError: If the span is not running.
+        """
+        duration_ns = time.perf_counter_ns() - self._started
+        if self._token is None or self.span_id is None:
+            error_message = f"Span {self.name!r} is not running"
+            raise RuntimeError(error_message)
+
+        self.recorder.current.reset(self._token)
+        self._token = None
+        record = SpanRecord(
+            name=self.name,
+            span_id=self.span_id,
+            parent_id=self.parent_id,
+            depth=self.depth,
+            start_ns=self._start_ns,
+            end_ns=self._start_ns + duration_ns,
+            duration_ns=duration_ns,
+            context_marker=self.context_marker,
+            storage_marker=self.storage_marker,
+            error=type(error).__name__ if error is not None else None,
+        )
+        self.recorder.record(record)
+        if self.on_complete is not None:
+            self.on_complete(record)
+        return record
+
+    def __enter__(self) -> Span:  # noqa: PYI034
+        """Start the span."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Finish the span; exceptions are recorded and propagated."""
+        self.finish(exc)
+
+    async def __aenter__(self) -> Span:  # noqa: PYI034
+        """Start the span."""
+        return self.start()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Finish the span; exceptions are recorded and propagated."""
+        self.finish(exc)
+
+    def __call__(self, func: F) -> F:
+        """Time every call of a function or coroutine function.
+
+        Args:
+            func: The function to wrap.
+
+        Returns:
+            The wrapped function.
+        """
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                async with self._copy():
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self._copy():
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
@@ -0,0 +1,325 @@
+"""Storage backends for messages collected under storage markers.
+
+``Logging.stored_messages`` holds every message logged with a storage marker.
+The default backend keeps them in memory as a ``defaultdict`` of sets, exactly
+as earlier releases did. For very long runs, ``SQLiteStorageBackend`` keeps a
+bounded in-memory buffer and spills to an SQLite database once the buffer
+exceeds a threshold, so memory use stays flat regardless of run length.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import tempfile
+import threading
+
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+
+class StorageBackend(ABC):
+    """Interface for message storage keyed by storage marker.
+
+    Backends behave like a read-only mapping of marker to a set-like collection
+    of messages: ``marker in backend``, ``backend[marker]``, iteration over
+    markers, and ``msg in backend[marker]`` must all work. Messages are added
+    through :meth:`add` and :meth:`add_many` and keep set semantics.
+    """
+
+    @abstractmethod
+    def add(self, marker: str, msg: str) -> None:
+        """Store a message under a marker, ignoring duplicates.
+
+        Args:
+            marker: The storage marker to store the message under.
+            msg: The message to store.
+        """
+
+    def add_many(self, marker: str, msgs: Iterable[str]) -> None:
+        """Store several messages under the same marker.
+
+        Args:
+            marker: The storage marker to store the messages under.
+            msgs: The messages to store.
+        """
+        for msg in msgs:
+            self.add(marker, msg)
+
+    @abstractmethod
+    def __getitem__(self, marker: str) -> Any:
+        """Return the set-like collection of messages stored under a marker."""
+
+    @abstractmethod
+    def __contains__(self, marker: object) -> bool:
+        """Return whether any message has been stored under a marker."""
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the markers that have stored messages."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the backend."""
+
+
+class MemoryStorageBackend(defaultdict[str, set[str]], StorageBackend):
+    """In-memory storage backend, a ``defaultdict(set)`` keyed by marker.
+
+    This is the default backend and is fully compatible with code that treats
+    ``stored_messages`` as a plain ``defaultdict[str, set[str]]``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty in-memory store."""
+        super().__init__(set)
+
+    def add(self, marker: str, msg: str) -> None:
+        """Store a message under a marker, ignoring duplicates.
+
+        Args:
+            marker: The storage marker to store the message under.
+            msg: The message to store.
+        """
+        self[marker].add(msg)
+
+    def add_many(self, marker: str, msgs: Iterable[str]) -> None:
+        """Store several messages under the same marker.
+
+        Args:
+            marker: The storage marker to store the messages under.
+            msgs: The messages to store.
+        """
+        self[marker].update(msgs)
+
+
+def _digest(msg: str) -> bytes:
+    """Return the fixed-size digest used to deduplicate a stored message."""
+    return hashlib.blake2b(msg.encode("utf-8"), digest_size=16).digest()
+
+
+class StoredMessagesView:
+    """Set-like, read-only view of the messages stored under one marker.
+
+    Iteration streams rows from the database in chunks instead of loading them
+    all at once.
+    """
+
+    def __init__(self, backend: SQLiteStorageBackend, marker: str) -> None:
+        """Initialize the view.
+
+        Args:
+            backend: The backend that owns the messages.
+            marker: The storage marker this view covers.
+        """
+        self._backend = backend
+        self._marker = marker
+
+    def __contains__(self, msg: object) -> bool:
+        """Return whether a message is stored under this view's marker."""
+        return isinstance(msg, str) and self._backend.contains(self._marker, msg)
+
+    def __iter__(self) -> Iterator[str]:
+        """Stream the messages stored under this view's marker."""
+        return self._backend.iter_messages(self._marker)
+
+    def __len__(self) -> int:
+        """Return the number of distinct messages stored under this marker."""
+        return self._backend.count(self._marker)
+
+    def __repr__(self) -> str:
+        """Return a short description of the view."""
+        return f"StoredMessagesView(marker={self._marker!r}, size={len(self)})"
+
+
+class SQLiteStorageBackend(StorageBackend):
+    """Storage backend that spills messages to SQLite past a memory threshold.
+
+    Messages are buffered in memory until ``memory_threshold`` messages are
+    pending, then written to the database in one transaction. Deduplication
+    uses a primary key on the marker and a digest of the message, so set
+    semantics hold across the buffer and the database. Reads flush the buffer
+    first and stream results back with ``fetchmany``.
+    """
+
+    _FETCH_SIZE = 1000
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        memory_threshold: int = 10_000,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            path: Database file to spill to. Defaults to a temporary file that
+                is removed when the backend is closed.
+            memory_threshold: Number of pending messages kept in memory before
+                they are written to the database.
+        """
+        if memory_threshold < 1:
+            error_message = "memory_threshold must be at least 1"
+            raise ValueError(error_message)
+
+        self.memory_threshold = memory_threshold
+        self._tempdir: tempfile.TemporaryDirectory[str] | None = None
+        if path is None:
+            self._tempdir = tempfile.TemporaryDirectory(prefix="lifecyclelogging-")
+            path = Path(self._tempdir.name) / "stored_messages.sqlite3"
+        self.path = Path(path)
+
+        self._lock = threading.RLock()
+        self._pending: defaultdict[str, set[str]] = defaultdict(set)
+        self._pending_count = 0
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stored_messages ("
+            "marker TEXT NOT NULL, digest BLOB NOT NULL, msg TEXT NOT NULL, "
+            "PRIMARY KEY (marker, digest)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def add(self, marker: str, msg: str) -> None:
+        """Store a message under a marker, ignoring duplicates.
+
+        Args:
+            marker: The storage marker to store the message under.
+            msg: The message to store.
+        """
+        with self._lock:
+            pending = self._pending[marker]
+            if msg in pending:
+                return
+            pending.add(msg)
+            self._pending_count += 1
+            if self._pending_count >= self.memory_threshold:
+                self.flush()
+
+    def add_many(self, marker: str, msgs: Iterable[str]) -> None:
+        """Store several messages under the same marker.
+
+        Args:
+            marker: The storage marker to store the messages under.
+            msgs: The messages to store.
+        """
+        with self._lock:
+            pending = self._pending[marker]
+            before = len(pending)
+            pending.update(msgs)
+            self._pending_count += len(pending) - before
+            if self._pending_count >= self.memory_threshold:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered messages to the database."""
+        with self._lock:
+            if not self._pending_count:
+                return
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO stored_messages (marker, digest, msg) "
+                "VALUES (?, ?, ?)",
+                (
+                    (marker, _digest(msg), msg)
+                    for marker, msgs in self._pending.items()
+                    for msg in msgs
+                ),
+            )
+            self._conn.commit()
+            self._pending.clear()
+            self._pending_count = 0
+
+    def contains(self, marker: str, msg: str) -> bool:
+        """Return whether a message is stored under a marker.
+
+        Args:
+            marker: The storage marker to look under.
+            msg: The message to look for.
+
+        Returns:
+            bool: True if the message has been stored under the marker.
+        """
+        with self._lock:
+            if msg in self._pending.get(marker, ()):
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM stored_messages WHERE marker = ? AND digest = ?",
+                (marker, _digest(msg)),
+            ).fetchone()
+        return row is not None
+
+    def count(self, marker: str) -> int:
+        """Return the number of distinct messages stored under a marker.
+
+        Args:
+            marker: The storage marker to count.
+
+        Returns:
+            int: The number of stored messages.
+        """
+        with self._lock:
+            self.flush()
+            (total,) = self._conn.execute(
+                "SELECT COUNT(*) FROM stored_messages WHERE marker = ?", (marker,)
+            ).fetchone()
+        return int(total)
+
+    def iter_messages(self, marker: str) -> Iterator[str]:
+        """Stream the messages stored under a marker.
+
+        Args:
+            marker: The storage marker to read.
+
+        Yields:
+            str: Each stored message, in no particular order.
+        """
+        with self._lock:
+            self.flush()
+            cursor = self._conn.execute(
+                "SELECT msg FROM stored_messages WHERE marker = ?", (marker,)
+            )
+            rows = cursor.fetchmany(self._FETCH_SIZE)
+        while rows:
+            for (msg,) in rows:
+                yield msg
+            with self._lock:
+                rows = cursor.fetchmany(self._FETCH_SIZE)
+
+    def __getitem__(self, marker: str) -> StoredMessagesView:
+        """Return a streaming view of the messages stored under a marker."""
+        return StoredMessagesView(self, marker)
+
+    def __contains__(self, marker: object) -> bool:
+        """Return whether any message has been stored under a marker."""
+        if not isinstance(marker, str):
+            return False
+        with self._lock:
+            if self._pending.get(marker):
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM stored_messages WHERE marker = ? LIMIT 1", (marker,)
+            ).fetchone()
+        return row is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the markers that have stored messages."""
+        with self._lock:
+            self.flush()
+            markers = [
+                marker
+                for (marker,) in self._conn.execute(
+                    "SELECT DISTINCT marker FROM stored_messages"
+                )
+            ]
+        return iter(markers)
+
+    def close(self) -> None:
+        """Close the database and remove it if it was a temporary file."""
+        with self._lock:
+            self._conn.close()
+            if self._tempdir is not None:
+                self._tempdir.cleanup()
+                self._tempdir = None
@@ -0,0 +1,270 @@
+"""Network syslog sink with batching and reconnection.
+
+``NetworkSyslogHandler`` renders each record as an RFC 5424 syslog message on
+the logging thread and sends them from a background worker. Over TCP the
+messages are framed with RFC 6587 octet counting and a whole batch goes out
+in one write on a connection that is kept open; over UDP each message is one
+RFC 5426 datagram. A failed send closes the connection, and the retry opens
+a new one. Delivery is at least once: a batch interrupted part-way through
+is sent again in full.
+
+Records logged through ``Logging`` with ``structured_records`` enabled use
+their context marker as the ``MSGID`` and carry their identifiers and
+storage marker as structured data.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import select
+import socket
+import sys
+import threading
+import time
+
+from collections.abc import Sequence
+from logging.handlers import SysLogHandler
+from pathlib import Path
+from typing import Any
+
+from lifecyclelogging.const import STATEMENT_ATTRIBUTE
+from lifecyclelogging.log_types import SyslogTransport
+from lifecyclelogging.network import BackgroundBatchHandler
+
+
+SYSLOG_TRANSPORTS: tuple[str, ...] = ("tcp", "udp")
+"""tuple[str, ...]: The supported syslog transports."""
+
+SD_ID = "lifecyclelogging@32473"
+"""str: Structured data ID of the statement parameters.
+
+32473 is the private enterprise number RFC 5612 reserves for documentation.
+"""
+
+_NILVALUE = "-"
+
+
+def syslog_severity(levelno: int) -> int:
+    """Map a ``logging`` level to a syslog severity.
+
+    Args:
+        levelno: The numeric ``logging`` level.
+
+    Returns:
+        int: 2 (critical), 3 (error), 4 (warning), 6 (informational) or
+        7 (debug).
+    """
+    if levelno >= logging.CRITICAL:
+        return 2
+    if levelno >= logging.ERROR:
+        return 3
+    if levelno >= logging.WARNING:
+        return 4
+    if levelno >= logging.INFO:
+        return 6
+    return 7
+
+
+def header_field(value: str | None, max_length: int) -> str:
+    """Sanitize a value for an RFC 5424 header field.
+
+    Args:
+        value: The value, or None for the nil value.
+        max_length: The field's maximum length.
+
+    Returns:
+        str: The value with characters outside printable US-ASCII replaced by
+        underscores, truncated to ``max_length``, or ``-`` if it is empty.
+    """
+    if not value:
+        return _NILVALUE
+    return (
+        "".join(char if "!" <= char <= "~" else "_" for char in value[:max_length])
+        or _NILVALUE
+    )
+
+
+def _param_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("]", "\\]")
+
+
+class NetworkSyslogHandler(BackgroundBatchHandler):
+    """Sends RFC 5424 syslog messages over TCP or UDP in batches."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        address: tuple[str, int] = ("localhost", 514),
+        transport: SyslogTransport = "tcp",
+        facility: int | str = SysLogHandler.LOG_USER,
+        app_name: str | None = None,
+        hostname: str | None = None,
+        max_message: int = 8192,
+        connect_timeout: float = 5.0,
+        **batch_options: Any,
+    ) -> None:
+        """Initialize the sink.
+
+        Args:
+            address: Host and port of the syslog relay.
+            transport: ``tcp`` for octet-counted frames on one connection, or
+                ``udp`` for one datagram per message.
+            facility: Syslog facility number or name, such as ``local0``.
+            app_name: ``APP-NAME`` field. Defaults to the program's name.
+            hostname: ``HOSTNAME`` field. Defaults to this host's name.
+            max_message: Maximum bytes of one message; longer ones are cut
+                on a character boundary.
+            connect_timeout: Seconds to wait when connecting and sending.
+            **batch_options: Batching, buffering and retry options of
+                ``BackgroundBatchHandler``.
+
+        Raises:
+            ValueError: If the transport or facility is unknown.
+        """
+        if transport not in SYSLOG_TRANSPORTS:
+            available = ", ".join(SYSLOG_TRANSPORTS)
+            error_message = (
+                f"Unknown syslog transport '{transport}'. Available: {available}"
+            )
+            raise ValueError(error_message)
+        if isinstance(facility, str):
+            if facility.lower() not in SysLogHandler.facility_names:
+                error_message = f"Unknown syslog facility '{facility}'"
+                raise ValueError(error_message)
+            facility = SysLogHandler.facility_names[facility.lower()]
+
+        self.address = address
+        self.transport = transport
+        self.facility = facility
+        self.max_message = max_message
+        self.connect_timeout = connect_timeout
+        self.connections_opened = 0
+        program = Path(sys.argv[0]).name if sys.argv else ""
+        # The fields after TIMESTAMP only change per process
+        self._host_fields = " ".join(
+            (
+                header_field(hostname or socket.gethostname(), 255),
+                header_field(app_name or program, 48),
+                header_field(str(os.getpid()), 128),
+            )
+        )
+        self._second_text: tuple[int, str] = (-1, "")
+        self._msgids: dict[str | None, str] = {}
+        self._local = threading.local()
+        self._sockets: set[socket.socket] = set()
+        self._sockets_lock = threading.Lock()
+        super().__init__(**batch_options)
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        # Formatted once per second and swapped as one tuple, since records
+        # are prepared on several threads; the fraction is added per record
+        cached_second, text = self._second_text
+        if second != cached_second:
+            text = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_text = (second, text)
+        return f"{text}.{int((created - second) * 1e6):06d}Z"
+
+    def _msgid(self, context_marker: str | None) -> str:
+        msgid = self._msgids.get(context_marker)
+        if msgid is None:
+            msgid = header_field(context_marker, 32)
+            if len(self._msgids) < 1024:  # noqa: PLR2004
+                self._msgids[context_marker] = msgid
+        return msgid
+
+    @staticmethod
+    def _structured_data(statement: dict[str, Any]) -> str:
+        params = []
+        if statement.get("identifiers"):
+            identifiers = ",".join(str(value) for value in statement["identifiers"])
+            params.append(f'identifiers="{_param_value(identifiers)}"')
+        if statement.get("storage_marker"):
+            params.append(
+                f'storage_marker="{_param_value(str(statement["storage_marker"]))}"'
+            )
+        if not params:
+            return _NILVALUE
+        return f"[{SD_ID} {' '.join(params)}]"
+
+    def prepare(self, record: logging.LogRecord) -> bytes:
+        """Render a record as a syslog message, framed for the transport."""
+        statement = getattr(record, STATEMENT_ATTRIBUTE, None)
+        if statement is not None:
+            msgid = self._msgid(statement.get("context_marker"))
+            structured_data = self._structured_data(statement)
+        else:
+            msgid = structured_data = _NILVALUE
+        header = (
+            f"<{self.facility * 8 + syslog_severity(record.levelno)}>1 "
+            f"{self._timestamp(record.created)} {self._host_fields} "
+            f"{msgid} {structured_data} "
+        )
+        message = (header + self.format(record)).encode("utf-8")
+        if len(message) > self.max_message:
+            # Cut on a character boundary so the relay gets valid UTF-8
+            message = (
+                message[: self.max_message]
+                .decode("utf-8", errors="ignore")
+                .encode("utf-8")
+            )
+        if self.transport == "tcp":
+            return b"%d %b" % (len(message), message)
+        return message
+
+    def _connection(self) -> socket.socket:
+        sock: socket.socket | None = getattr(self._local, "sock", None)
+        if sock is not None and self.transport == "tcp":
+            # A relay never writes to the stream, so a readable socket means
+            # it closed the connection; writing would lose the batch silently
+            readable, _, _ = select.select([sock], [], [], 0)
+            if readable:
+                self._disconnect(sock)
+                sock = None
+        if sock is None:
+            if self.transport == "tcp":
+                sock = socket.create_connection(self.address, self.connect_timeout)
+            else:
+                host, port = self.address
+                family, _, _, _, sockaddr = socket.getaddrinfo(
+                    host, port, type=socket.SOCK_DGRAM
+                )[0]
+                sock = socket.socket(family, socket.SOCK_DGRAM)
+                sock.settimeout(self.connect_timeout)
+                sock.connect(sockaddr)
+            self._local.sock = sock
+            with self._sockets_lock:
+                self._sockets.add(sock)
+                self.connections_opened += 1
+        return sock
+
+    def _disconnect(self, sock: socket.socket) -> None:
+        self._local.sock = None
+        with self._sockets_lock:
+            self._sockets.discard(sock)
+        sock.close()
+
+    def send(self, items: Sequence[bytes]) -> None:
+        """Write a batch on this worker's connection, reconnecting on failure.
+
+        Raises:
+            OSError: If the batch could not be written. The connection is
+                closed, so the retry opens a new one.
+        """
+        sock = self._connection()
+        try:
+            if self.transport == "tcp":
+                sock.sendall(b"".join(items))
+            else:
+                for item in items:
+                    sock.send(item)
+        except OSError:
+            self._disconnect(sock)
+            raise
+
+    def close_transport(self) -> None:
+        """Close the connections of all workers."""
+        with self._sockets_lock:
+            sockets, self._sockets = self._sockets, set()
+        for sock in sockets:
+            sock.close()
@@ -0,0 +1,360 @@
+"""Traceback rendering policy for error-level logging.
+
+Rendering a traceback with Rich means extracting and highlighting source
+for every frame, which can take milliseconds per exception; an error storm
+then stalls the logging threads. ``TracebackPolicy`` bounds that cost:
+
+- Frames are rendered as plain text and cached by code location (file, line
+  and function), so a failure repeating on the same path costs cache hits.
+  The cache keeps the most recently used ``cache_size`` frames.
+- Locals are only rendered when ``show_locals`` is set.
+- Exception groups, and chains containing one, are rendered by
+  ``traceback.format_exception`` so their nested tracebacks are kept.
+- Full tracebacks can be rate limited per exception type with
+  ``max_full_renders``. Past the limit, a one-frame summary is rendered
+  instead, noting how many were suppressed. There is no limit by default.
+
+``TracebackFormatter`` applies the policy to ``logging.Formatter`` output,
+and ``TracebackRichHandler`` in ``lifecyclelogging.handlers`` uses Rich
+only for terminals and for exceptions within the rate limit.
+"""
+
+from __future__ import annotations
+
+import builtins
+import collections
+import contextlib
+import linecache
+import logging
+import reprlib
+import threading
+import time
+import traceback
+
+from types import TracebackType
+from typing import Any
+
+
+# Attribute caching the rate-limit decision on an exception, so every
+# handler rendering the same exception agrees and it is only counted once
+_DECISION_ATTRIBUTE = "_lifecyclelogging_full_traceback"
+
+_CAUSE_MESSAGE = (
+    "\nThe above exception was the direct cause of the following exception:\n\n"
+)
+_CONTEXT_MESSAGE = (
+    "\nDuring handling of the above exception, another exception occurred:\n\n"
+)
+
+# Python 3.11+; groups from the exceptiongroup backport are rendered like
+# any other exception
+_BASE_EXCEPTION_GROUP: type[BaseException] | None = getattr(
+    builtins, "BaseExceptionGroup", None
+)
+
+_locals_repr = reprlib.Repr()
+_locals_repr.maxstring = 80
+_locals_repr.maxother = 80
+
+
+class TracebackPolicy:
+    """Caches rendered frames and rate limits full tracebacks per type."""
+
+    def __init__(
+        self,
+        show_locals: bool = False,
+        max_full_renders: int | None = None,
+        rate_window: float = 60.0,
+        max_frames: int = 100,
+        cache_size: int = 4096,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            show_locals: Render each frame's local variables.
+            max_full_renders: Full tracebacks rendered per exception type
+                within ``rate_window``; later ones are summarized. None, the
+                default, renders every traceback in full.
+            rate_window: Length of the rate-limit window in seconds.
+            max_frames: Frames rendered per exception; the middle of deeper
+                stacks is elided.
+            cache_size: Maximum number of cached frames; the least recently
+                used frames are evicted beyond it.
+        """
+        self.show_locals = show_locals
+        self.max_full_renders = max_full_renders
+        self.rate_window = rate_window
+        self.max_frames = max_frames
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._frames: collections.OrderedDict[tuple[str, int, str], str] = (
+            collections.OrderedDict()
+        )
+        self._renders: dict[type[BaseException], collections.deque[float]] = {}
+        self._suppressed: collections.Counter[type[BaseException]] = (
+            collections.Counter()
+        )
+        self._lock = threading.Lock()
+
+    def allow_full(self, exc: BaseException) -> bool:
+        """Return whether an exception gets a full traceback.
+
+        The decision is made once per exception object, so handlers rendering
+        the same record agree and it only counts once against the limit.
+
+        Args:
+            exc: The exception being rendered.
+
+        Returns:
+            bool: False when the exception's type is over the rate limit.
+        """
+        decision = getattr(exc, _DECISION_ATTRIBUTE, None)
+        if decision is not None:
+            return bool(decision)
+
+        decision = True
+        if self.max_full_renders is not None:
+            now = time.monotonic()
+            with self._lock:
+                renders = self._renders.setdefault(type(exc), collections.deque())
+                while renders and renders[0] <= now - self.rate_window:
+                    renders.popleft()
+                if len(renders) < self.max_full_renders:
+                    renders.append(now)
+                else:
+                    self._suppressed[type(exc)] += 1
+                    decision = False
+
+        with contextlib.suppress(AttributeError, TypeError):
+            setattr(exc, _DECISION_ATTRIBUTE, decision)
+        return decision
+
+    def suppressed(self, exc_type: type[BaseException]) -> int:
+        """Return how many full tracebacks of a type were summarized."""
+        return self._suppressed[exc_type]
+
+    def format_frame(self, filename: str, lineno: int, name: str) -> str:
+        """Render one frame as ``traceback`` does, caching by code location.
+
+        Args:
+            filename: The frame's source file.
+            lineno: The line being executed.
+            name: The function name.
+
+        Returns:
+            str: The frame's ``File ..., line ..., in ...`` line and source.
+        """
+        key = (filename, lineno, name)
+        # OrderedDict operations are atomic, so no lock is needed; a frame
+        # evicted by another thread in between is simply rendered again
+        text = self._frames.get(key)
+        if text is not None:
+            # try/except, unlike contextlib.suppress, costs nothing on a hit
+            try:  # noqa: SIM105
+                self._frames.move_to_end(key)
+            except KeyError:
+                pass
+            self.cache_hits += 1
+            return text
+
+        self.cache_misses += 1
+        text = f'  File "{filename}", line {lineno}, in {name}\n'
+        line = linecache.getline(filename, lineno).strip()
+        if line:
+            text += f"    {line}\n"
+        self._frames[key] = text
+        if len(self._frames) > self.cache_size:
+            with contextlib.suppress(KeyError):
+                self._frames.popitem(last=False)
+        return text
+
+    def _format_locals(self, frame_locals: dict[str, Any]) -> str:
+        lines = []
+        for name, value in sorted(frame_locals.items()):
+            try:
+                rendered = _locals_repr.repr(value)
+            except Exception:  # noqa: BLE001
+                rendered = "<unrepresentable>"
+            lines.append(f"      {name} = {rendered}\n")
+        return "".join(lines)
+
+    def _format_stack(self, tb: TracebackType | None) -> list[str]:
+        entries: list[tuple[str, int, str, dict[str, Any] | None]] = []
+        while tb is not None:
+            code = tb.tb_frame.f_code
+            entries.append(
+                (
+                    code.co_filename,
+                    tb.tb_lineno,
+                    code.co_name,
+                    tb.tb_frame.f_locals if self.show_locals else None,
+                )
+            )
+            tb = tb.tb_next
+
+        parts: list[str] = []
+        elided = len(entries) - self.max_frames
+        for index, (filename, lineno, name, frame_locals) in enumerate(entries):
+            if (
+                elided > 0
+                and self.max_frames // 2 <= index < self.max_frames // 2 + elided
+            ):
+                if index == self.max_frames // 2:
+                    parts.append(f"  ... {elided} frames elided ...\n")
+                continue
+            parts.append(self.format_frame(filename, lineno, name))
+            if frame_locals is not None:
+                parts.append(self._format_locals(frame_locals))
+        return parts
+
+    @staticmethod
+    def _format_exception_only(exc: BaseException) -> str:
+        name = type(exc).__qualname__
+        module = type(exc).__module__
+        if module not in {"builtins", "__main__"}:
+            name = f"{module}.{name}"
+        try:
+            message = str(exc)
+        except Exception:  # noqa: BLE001
+            message = "<exception str() failed>"
+        text = f"{name}: {message}\n" if message else f"{name}\n"
+        notes = getattr(exc, "__notes__", None)
+        if isinstance(notes, (list, tuple)):
+            text += "".join(f"{note}\n" for note in notes)
+        return text
+
+    def format_full(self, exc: BaseException, tb: TracebackType | None = None) -> str:
+        """Render an exception and its cause or context chain in full.
+
+        Args:
+            exc: The exception to render.
+            tb: Traceback to render for ``exc`` instead of its own
+                ``__traceback__``, which is left untouched.
+
+        Returns:
+            str: Text in the layout of ``traceback.format_exception``.
+        """
+        tb = tb if tb is not None else exc.__traceback__
+        chain: list[tuple[BaseException, str]] = []
+        seen: set[int] = set()
+        current: BaseException | None = exc
+        message = ""
+        while current is not None and id(current) not in seen:
+            seen.add(id(current))
+            chain.append((current, message))
+            if current.__cause__ is not None:
+                current, message = current.__cause__, _CAUSE_MESSAGE
+            elif current.__context__ is not None and not current.__suppress_context__:
+                current, message = current.__context__, _CONTEXT_MESSAGE
+            else:
+                current = None
+
+        if _BASE_EXCEPTION_GROUP is not None and any(
+            isinstance(chained, _BASE_EXCEPTION_GROUP) for chained, _ in chain
+        ):
+            return "".join(traceback.format_exception(type(exc), exc, tb)).rstrip("\n")
+
+        parts: list[str] = []
+        for chained, separator in reversed(chain):
+            chained_tb = tb if chained is exc else chained.__traceback__
+            if chained_tb is not None:
+                parts.append("Traceback (most recent call last):\n")
+                parts.extend(self._format_stack(chained_tb))
+            parts.append(self._format_exception_only(chained))
+            parts.append(separator)
+        return "".join(parts).rstrip("\n")
+
+    def format_summary(
+        self, exc: BaseException, tb: TracebackType | None = None
+    ) -> str:
+        """Render an exception with only its innermost frame.
+
+        Args:
+            exc: The exception to render.
+            tb: Traceback to use instead of the exception's own.
+
+        Returns:
+            str: The innermost frame, the exception line and a note on how
+            many full tracebacks of its type were suppressed.
+        """
+        parts = []
+        tb = tb if tb is not None else exc.__traceback__
+        if tb is not None:
+            while tb.tb_next is not None:
+                tb = tb.tb_next
+            code = tb.tb_frame.f_code
+            parts.append("Traceback (innermost frame only):\n")
+            parts.append(
+                self.format_frame(code.co_filename, tb.tb_lineno, code.co_name)
+            )
+        parts.append(self._format_exception_only(exc))
+        parts.append(
+            f"[full traceback rate limited: {self.suppressed(type(exc))} "
+            f"{type(exc).__qualname__} tracebacks summarized, limit "
+            f"{self.max_full_renders} per {self.rate_window:g}s]"
+        )
+        return "".join(parts)
+
+    def format_exception(self, exc_info: Any) -> str:
+        """Render ``exc_info`` in full or as a summary, following the policy.
+
+        Args:
+            exc_info: A ``(type, value, traceback)`` tuple.
+
+        Returns:
+            str: The rendered traceback, or "" when there is no exception.
+        """
+        exc = exc_info[1] if exc_info else None
+        if exc is None:
+            return ""
+        tb = exc_info[2]
+        if self.allow_full(exc):
+            return self.format_full(exc, tb)
+        return self.format_summary(exc, tb)
+
+
+_default_policy: TracebackPolicy | None = None
+
+
+def get_default_traceback_policy() -> TracebackPolicy:
+    """Return the policy shared by handlers created without one.
+
+    Returns:
+        TracebackPolicy: The shared policy, created on first use.
+    """
+    global _default_policy  # noqa: PLW0603
+    if _default_policy is None:
+        _default_policy = TracebackPolicy()
+    return _default_policy
+
+
+class TracebackFormatter(logging.Formatter):
+    """Formatter rendering exceptions through a ``TracebackPolicy``."""
+
+    def __init__(
+        self,
+        fmt: str | None = None,
+        datefmt: str | None = None,
+        policy: TracebackPolicy | None = None,
+    ) -> None:
+        """Initialize the formatter.
+
+        Args:
+            fmt: The record format, as for ``logging.Formatter``.
+            datefmt: The date format, as for ``logging.Formatter``.
+            policy: The traceback policy. Defaults to the shared policy.
+        """
+        super().__init__(fmt, datefmt)
+        self.policy = policy or get_default_traceback_policy()
+
+    def formatException(self, ei: Any) -> str:  # noqa: N802
+        """Render an exception following the policy.
+
+        Args:
+            ei: The record's ``exc_info`` tuple.
+
+        Returns:
+            str: The rendered traceback.
+        """
+        return self.policy.format_exception(ei)
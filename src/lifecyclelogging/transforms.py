@@ -0,0 +1,283 @@
+"""Copy-on-write key transformation for ``exit_run`` results.
+
+``KeyTransformer`` renames keys throughout a results tree without mutating
+it. Containers are copied only along paths where a key actually changes:
+a mapping or list whose keys and children are all unchanged is returned as
+is, so transforming mostly-unchanged results allocates almost nothing.
+
+Because unchanged subtrees are shared with the input, mutating the output
+can change the caller's data; treat transformed results as read-only or copy
+them first.
+
+``compile_prefix_rule`` turns ``prefix_allowlist`` and ``prefix_denylist``
+into a rule backed by frozensets and one combined regular expression per
+list, so the cost of a decision does not grow with the list length.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+
+from collections.abc import Iterable, Mapping
+from itertools import islice
+from typing import Any, Callable
+
+
+KeyTransform = Callable[[str], str]
+"""Callable[[str], str]: Function that transforms a single key."""
+
+PrefixRule = Callable[[str, str], bool]
+"""Callable[[str, str], bool]: Decides from the original and transformed key
+whether a top-level field is prefixed."""
+
+MEMO_LIMIT = 1 << 16
+"""int: Maximum number of transformed keys memoized per transformer."""
+
+REGEX_PATTERN_PREFIX = "re:"
+"""str: Marks a prefix list entry as a regular expression."""
+
+_GLOB_CHARACTERS = frozenset("*?[")
+
+
+class KeyPatternSet:
+    """Exact key names plus glob and regex patterns, compiled once.
+
+    Entries starting with ``re:`` are regular expressions that must match the
+    whole key. Entries containing ``*``, ``?`` or ``[`` are shell-style globs
+    and also match themselves literally. Every other entry is an exact name.
+    All patterns are combined into a single compiled expression.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()) -> None:
+        """Compile the patterns.
+
+        Args:
+            patterns: Exact names, globs and ``re:`` regular expressions.
+
+        Raises:
+            re.error: If a regular expression is invalid.
+        """
+        exact: set[str] = set()
+        expressions: list[str] = []
+        for pattern in patterns:
+            if pattern.startswith(REGEX_PATTERN_PREFIX):
+                expressions.append(pattern[len(REGEX_PATTERN_PREFIX) :])
+                continue
+            exact.add(pattern)
+            if not _GLOB_CHARACTERS.isdisjoint(pattern):
+                expressions.append(fnmatch.translate(pattern))
+
+        self.exact = frozenset(exact)
+        self.pattern = (
+            re.compile("|".join(f"(?:{expression})" for expression in expressions))
+            if expressions
+            else None
+        )
+
+    def __bool__(self) -> bool:
+        """Return whether the set holds any names or patterns."""
+        return bool(self.exact) or self.pattern is not None
+
+    def matches(self, key: Any) -> bool:
+        """Return whether a key is listed or matches a pattern.
+
+        Args:
+            key: The key to check.
+
+        Returns:
+            bool: True if the key matches.
+        """
+        if key in self.exact:
+            return True
+        return (
+            self.pattern is not None
+            and isinstance(key, str)
+            and self.pattern.fullmatch(key) is not None
+        )
+
+
+def compile_prefix_rule(
+    allowlist: Iterable[str] | None = None,
+    denylist: Iterable[str] | None = None,
+) -> PrefixRule:
+    """Compile prefix allow and deny lists into a rule.
+
+    A field is prefixed when the allowlist is empty or matches its original or
+    transformed key, and the denylist matches neither. ``KeyTransformer``
+    memoizes the decision per field name.
+
+    Args:
+        allowlist: Names or patterns of fields to prefix.
+        denylist: Names or patterns of fields never to prefix.
+
+    Returns:
+        PrefixRule: The compiled rule.
+    """
+    allowed = KeyPatternSet(allowlist or ())
+    denied = KeyPatternSet(denylist or ())
+
+    def rule(field_name: str, transformed_key: str) -> bool:
+        return (
+            not allowed
+            or allowed.matches(field_name)
+            or allowed.matches(transformed_key)
+        ) and not (denied.matches(field_name) or denied.matches(transformed_key))
+
+    return rule
+
+
+class KeyTransformer:
+    """Applies a key transform, and optionally a prefix, to nested results.
+
+    Transformed keys are memoized for the lifetime of the transformer, so each
+    distinct key is transformed once however often it repeats. The memo stops
+    growing at ``MEMO_LIMIT`` keys, keeping memory bounded when keys are
+    unique identifiers.
+    """
+
+    def __init__(
+        self,
+        transform_fn: KeyTransform,
+        prefix: str | None = None,
+        prefix_rule: PrefixRule | None = None,
+        prefix_delimiter: str = "_",
+    ) -> None:
+        """Initialize the transformer.
+
+        Args:
+            transform_fn: Function applied to every key.
+            prefix: Prefix added to the fields of each top-level result.
+            prefix_rule: Decides which fields get the prefix. Every field is
+                prefixed when omitted.
+            prefix_delimiter: Delimiter between the prefix and the key.
+        """
+        self.transform_fn = transform_fn
+        self.prefix = prefix
+        self.prefix_rule = prefix_rule
+        self.prefix_delimiter = prefix_delimiter
+        self._keys: dict[Any, Any] = {}
+        self._field_keys: dict[Any, Any] = {}
+
+    def key(self, key: Any) -> Any:
+        """Return the transformed key, transforming each distinct key once."""
+        try:
+            return self._keys[key]
+        except KeyError:
+            transformed = self.transform_fn(key)
+            if len(self._keys) < MEMO_LIMIT:
+                self._keys[key] = transformed
+            return transformed
+
+    def field_key(self, field_name: Any) -> Any:
+        """Return the transformed and, where the rule allows, prefixed key."""
+        try:
+            return self._field_keys[field_name]
+        except KeyError:
+            transformed = self.key(field_name)
+            if self.prefix_rule is None or self.prefix_rule(field_name, transformed):
+                transformed = f"{self.prefix}{self.prefix_delimiter}{transformed}"
+            if len(self._field_keys) < MEMO_LIMIT:
+                self._field_keys[field_name] = transformed
+            return transformed
+
+    def transform(self, data: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Transform every key in a nested mapping.
+
+        Args:
+            data: The mapping to transform. It is never mutated.
+
+        Returns:
+            Mapping[str, Any]: ``data`` itself when no key changes, otherwise a
+            new dict sharing every unchanged subtree with ``data``.
+        """
+        return _copy_on_write(data, self.key, self.transform_value)
+
+    def transform_results(self, results: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Transform results, prefixing the fields of each top-level result.
+
+        Top-level keys are left as they are. Without a prefix this is the same
+        as ``transform``.
+
+        Args:
+            results: The results to transform. They are never mutated.
+
+        Returns:
+            Mapping[str, Any]: The transformed results, sharing every
+            unchanged subtree with ``results``.
+        """
+        if self.prefix is None:
+            return self.transform(results)
+        return _copy_on_write(results, _same, self._transform_result)
+
+    def transform_item(self, key: Any, value: Any) -> tuple[Any, Any]:
+        """Transform a single top-level result, as ``transform_results`` would.
+
+        Args:
+            key: The top-level key.
+            value: The top-level value. It is never mutated.
+
+        Returns:
+            tuple[Any, Any]: The transformed key and value.
+        """
+        if self.prefix is None:
+            # Top-level keys are usually unique, so they skip the memo
+            return self.transform_fn(key), self.transform_value(value)
+        return key, self._transform_result(value)
+
+    def transform_value(self, value: Any) -> Any:
+        """Transform the keys of mappings in a value, copying only on change."""
+        if isinstance(value, Mapping):
+            return _copy_on_write(value, self.key, self.transform_value)
+        if isinstance(value, list):
+            return self._transform_list(value)
+        return value
+
+    def _transform_result(self, value: Any) -> Any:
+        if isinstance(value, Mapping):
+            return _copy_on_write(value, self.field_key, self.transform_value)
+        return value
+
+    def _transform_list(self, items: list[Any]) -> list[Any]:
+        result: list[Any] | None = None
+        for index, item in enumerate(items):
+            new_item = (
+                _copy_on_write(item, self.key, self.transform_value)
+                if isinstance(item, Mapping)
+                else item
+            )
+            if result is None:
+                if new_item is item:
+                    continue
+                result = items[:index]
+            result.append(new_item)
+        return items if result is None else result
+
+
+def _same(key: Any) -> Any:
+    return key
+
+
+def _copy_on_write(
+    data: Mapping[Any, Any],
+    key_fn: Callable[[Any], Any],
+    value_fn: Callable[[Any], Any],
+) -> Mapping[Any, Any]:
+    """Rebuild ``data`` with new keys and values, copying only on change.
+
+    Mappings that are not dicts are always converted to dicts, so the result
+    stays serializable.
+    """
+    result: dict[Any, Any] | None = None
+    for index, (key, value) in enumerate(data.items()):
+        new_key = key_fn(key)
+        new_value = value_fn(value)
+        if result is None:
+            if new_key == key and new_value is value:
+                continue
+            result = dict(islice(data.items(), index))
+        result[new_key] = new_value
+
+    if result is not None:
+        return result
+    return data if isinstance(data, dict) else dict(data)
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import logging
 
-from collections.abc import Mapping, Sequence
-from copy import copy, deepcopy
+from collections.abc import Hashable, Mapping, Sequence
 from typing import Any
 
 from extended_data_types import make_raw_data_export_safe, wrap_raw_data_for_export
 
+from lifecyclelogging.cache import PayloadCache
 from lifecyclelogging.const import DEFAULT_LOG_LEVEL
+from lifecyclelogging.limits import PayloadLimits, cap_serialized, limit_payload
 
 
 def get_log_level(level: int | str) -> int:
@@ -91,64 +92,233 @@ def sanitize_json_data(data: Any) -> Any:
     return make_raw_data_export_safe(data, export_to_yaml=False)
 
 
+def render_json_payload(data: Any, limits: PayloadLimits | None = None) -> str:
+    """Sanitize and serialize a single payload for inclusion in a message.
+
+    Sanitizing builds new containers and never mutates ``data``, so no
+    defensive copy is needed.
+
+    Args:
+        data: The payload to render.
+        limits: Optional size limits applied before serialization.
+
+    Returns:
+        str: The serialized payload.
+    """
+    if limits is None:
+        return wrap_raw_data_for_export(sanitize_json_data(data), allow_encoding=True)
+
+    limited, _ = limit_payload(data, limits)
+    return cap_serialized(
+        wrap_raw_data_for_export(sanitize_json_data(limited), allow_encoding=True),
+        limits,
+    )
+
+
+def _render_payload(
+    data: Any,
+    limits: PayloadLimits | None,
+    cache: PayloadCache | None,
+    cache_key: Hashable | None,
+    label: str | None = None,
+) -> str:
+    """Render a payload, going through the payload cache when one is given."""
+    payload = data if label is None else {label: data}
+    if cache is None:
+        return render_json_payload(payload, limits)
+
+    return cache.render(
+        data,
+        lambda: render_json_payload(payload, limits),
+        key=cache_key,
+        variant=(label, limits),
+    )
+
+
+class MessageBuilder:
+    """Collects message segments and joins them once.
+
+    Growing a message with repeated ``+=`` copies the whole message for every
+    appended payload, which is quadratic in the number of payloads. The
+    builder keeps the segments in a list and joins them in a single pass.
+    """
+
+    __slots__ = ("segments",)
+
+    def __init__(self, *segments: str) -> None:
+        """Initialize the builder.
+
+        Args:
+            *segments: Initial segments of the message.
+        """
+        self.segments: list[str] = list(segments)
+
+    def append(self, segment: str) -> None:
+        """Append a segment to the message.
+
+        Args:
+            segment: The text to append.
+        """
+        self.segments.append(segment)
+
+    def __len__(self) -> int:
+        """Return the number of segments collected so far."""
+        return len(self.segments)
+
+    def build(self) -> str:
+        """Join the segments into the final message.
+
+        Returns:
+            str: The complete message.
+        """
+        return "".join(self.segments)
+
+
+def append_labeled_json(
+    builder: MessageBuilder,
+    labeled_data: Mapping[str, Mapping[str, Any]],
+    limits: PayloadLimits | None = None,
+    cache: PayloadCache | None = None,
+    cache_key: Hashable | None = None,
+) -> None:
+    """Append labeled JSON data to a message builder.
+
+    Args:
+        builder: The message builder to append to.
+        labeled_data: The labeled JSON data to append.
+        limits: Optional size limits applied to each payload.
+        cache: Optional cache of rendered payload text.
+        cache_key: Optional explicit cache key; combined with each label.
+    """
+    append = builder.segments.append
+    for label, data in labeled_data.items():
+        key = None if cache_key is None else (cache_key, "labeled", label)
+        if not isinstance(data, Mapping):
+            append("\n:")
+            append(_render_payload(data, limits, cache, key, label=label))
+            continue
+
+        append(f"\n{label}:\n")
+        append(_render_payload(data, limits, cache, key))
+
+
+def append_unlabeled_json(
+    builder: MessageBuilder,
+    json_data: Mapping[str, Any] | Sequence[Mapping[str, Any]],
+    limits: PayloadLimits | None = None,
+    cache: PayloadCache | None = None,
+    cache_key: Hashable | None = None,
+) -> None:
+    """Append unlabeled JSON data to a message builder.
+
+    Args:
+        builder: The message builder to append to.
+        json_data: The JSON data to append.
+        limits: Optional size limits applied to each payload.
+        cache: Optional cache of rendered payload text.
+        cache_key: Optional explicit cache key; combined with each payload's
+            position.
+    """
+    unlabeled_json_data = json_data if isinstance(json_data, Sequence) else [json_data]
+    if (
+        limits is not None
+        and limits.max_items is not None
+        and len(unlabeled_json_data) > limits.max_items
+    ):
+        total = len(unlabeled_json_data)
+        unlabeled_json_data = unlabeled_json_data[: limits.max_items]
+        builder.append(
+            f"\n:[{total - limits.max_items} more payloads truncated ({total} total)]"
+        )
+
+    append = builder.segments.append
+    for index, jd in enumerate(unlabeled_json_data):
+        key = None if cache_key is None else (cache_key, "unlabeled", index)
+        append("\n:")
+        append(_render_payload(jd, limits, cache, key))
+
+
+def append_json_data(
+    builder: MessageBuilder,
+    json_data: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None,
+    labeled_json_data: Mapping[str, Mapping[str, Any]] | None,
+    limits: PayloadLimits | None = None,
+    cache: PayloadCache | None = None,
+    cache_key: Hashable | None = None,
+) -> None:
+    """Append JSON data to a message builder.
+
+    Args:
+        builder: The message builder to append to.
+        json_data: The JSON data to append.
+        labeled_json_data: The labeled JSON data to append.
+        limits: Optional size limits applied to each payload.
+        cache: Optional cache of rendered payload text.
+        cache_key: Optional explicit key for the payload cache.
+    """
+    if labeled_json_data:
+        append_labeled_json(builder, labeled_json_data, limits, cache, cache_key)
+
+    if json_data:
+        append_unlabeled_json(builder, json_data, limits, cache, cache_key)
+
+
 def add_labeled_json(
     msg: str,
     labeled_data: Mapping[str, Mapping[str, Any]],
+    limits: PayloadLimits | None = None,
+    cache: PayloadCache | None = None,
+    cache_key: Hashable | None = None,
 ) -> str:
     """Add labeled JSON data to the message.
 
     Args:
         msg: The base message to append data to.
         labeled_data: The labeled JSON data to append.
+        limits: Optional size limits applied to each payload.
+        cache: Optional cache of rendered payload text.
+        cache_key: Optional explicit cache key; combined with each label.
 
     Returns:
         str: The message with appended labeled JSON data.
     """
-    for label, data in deepcopy(labeled_data).items():
-        if not isinstance(data, Mapping):
-            mapped_data = {label: data}
-            msg += "\n:" + wrap_raw_data_for_export(
-                sanitize_json_data(mapped_data),
-                allow_encoding=True,
-            )
-            continue
-
-        msg += f"\n{label}:\n" + wrap_raw_data_for_export(
-            sanitize_json_data(data),
-            allow_encoding=True,
-        )
-    return msg
+    builder = MessageBuilder(msg)
+    append_labeled_json(builder, labeled_data, limits, cache, cache_key)
+    return builder.build()
 
 
 def add_unlabeled_json(
     msg: str,
     json_data: Mapping[str, Any] | Sequence[Mapping[str, Any]],
+    limits: PayloadLimits | None = None,
+    cache: PayloadCache | None = None,
+    cache_key: Hashable | None = None,
 ) -> str:
     """Add unlabeled JSON data to the message.
 
     Args:
         msg (str): The base message to append data to.
         json_data (Mapping[str, Any] | Sequence[Mapping[str, Any]]): The JSON data to append.
+        limits (PayloadLimits | None): Optional size limits applied to each payload.
+        cache (PayloadCache | None): Optional cache of rendered payload text.
+        cache_key (Hashable | None): Optional explicit cache key; combined with
+            each payload's position.
 
     Returns:
         str: The message with appended unlabeled JSON data.
     """
-    unlabeled_json_data = (
-        deepcopy(json_data) if isinstance(json_data, Sequence) else [copy(json_data)]
-    )
-
-    for jd in unlabeled_json_data:
-        msg += "\n:" + wrap_raw_data_for_export(
-            sanitize_json_data(jd),
-            allow_encoding=True,
-        )
-    return msg
+    builder = MessageBuilder(msg)
+    append_unlabeled_json(builder, json_data, limits, cache, cache_key)
+    return builder.build()
 
 
 def add_json_data(
     msg: str,
     json_data: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None,
     labeled_json_data: Mapping[str, Mapping[str, Any]] | None,
+    limits: PayloadLimits | None = None,
+    cache: PayloadCache | None = None,
+    cache_key: Hashable | None = None,
 ) -> str:
     """Add JSON data to the log message.
 
@@ -156,14 +326,13 @@ def add_json_data(
         msg (str): The base message to append data to.
         json_data (Mapping[str, Any] | Sequence[Mapping[str, Any]] | None): The JSON data to append.
         labeled_json_data (Mapping[str, Mapping[str, Any]] | None): The labeled JSON data to append.
+        limits (PayloadLimits | None): Optional size limits applied to each payload.
+        cache (PayloadCache | None): Optional cache of rendered payload text.
+        cache_key (Hashable | None): Optional explicit key for the payload cache.
 
     Returns:
         str: The message with appended JSON data.
     """
-    if labeled_json_data:
-        msg = add_labeled_json(msg, labeled_json_data)
-
-    if json_data:
-        msg = add_unlabeled_json(msg, json_data)
-
-    return msg
+    builder = MessageBuilder(msg)
+    append_json_data(builder, json_data, labeled_json_data, limits, cache, cache_key)
+    return builder.build()
@@ -0,0 +1,184 @@
+"""Fast, atomic and optionally background writing of results files.
+
+``dump_results`` serializes results straight to bytes with orjson, handling
+the special types ``wrap_raw_data_for_export`` converts (dates, paths, sets,
+non-dict mappings) in a ``default`` hook instead of a full pre-pass over the
+data. ``write_atomic`` writes to a temporary file in the target directory and
+renames it into place, so a reader sees either the old file or the new one,
+never a partial write; ``temporary_file`` does the same for files written
+incrementally. ``BackgroundWriter`` runs such writes on a worker
+thread; ``join`` waits for them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as dt
+import os
+import queue
+import tempfile
+import threading
+
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import IO, Any, Callable
+
+import orjson
+
+
+def _export_default(obj: Any) -> Any:
+    """Convert values orjson does not serialize, like ``convert_special_type``."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, dt.date):
+        return obj.isoformat().removesuffix("+00:00")
+    wrapped = getattr(obj, "__wrapped__", None)
+    if wrapped is not None:
+        return wrapped
+    return str(obj)
+
+
+def dump_results(results: Any, indent: bool = False) -> bytes:
+    """Serialize results to JSON bytes.
+
+    Args:
+        results: The results to serialize.
+        indent: Indent nested values by two spaces for readability.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(results, default=_export_default, option=option)
+
+
+def write_atomic(path: str | Path, data: bytes) -> None:
+    """Replace a file's contents atomically.
+
+    The data is written to a temporary file beside ``path``, which is then
+    renamed over it. Missing parent directories are created.
+
+    Args:
+        path: The file to write.
+        data: The new contents.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        Path(tmp_name).replace(path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            Path(tmp_name).unlink()
+        raise
+
+
+@contextlib.contextmanager
+def temporary_file(path: str | Path) -> Iterator[tuple[IO[bytes], Path]]:
+    """Open a temporary file beside ``path`` for incremental writing.
+
+    The file is closed when the block exits. If the block raises, the file
+    is removed; otherwise the caller renames it over ``path`` or moves its
+    contents elsewhere. Missing parent directories are created.
+
+    Args:
+        path: The file the temporary file will replace.
+
+    Yields:
+        tuple[IO[bytes], Path]: The open file and its path.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            yield tmp_file, tmp_path
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+
+class BackgroundWriter:
+    """Runs write tasks in order on a single worker thread.
+
+    The worker starts with the first task. Failures are collected rather
+    than raised on the worker, and returned by ``join``.
+    """
+
+    def __init__(self, max_pending: int = 16) -> None:
+        """Initialize the writer.
+
+        Args:
+            max_pending: Maximum number of queued tasks; ``submit`` blocks
+                while the queue is full.
+        """
+        self.max_pending = max_pending
+        self._queue: queue.Queue[Callable[[], Any] | None] = queue.Queue(max_pending)
+        self._errors: list[BaseException] = []
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """int: Number of tasks waiting to run."""
+        return self._queue.qsize()
+
+    def submit(self, task: Callable[[], Any]) -> None:
+        """Queue a task to run on the worker thread.
+
+        Args:
+            task: Callable run without arguments.
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="lifecyclelogging-results", daemon=True
+                )
+                self._thread.start()
+        self._queue.put(task)
+
+    def _run(self) -> None:
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                task()
+            except Exception as exc:  # noqa: BLE001
+                with self._lock:
+                    self._errors.append(exc)
+            finally:
+                self._queue.task_done()
+
+    def join(self) -> list[BaseException]:
+        """Wait until every queued task has run.
+
+        Returns:
+            list[BaseException]: Errors raised by tasks since the last join.
+        """
+        self._queue.join()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        return errors
+
+    def close(self) -> list[BaseException]:
+        """Run the queued tasks and stop the worker thread.
+
+        Returns:
+            list[BaseException]: Errors raised by tasks since the last join.
+        """
+        errors = self.join()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+        return errors
@@ -0,0 +1,170 @@
+"""Tests for load-aware verbosity adaptation."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+import pytest
+
+from lifecyclelogging import AdaptiveVerbosity, Logging
+from lifecyclelogging.adaptive import VerbosityChange
+
+
+SECOND_NS = 1_000_000_000
+
+
+def busy_window(controller: AdaptiveVerbosity, start_ns: int) -> int:
+    """Feed one window over the rate limit and return its end time."""
+    controller.observe(1_000, start_ns, count=10_000)
+    end_ns = start_ns + SECOND_NS
+    controller.observe(1_000, end_ns)
+    return end_ns
+
+
+def calm_window(controller: AdaptiveVerbosity, start_ns: int) -> int:
+    """Feed one window well under every limit and return its end time."""
+    end_ns = start_ns + SECOND_NS
+    controller.observe(1_000, end_ns)
+    return end_ns
+
+
+def test_pressure_lowers_threshold_to_floor() -> None:
+    """Test that each busy window lowers the threshold one step."""
+    changes: list[VerbosityChange] = []
+    controller = AdaptiveVerbosity(
+        ceiling=4, floor=2, max_rate=100, on_change=changes.append
+    )
+    now = 0
+    for _ in range(4):
+        now = busy_window(controller, now)
+
+    assert controller.threshold == controller.floor
+    assert [change.threshold for change in changes] == [3, 2]
+    assert changes[0].reason == "pressure"
+    assert changes[0].rate > controller.max_rate
+
+
+def test_recovery_needs_consecutive_calm_windows() -> None:
+    """Test the hysteresis: one step up per run of calm windows."""
+    controller = AdaptiveVerbosity(ceiling=3, floor=1, max_rate=100, recover_windows=2)
+    now = busy_window(controller, 0)
+    now = busy_window(controller, now)
+    assert controller.threshold == 1
+
+    now = calm_window(controller, now)
+    assert controller.threshold == 1
+    now = calm_window(controller, now)
+    assert controller.threshold == 2  # noqa: PLR2004
+
+    # A window between the recovery and pressure limits resets the count
+    controller.observe(1_000, now, count=70)
+    now = calm_window(controller, now)
+    now = calm_window(controller, now)
+    assert controller.threshold == 2  # noqa: PLR2004
+    now = calm_window(controller, now)
+    assert controller.threshold == controller.ceiling
+
+
+def test_latency_and_queue_depth_count_as_pressure() -> None:
+    """Test that slow handlers or deep queues lower the threshold."""
+    slow = AdaptiveVerbosity(ceiling=3, max_rate=None, max_latency=0.001)
+    slow.observe(5_000_000, 0)
+    slow.observe(5_000_000, SECOND_NS)
+    assert slow.threshold == 2  # noqa: PLR2004
+
+    queued = AdaptiveVerbosity(
+        ceiling=3, max_rate=None, max_queue_depth=10, queue_depth=lambda: 50.0
+    )
+    queued.observe(1_000, 0)
+    queued.observe(1_000, SECOND_NS)
+    assert queued.threshold == 2  # noqa: PLR2004
+
+
+def test_concurrent_observers_lose_no_statements() -> None:
+    """Test that statements counted from many threads all land in the window."""
+    changes: list[VerbosityChange] = []
+    controller = AdaptiveVerbosity(
+        ceiling=3, floor=1, max_rate=1, on_change=changes.append
+    )
+    controller.observe(0, 1, count=0)
+    threads, per_thread = 8, 20_000
+    barrier = threading.Barrier(threads)
+
+    def emit() -> None:
+        barrier.wait()
+        for _ in range(per_thread):
+            controller.observe(0, 1)
+
+    workers = [threading.Thread(target=emit) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    controller.observe(0, SECOND_NS + 1, count=0)
+
+    assert [change.rate for change in changes] == [threads * per_thread]
+
+
+def test_invalid_settings_rejected() -> None:
+    """Test that inconsistent limits raise ValueError."""
+    with pytest.raises(ValueError, match="floor"):
+        AdaptiveVerbosity(ceiling=1, floor=2)
+    with pytest.raises(ValueError, match="window"):
+        AdaptiveVerbosity(ceiling=3, window=0)
+
+
+def test_logging_applies_threshold_and_logs_notice(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that Logging suppresses by the adapted threshold and says so."""
+    logger = Logging(
+        enable_console=False,
+        enable_file=False,
+        enable_verbose_output=True,
+        verbosity_threshold=3,
+    )
+    logger.logger.propagate = True
+    logger.register_verbosity_bypass_marker("trace")
+    adaptive = logger.enable_adaptive_verbosity(max_rate=100)
+    assert logger.logged_statement("detail", verbosity=3) == "detail"
+
+    with caplog.at_level(logging.DEBUG, logger=logger.logger.name):
+        now = busy_window(adaptive, time.perf_counter_ns())
+        busy_window(adaptive, now)
+
+    assert adaptive.threshold == 1
+    assert logger.logged_statement("detail", verbosity=2) is None
+    assert logger.logged_statement("kept") == "kept"
+    assert logger.logged_statement("traced", verbosity=3, context_marker="trace") == (
+        "[trace] traced"
+    )
+
+    notices = [
+        record for record in caplog.records if hasattr(record, "adaptive_verbosity")
+    ]
+    assert [record.levelno for record in notices] == [logging.WARNING] * 2
+    assert notices[-1].adaptive_verbosity["threshold"] == 1
+    assert '"reason":"pressure"' in notices[-1].getMessage()
+
+    logger.disable_adaptive_verbosity()
+    assert logger.logged_statement("detail", verbosity=3) == "detail"
+
+
+def test_logging_warns_when_adaptation_has_no_range(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that enabling adaptation with ceiling equal to floor warns."""
+    logger = Logging(enable_console=False, enable_file=False)
+    logger.logger.propagate = True
+
+    with caplog.at_level(logging.WARNING, logger=logger.logger.name):
+        logger.enable_adaptive_verbosity()
+    assert "no effect" in caplog.text
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger=logger.logger.name):
+        logger.enable_adaptive_verbosity(ceiling=3)
+    assert "no effect" not in caplog.text
+    logger.disable_adaptive_verbosity()
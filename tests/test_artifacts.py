@@ -0,0 +1,207 @@
+"""Tests for the content-addressed results artifact store."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+import types
+
+from pathlib import Path
+
+import orjson
+import pytest
+
+from lifecyclelogging import ArtifactStore, Logging
+from lifecyclelogging.artifacts import canonical_json
+
+
+def _logger(store: ArtifactStore) -> Logging:
+    return Logging(enable_console=False, enable_file=False, artifact_store=store)
+
+
+def _objects(root: Path) -> list[Path]:
+    return sorted((root / "objects").glob("*/*"))
+
+
+def test_put_and_read_round_trip(tmp_path: Path) -> None:
+    """Test that a stored artifact reads back from the latest manifest."""
+    store = ArtifactStore(tmp_path, run_id="run-1")
+    digest = store.put_json("results.json", {"b": 1, "a": [1, 2]})
+
+    assert store.read("results.json") == b'{"a":[1,2],"b":1}'
+    manifest = store.manifest()
+    assert manifest["run_id"] == "run-1"
+    assert manifest["artifacts"]["results.json"]["digest"] == digest
+    assert _objects(tmp_path)[0].suffix == ".gz"
+
+
+def test_unchanged_content_is_not_rewritten(tmp_path: Path) -> None:
+    """Test that a second run with equal results reuses the stored object."""
+    first = ArtifactStore(tmp_path, run_id="run-1")
+    first.put_json("results.json", {"a": 1, "b": 2})
+    (stored,) = _objects(tmp_path)
+    inode = stored.stat().st_ino
+
+    second = ArtifactStore(tmp_path, run_id="run-2")
+    second.put_json("results.json", {"b": 2, "a": 1})
+
+    assert second.objects_written == 0
+    assert second.objects_reused == 1
+    assert [path.stat().st_ino for path in _objects(tmp_path)] == [inode]
+    assert second.runs() == ["run-1", "run-2"]
+    assert second.manifest()["artifacts"]["results.json"]["reused"] is True
+
+
+def test_prune_keeps_recent_runs_and_referenced_objects(tmp_path: Path) -> None:
+    """Test that pruning drops old manifests and their unreferenced objects."""
+    for index in range(4):
+        ArtifactStore(tmp_path, run_id=f"run-{index}").put_json(
+            "results.json", {"run": index}
+        )
+    old = time.time() - 7200
+    for path in _objects(tmp_path):
+        os.utime(path, (old, old))
+
+    store = ArtifactStore(tmp_path, keep_runs=2, run_id="run-3")
+    assert store.prune() == ["run-0", "run-1"]
+    assert store.runs() == ["run-2", "run-3"]
+    assert len(_objects(tmp_path)) == len(store.runs())
+    assert orjson.loads(store.read("results.json", "run-2")) == {"run": 2}
+
+
+def test_prune_by_age(tmp_path: Path) -> None:
+    """Test that runs older than max_age are pruned, but never the current run."""
+    ArtifactStore(tmp_path, run_id="run-0").put_json("results.json", {})
+    old = time.time() - 120
+    os.utime(tmp_path / "runs" / "run-0.json", (old, old))
+
+    store = ArtifactStore(tmp_path, keep_runs=None, max_age=60, run_id="run-1")
+    store.put_json("results.json", {})
+    assert store.prune() == ["run-0"]
+    assert store.runs() == ["run-1"]
+
+
+def test_uncompressed_and_zstd_objects(tmp_path: Path) -> None:
+    """Test that objects stay readable whatever compression wrote them."""
+    ArtifactStore(tmp_path, compression=None, run_id="run-1").put(
+        "raw.txt", b"plain", "text"
+    )
+    assert ArtifactStore(tmp_path).read("raw.txt") == b"plain"
+
+    pytest.importorskip("zstandard")
+    store = ArtifactStore(tmp_path, compression="zstd", run_id="run-2")
+    store.put("other.txt", b"compressed" * 100, "text")
+    assert store.read("other.txt") == b"compressed" * 100
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_put_file_matches_put(tmp_path: Path, compression: str | None) -> None:
+    """Test that a file stored in chunks dedupes with the same bytes."""
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    data = b'{"line":1}\n' * 50_000
+    source = tmp_path / "results.ndjson"
+    source.write_bytes(data)
+    store = ArtifactStore(tmp_path / "store", compression=compression)  # type: ignore[arg-type]
+
+    digest = store.put_file("results.ndjson", source, "ndjson")
+
+    assert store.put("copy.ndjson", data, "ndjson") == digest
+    assert store.read("results.ndjson") == data
+    assert store.objects_reused == 1
+    assert source.read_bytes() == data
+
+
+def test_invalid_options(tmp_path: Path) -> None:
+    """Test that invalid compression and retention raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown artifact compression"):
+        ArtifactStore(tmp_path, compression="xz")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="keep_runs"):
+        ArtifactStore(tmp_path, keep_runs=0)
+
+
+def test_canonical_json_is_independent_of_hash_seed() -> None:
+    """Test that sets and mappings give the same bytes under any hash seed."""
+    script = (
+        "import hashlib, types\n"
+        "from lifecyclelogging.artifacts import canonical_json\n"
+        "data = {'tags': {'b', 'a', 'c', 'zz', 'q'}, 'mixed': {1, 'x', 2.5},\n"
+        "        'view': types.MappingProxyType({'k': frozenset({'y', 'x'})})}\n"
+        "print(hashlib.sha256(canonical_json(data)).hexdigest())\n"
+    )
+    digests = {
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(digests) == 1
+    assert orjson.loads(
+        canonical_json({"view": types.MappingProxyType({"s": {"b", "a"}})})
+    ) == {"view": {"s": ["a", "b"]}}
+
+
+def test_missing_artifact_raises(tmp_path: Path) -> None:
+    """Test that reading unknown runs or names raises FileNotFoundError."""
+    store = ArtifactStore(tmp_path)
+    with pytest.raises(FileNotFoundError, match="No runs"):
+        store.manifest()
+    store.put_json("results.json", {})
+    with pytest.raises(FileNotFoundError, match="No artifact named"):
+        store.read("missing.json")
+
+
+def test_log_results_writes_to_store(tmp_path: Path) -> None:
+    """Test that log_results stores artifacts instead of writing files."""
+    os.chdir(tmp_path)
+    store = ArtifactStore(tmp_path / "store", run_id="run-1")
+    logger = _logger(store)
+
+    logger.log_results({"key": "value"}, "results")
+    logger.log_results("raw text", "notes", no_formatting=True, ext=".txt")
+
+    assert not (tmp_path / "results.json").exists()
+    assert store.read("results.json") == canonical_json({"key": "value"})
+    assert store.read("notes.txt") == b"raw text"
+
+
+def test_exit_run_prunes_store(tmp_path: Path) -> None:
+    """Test that exit_run stores its results and applies retention."""
+    os.chdir(tmp_path)
+    for index in range(3):
+        store = ArtifactStore(tmp_path / "store", keep_runs=1, run_id=f"run-{index}")
+        _logger(store).exit_run({"a": {"b": 1}}, exit_on_completion=False)
+
+    assert store.runs() == ["run-2"]
+    assert len(_objects(tmp_path / "store")) == 1
+    assert store.objects_reused == 1
+
+
+def test_exit_run_ndjson_goes_to_store(
+    tmp_path: Path, capsysbinary: pytest.CaptureFixture[bytes]
+) -> None:
+    """Test that streamed JSON lines are stored like the JSON results file."""
+    os.chdir(tmp_path)
+    store = ArtifactStore(tmp_path / "store", run_id="run-1")
+    with pytest.raises(SystemExit):
+        _logger(store).exit_run({"a": 1, "b": 2}, output_format="ndjson")
+
+    assert store.read("results.ndjson") == capsysbinary.readouterr().out
+    assert store.manifest()["artifacts"]["results.ndjson"]["content_type"] == "ndjson"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["store"]
+
+
+def test_artifact_store_from_env(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that LOG_ARTIFACT_STORE enables a store rooted at its path."""
+    monkeypatch.setenv("LOG_ARTIFACT_STORE", str(tmp_path))
+    logger = Logging(enable_console=False, enable_file=False)
+    assert logger.artifact_store is not None
+    assert logger.artifact_store.root == tmp_path
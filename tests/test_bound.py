@@ -0,0 +1,76 @@
+"""Tests for child loggers returned by Logging.bind."""
+
+from __future__ import annotations
+
+from lifecyclelogging import BoundLogging, Logging
+
+
+def test_bound_statement_matches_explicit_arguments(logger: Logging) -> None:
+    """Test that bound values render exactly like explicit arguments."""
+    child = logger.bind(context_marker="sync", identifiers=["acct-1", "us-east-1"])
+
+    assert isinstance(child, BoundLogging)
+    assert child.logged_statement("Started") == logger.logged_statement(
+        "Started", context_marker="sync", identifiers=["acct-1", "us-east-1"]
+    )
+    assert child.logged_statement("Started") == "[sync] Started (acct-1, us-east-1)"
+    assert logger.current_context_marker == "sync"
+
+
+def test_explicit_arguments_override_bound_values(logger: Logging) -> None:
+    """Test that arguments passed to the child win over bound ones."""
+    child = logger.bind(context_marker="sync", identifiers=["a"])
+    assert (
+        child.logged_statement("Done", context_marker="teardown", identifiers=["b"])
+        == "[teardown] Done (b)"
+    )
+
+
+def test_child_shares_parent_state(logger: Logging) -> None:
+    """Test that storage, errors and configuration are shared both ways."""
+    child = logger.bind(storage_marker="EVENTS")
+    child.logged_statement("stored", log_level="warning")
+    assert list(logger.stored_messages["EVENTS"]) == [":warning: stored"]
+
+    child.error_list.append("failure")
+    assert logger.error_list == ["failure"]
+
+    logger.verbosity_threshold = 1
+    assert child.logged_statement("hidden", verbosity=2) is None
+    assert child.logger is logger.logger
+
+
+def test_bound_marker_bypasses_verbosity(logger: Logging) -> None:
+    """Test that a bound bypass marker lets verbose statements through."""
+    logger.register_verbosity_bypass_marker("debug_sync")
+    child = logger.bind(context_marker="debug_sync")
+    assert child.logged_statement("detail", verbose=True, verbosity=3) == (
+        "[debug_sync] detail"
+    )
+
+
+def test_nested_bind_inherits_unset_fields(logger: Logging) -> None:
+    """Test that binding a child keeps the values it does not replace."""
+    child = logger.bind(context_marker="sync", storage_marker="EVENTS")
+    grandchild = child.bind(identifiers=["acct-1"])
+    grandchild.logged_statement("nested", log_level="info")
+    assert list(logger.stored_messages["EVENTS"]) == ["[sync] nested (acct-1)"]
+
+
+def test_bound_logged_statements(logger: Logging) -> None:
+    """Test that bulk logging applies the bound values as defaults."""
+    child = logger.bind(context_marker="bulk", identifiers=["x"])
+    assert child.logged_statements(
+        [{"msg": "one"}, {"msg": "two", "context_marker": "other"}]
+    ) == ["[bulk] one (x)", "[other] two (x)"]
+
+
+def test_profiler_attributes_bound_calls_to_caller(logger: Logging) -> None:
+    """Test that profiled call sites skip the child's forwarding method."""
+    profiler = logger.enable_profiling(report_on_exit=False)
+
+    def component() -> None:
+        logger.bind(context_marker="sync").logged_statement("hello")
+
+    component()
+    assert [row["function"] for row in profiler.top()] == ["component"]
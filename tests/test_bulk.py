@@ -0,0 +1,116 @@
+"""Unit tests for bulk logging with Logging.logged_statements."""
+
+from __future__ import annotations
+
+import logging
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from lifecyclelogging import Logging
+from lifecyclelogging.handlers import BatchFileHandler
+
+
+RECORDS: list[dict[str, Any]] = [
+    {"msg": "Starting", "context_marker": "setup", "log_level": "info"},
+    {"msg": "Details", "verbose": True},
+    {"msg": "Payload", "json_data": {"key": "value"}, "log_level": "info"},
+    {"msg": "Careful", "log_level": "warning", "identifiers": ["id-1"]},
+    {"msg": "Noise", "log_level": "debug", "denied_levels": ["debug"]},
+]
+
+
+def _new_logger(name: str, **kwargs: Any) -> Logging:
+    return Logging(
+        enable_console=False,
+        enable_file=False,
+        logger_name=name,
+        default_storage_marker="run",
+        **kwargs,
+    )
+
+
+def test_logged_statements_matches_individual_calls() -> None:
+    """Test that bulk logging returns and stores what N single calls would."""
+    single = _new_logger("bulk_single")
+    bulk = _new_logger("bulk_batch")
+
+    expected = [single.logged_statement(**record) for record in RECORDS]
+    results = bulk.logged_statements(RECORDS)
+
+    assert results == expected
+    assert results[1] is None
+    assert set(bulk.stored_messages["run"]) == set(single.stored_messages["run"])
+    assert bulk.current_context_marker == single.current_context_marker
+
+
+def test_logged_statements_applies_defaults() -> None:
+    """Test that defaults apply unless a record overrides them."""
+    logger = _new_logger("bulk_defaults")
+    results = logger.logged_statements(
+        [{"msg": "one"}, {"msg": "two", "context_marker": "other"}],
+        context_marker="shared",
+        log_level="info",
+    )
+
+    assert results == ["[shared] one", "[other] two"]
+
+
+def test_logged_statements_rejects_unknown_fields() -> None:
+    """Test that misspelled fields raise TypeError like a bad keyword would."""
+    logger = _new_logger("bulk_unknown")
+    with pytest.raises(TypeError, match="unknown fields"):
+        logger.logged_statements([{"msg": "one", "levle": "info"}])
+    with pytest.raises(TypeError, match="missing 'msg'"):
+        logger.logged_statements([{"log_level": "info"}])
+
+
+def test_logged_statements_writes_batch_once(tmp_path: Path) -> None:
+    """Test that a batch handler receives the whole batch in one call."""
+    logger = _new_logger("bulk_file")
+    logger.logger.setLevel(logging.DEBUG)
+    handler = BatchFileHandler(tmp_path / "bulk.log")
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    batches: list[int] = []
+    original = handler.emit_batch
+
+    def record_batch(records: Any) -> None:
+        batches.append(len(records))
+        original(records)
+
+    handler.emit_batch = record_batch  # type: ignore[method-assign]
+    logger.logger.addHandler(handler)
+    try:
+        logger.logged_statements(
+            [{"msg": f"line {index}", "log_level": "info"} for index in range(5)]
+        )
+    finally:
+        logger.logger.removeHandler(handler)
+        handler.close()
+
+    assert batches == [5]
+    lines = (tmp_path / "bulk.log").read_text().splitlines()
+    assert lines == [f"INFO line {index}" for index in range(5)]
+
+
+def test_logged_statements_respects_handler_levels(tmp_path: Path) -> None:
+    """Test that records below a handler's level are not written."""
+    logger = _new_logger("bulk_levels")
+    logger.logger.setLevel(logging.DEBUG)
+    handler = BatchFileHandler(tmp_path / "levels.log")
+    handler.setLevel(logging.WARNING)
+    logger.logger.addHandler(handler)
+    try:
+        logger.logged_statements(
+            [
+                {"msg": "quiet", "log_level": "info"},
+                {"msg": "loud", "log_level": "error"},
+            ]
+        )
+    finally:
+        logger.logger.removeHandler(handler)
+        handler.close()
+
+    assert (tmp_path / "levels.log").read_text().splitlines() == ["loud"]
@@ -0,0 +1,116 @@
+"""Unit tests for the rendered payload cache in the lifecyclelogging package."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from lifecyclelogging import Logging, PayloadCache
+
+
+def _counting_render(calls: list[str], text: str) -> Any:
+    def render() -> str:
+        calls.append(text)
+        return text
+
+    return render
+
+
+def test_cache_hits_on_same_object() -> None:
+    """Test that the same unchanged object is rendered only once."""
+    cache = PayloadCache()
+    payload = {"key": "value"}
+    calls: list[str] = []
+
+    first = cache.render(payload, _counting_render(calls, "rendered"))
+    second = cache.render(payload, _counting_render(calls, "rendered"))
+
+    assert first == second == "rendered"
+    assert calls == ["rendered"]
+    assert cache.stats()["hits"] == 1
+
+
+def test_cache_detects_top_level_changes() -> None:
+    """Test that replacing a top-level value invalidates the entry."""
+    cache = PayloadCache()
+    payload = {"key": "value"}
+    calls: list[str] = []
+
+    cache.render(payload, _counting_render(calls, "v1"))
+    payload["key"] = "other"
+    assert cache.render(payload, _counting_render(calls, "v2")) == "v2"
+    payload["new"] = "key"
+    assert cache.render(payload, _counting_render(calls, "v3")) == "v3"
+    assert calls == ["v1", "v2", "v3"]
+
+
+def test_cache_explicit_key() -> None:
+    """Test that explicit keys are used instead of identity."""
+    cache = PayloadCache()
+    calls: list[str] = []
+
+    cache.render({"a": 1}, _counting_render(calls, "first"), key="config-v1")
+    hit = cache.render({"a": 1}, _counting_render(calls, "second"), key="config-v1")
+
+    assert hit == "first"
+    assert calls == ["first"]
+
+
+def test_cache_evicts_by_entries_and_bytes() -> None:
+    """Test that the LRU honours both the entry and byte budgets."""
+    cache = PayloadCache(max_entries=2, max_bytes=10)
+    payloads = [{"n": n} for n in range(3)]
+    for payload in payloads:
+        cache.render(payload, lambda: "abcd")
+
+    stats = cache.stats()
+    assert stats["entries"] == len(payloads) - 1
+    assert stats["evictions"] == 1
+
+    cache.render({"big": 1}, lambda: "x" * 100)
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_logging_uses_payload_cache() -> None:
+    """Test that repeated labeled payloads are served from the cache."""
+    cache = PayloadCache()
+    logger = Logging(enable_console=False, enable_file=False, payload_cache=cache)
+    config = {"region": "us-east-1", "replicas": 3}
+
+    first = logger.logged_statement(
+        "Iteration",
+        labeled_json_data={"config": config},
+        log_level="info",  # type: ignore[arg-type]
+    )
+    second = logger.logged_statement(
+        "Iteration",
+        labeled_json_data={"config": config},
+        log_level="info",  # type: ignore[arg-type]
+    )
+
+    assert first == second
+    assert first is not None
+    assert "us-east-1" in first
+    assert cache.stats()["hits"] == 1
+
+
+def test_logging_payload_cache_key() -> None:
+    """Test that an explicit payload_cache_key is honoured."""
+    cache = PayloadCache()
+    logger = Logging(enable_console=False, enable_file=False, payload_cache=cache)
+
+    logger.logged_statement(
+        "Inventory",
+        json_data={"hosts": ["a"]},
+        payload_cache_key="inventory-1",
+        log_level="info",  # type: ignore[arg-type]
+    )
+    result = logger.logged_statement(
+        "Inventory",
+        json_data={"hosts": ["a"]},
+        payload_cache_key="inventory-1",
+        log_level="info",  # type: ignore[arg-type]
+    )
+
+    assert result is not None
+    assert '"hosts"' in result
+    assert cache.stats()["hits"] == 1
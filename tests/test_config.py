@@ -0,0 +1,243 @@
+"""Tests for runtime reconfiguration and the control-file watcher."""
+
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
+
+from lifecyclelogging import Logging
+from lifecyclelogging.config import LoggingConfig
+
+
+class ListHandler(logging.Handler):
+    """Handler collecting the messages it receives."""
+
+    def __init__(self) -> None:
+        """Initialize the handler."""
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Collect a message."""
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def logger() -> Logging:
+    """Create a Logging instance at INFO level."""
+    instance = Logging(
+        enable_console=False, enable_file=False, enable_verbose_output=True
+    )
+    instance.logger.setLevel(logging.INFO)
+    return instance
+
+
+@pytest.fixture
+def handler(logger: Logging) -> ListHandler:
+    """Attach a collecting handler to the logger."""
+    collector = ListHandler()
+    logger.logger.addHandler(collector)
+    return collector
+
+
+def test_reconfigure_swaps_snapshot(logger: Logging) -> None:
+    """Test that settings change on the next statement as one snapshot."""
+    before = logger.config
+    assert logger.logged_statement("detail", verbosity=2) is None
+
+    config = logger.reconfigure(verbosity_threshold=3, allowed_levels=["INFO"])
+
+    assert isinstance(config, LoggingConfig)
+    assert logger.config is config
+    assert before.verbosity_threshold == 1
+    assert logger.allowed_levels == ("info",)
+    assert logger.logged_statement("detail", verbosity=2) == "detail"
+
+
+def test_attribute_assignment_reconfigures(logger: Logging) -> None:
+    """Test that assigning a setting swaps in a new snapshot."""
+    before = logger.config
+    logger.verbosity_threshold = 4
+    assert logger.config is not before
+    assert logger.config.verbosity_threshold == 4  # noqa: PLR2004
+
+
+def test_reconfigure_rejects_unknown_settings(logger: Logging) -> None:
+    """Test that misspelled settings and handler names raise."""
+    with pytest.raises(TypeError, match="verbosity"):
+        logger.reconfigure(verbosity=2)
+    with pytest.raises(ValueError, match="missing"):
+        logger.reconfigure(handler_levels={"missing": "INFO"})
+
+
+@pytest.mark.parametrize(
+    ("settings", "error"),
+    [
+        ({"verbosity_threshold": "3"}, TypeError),
+        ({"verbosity_threshold": True}, TypeError),
+        ({"verbosity_threshold": 0}, ValueError),
+        ({"enable_verbose_output": "yes"}, TypeError),
+        ({"allowed_levels": "info"}, TypeError),
+        ({"denied_levels": ["debug", 10]}, TypeError),
+        ({"default_storage_marker": 1}, TypeError),
+        ({"verbosity_bypass_markers": "IMPORTANT"}, TypeError),
+        ({"debug_markers": {"sync": "300"}}, TypeError),
+        ({"handler_levels": ["INFO"]}, TypeError),
+    ],
+)
+def test_reconfigure_rejects_invalid_values(
+    logger: Logging, settings: dict[str, Any], error: type[Exception]
+) -> None:
+    """Test that bad values raise and leave the current settings in place."""
+    before = logger.config
+    with pytest.raises(error):
+        logger.reconfigure(**settings)
+    assert logger.config is before
+    assert logger.verbosity_bypass_markers == []
+    # Statements keep working with the settings already in effect
+    logger.logged_statement("detail", verbose=True, verbosity=2)
+
+
+def test_reconfigure_logger_and_handler_levels(
+    logger: Logging, handler: ListHandler
+) -> None:
+    """Test that logger and handler levels change in place."""
+    handler.set_name("collector")
+    logger.reconfigure(log_level="DEBUG", handler_levels={"collector": "WARNING"})
+    assert logger.logger.level == logging.DEBUG
+    assert handler.level == logging.WARNING
+    assert handler in logger.logger.handlers
+
+
+def test_debug_marker_emits_below_logger_level(
+    logger: Logging, handler: ListHandler
+) -> None:
+    """Test that a debug marker bypasses verbosity and the logger's level."""
+    logger.reconfigure(debug_markers={"sync": 300})
+
+    assert logger.logged_statement("traced", context_marker="sync", verbosity=4) == (
+        "[sync] traced"
+    )
+    logger.logged_statement("quiet", context_marker="other")
+    logger.logged_statements(
+        [{"msg": "bulk", "context_marker": "sync"}, {"msg": "dropped"}]
+    )
+
+    assert handler.messages == ["[sync] traced", "[sync] bulk"]
+
+
+def test_debug_marker_expires(logger: Logging, handler: ListHandler) -> None:
+    """Test that an expired override no longer applies."""
+    logger.reconfigure(debug_markers={"sync": 0})
+    logger.logged_statement("traced", context_marker="sync")
+    assert handler.messages == []
+    assert logger.reconfigure().marker_overrides == {}
+
+
+def test_no_records_dropped_during_swaps(logger: Logging, handler: ListHandler) -> None:
+    """Test that statements logged while settings change all arrive."""
+    per_thread = 500
+    stop = threading.Event()
+
+    def toggle() -> None:
+        threshold = 1
+        while not stop.is_set():
+            threshold = 3 - threshold
+            logger.reconfigure(verbosity_threshold=threshold)
+
+    def produce() -> None:
+        for index in range(per_thread):
+            logger.logged_statement(f"line {index}", log_level="info")
+
+    toggler = threading.Thread(target=toggle)
+    toggler.start()
+    producers = [threading.Thread(target=produce) for _ in range(4)]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    stop.set()
+    toggler.join()
+
+    assert len(handler.messages) == per_thread * len(producers)
+
+
+def write_control_file(path: Path, settings: dict[str, object], mtime: int) -> None:
+    """Write a control file with a distinct modification time."""
+    path.write_bytes(orjson.dumps(settings))
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_watcher_applies_changed_file(logger: Logging, tmp_path: Path) -> None:
+    """Test that the watcher applies the file once per change."""
+    control = tmp_path / "logging.json"
+    write_control_file(control, {"verbosity_threshold": 2}, 1_000_000_000)
+    watcher = logger.watch_config(control, interval=None)
+    try:
+        assert logger.verbosity_threshold == 2  # noqa: PLR2004
+        assert not watcher.reload()
+
+        write_control_file(
+            control,
+            {"verbosity_threshold": 5, "log_level": "DEBUG"},
+            2_000_000_000,
+        )
+        assert watcher.reload()
+        assert logger.verbosity_threshold == 5  # noqa: PLR2004
+        assert logger.logger.level == logging.DEBUG
+    finally:
+        watcher.stop()
+
+
+def test_watcher_keeps_settings_on_invalid_file(
+    logger: Logging, handler: ListHandler, tmp_path: Path
+) -> None:
+    """Test that an invalid control file is reported and ignored."""
+    control = tmp_path / "logging.json"
+    write_control_file(control, {"verbosity_threshold": 3}, 1_000_000_000)
+    watcher = logger.watch_config(control, interval=None)
+    try:
+        for mtime_ns, settings in enumerate(
+            [
+                {"verbosity": 9},
+                {"verbosity_threshold": "9"},
+                {"allowed_levels": "info"},
+            ],
+            start=2,
+        ):
+            write_control_file(control, settings, mtime_ns * 1_000_000_000)
+            assert not watcher.reload()
+            assert logger.verbosity_threshold == 3  # noqa: PLR2004
+            assert logger.allowed_levels == ()
+        assert (
+            sum("Invalid logging control file" in m for m in handler.messages) == 3  # noqa: PLR2004
+        )
+    finally:
+        watcher.stop()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires SIGUSR1")
+def test_watcher_reloads_on_signal(logger: Logging, tmp_path: Path) -> None:
+    """Test that the signal forces a reload on the watcher thread."""
+    control = tmp_path / "logging.json"
+    write_control_file(control, {"verbosity_threshold": 2}, 1_000_000_000)
+    watcher = logger.watch_config(control, interval=None, signum=signal.SIGUSR1)
+    try:
+        write_control_file(control, {"verbosity_threshold": 4}, 1_000_000_000)
+        os.kill(os.getpid(), signal.SIGUSR1)
+        deadline = time.monotonic() + 5
+        while watcher.applied < 2 and time.monotonic() < deadline:  # noqa: PLR2004
+            time.sleep(0.01)
+        assert logger.verbosity_threshold == 4  # noqa: PLR2004
+    finally:
+        watcher.stop()
@@ -0,0 +1,69 @@
+"""Tests for the MessagePack and CBOR encoders."""
+
+from __future__ import annotations
+
+import datetime as dt
+import sys
+
+import pytest
+
+from lifecyclelogging.encoders import (
+    decode_binary,
+    encode_binary,
+    format_for_path,
+    require_format,
+)
+
+
+@pytest.mark.parametrize(
+    ("output_format", "package"), [("msgpack", "msgpack"), ("cbor", "cbor2")]
+)
+def test_round_trip(output_format: str, package: str) -> None:
+    """Test that nested results survive an encode and decode."""
+    pytest.importorskip(package)
+    data = {"a": {"list": [1, 2.5, "x", None, True]}, "raw": b"\x00\xff"}
+    assert decode_binary(encode_binary(data, output_format), output_format) == data
+
+
+@pytest.mark.parametrize(
+    ("output_format", "package"), [("msgpack", "msgpack"), ("cbor", "cbor2")]
+)
+def test_extension_types(output_format: str, package: str) -> None:
+    """Test that aware datetimes use the format's native type."""
+    pytest.importorskip(package)
+    moment = dt.datetime(2024, 5, 1, 12, 30, tzinfo=dt.timezone.utc)
+    decoded = decode_binary(
+        encode_binary({"at": moment, "tags": ("a", "b")}, output_format),
+        output_format,
+    )
+    assert decoded["at"] == moment
+    assert list(decoded["tags"]) == ["a", "b"]
+
+
+def test_unsupported_values_use_default() -> None:
+    """Test that values without a native encoding fall back to ``default``."""
+    pytest.importorskip("msgpack")
+    marker = object()
+    decoded = decode_binary(encode_binary({"m": marker}, "msgpack"), "msgpack")
+    assert decoded == {"m": str(marker)}
+
+
+def test_missing_package_raises_import_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a missing optional package names the extra to install."""
+    monkeypatch.setitem(sys.modules, "cbor2", None)
+    with pytest.raises(ImportError, match=r"lifecyclelogging\[cbor\]"):
+        encode_binary({}, "cbor")
+
+
+def test_unknown_format_raises_value_error() -> None:
+    """Test that a non-binary format raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown binary format"):
+        require_format("json")
+
+
+def test_format_for_path() -> None:
+    """Test that file extensions map to binary formats."""
+    assert format_for_path("results.msgpack") == "msgpack"
+    assert format_for_path("results.MPK") == "msgpack"
+    assert format_for_path(".cbor") == "cbor"
+    assert format_for_path("results.json") is None
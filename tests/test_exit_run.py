@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import base64
+import copy
 import json
 import os
+import sys
 
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from lifecyclelogging import ExitRunError, Logging
+from lifecyclelogging.encoders import decode_binary
 
 
 @pytest.fixture
@@ -217,6 +221,24 @@ class TestExitRunNoExit:
         assert "pre_normal_field" in output["item1"]
         assert "excluded_field" in output["item1"]
 
+    def test_exit_run_prefix_patterns(self, logger: Logging, tmp_path: Path) -> None:
+        """Test glob and regex entries in the prefix allow and deny lists."""
+        os.chdir(tmp_path)
+        results = {"item1": {"accountId": 1, "regionId": 2, "name": "n", "tag1": "t"}}
+        output = logger.exit_run(
+            results,
+            prefix="pre",
+            prefix_allowlist=["*_id", "re:tag[0-9]"],
+            prefix_denylist=["region*"],
+            exit_on_completion=False,
+        )
+        assert set(output["item1"]) == {
+            "pre_account_id",
+            "region_id",
+            "name",
+            "pre_tag1",
+        }
+
     def test_exit_run_prefix_with_nested_lists(
         self, logger: Logging, tmp_path: Path
     ) -> None:
@@ -297,6 +319,19 @@ class TestExitRunNoExit:
                 exit_on_completion=False,
             )
 
+    def test_exit_run_formatting_error_omits_results(
+        self, logger: Logging, tmp_path: Path
+    ) -> None:
+        """Test that a formatting error reports its cause without dumping results."""
+        os.chdir(tmp_path)
+        results = {"a": {"otherField": "secret-payload"}}
+        with pytest.raises(RuntimeError) as exc_info:
+            logger.exit_run(
+                results, sort_by_field="missingField", exit_on_completion=False
+            )
+        assert "missingField" in str(exc_info.value)
+        assert "secret-payload" not in str(exc_info.value)
+
     def test_exit_run_with_errors_raises(self, logger: Logging, tmp_path: Path) -> None:
         """Test that exit_run raises when error_list is not empty."""
         os.chdir(tmp_path)
@@ -306,6 +341,41 @@ class TestExitRunNoExit:
         with pytest.raises(RuntimeError, match="Test error 1"):
             logger.exit_run({"key": "value"}, exit_on_completion=False)
 
+    def test_exit_run_prefix_does_not_mutate_input(
+        self, logger: Logging, tmp_path: Path
+    ) -> None:
+        """Test that prefixing leaves the caller's results untouched."""
+        os.chdir(tmp_path)
+        results = {"item1": {"fieldName": {"innerKey": "v"}}, "flag": True}
+        snapshot = copy.deepcopy(results)
+
+        output = logger.exit_run(results, prefix="pre", exit_on_completion=False)
+
+        assert results == snapshot
+        assert output["item1"] == {"pre_field_name": {"inner_key": "v"}}
+
+    def test_exit_run_transform_shares_unchanged_subtrees(
+        self, logger: Logging, tmp_path: Path
+    ) -> None:
+        """Test that only paths where a key changes are copied."""
+        os.chdir(tmp_path)
+        unchanged = {"already_snake": [{"nested_key": 1}], "other": {"x": 2}}
+        results = {"changedKey": {"innerKey": 1}, "stable": unchanged}
+        snapshot = copy.deepcopy(results)
+
+        output = logger.exit_run(results, unhump_results=True, exit_on_completion=False)
+
+        assert results == snapshot
+        assert output is not results
+        assert output["changed_key"] == {"inner_key": 1}
+        assert output["stable"] is unchanged
+
+        untouched = {"all_snake": {"keys_here": [1, 2]}}
+        assert (
+            logger.exit_run(untouched, unhump_results=True, exit_on_completion=False)
+            is untouched
+        )
+
 
 class TestExitRunWithExit:
     """Tests for exit_run with exit_on_completion=True."""
@@ -371,6 +441,138 @@ class TestExitRunWithExit:
                 assert "data" in decoded
 
 
+class TestExitRunNdjson:
+    """Tests for exit_run with output_format="ndjson"."""
+
+    def test_ndjson_streams_one_line_per_result(
+        self,
+        logger: Logging,
+        tmp_path: Path,
+        capsysbinary: pytest.CaptureFixture[bytes],
+    ) -> None:
+        """Test that each transformed result is written as its own line."""
+        os.chdir(tmp_path)
+        results = {"a": {"fieldName": 1}, "b": {"fieldName": 2}}
+
+        with pytest.raises(SystemExit) as exc_info:
+            logger.exit_run(results, unhump_results=True, output_format="ndjson")
+
+        assert exc_info.value.code == 0
+        lines = capsysbinary.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"a": {"field_name": 1}},
+            {"b": {"field_name": 2}},
+        ]
+        assert (tmp_path / "results.ndjson").read_bytes().splitlines() == lines
+
+    def test_ndjson_consumes_generators_lazily(
+        self, logger: Logging, tmp_path: Path
+    ) -> None:
+        """Test that generator input is processed one result at a time."""
+        os.chdir(tmp_path)
+        produced: list[int] = []
+
+        def generate() -> Iterator[tuple[str, dict[str, int]]]:
+            for index in range(3):
+                produced.append(index)
+                yield f"r{index}", {"sortKey": index}
+
+        lines = logger.exit_run(
+            generate(),
+            sort_by_field="sortKey",
+            output_format="ndjson",
+            exit_on_completion=False,
+        )
+        assert produced == []
+        assert json.loads(next(lines)) == {"0": {"sortKey": 0}}
+        assert produced == [0]
+        assert [json.loads(line) for line in lines] == [
+            {"1": {"sortKey": 1}},
+            {"2": {"sortKey": 2}},
+        ]
+
+    def test_ndjson_interrupted_run_keeps_previous_results(
+        self, logger: Logging, tmp_path: Path
+    ) -> None:
+        """Test that a failed run leaves the previous results log intact."""
+        os.chdir(tmp_path)
+        (tmp_path / "results.ndjson").write_bytes(b'{"old":1}\n')
+
+        def generate() -> Iterator[tuple[str, int]]:
+            yield "a", 1
+            error_message = "source failed"
+            raise OSError(error_message)
+
+        with pytest.raises(OSError, match="source failed"):
+            logger.exit_run(generate(), output_format="ndjson")
+
+        assert (tmp_path / "results.ndjson").read_bytes() == b'{"old":1}\n'
+        assert [path.name for path in tmp_path.iterdir()] == ["results.ndjson"]
+
+    def test_ndjson_iterator_finalizes_the_run_when_done(
+        self, logger: Logging, tmp_path: Path
+    ) -> None:
+        """Test that reports and flushing wait until the lines are consumed."""
+        os.chdir(tmp_path)
+        with patch.object(logger, "_finalize_run") as finalize:
+            lines = logger.exit_run(
+                {"a": 1, "b": 2}, output_format="ndjson", exit_on_completion=False
+            )
+            next(lines)
+            finalize.assert_not_called()
+            list(lines)
+            finalize.assert_called_once_with()
+
+    def test_ndjson_iterator_failure_flushes_flight_recorder(
+        self, logger: Logging, tmp_path: Path
+    ) -> None:
+        """Test that a failure while producing lines replays recorded statements."""
+        os.chdir(tmp_path)
+
+        def generate() -> Iterator[tuple[str, int]]:
+            yield "a", 1
+            error_message = "source failed"
+            raise OSError(error_message)
+
+        lines = logger.exit_run(
+            generate(), output_format="ndjson", exit_on_completion=False
+        )
+        with (
+            patch.object(logger, "flush_flight_recorder") as flush,
+            patch.object(logger, "_finalize_run") as finalize,
+        ):
+            assert json.loads(next(lines)) == {"a": 1}
+            with pytest.raises(OSError, match="source failed"):
+                next(lines)
+        flush.assert_called_once_with()
+        finalize.assert_called_once_with()
+
+    def test_ndjson_encodes_values_with_base64(
+        self, logger: Logging, tmp_path: Path
+    ) -> None:
+        """Test that encode_all_values_to_base64 applies per line."""
+        os.chdir(tmp_path)
+        lines = logger.exit_run(
+            {"a": {"key": "value"}},
+            encode_all_values_to_base64=True,
+            format_results=False,
+            output_format="ndjson",
+            exit_on_completion=False,
+        )
+        (line,) = list(lines)
+        assert base64.b64decode(json.loads(line)["a"]) == b"{'key': 'value'}"
+
+    def test_ndjson_rejects_whole_document_options(
+        self, logger: Logging, tmp_path: Path
+    ) -> None:
+        """Test that options needing the whole document raise ValueError."""
+        os.chdir(tmp_path)
+        with pytest.raises(ValueError, match="cannot be combined"):
+            logger.exit_run({}, key="wrap", output_format="ndjson")
+        with pytest.raises(ValueError, match="Unknown output_format"):
+            logger.exit_run({}, output_format="yaml")  # type: ignore[arg-type]
+
+
 class TestExitRunError:
     """Tests for ExitRunError exception."""
 
@@ -384,3 +586,91 @@ class TestExitRunError:
         msg = "test message"
         with pytest.raises(ExitRunError, match=msg):
             raise ExitRunError(msg)
+
+
+class TestExitRunBinary:
+    """Tests for exit_run and log_results with MessagePack and CBOR."""
+
+    @pytest.mark.parametrize(
+        ("output_format", "package"), [("msgpack", "msgpack"), ("cbor", "cbor2")]
+    )
+    def test_binary_output(
+        self,
+        logger: Logging,
+        tmp_path: Path,
+        capsysbinary: pytest.CaptureFixture[bytes],
+        output_format: str,
+        package: str,
+    ) -> None:
+        """Test that the transformed results are written as one binary document."""
+        pytest.importorskip(package)
+        os.chdir(tmp_path)
+
+        with pytest.raises(SystemExit) as exc_info:
+            logger.exit_run(
+                {"a": {"fieldName": 1}},
+                unhump_results=True,
+                key="wrapped",
+                output_format=output_format,  # type: ignore[arg-type]
+            )
+
+        assert exc_info.value.code == 0
+        output = capsysbinary.readouterr().out
+        assert decode_binary(output, output_format) == {
+            "wrapped": {"a": {"field_name": 1}}
+        }
+
+    def test_binary_output_with_base64(
+        self,
+        logger: Logging,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that encode_to_base64 encodes the binary document."""
+        pytest.importorskip("msgpack")
+        os.chdir(tmp_path)
+
+        with pytest.raises(SystemExit):
+            logger.exit_run(
+                {"a": [1, 2]}, encode_to_base64=True, output_format="msgpack"
+            )
+
+        output = capsys.readouterr().out
+        assert decode_binary(base64.b64decode(output), "msgpack") == {"a": [1, 2]}
+
+    def test_missing_package_fails_before_output(
+        self,
+        logger: Logging,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsysbinary: pytest.CaptureFixture[bytes],
+    ) -> None:
+        """Test that a missing optional package raises ImportError up front."""
+        os.chdir(tmp_path)
+        monkeypatch.setitem(sys.modules, "msgpack", None)
+
+        with pytest.raises(ImportError, match=r"lifecyclelogging\[msgpack\]"):
+            logger.exit_run({"a": 1}, output_format="msgpack")
+
+        assert capsysbinary.readouterr().out == b""
+        assert not (tmp_path / "results.json").exists()
+
+    @pytest.mark.parametrize(
+        ("ext", "output_format", "package"),
+        [(".msgpack", "msgpack", "msgpack"), (".cbor", "cbor", "cbor2")],
+    )
+    def test_log_results_binary_extension(
+        self,
+        logger: Logging,
+        tmp_path: Path,
+        ext: str,
+        output_format: str,
+        package: str,
+    ) -> None:
+        """Test that log_results picks the encoder from the extension."""
+        pytest.importorskip(package)
+        os.chdir(tmp_path)
+        logger.log_results({"key": [1, "two"]}, "binary_results", ext=ext)
+
+        data = (tmp_path / f"binary_results{ext}").read_bytes()
+        assert decode_binary(data, output_format) == {"key": [1, "two"]}
@@ -0,0 +1,173 @@
+"""Tests for the flight recorder of suppressed statements."""
+
+from __future__ import annotations
+
+import logging
+
+from pathlib import Path
+
+import pytest
+
+from lifecyclelogging import FlightRecorder, Logging
+from lifecyclelogging.flight import ErrorList
+
+
+class ListHandler(logging.Handler):
+    """Handler collecting the records it receives."""
+
+    def __init__(self) -> None:
+        """Initialize the handler."""
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Collect a record."""
+        self.records.append(record)
+
+
+@pytest.fixture
+def logger() -> Logging:
+    """Create a Logging instance at INFO level with a flight recorder."""
+    instance = Logging(enable_console=False, enable_file=False)
+    instance.logger.setLevel(logging.INFO)
+    instance.enable_flight_recorder(capacity=8)
+    return instance
+
+
+@pytest.fixture
+def handler(logger: Logging) -> ListHandler:
+    """Attach a collecting handler to the logger."""
+    collector = ListHandler()
+    logger.logger.addHandler(collector)
+    return collector
+
+
+def test_error_replays_suppressed_statements_first(
+    logger: Logging, handler: ListHandler
+) -> None:
+    """Test that logging an error flushes the recorder ahead of the error."""
+    assert logger.logged_statement("step 1", json_data={"id": 1}) is None
+    assert logger.logged_statement("step 2", context_marker="sync") is None
+    assert handler.records == []
+
+    logger.logged_statement("boom", log_level="error")
+
+    messages = [record.getMessage() for record in handler.records]
+    assert messages[0].startswith("step 1")
+    assert '"id":1' in messages[0]
+    assert messages[1:] == ["[sync] step 2", "boom"]
+    assert [record.levelno for record in handler.records] == [
+        logging.DEBUG,
+        logging.DEBUG,
+        logging.ERROR,
+    ]
+    assert getattr(handler.records[0], "flight_recorder", False)
+    assert len(logger.flight_recorder or []) == 0
+
+
+def test_direct_logger_error_flushes(logger: Logging, handler: ListHandler) -> None:
+    """Test that errors logged on the underlying logger also flush."""
+    logger.logged_statement("detail")
+    logger.logger.error("failed")
+    assert [record.getMessage() for record in handler.records] == [
+        "detail",
+        "failed",
+    ]
+
+
+def test_verbosity_suppressed_statements_are_recorded(
+    logger: Logging, handler: ListHandler
+) -> None:
+    """Test that statements suppressed by verbosity are recorded too."""
+    assert logger.logged_statement("chatty", verbose=True, log_level="info") is None
+    logger.logged_statements([{"msg": "bulk", "verbosity": 5}])
+    logger.error_list.append("failure")
+
+    assert [record.getMessage() for record in handler.records] == ["chatty", "bulk"]
+
+
+def test_bulk_level_suppressed_statements_are_recorded(
+    logger: Logging, handler: ListHandler
+) -> None:
+    """Test that logged_statements records statements below the logger level."""
+    results = logger.logged_statements(
+        [
+            {"msg": "detail", "json_data": {"id": 1}},
+            {"msg": "progress", "log_level": "info"},
+        ]
+    )
+    assert results == [None, "progress"]
+    assert len(logger.flight_recorder or []) == 1
+
+    logger.error_list.append("failure")
+    messages = [record.getMessage() for record in handler.records]
+    assert messages[0] == "progress"
+    assert messages[1].startswith("detail")
+    assert '"id":1' in messages[1]
+
+
+@pytest.mark.usefixtures("handler")
+def test_stored_statements_are_not_recorded(logger: Logging) -> None:
+    """Test that statements with a storage marker are rendered and stored."""
+    assert logger.logged_statement("kept", storage_marker="EVENTS") == "kept"
+    assert list(logger.stored_messages["EVENTS"]) == ["kept"]
+    assert len(logger.flight_recorder or []) == 0
+
+
+def test_exit_run_failure_flushes(
+    logger: Logging,
+    handler: ListHandler,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a failing exit_run replays the recorded statements."""
+    monkeypatch.chdir(tmp_path)
+    logger.logged_statement("before failure")
+    logger.error_list[:] = ["already failed"]
+    with pytest.raises(RuntimeError, match="already failed"):
+        logger.exit_run({"a": 1}, exit_on_completion=False)
+    assert "before failure" in [record.getMessage() for record in handler.records]
+
+
+def test_ring_evicts_oldest_by_count_and_bytes() -> None:
+    """Test that the ring is bounded by records and by estimated bytes."""
+    recorder = FlightRecorder(capacity=3, max_bytes=None)
+    messages = [f"m{index}" for index in range(5)]
+    for message in messages:
+        recorder.record(logging.DEBUG, message)
+    assert [entry.msg for entry in recorder.drain()] == messages[-3:]
+    assert recorder.evicted == len(messages) - recorder.capacity
+
+    recorder = FlightRecorder(capacity=10, max_bytes=10)
+    recorder.record(logging.DEBUG, "a" * 6)
+    recorder.record(logging.DEBUG, "b" * 6)
+    assert [entry.msg for entry in recorder.drain()] == ["b" * 6]
+
+
+def test_invalid_capacity_rejected() -> None:
+    """Test that non-positive limits raise ValueError."""
+    with pytest.raises(ValueError, match="capacity"):
+        FlightRecorder(capacity=0)
+    with pytest.raises(ValueError, match="max_bytes"):
+        FlightRecorder(max_bytes=0)
+
+
+def test_disable_stops_recording(logger: Logging, handler: ListHandler) -> None:
+    """Test that disabling the recorder restores plain suppression."""
+    logger.disable_flight_recorder()
+    assert logger.logged_statement("plain") == "plain"
+    logger.logger.error("failed")
+    assert [record.getMessage() for record in handler.records] == ["failed"]
+
+
+def test_error_list_reports_growth() -> None:
+    """Test that ErrorList calls its hook when errors are added."""
+    calls: list[int] = []
+    errors = ErrorList(lambda: calls.append(1))
+    errors.append("a")
+    errors.extend(["b", "c"])
+    errors.extend([])
+    errors.insert(0, "z")
+    errors += ["d"]
+    assert errors == ["z", "a", "b", "c", "d"]
+    assert calls == [1, 1, 1, 1]
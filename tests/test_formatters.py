@@ -0,0 +1,134 @@
+"""Tests for the compiled log line formatter."""
+
+from __future__ import annotations
+
+import logging
+import re
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+from lifecyclelogging import Logging
+from lifecyclelogging.formatters import CompiledFormatter
+from lifecyclelogging.handlers import PLAIN_CONSOLE_FORMAT
+
+
+def make_record(
+    msg: str = "hello %s", args: tuple[object, ...] = ("world",)
+) -> logging.LogRecord:
+    """Create a record with a message, location and function."""
+    return logging.LogRecord(
+        "tests.formatters", logging.INFO, "/app/job.py", 42, msg, args, None, "run"
+    )
+
+
+@pytest.mark.parametrize(
+    "fmt",
+    [
+        PLAIN_CONSOLE_FORMAT,
+        "%(asctime)s %(name)s:%(lineno)d %(funcName)s - %(message)s",
+        "%(levelno)03d %(msecs)03d %(relativeCreated).1f %(process)x %(msg)r",
+        '{literal} "quoted" \\ tab\t é 100%% %(message)-12s|',
+        "%(message)s",
+    ],
+)
+def test_matches_logging_formatter(fmt: str) -> None:
+    """Test that lines are identical to logging.Formatter's."""
+    record = make_record()
+    assert CompiledFormatter(fmt).format(record) == logging.Formatter(fmt).format(
+        record
+    )
+
+
+def test_matches_with_datefmt_and_custom_level() -> None:
+    """Test dates with an explicit format and unregistered level names."""
+    record = make_record()
+    record.levelname = "TRACE"
+    fmt = "%(asctime)s [%(levelname)-8s] %(message)s"
+    for formatter, expected in (
+        (CompiledFormatter(fmt, "%H:%M:%S"), logging.Formatter(fmt, "%H:%M:%S")),
+        (CompiledFormatter(fmt), logging.Formatter(fmt)),
+    ):
+        assert formatter.format(record) == expected.format(record)
+    assert record.asctime
+
+
+@given(text=st.text(alphabet=st.characters(blacklist_characters="%")))
+def test_literal_text_round_trips(text: str) -> None:
+    """Test that any literal text around the fields is kept verbatim."""
+    fmt = f"{text}%(message)s{text}"
+    record = make_record()
+    assert CompiledFormatter(fmt).format(record) == logging.Formatter(fmt).format(
+        record
+    )
+
+
+def test_exceptions_and_stacks_are_appended() -> None:
+    """Test that tracebacks and stack info follow the line as usual."""
+    try:
+        error_message = "boom"
+        raise RuntimeError(error_message)
+    except RuntimeError:
+        exc_info = sys.exc_info()
+    record = make_record()
+    record.exc_info = exc_info
+    record.stack_info = "Stack (most recent call last):\n  frame"
+
+    text = CompiledFormatter(PLAIN_CONSOLE_FORMAT).format(record)
+    line, rest = text.split("\n", 1)
+    assert line.endswith("hello world")
+    assert "RuntimeError: boom" in rest
+    assert text.endswith("Stack (most recent call last):\n  frame")
+
+
+def test_timestamp_and_sequence_fields() -> None:
+    """Test the high-resolution timestamp and per-formatter sequence numbers."""
+    record = make_record()
+    record.created = 1_792_400_000.123456
+    record.msecs = 123.0
+    patterns = {
+        "s": r"2026-10-19T\d\d:\d\d:\d\dZ",
+        "ms": r"2026-10-19T\d\d:\d\d:\d\d\.123Z",
+        "us": r"2026-10-19T\d\d:\d\d:\d\d\.12345\dZ",
+    }
+    for precision, pattern in patterns.items():
+        formatter = CompiledFormatter(
+            "%(timestamp)s #%(sequence)d %(message)s",
+            timestamp_precision=precision,  # type: ignore[arg-type]
+        )
+        first = formatter.format(record)
+        second = formatter.format(record)
+        assert re.fullmatch(rf"{pattern} #1 hello world", first)
+        assert second.endswith("#2 hello world")
+
+    with pytest.raises(ValueError, match="precision"):
+        CompiledFormatter(timestamp_precision="ns")  # type: ignore[arg-type]
+
+
+def test_log_file_uses_compiled_format(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that Logging writes its file with the configured layout."""
+    monkeypatch.chdir(tmp_path)
+    logger = Logging(
+        enable_file=True,
+        log_file_name="run.log",
+        logger_name="tests.formatters.file",
+        log_format="%(sequence)d %(levelname)s %(message)s",
+    )
+    try:
+        logger.logged_statement("first", log_level="info")
+        logger.logged_statement("second", log_level="warning")
+    finally:
+        for handler in list(logger.logger.handlers):
+            logger.logger.removeHandler(handler)
+            handler.close()
+
+    assert (tmp_path / "run.log").read_text().splitlines() == [
+        "1 INFO first",
+        "2 WARNING second",
+    ]
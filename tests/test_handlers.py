@@ -2,11 +2,27 @@
 
 from __future__ import annotations
 
+import gzip
+import io
+import json
 import logging
+import sys
+
+from pathlib import Path
 
 import pytest
 
-from lifecyclelogging.handlers import add_console_handler, add_file_handler
+from lifecyclelogging import Logging
+from lifecyclelogging.handlers import (
+    BufferedStreamHandler,
+    CompressedFileHandler,
+    JsonLinesFormatter,
+    add_console_handler,
+    add_file_handler,
+    read_compressed_log,
+    resolve_console_mode,
+)
+from rich.logging import RichHandler
 
 
 def test_add_file_handler() -> None:
@@ -34,3 +50,153 @@ def test_add_console_handler() -> None:
     add_console_handler(logger)
     assert len(logger.handlers) == 1
     assert logger.handlers[0].formatter is not None
+
+
+@pytest.mark.parametrize("mode", ["plain", "jsonl"])
+def test_add_console_handler_buffered_modes(mode: str) -> None:
+    """Test that plain and jsonl modes install a buffered stream handler."""
+    logger = logging.getLogger(f"test_console_{mode}")
+    add_console_handler(logger, mode)  # type: ignore[arg-type]
+
+    handler = logger.handlers[-1]
+    assert isinstance(handler, BufferedStreamHandler)
+    logger.removeHandler(handler)
+
+
+def test_console_mode_auto_uses_plain_without_tty(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that auto mode picks plain output when stdout is not a terminal."""
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    assert resolve_console_mode("auto") == "plain"
+
+
+def test_console_mode_invalid() -> None:
+    """Test that an unknown console mode raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown console mode"):
+        resolve_console_mode("fancy")
+
+
+def test_invalid_console_mode_env_falls_back_to_rich(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that a bad LOG_CONSOLE_MODE warns instead of raising."""
+    monkeypatch.setenv("LOG_CONSOLE_MODE", "fancy")
+    logger = Logging(enable_console=False, enable_file=False)
+    assert logger.console_mode == "rich"
+    assert "Ignoring unknown LOG_CONSOLE_MODE 'fancy'" in capsys.readouterr().err
+
+    with pytest.raises(ValueError, match="Unknown console mode"):
+        Logging(enable_console=True, enable_file=False, console_mode="fancy")  # type: ignore[arg-type]
+
+
+def test_rich_handlers_share_console() -> None:
+    """Test that Rich console handlers reuse one Console instance."""
+    first = logging.getLogger("test_shared_console_1")
+    second = logging.getLogger("test_shared_console_2")
+    add_console_handler(first)
+    add_console_handler(second)
+
+    assert isinstance(first.handlers[-1], RichHandler)
+    assert first.handlers[-1].console is second.handlers[-1].console
+
+
+def test_buffered_stream_handler_batches_flushes() -> None:
+    """Test that records are flushed in batches and on warnings."""
+    stream = io.StringIO()
+    flushes: list[int] = []
+    stream.flush = lambda: flushes.append(1)  # type: ignore[method-assign]
+    handler = BufferedStreamHandler(stream, flush_every=3)
+    logger = logging.getLogger("test_buffered_stream")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+
+    logger.info("one")
+    logger.info("two")
+    assert flushes == []
+    logger.warning("three")
+    assert len(flushes) == 1
+    assert stream.getvalue().splitlines() == ["one", "two", "three"]
+    logger.removeHandler(handler)
+
+
+def test_json_lines_formatter() -> None:
+    """Test that records are rendered as single JSON lines."""
+    record = logging.LogRecord(
+        "name", logging.INFO, __file__, 1, "hello\nworld", (), None
+    )
+    line = JsonLinesFormatter().format(record)
+
+    assert "\n" not in line
+    assert json.loads(line)["message"] == "hello\nworld"
+    assert json.loads(line)["level"] == "INFO"
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, (), None)
+
+
+def test_compressed_file_handler_gzip(tmp_path: Path) -> None:
+    """Test that a closed gzip log is a complete, standard gzip file."""
+    path = tmp_path / "run.log.gz"
+    handler = CompressedFileHandler(path, "gzip")
+    for index in range(100):
+        handler.handle(_record(f"line {index}"))
+    handler.close()
+
+    lines = gzip.decompress(path.read_bytes()).decode().splitlines()
+    assert lines == [f"line {index}" for index in range(100)]
+    assert handler.bytes_out < handler.bytes_in
+
+
+def test_compressed_file_handler_readable_after_flush(tmp_path: Path) -> None:
+    """Test that flushed records can be read before the stream is finished."""
+    path = tmp_path / "crash.log.gz"
+    handler = CompressedFileHandler(path, "gzip", sync_interval=60)
+    handler.handle(_record("before crash"))
+    handler.flush()
+
+    assert read_compressed_log(path) == "before crash\n"
+    handler.close()
+
+
+def test_compressed_file_handler_appends_members(tmp_path: Path) -> None:
+    """Test that reopening a log appends a member readable with the rest."""
+    path = tmp_path / "append.log.gz"
+    for message in ("first", "second"):
+        handler = CompressedFileHandler(path)
+        handler.handle(_record(message))
+        handler.close()
+
+    assert read_compressed_log(path).splitlines() == ["first", "second"]
+
+
+def test_compressed_file_handler_zstd(tmp_path: Path) -> None:
+    """Test zstd compression through the optional zstandard package."""
+    pytest.importorskip("zstandard")
+    path = tmp_path / "run.log.zst"
+    handler = CompressedFileHandler(path, "zstd", sync_interval=60)
+    handler.handle_batch([_record("alpha"), _record("beta")])
+    handler.flush()
+    assert read_compressed_log(path).splitlines() == ["alpha", "beta"]
+    handler.close()
+
+
+def test_compressed_file_handler_invalid_format(tmp_path: Path) -> None:
+    """Test that an unknown compression format raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown log compression"):
+        CompressedFileHandler(tmp_path / "run.log.xz", "xz")  # type: ignore[arg-type]
+
+
+def test_add_file_handler_with_compression(tmp_path: Path) -> None:
+    """Test that add_file_handler adds the format suffix when compressing."""
+    logger = logging.getLogger("test_compressed_file")
+    add_file_handler(logger, str(tmp_path / "compressed.log"), compression="gzip")
+    handler = logger.handlers[-1]
+    try:
+        assert isinstance(handler, CompressedFileHandler)
+        assert handler.baseFilename.endswith("compressed.log.gz")
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
@@ -0,0 +1,90 @@
+"""Unit tests for payload size guards in the lifecyclelogging package."""
+
+from __future__ import annotations
+
+from lifecyclelogging import Logging, PayloadLimits
+from lifecyclelogging.limits import TRUNCATION_KEY, cap_serialized, limit_payload
+from lifecyclelogging.utils import add_json_data
+
+
+def test_limit_payload_without_truncation() -> None:
+    """Test that payloads within the limits are copied unchanged."""
+    data = {"key": ["a", "b"], "nested": {"x": 1}}
+    limited, truncated = limit_payload(data, PayloadLimits(max_items=5))
+
+    assert limited == data
+    assert limited is not data
+    assert truncated is False
+
+
+def test_limit_payload_max_items() -> None:
+    """Test that mappings and lists are cut at max_items with original sizes."""
+    data = {"items": list(range(100)), **{f"k{i}": i for i in range(10)}}
+    limited, truncated = limit_payload(data, PayloadLimits(max_items=3))
+
+    assert truncated is True
+    assert limited["items"][:3] == [0, 1, 2]
+    assert limited["items"][3] == "... 97 more items truncated (100 total)"
+    assert limited[TRUNCATION_KEY] == "8 more items truncated (11 total)"
+
+
+def test_limit_payload_max_depth() -> None:
+    """Test that containers below max_depth are summarized."""
+    data = {"level1": {"level2": {"level3": 1}}, "list": [[1, 2]]}
+    limited, _ = limit_payload(data, PayloadLimits(max_depth=2))
+
+    assert limited["level1"]["level2"] == "<truncated mapping with 1 items>"
+    assert limited["list"][0] == "<truncated list with 2 items>"
+
+
+def test_limit_payload_max_string_length() -> None:
+    """Test that long strings are cut with their original length."""
+    limited, _ = limit_payload({"text": "x" * 50}, PayloadLimits(max_string_length=10))
+
+    assert limited["text"] == "x" * 10 + "...[truncated, 50 chars total]"
+
+
+def test_limit_payload_max_bytes_bounds_work() -> None:
+    """Test that the byte budget stops the walk early on huge inputs."""
+    data = {f"key{i}": "value" * 10 for i in range(100_000)}
+    limited, truncated = limit_payload(data, PayloadLimits(max_bytes=1024))
+
+    assert truncated is True
+    assert len(limited) < len(data) // 100
+    assert "100000 total" in limited[TRUNCATION_KEY]
+
+
+def test_cap_serialized_enforces_byte_limit() -> None:
+    """Test the hard cap on serialized text."""
+    limits = PayloadLimits(max_bytes=16)
+
+    assert cap_serialized("short", limits) == "short"
+    capped = cap_serialized("y" * 100, limits)
+    assert capped.startswith("y" * 16 + "...[truncated at 16 bytes, 100 bytes total]")
+
+
+def test_add_json_data_with_limits_does_not_mutate_input() -> None:
+    """Test that limited rendering leaves caller data untouched."""
+    payload = {"values": list(range(20))}
+    msg = add_json_data("msg", payload, {"label": payload}, PayloadLimits(max_items=2))
+
+    assert "18 more items truncated (20 total)" in msg
+    assert payload == {"values": list(range(20))}
+
+
+def test_logging_applies_payload_limits() -> None:
+    """Test that Logging applies its payload limits to logged statements."""
+    logger = Logging(
+        enable_console=False,
+        enable_file=False,
+        payload_limits=PayloadLimits(max_items=2),
+    )
+    result = logger.logged_statement(
+        "Big list",
+        json_data=[{"a": 1}, {"b": 2}, {"c": 3}],
+        log_level="info",  # type: ignore[arg-type]
+    )
+
+    assert result is not None
+    assert "1 more payloads truncated (3 total)" in result
+    assert '"c"' not in result
@@ -0,0 +1,123 @@
+"""Unit tests for logging metrics in the lifecyclelogging package."""
+
+from __future__ import annotations
+
+import logging
+import os
+
+from pathlib import Path
+
+import pytest
+
+from lifecyclelogging import Logging
+from lifecyclelogging.metrics import Histogram, LoggingMetrics
+
+
+def test_metrics_disabled_by_default(logger: Logging) -> None:
+    """Test that metrics are opt-in."""
+    assert logger.metrics is None
+
+
+def test_metrics_count_calls(logger: Logging) -> None:
+    """Test that emitted, suppressed and stored calls are counted."""
+    metrics = logger.enable_metrics()
+
+    logger.logged_statement("Shown", context_marker="ctx", log_level="info")  # type: ignore[arg-type]
+    logger.logged_statement("Hidden", verbose=True, log_level="debug")  # type: ignore[arg-type]
+    logger.logged_statement("Kept", storage_marker="events", log_level="warning")  # type: ignore[arg-type]
+
+    counters = metrics.snapshot()["counters"]
+    assert counters["emitted"]["info"]["ctx"] == 1
+    assert counters["suppressed_verbosity"]["debug"][""] == 1
+    assert counters["stored"]["warning"]["events"] == 1
+
+
+def test_metrics_count_level_suppression(logger: Logging) -> None:
+    """Test that calls below the logger level are counted as suppressed."""
+    metrics = logger.enable_metrics()
+    logger.logger.setLevel(logging.WARNING)
+
+    logger.logged_statement("Too quiet", log_level="debug")  # type: ignore[arg-type]
+
+    counters = metrics.snapshot()["counters"]
+    assert counters["suppressed_level"]["debug"][""] == 1
+    assert "emitted" not in counters
+
+
+def test_metrics_time_stages_and_payloads(logger: Logging) -> None:
+    """Test that stage timings and payload sizes are recorded."""
+    metrics = logger.enable_metrics()
+
+    logger.logged_statement("Data", json_data={"key": "value"}, log_level="info")  # type: ignore[arg-type]
+
+    snapshot = metrics.snapshot()
+    assert set(snapshot["timings"]) == {
+        "prepare_message",
+        "add_json_data",
+        "handler_emit",
+    }
+    assert snapshot["payload_bytes"]["count"] == 1
+    assert snapshot["payload_bytes"]["sum"] > 0
+
+
+def test_metrics_sample_handler_queue_depth(logger: Logging) -> None:
+    """Test that handlers exposing queue_depth are reported as gauges."""
+
+    class QueueingHandler(logging.Handler):
+        queue_depth = 7
+
+        def emit(self, record: logging.LogRecord) -> None:
+            pass
+
+    handler = QueueingHandler()
+    handler.set_name("queued")
+    logger.logger.addHandler(handler)
+    metrics = logger.enable_metrics()
+
+    assert metrics.snapshot()["gauges"]["handler_queue_depth"] == {"queued": 7.0}
+    logger.logger.removeHandler(handler)
+
+
+def test_histogram_cumulative_buckets() -> None:
+    """Test that histogram buckets are cumulative and end with +Inf."""
+    histogram = Histogram([1.0, 10.0])
+    for value in (0.5, 5.0, 50.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [("1.0", 1), ("10.0", 2), ("+Inf", 3)]
+
+
+def test_prometheus_output(tmp_path: Path) -> None:
+    """Test rendering and writing the Prometheus text format."""
+    metrics = LoggingMetrics(prometheus_file=tmp_path / "metrics.prom")
+    metrics.increment("emitted", "info", 'quote"marker')
+    metrics.observe_time("handler_emit", 2_000)
+
+    text = metrics.to_prometheus()
+    assert (
+        'lifecyclelogging_calls_total{event="emitted",level="info",'
+        'marker="quote\\"marker"} 1'
+    ) in text
+    assert (
+        'lifecyclelogging_stage_seconds_bucket{stage="handler_emit",le="+Inf"} 1'
+        in text
+    )
+
+    written = metrics.write_prometheus()
+    assert written.read_text() == text
+
+
+def test_write_prometheus_requires_path() -> None:
+    """Test that writing without a configured file raises ValueError."""
+    with pytest.raises(ValueError, match="No Prometheus output file"):
+        LoggingMetrics().write_prometheus()
+
+
+def test_exit_run_writes_prometheus_file(logger: Logging, tmp_path: Path) -> None:
+    """Test that exit_run writes the configured Prometheus file."""
+    os.chdir(tmp_path)
+    logger.enable_metrics(prometheus_file=tmp_path / "metrics.prom")
+
+    logger.exit_run({"key": "value"}, exit_on_completion=False)
+
+    assert "lifecyclelogging_calls_total" in (tmp_path / "metrics.prom").read_text()
@@ -0,0 +1,307 @@
+"""Tests for the batched OTLP/HTTP exporter."""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import sys
+import threading
+
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import orjson
+import pytest
+
+from lifecyclelogging import Logging, OTLPLogHandler
+from lifecyclelogging.network import BackgroundBatchHandler, DeliveryError
+from lifecyclelogging.otlp import record_to_otlp, to_any_value
+
+
+class StandInCollector(ThreadingHTTPServer):
+    """Local collector recording the export requests it receives."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        """Start listening on a free local port."""
+        super().__init__(("127.0.0.1", 0), CollectorRequestHandler)
+        self.requests: list[dict[str, Any]] = []
+        self.client_ports: set[int] = set()
+        self.statuses: list[int] = []
+        self.lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        """str: The collector's logs URL."""
+        return f"http://127.0.0.1:{self.server_address[1]}/v1/logs"
+
+    def log_records(self) -> list[dict[str, Any]]:
+        """Return every received log record, in order of arrival."""
+        with self.lock:
+            return [
+                log_record
+                for request in self.requests
+                for resource_logs in request["resourceLogs"]
+                for scope_logs in resource_logs["scopeLogs"]
+                for log_record in scope_logs["logRecords"]
+            ]
+
+
+class CollectorRequestHandler(BaseHTTPRequestHandler):
+    """Accepts OTLP/JSON exports, answering with queued statuses first."""
+
+    protocol_version = "HTTP/1.1"
+    server: StandInCollector
+
+    def do_POST(self) -> None:
+        """Record an export request."""
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        with self.server.lock:
+            self.server.client_ports.add(self.client_address[1])
+            status = self.server.statuses.pop(0) if self.server.statuses else 200
+            if status == 200:  # noqa: PLR2004
+                self.server.requests.append(orjson.loads(body))
+        self.send_response(status)
+        if status == 503:  # noqa: PLR2004
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def collector() -> Iterator[StandInCollector]:
+    """Run a stand-in collector on a background thread."""
+    server = StandInCollector()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def logger() -> Iterator[Logging]:
+    """Create a Logging instance without console or file output."""
+    instance = Logging(enable_console=False, enable_file=False)
+    instance.logger.setLevel(logging.DEBUG)
+    yield instance
+    for handler in list(instance.logger.handlers):
+        instance.logger.removeHandler(handler)
+        handler.close()
+
+
+def attributes(log_record: dict[str, Any]) -> dict[str, Any]:
+    """Index a log record's attributes by key."""
+    return {item["key"]: item["value"] for item in log_record["attributes"]}
+
+
+def test_statements_export_as_structured_records(
+    logger: Logging, collector: StandInCollector
+) -> None:
+    """Test that a statement's parts become the body and attributes."""
+    handler = logger.add_otlp_exporter(collector.endpoint, service_name="sync-job")
+    logger.logged_statement(
+        "Synced",
+        json_data={"count": 3},
+        labeled_json_data={"account": {"id": "a-1"}},
+        identifiers=["a-1"],
+        context_marker="sync",
+        storage_marker="results",
+        log_level="warning",
+    )
+    assert handler.flush(5)
+
+    (log_record,) = collector.log_records()
+    assert log_record["body"] == {"stringValue": "Synced"}
+    assert log_record["severityNumber"] == 13  # noqa: PLR2004
+    assert log_record["severityText"] == "WARNING"
+    values = attributes(log_record)
+    assert values["lifecyclelogging.context_marker"] == {"stringValue": "sync"}
+    assert values["lifecyclelogging.storage_marker"] == {"stringValue": "results"}
+    assert values["lifecyclelogging.identifiers"] == {
+        "arrayValue": {"values": [{"stringValue": "a-1"}]}
+    }
+    assert values["lifecyclelogging.json_data"] == {
+        "kvlistValue": {"values": [{"key": "count", "value": {"intValue": "3"}}]}
+    }
+    assert "lifecyclelogging.labeled.account" in values
+    assert values["code.function"] == {
+        "stringValue": "test_statements_export_as_structured_records"
+    }
+    resource = collector.requests[0]["resourceLogs"][0]["resource"]
+    assert resource["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "sync-job"}}
+    ]
+
+
+def test_batches_share_one_keep_alive_connection(
+    logger: Logging, collector: StandInCollector
+) -> None:
+    """Test that records are batched and sent over a reused connection."""
+    handler = logger.add_otlp_exporter(
+        collector.endpoint, max_batch=10, linger=0.01, compression="gzip"
+    )
+    logger.logged_statements([{"msg": f"line {index}"} for index in range(35)])
+    for index in range(15):
+        logger.logged_statement(f"single {index}")
+    assert handler.flush(5)
+
+    bodies = [record["body"]["stringValue"] for record in collector.log_records()]
+    assert bodies == [f"line {index}" for index in range(35)] + [
+        f"single {index}" for index in range(15)
+    ]
+    assert all(
+        len(request["resourceLogs"][0]["scopeLogs"][0]["logRecords"]) <= 10  # noqa: PLR2004
+        for request in collector.requests
+    )
+    assert handler.sent == 50  # noqa: PLR2004
+    assert handler.connections_opened == 1
+    assert len(collector.client_ports) == 1
+
+
+def test_retryable_status_is_retried(
+    logger: Logging, collector: StandInCollector
+) -> None:
+    """Test that a 503 is retried and the batch then delivered."""
+    collector.statuses.extend([503, 429])
+    handler = logger.add_otlp_exporter(collector.endpoint, backoff=0.001)
+    logger.logged_statement("eventually")
+    assert handler.flush(5)
+
+    assert [r["body"]["stringValue"] for r in collector.log_records()] == ["eventually"]
+    assert handler.retries == 2  # noqa: PLR2004
+    assert handler.failed == 0
+
+
+def test_rejected_batch_is_not_retried(
+    logger: Logging, collector: StandInCollector
+) -> None:
+    """Test that a 400 drops the batch without retrying."""
+    collector.statuses.append(400)
+    handler = logger.add_otlp_exporter(collector.endpoint, backoff=0.001)
+    logger.logged_statement("malformed")
+    assert handler.flush(5)
+
+    assert collector.log_records() == []
+    assert handler.retries == 0
+    assert handler.failed == 1
+    assert isinstance(handler.last_error, DeliveryError)
+    assert not handler.last_error.retryable
+
+
+def test_unreachable_collector_gives_up(logger: Logging) -> None:
+    """Test that connection failures are retried, then counted as failed."""
+    handler = logger.add_otlp_exporter(
+        "http://127.0.0.1:9/v1/logs", max_retries=2, backoff=0.001, timeout=1
+    )
+    logger.logged_statement("lost")
+    assert handler.flush(5)
+    assert handler.retries == 2  # noqa: PLR2004
+    assert handler.failed == 1
+    assert isinstance(handler.last_error, OSError)
+
+
+class BlockedHandler(BackgroundBatchHandler):
+    """Handler whose sends wait until released."""
+
+    def __init__(self, **options: Any) -> None:
+        """Initialize the handler closed off."""
+        self.unblock = threading.Event()
+        self.delivered: list[str] = []
+        super().__init__(**options)
+
+    def prepare(self, record: logging.LogRecord) -> str:
+        """Keep the message."""
+        return record.getMessage()
+
+    def send(self, items: Any) -> None:
+        """Wait for the release, then keep the items."""
+        self.unblock.wait(5)
+        self.delivered.extend(items)
+
+
+def test_incomplete_subclass_fails_on_creation() -> None:
+    """Test that a handler missing send cannot be created."""
+
+    class PrepareOnly(BackgroundBatchHandler):
+        def prepare(self, record: logging.LogRecord) -> str:
+            return record.getMessage()
+
+    with pytest.raises(TypeError, match="abstract"):
+        PrepareOnly()  # type: ignore[abstract]
+
+
+def test_full_queue_drops_new_records() -> None:
+    """Test that the drop policy discards records the queue cannot hold."""
+    handler = BlockedHandler(max_queue=4, max_batch=1, linger=0)
+    logger = logging.getLogger("tests.otlp.drop")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for index in range(20):
+            logger.warning("record %d", index)
+        assert handler.dropped >= 20 - 4 - 1
+        handler.unblock.set()
+        assert handler.flush(5)
+        assert handler.sent + handler.dropped == 20  # noqa: PLR2004
+        assert handler.delivered[0] == "record 0"
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_close_sends_queued_records(collector: StandInCollector) -> None:
+    """Test that closing the handler delivers what is still queued."""
+    handler = OTLPLogHandler(collector.endpoint, linger=1.0)
+    logger = logging.getLogger("tests.otlp.close")
+    logger.propagate = False
+    logger.addHandler(handler)
+    logger.warning("plain %s", "record")
+    logger.removeHandler(handler)
+    handler.close()
+
+    (log_record,) = collector.log_records()
+    assert log_record["body"] == {"stringValue": "plain record"}
+    assert "lifecyclelogging.context_marker" not in attributes(log_record)
+
+
+def test_exception_and_value_mapping() -> None:
+    """Test the exception attributes and AnyValue conversion."""
+    try:
+        error_message = "boom"
+        raise RuntimeError(error_message)
+    except RuntimeError:
+        record = logging.getLogger("tests.otlp").makeRecord(
+            "tests.otlp", logging.CRITICAL, __file__, 1, "failed", (), sys.exc_info()
+        )
+    log_record = record_to_otlp(record)
+    values = attributes(log_record)
+    assert log_record["severityNumber"] == 21  # noqa: PLR2004
+    assert values["exception.type"] == {"stringValue": "RuntimeError"}
+    assert values["exception.message"] == {"stringValue": "boom"}
+    assert "RuntimeError: boom" in values["exception.stacktrace"]["stringValue"]
+
+    assert to_any_value(None) == {}
+    assert to_any_value(True) == {"boolValue": True}
+    assert to_any_value(1.5) == {"doubleValue": 1.5}
+    assert to_any_value(b"\x00") == {"bytesValue": "AA=="}
+    assert to_any_value(object)["stringValue"] == "<class 'object'>"
+
+
+def test_invalid_options_raise() -> None:
+    """Test that unsupported settings are rejected up front."""
+    with pytest.raises(ValueError, match="http"):
+        OTLPLogHandler("collector:4318")
+    with pytest.raises(ValueError, match="compression"):
+        OTLPLogHandler(compression="zstd")
+    with pytest.raises(ValueError, match="overflow"):
+        OTLPLogHandler(overflow="spill")  # type: ignore[arg-type]
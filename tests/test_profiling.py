@@ -0,0 +1,87 @@
+"""Unit tests for call-site profiling in the lifecyclelogging package."""
+
+from __future__ import annotations
+
+import json
+import os
+import pstats
+
+from pathlib import Path
+
+import pytest
+
+from lifecyclelogging import Logging
+from lifecyclelogging.profiling import CallSiteProfiler
+
+
+def _log_small(logger: Logging) -> None:
+    logger.logged_statement("Small", json_data={"key": "value"}, log_level="info")  # type: ignore[arg-type]
+
+
+def _log_large(logger: Logging) -> None:
+    logger.logged_statement(
+        "Large",
+        json_data={f"key{i}": "value" * 20 for i in range(200)},
+        log_level="info",  # type: ignore[arg-type]
+    )
+
+
+def test_profiling_disabled_by_default(logger: Logging) -> None:
+    """Test that profiling is opt-in."""
+    assert logger.profiler is None
+
+
+def test_profiling_records_call_sites(logger: Logging) -> None:
+    """Test that each call site is recorded with its caller location."""
+    profiler = logger.enable_profiling()
+    small_calls = 3
+    for _ in range(small_calls):
+        _log_small(logger)
+    _log_large(logger)
+
+    by_function = {row["function"]: row for row in profiler.top()}
+    assert by_function["_log_small"]["calls"] == small_calls
+    assert by_function["_log_small"]["site"].startswith(__file__)
+    assert profiler.top(sort_by="payload_bytes")[0]["function"] == "_log_large"
+
+
+def test_profiling_skips_suppressed_calls(logger: Logging) -> None:
+    """Test that calls suppressed by verbosity are not attributed."""
+    profiler = logger.enable_profiling()
+    logger.logged_statement("Hidden", verbose=True)
+
+    assert profiler.top() == []
+
+
+def test_profiling_rejects_unknown_sort(logger: Logging) -> None:
+    """Test that ranking by an unknown statistic raises ValueError."""
+    profiler = logger.enable_profiling()
+    with pytest.raises(ValueError, match="Unknown sort_by"):
+        profiler.top(sort_by="bogus")
+
+
+def test_profiling_outputs(logger: Logging, tmp_path: Path) -> None:
+    """Test the text, JSON and pstats outputs."""
+    profiler = logger.enable_profiling()
+    _log_small(logger)
+
+    assert "_log_small" in profiler.report()
+    assert json.loads(profiler.to_json())[0]["function"] == "_log_small"
+
+    stats_path = profiler.dump_stats(tmp_path / "logging.prof")
+    stats = pstats.Stats(str(stats_path))
+    assert any(func == "_log_small" for _, _, func in stats.stats)  # type: ignore[attr-defined]
+
+
+def test_profiling_report_at_exit_run(logger: Logging, tmp_path: Path) -> None:
+    """Test that exit_run writes the configured profiling report."""
+    os.chdir(tmp_path)
+    profiler = CallSiteProfiler()
+    logger.profiler = profiler
+    profiler.report_path = tmp_path / "profile.json"
+    _log_small(logger)
+
+    logger.exit_run({"key": "value"}, exit_on_completion=False)
+
+    report = json.loads((tmp_path / "profile.json").read_text())
+    assert any(row["function"] == "_log_small" for row in report)
@@ -0,0 +1,153 @@
+"""Unit tests for lifecycle timing spans in the lifecyclelogging package."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from lifecyclelogging import Logging
+from lifecyclelogging.spans import SpanRecord, SpanRecorder
+
+
+def _span_records(logger: Logging, marker: str) -> list[dict[str, object]]:
+    return [
+        json.loads(message.split("span:\n", 1)[1])
+        for message in logger.stored_messages[marker]
+    ]
+
+
+def test_span_context_manager_records_duration(logger: Logging) -> None:
+    """Test that a span logs a structured record with its duration."""
+    with logger.span("load", context_marker="setup", storage_marker="spans"):
+        pass
+
+    (record,) = _span_records(logger, "spans")
+    assert record["name"] == "load"
+    assert record["context_marker"] == "setup"
+    assert record["parent_id"] is None
+    assert record["duration_ns"] >= 0
+    assert record["end_ns"] >= record["start_ns"]
+    assert logger.span_summary()["load"]["count"] == 1
+
+
+def test_spans_nest(logger: Logging) -> None:
+    """Test that an inner span records the outer span as its parent."""
+    outer_span = logger.span("outer", storage_marker="spans")
+    inner_span = logger.span("inner", storage_marker="spans")
+    with outer_span as outer, inner_span as inner:
+        assert inner.parent_id == outer.span_id
+        assert inner.depth == 1
+
+    by_name = {record["name"]: record for record in _span_records(logger, "spans")}
+    assert by_name["inner"]["parent_id"] == by_name["outer"]["span_id"]
+    assert by_name["outer"]["duration_ns"] >= by_name["inner"]["duration_ns"]
+
+
+def test_span_decorator_sync_and_async(logger: Logging) -> None:
+    """Test that decorated functions and coroutines are timed on every call."""
+
+    @logger.span("work")
+    def work(value: int) -> int:
+        return value * 2
+
+    @logger.span("async_work")
+    async def async_work(value: int) -> int:
+        await asyncio.sleep(0)
+        return value + 1
+
+    calls = 3
+    assert [work(index) for index in range(calls)] == [0, 2, 4]
+    assert asyncio.run(async_work(1)) == 2  # noqa: PLR2004
+
+    summary = logger.span_summary()
+    assert summary["work"]["count"] == calls
+    assert summary["async_work"]["count"] == 1
+
+
+def test_async_spans_nest_per_task(logger: Logging) -> None:
+    """Test that concurrent tasks each see their own parent span."""
+
+    async def child(name: str) -> int | None:
+        async with logger.span(name) as span:
+            await asyncio.sleep(0)
+            return span.parent_id
+
+    async def main() -> tuple[int | None, list[int | None]]:
+        async with logger.span("parent") as parent:
+            parents = await asyncio.gather(child("a"), child("b"))
+            return parent.span_id, list(parents)
+
+    parent_id, parents = asyncio.run(main())
+    assert parents == [parent_id, parent_id]
+
+
+def test_span_records_errors(logger: Logging) -> None:
+    """Test that exceptions are recorded on the span and propagated."""
+    error_message = "boom"
+    span = logger.span("failing", storage_marker="spans")
+    with pytest.raises(ValueError, match=error_message), span:
+        raise ValueError(error_message)
+
+    (record,) = _span_records(logger, "spans")
+    assert record["error"] == "ValueError"
+
+
+def test_span_cannot_run_twice_at_once(logger: Logging) -> None:
+    """Test that a single span instance cannot be entered while running."""
+    span = logger.span("busy")
+    with span, pytest.raises(RuntimeError, match="already running"):
+        span.start()
+
+
+def test_span_summary_percentiles() -> None:
+    """Test the count, total and nearest-rank percentile aggregates."""
+    recorder = SpanRecorder()
+    for duration in range(1, 101):
+        recorder.record(SpanRecord("phase", duration, None, 0, 0, duration, duration))
+
+    stats = recorder.summary()["phase"]
+    assert stats == {
+        "count": 100,
+        "total_ns": 5050,
+        "min_ns": 1,
+        "p50_ns": 50,
+        "p95_ns": 95,
+        "max_ns": 100,
+    }
+    assert "phase" in recorder.report()
+
+
+def test_span_aggregates_stay_bounded() -> None:
+    """Test that long runs keep exact totals in a fixed-size sample."""
+    recorder = SpanRecorder(sample_size=100)
+    for duration in range(1, 10_001):
+        recorder.record(SpanRecord("phase", duration, None, 0, 0, duration, duration))
+
+    assert [len(stats.samples) for stats in recorder._stats.values()] == [100]  # noqa: SLF001
+    stats = recorder.summary()["phase"]
+    assert stats.pop("p50_ns") in range(2_000, 8_000)
+    assert stats.pop("p95_ns") in range(8_000, 10_001)
+    assert stats == {
+        "count": 10_000,
+        "total_ns": 50_005_000,
+        "min_ns": 1,
+        "max_ns": 10_000,
+    }
+    with pytest.raises(ValueError, match="sample_size"):
+        SpanRecorder(sample_size=0)
+
+
+def test_span_summary_at_exit_run(
+    logger: Logging, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that exit_run logs the span summary when asked to."""
+    logger.spans.summary_on_exit = True
+    with logger.span("phase"):
+        pass
+
+    with caplog.at_level("INFO", logger=logger.logger.name):
+        logger.exit_run({"key": "value"}, exit_on_completion=False)
+
+    assert any("Lifecycle spans" in message for message in caplog.messages)
@@ -0,0 +1,90 @@
+"""Unit tests for stored message backends in the lifecyclelogging package."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+from lifecyclelogging import Logging, MemoryStorageBackend, SQLiteStorageBackend
+
+
+def test_memory_backend_is_default(logger: Logging) -> None:
+    """Test that Logging keeps the in-memory defaultdict backend by default."""
+    assert isinstance(logger.stored_messages, MemoryStorageBackend)
+    assert isinstance(logger.stored_messages, defaultdict)
+
+    logger.logged_statement("Stored", storage_marker="default", log_level="info")  # type: ignore[arg-type]
+    assert logger.stored_messages["default"] == {"Stored"}
+
+
+def test_memory_backend_add_many() -> None:
+    """Test bulk insertion keeps set semantics in the memory backend."""
+    backend = MemoryStorageBackend()
+    backend.add_many("bulk", ["a", "b", "a"])
+    backend.add("bulk", "b")
+
+    assert backend["bulk"] == {"a", "b"}
+    assert "bulk" in backend
+    assert "missing" not in backend
+
+
+def test_sqlite_backend_spills_and_deduplicates(tmp_path: Path) -> None:
+    """Test that the SQLite backend spills past its threshold without duplicates."""
+    backend = SQLiteStorageBackend(tmp_path / "store.sqlite3", memory_threshold=3)
+    expected = [f"message {i}" for i in range(10)]
+    for msg in expected + expected:
+        backend.add("marker", msg)
+
+    assert len(backend["marker"]) == len(expected)
+    assert sorted(backend["marker"]) == sorted(expected)
+    assert "message 4" in backend["marker"]
+    assert "message 42" not in backend["marker"]
+    backend.close()
+
+
+def test_sqlite_backend_markers(tmp_path: Path) -> None:
+    """Test marker membership and iteration across buffer and database."""
+    backend = SQLiteStorageBackend(tmp_path / "store.sqlite3", memory_threshold=100)
+    backend.add("pending", "only buffered")
+
+    assert "pending" in backend
+    assert "absent" not in backend
+    assert list(backend) == ["pending"]
+    assert list(backend["absent"]) == []
+    backend.close()
+
+
+def test_sqlite_backend_streams_large_markers() -> None:
+    """Test that reads stream back every message past the fetch size."""
+    backend = SQLiteStorageBackend(memory_threshold=500)
+    expected = {f"line {i}" for i in range(2500)}
+    backend.add_many("bulk", expected)
+
+    assert set(backend["bulk"]) == expected
+    backend.close()
+
+
+def test_sqlite_backend_rejects_invalid_threshold() -> None:
+    """Test that a non-positive memory threshold is rejected."""
+    with pytest.raises(ValueError, match="memory_threshold"):
+        SQLiteStorageBackend(memory_threshold=0)
+
+
+def test_logging_with_sqlite_backend(tmp_path: Path) -> None:
+    """Test that logged statements land in a configured SQLite backend."""
+    backend = SQLiteStorageBackend(tmp_path / "store.sqlite3", memory_threshold=2)
+    logger = Logging(
+        enable_console=False,
+        enable_file=False,
+        storage_backend=backend,
+    )
+
+    logger.logged_statement("Info", storage_marker="events", log_level="info")  # type: ignore[arg-type]
+    logger.logged_statement("Oops", storage_marker="events", log_level="error")  # type: ignore[arg-type]
+    logger.logged_statement("Info", storage_marker="events", log_level="info")  # type: ignore[arg-type]
+
+    assert "events" in logger.stored_messages
+    assert set(logger.stored_messages["events"]) == {"Info", ":warning: Oops"}
+    backend.close()
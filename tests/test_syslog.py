@@ -0,0 +1,250 @@
+"""Tests for the network syslog sink."""
+
+from __future__ import annotations
+
+import logging
+import re
+import socketserver
+import threading
+import time
+
+from collections.abc import Iterator
+
+import pytest
+
+from lifecyclelogging import Logging, NetworkSyslogHandler
+from lifecyclelogging.syslog import header_field
+
+
+RFC5424 = re.compile(
+    r"<(?P<pri>\d+)>1 (?P<timestamp>\S+) (?P<hostname>\S+) (?P<app>\S+) "
+    r"(?P<procid>\S+) (?P<msgid>\S+) (?P<sd>-|\[.*?[^\\]\]) (?P<msg>.*)",
+    re.DOTALL,
+)
+
+
+class StandInRelay(socketserver.ThreadingTCPServer):
+    """Local TCP syslog relay reading octet-counted frames."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, close_after: int | None = None) -> None:
+        """Start listening on a free local port."""
+        super().__init__(("127.0.0.1", 0), OctetCountingHandler)
+        self.messages: list[str] = []
+        self.connections = 0
+        self.close_after = close_after
+        self.lock = threading.Lock()
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> list[str]:
+        """Wait until ``count`` messages arrived and return them."""
+        deadline = time.monotonic() + timeout
+        while len(self.messages) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with self.lock:
+            return list(self.messages)
+
+
+class OctetCountingHandler(socketserver.StreamRequestHandler):
+    """Reads ``LENGTH SP MESSAGE`` frames from one connection."""
+
+    server: StandInRelay
+
+    def handle(self) -> None:
+        """Collect frames until the client disconnects."""
+        with self.server.lock:
+            self.server.connections += 1
+            close_after = self.server.close_after
+            self.server.close_after = None
+        received = 0
+        while close_after is None or received < close_after:
+            length = b""
+            while not length.endswith(b" "):
+                char = self.rfile.read(1)
+                if not char:
+                    return
+                length += char
+            message = self.rfile.read(int(length))
+            with self.server.lock:
+                self.server.messages.append(message.decode("utf-8"))
+            received += 1
+
+
+@pytest.fixture
+def relay() -> Iterator[StandInRelay]:
+    """Run a TCP relay on a background thread."""
+    server = StandInRelay()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def logger() -> Iterator[Logging]:
+    """Create a Logging instance without console or file output."""
+    instance = Logging(enable_console=False, enable_file=False)
+    instance.logger.setLevel(logging.DEBUG)
+    yield instance
+    for handler in list(instance.logger.handlers):
+        instance.logger.removeHandler(handler)
+        handler.close()
+
+
+def test_tcp_frames_rfc5424_messages(logger: Logging, relay: StandInRelay) -> None:
+    """Test the header, structured data and octet counting of a statement."""
+    handler = logger.add_syslog_sink(
+        relay.server_address, facility="local0", app_name="sync job", hostname="h1"
+    )
+    logger.logged_statement(
+        "Synced",
+        identifiers=["a-1", 'quote"d'],
+        context_marker="sync",
+        storage_marker="results",
+        log_level="warning",
+    )
+    assert handler.flush(5)
+
+    (message,) = relay.wait_for(1)
+    fields = RFC5424.fullmatch(message)
+    assert fields is not None
+    assert fields["pri"] == str(16 * 8 + 4)
+    assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}Z", fields["timestamp"])
+    assert fields["hostname"] == "h1"
+    assert fields["app"] == "sync_job"
+    assert fields["msgid"] == "sync"
+    assert fields["sd"] == (
+        '[lifecyclelogging@32473 identifiers="a-1,quote\\"d" storage_marker="results"]'
+    )
+    assert fields["msg"] == '[sync] Synced (a-1, quote"d)'
+
+
+def test_batches_reuse_one_connection(logger: Logging, relay: StandInRelay) -> None:
+    """Test that many records are written over a single connection."""
+    handler = logger.add_syslog_sink(relay.server_address, max_batch=16)
+    logger.logged_statements([{"msg": f"line {index}"} for index in range(100)])
+    assert handler.flush(5)
+
+    messages = relay.wait_for(100)
+    assert [RFC5424.fullmatch(m)["msg"] for m in messages] == [  # type: ignore[index]
+        f"line {index}" for index in range(100)
+    ]
+    assert relay.connections == 1
+    assert handler.connections_opened == 1
+    assert handler.batches < 100  # noqa: PLR2004
+
+
+def test_reconnects_after_relay_closes(logger: Logging) -> None:
+    """Test that a connection closed by the relay is reopened."""
+    relay = StandInRelay(close_after=1)
+    threading.Thread(target=relay.serve_forever, daemon=True).start()
+    try:
+        handler = logger.add_syslog_sink(relay.server_address, backoff=0.001)
+        logger.logged_statement("first")
+        assert handler.flush(5)
+        relay.wait_for(1)
+        # Give the relay time to close its end of the first connection
+        time.sleep(0.1)
+        logger.logged_statement("second")
+        assert handler.flush(5)
+
+        messages = relay.wait_for(2)
+        assert [RFC5424.fullmatch(m)["msg"] for m in messages] == [  # type: ignore[index]
+            "first",
+            "second",
+        ]
+        assert relay.connections == 2  # noqa: PLR2004
+        assert handler.failed == 0
+    finally:
+        relay.shutdown()
+        relay.server_close()
+
+
+def test_unreachable_relay_counts_failures(logger: Logging) -> None:
+    """Test that connection failures are retried, then counted as failed."""
+    handler = logger.add_syslog_sink(
+        ("127.0.0.1", 9), max_retries=1, backoff=0.001, connect_timeout=1
+    )
+    logger.logged_statement("lost")
+    assert handler.flush(5)
+    assert handler.retries == 1
+    assert handler.failed == 1
+    assert isinstance(handler.last_error, OSError)
+
+
+class DatagramCollector(socketserver.UDPServer):
+    """Local UDP syslog relay."""
+
+    def __init__(self) -> None:
+        """Start listening on a free local port."""
+        super().__init__(("127.0.0.1", 0), DatagramHandler)
+        self.datagrams: list[bytes] = []
+
+
+class DatagramHandler(socketserver.DatagramRequestHandler):
+    """Collects one datagram."""
+
+    server: DatagramCollector
+
+    def handle(self) -> None:
+        """Collect the datagram."""
+        self.server.datagrams.append(self.rfile.read())
+
+
+def test_udp_sends_one_datagram_per_record() -> None:
+    """Test that UDP sends unframed datagrams, cut to ``max_message``."""
+    server = DatagramCollector()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    handler = NetworkSyslogHandler(
+        server.server_address, transport="udp", max_message=120
+    )
+    logger = logging.getLogger("tests.syslog.udp")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        logger.error("short")
+        logger.error("long %s", "x" * 500)
+        assert handler.flush(5)
+        deadline = time.monotonic() + 5
+        while len(server.datagrams) < 2 and time.monotonic() < deadline:  # noqa: PLR2004
+            time.sleep(0.01)
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+        server.shutdown()
+        server.server_close()
+
+    short, long = server.datagrams
+    assert short.startswith(b"<11>1 ")
+    assert short.endswith(b" - - short")
+    assert len(long) == 120  # noqa: PLR2004
+
+
+def test_long_messages_are_cut_on_a_character_boundary() -> None:
+    """Test that truncation never splits a multi-byte character."""
+    handler = NetworkSyslogHandler(("127.0.0.1", 9), transport="udp")
+    record = logging.LogRecord(
+        "tests.syslog", logging.ERROR, __file__, 0, "é€" * 100, (), None
+    )
+    try:
+        for limit in range(100, 106):
+            handler.max_message = limit
+            message = handler.prepare(record)
+            text = message.decode("utf-8")
+            assert limit - 3 < len(message) <= limit
+            assert text.endswith(("é", "€"))
+    finally:
+        handler.close()
+
+
+def test_header_fields_and_options() -> None:
+    """Test header sanitizing and the validation of options."""
+    assert header_field("my app\n", 48) == "my_app_"
+    assert header_field("x" * 40, 32) == "x" * 32
+    assert header_field("", 32) == "-"
+    assert header_field(None, 32) == "-"
+    with pytest.raises(ValueError, match="transport"):
+        NetworkSyslogHandler(transport="tls")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="facility"):
+        NetworkSyslogHandler(facility="nonsense")
@@ -0,0 +1,207 @@
+"""Tests for the traceback rendering policy."""
+
+from __future__ import annotations
+
+import io
+import logging
+import re
+import sys
+import traceback
+
+import pytest
+
+from lifecyclelogging.handlers import TracebackRichHandler
+from lifecyclelogging.tracebacks import (
+    TracebackFormatter,
+    TracebackPolicy,
+    get_default_traceback_policy,
+)
+from rich.console import Console
+
+
+def _fail(depth: int = 0) -> None:
+    if depth:
+        _fail(depth - 1)
+    frame_local = "local-value"  # noqa: F841
+    error_message = "inner failure"
+    raise ValueError(error_message)
+
+
+def _chained() -> BaseException:
+    try:
+        try:
+            _fail()
+        except ValueError as exc:
+            error_message = "outer failure"
+            raise RuntimeError(error_message) from exc
+    except RuntimeError as exc:
+        return exc
+    raise AssertionError
+
+
+def _caught(depth: int = 0) -> BaseException:
+    try:
+        _fail(depth)
+    except ValueError as exc:
+        return exc
+    raise AssertionError
+
+
+def _without_carets(text: str) -> str:
+    """Drop the caret lines newer Pythons add under the failing expression."""
+    return "\n".join(
+        line for line in text.splitlines() if not re.fullmatch(r"\s*[\^~]+\s*", line)
+    )
+
+
+def test_full_render_matches_traceback_module() -> None:
+    """Test that chained exceptions render as traceback.format_exception does."""
+    exc = _chained()
+    expected = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+    rendered = TracebackPolicy().format_full(exc)
+    assert _without_carets(rendered) == _without_carets(expected)
+
+
+def test_repeated_failures_hit_the_frame_cache() -> None:
+    """Test that the same failure path is rendered from cached frames."""
+    policy = TracebackPolicy(max_full_renders=None)
+    first = policy.format_full(_caught(depth=3))
+    misses = policy.cache_misses
+    second = policy.format_full(_caught(depth=3))
+    assert first == second
+    assert policy.cache_misses == misses
+    assert policy.cache_hits >= misses
+
+
+def test_frame_cache_evicts_least_recently_used() -> None:
+    """Test that a full cache drops its oldest frames and keeps filling."""
+    policy = TracebackPolicy(cache_size=2)
+    policy.format_frame("a.py", 1, "a")
+    policy.format_frame("b.py", 1, "b")
+    policy.format_frame("a.py", 1, "a")
+    policy.format_frame("c.py", 1, "c")
+    misses = policy.cache_misses
+
+    policy.format_frame("a.py", 1, "a")
+    policy.format_frame("c.py", 1, "c")
+    assert policy.cache_misses == misses
+    policy.format_frame("b.py", 1, "b")
+    assert policy.cache_misses == misses + 1
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="needs ExceptionGroup")
+def test_exception_groups_render_nested_tracebacks() -> None:
+    """Test that sub-exceptions of a group keep their own tracebacks."""
+    try:
+        error_message = "several"
+        raise ExceptionGroup(error_message, [_caught(), _chained()])  # noqa: F821
+    except Exception as exc:  # noqa: BLE001
+        group = exc
+    expected = "".join(
+        traceback.format_exception(type(group), group, group.__traceback__)
+    )
+
+    rendered = TracebackPolicy().format_full(group)
+
+    assert rendered == expected.rstrip("\n")
+    assert "inner failure" in rendered
+    assert "outer failure" in rendered
+
+
+def test_exc_info_traceback_is_not_attached() -> None:
+    """Test that rendering exc_info leaves the exception object unchanged."""
+    exc = _caught()
+    tb = exc.__traceback__
+    exc.__traceback__ = None
+
+    rendered = TracebackPolicy().format_exception((type(exc), exc, tb))
+
+    assert "in _fail" in rendered
+    assert exc.__traceback__ is None
+
+
+def test_locals_only_when_requested() -> None:
+    """Test that frame locals are rendered only with show_locals."""
+    exc = _caught()
+    assert "frame_local" not in TracebackPolicy().format_full(exc)
+    assert "frame_local = 'local-value'" in TracebackPolicy(
+        show_locals=True
+    ).format_full(exc)
+
+
+def test_rate_limit_summarizes_per_type() -> None:
+    """Test that full renders past the limit are summarized, per type."""
+    policy = TracebackPolicy(max_full_renders=2, rate_window=60)
+    rendered = [
+        policy.format_exception((ValueError, exc, exc.__traceback__))
+        for exc in (_caught() for _ in range(4))
+    ]
+
+    assert all(text.startswith("Traceback (most recent") for text in rendered[:2])
+    assert rendered[3].startswith("Traceback (innermost frame only)")
+    assert "in _fail" in rendered[3]
+    assert "ValueError: inner failure" in rendered[3]
+    assert "2 ValueError tracebacks summarized" in rendered[3]
+    assert policy.allow_full(KeyError("other type"))
+
+
+def test_decision_is_made_once_per_exception() -> None:
+    """Test that rendering one exception twice counts once against the limit."""
+    policy = TracebackPolicy(max_full_renders=1)
+    exc = _caught()
+    assert policy.allow_full(exc)
+    assert policy.allow_full(exc)
+    assert not policy.allow_full(_caught())
+
+
+def test_deep_stacks_are_elided() -> None:
+    """Test that only max_frames frames are rendered."""
+    rendered = TracebackPolicy(max_frames=6).format_full(_caught(depth=20))
+    assert "frames elided" in rendered
+    assert rendered.count('  File "') == 6  # noqa: PLR2004
+
+
+def test_formatter_uses_policy() -> None:
+    """Test that TracebackFormatter renders record exceptions via the policy."""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(
+        TracebackFormatter("%(message)s", policy=TracebackPolicy(max_full_renders=0))
+    )
+    logger = logging.getLogger("test_traceback_formatter")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        exc = _caught()
+        logger.error("failed", exc_info=exc)
+    finally:
+        logger.removeHandler(handler)
+    assert "Traceback (innermost frame only)" in stream.getvalue()
+
+
+def test_default_policy_renders_every_traceback_in_full() -> None:
+    """Test that rate limiting is off unless a limit is configured."""
+    assert get_default_traceback_policy().max_full_renders is None
+    policy = TracebackPolicy()
+    for _ in range(20):
+        exc = _caught()
+        rendered = policy.format_exception((type(exc), exc, exc.__traceback__))
+        assert rendered.startswith("Traceback (most recent call last):")
+    assert policy.suppressed(ValueError) == 0
+
+
+@pytest.mark.parametrize("terminal", [False, True])
+def test_rich_handler_plain_for_non_terminals(terminal: bool) -> None:
+    """Test that Rich tracebacks are only rendered for terminals."""
+    output = io.StringIO()
+    console = Console(file=output, force_terminal=terminal, width=200)
+    handler = TracebackRichHandler(console=console, policy=TracebackPolicy())
+    handler.setFormatter(TracebackFormatter("%(message)s"))
+    record = logging.LogRecord("test", logging.ERROR, __file__, 0, "failed", (), None)
+    exc = _caught()
+    record.exc_info = (type(exc), exc, exc.__traceback__)
+    handler.handle(record)
+
+    text = output.getvalue()
+    assert ("Traceback (most recent call last):" in text) is not terminal
+    assert handler.rich_tracebacks
@@ -0,0 +1,78 @@
+"""Unit tests for result key transformation in the lifecyclelogging package."""
+
+from __future__ import annotations
+
+import re
+
+from types import MappingProxyType
+
+import pytest
+
+from lifecyclelogging.transforms import (
+    KeyPatternSet,
+    KeyTransformer,
+    compile_prefix_rule,
+)
+
+
+def test_key_transformer_memoizes_keys() -> None:
+    """Test that each distinct key is transformed once."""
+    calls: list[str] = []
+
+    def upper(key: str) -> str:
+        calls.append(key)
+        return key.upper()
+
+    transformer = KeyTransformer(upper)
+    output = transformer.transform({"a": [{"b": 1}, {"b": 2}], "c": {"b": 3}})
+
+    assert output == {"A": [{"B": 1}, {"B": 2}], "C": {"B": 3}}
+    assert sorted(calls) == ["a", "b", "c"]
+
+
+def test_key_transformer_converts_other_mappings() -> None:
+    """Test that unchanged non-dict mappings still come back as dicts."""
+    proxy = MappingProxyType({"same": 1})
+    output = KeyTransformer(str).transform(proxy)
+
+    assert type(output) is dict
+    assert output == {"same": 1}
+
+
+def test_key_pattern_set_matching() -> None:
+    """Test exact names, globs and regular expressions."""
+    patterns = KeyPatternSet(["exact", "*_id", "re:tag_[0-9]+", "lit[eral"])
+
+    assert patterns.matches("exact")
+    assert patterns.matches("account_id")
+    assert patterns.matches("tag_42")
+    assert patterns.matches("lit[eral")
+    assert not patterns.matches("tag_x")
+    assert not patterns.matches("exactly")
+    assert not KeyPatternSet()
+
+
+def test_key_pattern_set_invalid_regex() -> None:
+    """Test that invalid regular expressions fail when compiled."""
+    with pytest.raises(re.error):
+        KeyPatternSet(["re:("])
+
+
+def test_compile_prefix_rule() -> None:
+    """Test allowlist and denylist decisions on original and transformed keys."""
+    rule = compile_prefix_rule(["*Name", "re:size_.*"], ["secretName"])
+
+    assert rule("accountName", "account_name")
+    assert rule("sizeBytes", "size_bytes")
+    assert not rule("secretName", "secret_name")
+    assert not rule("region", "region")
+    assert compile_prefix_rule()("anything", "anything")
+
+
+def test_prefix_throughput_independent_of_list_size() -> None:
+    """Test that large allowlists are compiled rather than scanned."""
+    allowlist = [f"field{index}" for index in range(10_000)]
+    rule = compile_prefix_rule(allowlist)
+
+    assert rule("field9999", "field9999")
+    assert not rule("other", "other")
@@ -9,6 +9,9 @@ from typing import Any
 import pytest
 
 from lifecyclelogging.utils import (
+    MessageBuilder,
+    add_json_data,
+    append_json_data,
     clear_existing_handlers,
     find_logger,
     get_log_level,
@@ -83,3 +86,28 @@ def test_sanitize_json_data(input_data: Any, expected: Any) -> None:
     in YAML (like large ints and complex numbers) rather than stringifying them.
     """
     assert sanitize_json_data(input_data) == expected
+
+
+def test_message_builder_joins_segments_once() -> None:
+    """Test that the message builder joins its segments in order."""
+    builder = MessageBuilder("[ctx] ", "message")
+    builder.append(" (id)")
+
+    assert len(builder) == len(builder.segments)
+    assert builder.build() == "[ctx] message (id)"
+
+
+def test_append_json_data_matches_add_json_data() -> None:
+    """Test that the builder path renders the same text as add_json_data."""
+    labeled = {f"label{i}": {"value": i} for i in range(50)}
+    labeled["scalar"] = "plain"  # type: ignore[assignment]
+    unlabeled = [{"a": 1}, {"b": 2}]
+
+    builder = MessageBuilder("msg")
+    append_json_data(builder, unlabeled, labeled)
+
+    expected = add_json_data("msg", unlabeled, labeled)
+    assert builder.build() == expected
+    assert '\nlabel49:\n{"value":49}' in expected
+    assert '\n:{"scalar":"plain"}' in expected
+    assert expected.endswith('\n:{"a":1}\n:{"b":2}')
@@ -0,0 +1,132 @@
+"""Tests for results serialization, atomic writes and the background writer."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import os
+import threading
+
+from collections import OrderedDict
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from extended_data_types import wrap_raw_data_for_export
+from lifecyclelogging import Logging
+from lifecyclelogging.writers import BackgroundWriter, dump_results, write_atomic
+
+
+def test_dump_results_matches_export_for_special_types() -> None:
+    """Test that special values serialize as wrap_raw_data_for_export does."""
+    results = {
+        "when": dt.datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt.timezone.utc),
+        "day": dt.date(2024, 1, 2),
+        "path": Path("/tmp/results"),  # noqa: S108
+        "tags": {"only"},
+        "ordered": OrderedDict(a=1),
+        "nested": {"items": [1, "two", None, 2.5, True]},
+        "other": object,
+    }
+    assert json.loads(dump_results(results)) == json.loads(
+        wrap_raw_data_for_export(results, allow_encoding=True, default=str)
+    )
+
+
+def test_dump_results_indent() -> None:
+    """Test that indent pretty-prints with two spaces."""
+    assert dump_results({"a": [1]}, indent=True) == b'{\n  "a": [\n    1\n  ]\n}'
+
+
+def test_write_atomic_replaces_file(tmp_path: Path) -> None:
+    """Test that the file is replaced and no temporary file is left behind."""
+    path = tmp_path / "nested" / "results.json"
+    write_atomic(path, b"old")
+    write_atomic(path, b"new")
+    assert path.read_bytes() == b"new"
+    assert [p.name for p in path.parent.iterdir()] == ["results.json"]
+
+
+def test_write_atomic_keeps_old_file_on_failure(tmp_path: Path) -> None:
+    """Test that a failed write leaves the previous contents in place."""
+    path = tmp_path / "results.json"
+    write_atomic(path, b"old")
+    with (
+        patch.object(Path, "replace", side_effect=OSError("disk full")),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        write_atomic(path, b"new")
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["results.json"]
+
+
+def test_background_writer_runs_tasks_in_order() -> None:
+    """Test that tasks run on one worker thread in submission order."""
+    writer = BackgroundWriter()
+    seen: list[tuple[int, str]] = []
+    for index in range(5):
+        writer.submit(
+            lambda index=index: seen.append((index, threading.current_thread().name))
+        )
+    assert writer.join() == []
+    assert [index for index, _ in seen] == list(range(5))
+    assert {name for _, name in seen} == {"lifecyclelogging-results"}
+    writer.close()
+
+
+def test_background_writer_collects_errors() -> None:
+    """Test that task failures are returned by join and do not stop the worker."""
+    writer = BackgroundWriter()
+    done = threading.Event()
+
+    def fail() -> None:
+        error_message = "boom"
+        raise OSError(error_message)
+
+    writer.submit(fail)
+    writer.submit(done.set)
+    errors = writer.close()
+    assert [str(error) for error in errors] == ["boom"]
+    assert done.is_set()
+
+
+def test_log_results_indent_option(tmp_path: Path) -> None:
+    """Test that results_indent and the indent argument pretty-print results."""
+    os.chdir(tmp_path)
+    logger = Logging(enable_console=False, enable_file=False, results_indent=True)
+    logger.log_results({"a": 1}, "indented")
+    logger.log_results({"a": 1}, "compact", indent=False)
+    assert (tmp_path / "indented.json").read_bytes() == b'{\n  "a": 1\n}'
+    assert (tmp_path / "compact.json").read_bytes() == b'{"a":1}'
+
+
+def test_exit_run_joins_background_writes(tmp_path: Path) -> None:
+    """Test that exit_run waits for the background results write."""
+    os.chdir(tmp_path)
+    logger = Logging(enable_console=False, enable_file=False, background_results=True)
+    release = threading.Event()
+    assert logger.results_writer is not None
+    logger.results_writer.submit(release.wait)
+
+    threading.Timer(0.05, release.set).start()
+    logger.exit_run({"a": {"fieldName": 1}}, exit_on_completion=False)
+
+    assert logger.results_writer.queue_depth == 0
+    assert json.loads((tmp_path / "results.json").read_bytes()) == {
+        "a": {"fieldName": 1}
+    }
+
+
+def test_background_write_failure_is_logged(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a failed background write is logged when exit_run finishes."""
+    os.chdir(tmp_path)
+    logger = Logging(enable_console=False, enable_file=False, background_results=True)
+    logger.logger.propagate = True
+    with patch(
+        "lifecyclelogging.logging.write_atomic", side_effect=OSError("disk full")
+    ):
+        logger.exit_run({"a": 1}, exit_on_completion=False)
+    assert "Failed to write results: disk full" in caplog.text